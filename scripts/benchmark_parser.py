@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark MarkdownParser on a synthetic multi-megabyte research document."""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.data.parsers.markdown_parser import MarkdownParser
+
+LOCATIONS = ["Munich", "Darmstadt/Germany", "USA", "UK", "Japan", "France", "Garching", "Hanau"]
+TECHNOLOGIES = ["Tokamak", "Stellarator", "Laser-driven ICF", "FRC", "Z-pinch", "Mirror"]
+INVESTORS = ["Earlybird", "SPRIND", "HV Capital", "Bill Gates", "Google", "BMBF", "EQT Ventures"]
+
+
+def company_block(rng: random.Random, index: int) -> str:
+    """Generate one ``####`` company block in the research document format."""
+    investors = ", ".join(rng.sample(INVESTORS, 3))
+    return f"""#### Fusion Company {index} ({rng.choice(LOCATIONS)})
+
+**Profil:** {rng.choice(TECHNOLOGIES)} developer, gegründet {rng.randint(1995, 2025)}, \
+with {rng.randint(5, 900)} Mitarbeiter working towards a pilot plant in the 2030s.
+
+- Finanzierung: EUR {rng.randint(1, 900)}M (Series {rng.choice("ABC")})
+- Status: TRL {rng.randint(2, 7)}, prototype under construction
+- Investoren: {investors}
+- Partnerships with research institutes and industrial suppliers
+
+Additional notes on the company's roadmap, regulatory status and supply chain \
+relationships. {"Lorem ipsum dolor sit amet. " * rng.randint(2, 12)}
+"""
+
+
+def synthetic_document(target_mb: float, seed: int = 42) -> str:
+    """Generate a research document of roughly ``target_mb`` megabytes."""
+    rng = random.Random(seed)
+    parts = ["## Executive Summary\n", "Synthetic benchmark document.\n"]
+    size = sum(len(p) for p in parts)
+    index = 0
+    section = 0
+
+    while size < target_mb * 1_000_000:
+        if index % 200 == 0:
+            section += 1
+            header = f"\n## {section}. Company Landscape {section}\n\n### {section}.1 Startups\n\n"
+            parts.append(header)
+            size += len(header)
+        block = company_block(rng, index)
+        parts.append(block)
+        size += len(block)
+        index += 1
+
+    return "\n".join(parts)
+
+
+def time_parse(content: str, repeat: int, workers: int = 0) -> list[float]:
+    """Time ``repeat`` full parses of ``content`` (``workers`` > 0 enables parallel mode)."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        MarkdownParser(content, parallel=workers > 0, max_workers=workers or None).parse()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the research markdown parser")
+    parser.add_argument(
+        "--sizes",
+        type=float,
+        nargs="+",
+        default=[0.5, 2.0, 8.0],
+        help="Document sizes in MB (default: 0.5 2 8)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Parses per size; the median is reported (default: 3)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Also time parallel extraction with this many processes (default: off)",
+    )
+    args = parser.parse_args()
+
+    header = f"{'Size (MB)':>10} {'Companies':>10} {'Median (s)':>11} {'MB/s':>8}"
+    if args.workers:
+        header += f" {'Parallel (s)':>13} {'Speedup':>8}"
+    print(header)
+    for target_mb in args.sizes:
+        content = synthetic_document(target_mb)
+        size_mb = len(content.encode("utf-8")) / 1_000_000
+        companies = len(MarkdownParser(content).parse().companies)
+        median = statistics.median(time_parse(content, args.repeat))
+        row = f"{size_mb:>10.2f} {companies:>10} {median:>11.3f} {size_mb / median:>8.1f}"
+        if args.workers:
+            parallel = statistics.median(time_parse(content, args.repeat, args.workers))
+            row += f" {parallel:>13.3f} {median / parallel:>7.2f}x"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
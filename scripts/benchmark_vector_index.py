@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark quantized NumPy vector indexes against the float32 baseline."""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from langchain_core.documents import Document
+
+from src.data.vector_backends import NumpyBackend
+
+
+def synthetic_vectors(rows: int, dimensions: int, rng: np.random.Generator) -> np.ndarray:
+    """Clustered vectors, like embeddings of documents about a few hundred topics."""
+    centers = rng.normal(size=(max(1, rows // 100), dimensions))
+    return centers[rng.integers(0, len(centers), rows)] + 0.6 * rng.normal(size=(rows, dimensions))
+
+
+def build_index(directory: str, vectors: np.ndarray, **options) -> tuple[NumpyBackend, float]:
+    """Index ``vectors`` in batches; returns the backend and the build time."""
+    backend = NumpyBackend(directory, **options)
+    start = time.perf_counter()
+    for first in range(0, len(vectors), 10_000):
+        block = vectors[first:first + 10_000]
+        ids = [str(first + i) for i in range(len(block))]
+        docs = [Document(page_content=doc_id, metadata={"type": "news"}) for doc_id in ids]
+        backend.upsert(ids, block, docs)
+    return backend, time.perf_counter() - start
+
+
+def time_queries(backend: NumpyBackend, queries: np.ndarray, k: int) -> tuple[list, float]:
+    """Run the queries one by one; returns the hit ids and the median latency (ms)."""
+    hits = []
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        result = backend.query(query, k=k)
+        timings.append(time.perf_counter() - start)
+        hits.append([doc.id for doc, _ in result])
+    return hits, 1000 * statistics.median(timings)
+
+
+def recall(hits: list, truth: list, k: int) -> float:
+    """Mean share of the exact top-k found."""
+    return statistics.mean(len(set(found) & set(exact)) / k for found, exact in zip(hits, truth))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark quantized vector indexes")
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[20_000, 100_000],
+        help="Index sizes (default: 20000 100000)",
+    )
+    parser.add_argument("--dimensions", type=int, default=384, help="Vector size (default: 384)")
+    parser.add_argument("--queries", type=int, default=100, help="Queries per index (default: 100)")
+    parser.add_argument("-k", type=int, default=10, help="Results per query (default: 10)")
+    parser.add_argument(
+        "--recall-targets",
+        type=float,
+        nargs="+",
+        default=[0.9, 0.95, 0.99],
+        help="Recall targets to calibrate the re-scoring shortlist for (default: 0.9 0.95 0.99)",
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print(
+        f"{'Rows':>8} {'Index':>6} {'Target':>7} {'Rescore':>8} {'Index MB':>9} "
+        f"{'Recall@k':>9} {'Query ms':>9} {'Build s':>8}"
+    )
+    for rows in args.rows:
+        vectors = synthetic_vectors(rows, args.dimensions, rng)
+        # Perturbed documents; the first half calibrates, the second half is measured
+        queries = vectors[rng.choice(rows, 2 * args.queries, replace=False)]
+        queries = queries + 0.3 * rng.normal(size=queries.shape)
+        calibration, queries = queries[:args.queries], queries[args.queries:]
+
+        with tempfile.TemporaryDirectory() as directory:
+            baseline, build = build_index(f"{directory}/float32", vectors)
+            truth, latency = time_queries(baseline, queries, args.k)
+            index_mb = baseline.memory_footprint()["index_bytes"] / 1e6
+            print(
+                f"{rows:>8} {'f32':>6} {'-':>7} {'-':>8} {index_mb:>9.1f} "
+                f"{1.0:>9.3f} {latency:>9.2f} {build:>8.1f}"
+            )
+
+            for quantization in ("int8", "pq"):
+                backend, build = build_index(
+                    f"{directory}/{quantization}", vectors, quantization=quantization
+                )
+                index_mb = backend.memory_footprint()["index_bytes"] / 1e6
+                for target in args.recall_targets:
+                    rescore = backend.calibrate(target, k=args.k, queries=calibration)["rescore"]
+                    hits, latency = time_queries(backend, queries, args.k)
+                    print(
+                        f"{rows:>8} {quantization:>6} {target:>7.2f} {rescore:>8} "
+                        f"{index_mb:>9.1f} {recall(hits, truth, args.k):>9.3f} "
+                        f"{latency:>9.2f} {build:>8.1f}"
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -20,7 +20,7 @@ def main():
     # Get LLM for summarization
     print("\n🤖 Initializing LLM...")
     try:
-        llm = get_llm(model="qwen3:8b")
+        llm = get_llm(model="qwen3:8b", priority="batch")
         print("  Using qwen3:8b for summarization")
     except Exception as e:
         print(f"  LLM not available: {e}")
@@ -11,6 +11,7 @@ sys.path.insert(0, str(project_root))
 
 from src.services.markdown_merger_service import MarkdownMergerService, MergeConfig
 from src.llm.chain_factory import get_llm
+from src.llm.scheduler import configure_llm_scheduler
 
 
 def main():
@@ -47,6 +48,12 @@ def main():
         default="qwen3:8b",
         help="Ollama model to use (default: qwen3:8b)",
     )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=4,
+        help="Company merges sent to the LLM at once (default: 4)",
+    )
     parser.add_argument(
         "--research-dir",
         default="research",
@@ -85,7 +92,9 @@ def main():
     # Initialize LLM
     print("\nInitializing LLM...")
     try:
-        llm = get_llm(model=args.model)
+        # No interactive traffic in this process: batch work may use every slot
+        configure_llm_scheduler(args.max_concurrent)
+        llm = get_llm(model=args.model, priority="batch")
     except Exception as e:
         print(f"Error initializing LLM: {e}")
         print("Make sure Ollama is running: ollama serve")
@@ -94,6 +103,7 @@ def main():
     # Configure merger
     config = MergeConfig(
         backup_suffix="" if args.no_backup else ".backup",
+        max_concurrent_merges=args.max_concurrent,
     )
 
     merger = MarkdownMergerService(
@@ -147,8 +157,13 @@ def main():
     print(f"  Sections merged:    {result.sections_merged}")
     print(f"  Companies added:    {result.companies_added}")
     print(f"  Companies updated:  {result.companies_updated}")
+    print(f"  LLM merge requests: {result.llm_requests}")
+    print(f"  Merged without LLM: {result.local_merge_ratio:.0%} of sections")
     print(f"  Conflicts resolved: {result.conflicts_resolved}")
 
+    if result.snapshot_version is not None:
+        print(f"  Snapshot:           v{result.snapshot_version} "
+              f"(restore with scripts/research_snapshots.py restore {result.snapshot_version})")
     if result.backup_path:
         print(f"  Backup created:     {result.backup_path}")
 
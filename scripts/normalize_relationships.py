@@ -16,6 +16,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.data.database import get_database
+from src.data.repositories import InvestorRepository
 from src.data.parsers.relationship_parser import classify_partner, parse_text_list
 
 
@@ -40,6 +41,9 @@ def normalize_relationships(db_path: str = "research/fusion_research.db") -> dic
     )
     companies = cursor.fetchall()
 
+    # Resolve investor name variants ("X GmbH", "X") to one investor
+    investor_index = InvestorRepository(db).name_index()
+
     for company in companies:
         company_id = company["id"]
         company_name = company["name"]
@@ -49,18 +53,14 @@ def normalize_relationships(db_path: str = "research/fusion_research.db") -> dic
         investor_names = parse_text_list(company["key_investors"])
         for inv_name in investor_names:
             # Get or create investor
-            inv_cursor = db.execute(
-                "SELECT id FROM investors WHERE name = ?", (inv_name,)
-            )
-            inv_row = inv_cursor.fetchone()
-            if inv_row:
-                investor_id = inv_row["id"]
-            else:
+            investor_id = investor_index.resolve(inv_name)
+            if investor_id is None:
                 ins_cursor = db.execute(
                     "INSERT INTO investors (name, investor_type) VALUES (?, ?)",
                     (inv_name, "Unknown"),
                 )
                 investor_id = ins_cursor.lastrowid
+                investor_index.add(inv_name, investor_id)
                 stats["investors_created"] += 1
 
             # Find or create a synthetic funding round to link through
@@ -1,5 +1,6 @@
 """Populate ChromaDB vector store with data from SQLite database."""
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -10,6 +11,7 @@ sys.path.insert(0, str(project_root))
 from src.data.database import get_database
 from src.data.vector_store import get_vector_store
 from src.data.repositories import CompanyRepository, TechnologyRepository, MarketRepository
+from src.data.research_chunker import DEFAULT_MAX_TOKENS, DEFAULT_OVERLAP_TOKENS, ResearchChunker
 
 
 def populate_companies(vector_store, db):
@@ -84,8 +86,12 @@ def populate_markets(vector_store, db):
     return count
 
 
-def populate_research_chunks(vector_store):
-    """Populate vector store with research document chunks."""
+def populate_research_chunks(
+    vector_store,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+):
+    """Sync research document chunks; only new or edited chunks are embedded."""
     research_path = Path("research/Fusion_Research.md")
     
     if not research_path.exists():
@@ -93,45 +99,43 @@ def populate_research_chunks(vector_store):
         return 0
     
     content = research_path.read_text(encoding="utf-8")
+    chunks = ResearchChunker(max_tokens, overlap_tokens).chunk(content)
     
-    # Split into sections by ## headers
-    sections = content.split("\n## ")
+    try:
+        counts = vector_store.sync_research_chunks(chunks, source=research_path.name)
+    except Exception as e:
+        print(f"  Error syncing research chunks: {e}")
+        return 0
     
-    count = 0
-    for i, section in enumerate(sections):
-        if not section.strip():
-            continue
-        
-        # Get section title from first line
-        lines = section.split("\n")
-        title = lines[0].strip("#").strip() if lines else f"Section {i}"
-        section_content = "\n".join(lines[1:]).strip()
-        
-        # Skip very short sections
-        if len(section_content) < 100:
-            continue
-        
-        # Split large sections into chunks (~1000 chars each)
-        chunk_size = 1000
-        chunks = [section_content[j:j+chunk_size] for j in range(0, len(section_content), chunk_size)]
-        
-        for j, chunk in enumerate(chunks):
-            try:
-                vector_store.add_research_chunk(
-                    chunk_id=f"section_{i}_chunk_{j}",
-                    content=chunk,
-                    section=title,
-                )
-                count += 1
-            except Exception as e:
-                print(f"  Error adding chunk {i}_{j}: {e}")
-    
-    print(f"  Added {count} research chunks")
-    return count
+    print(
+        f"  {len(chunks)} research chunks: {counts['added']} added, "
+        f"{counts['removed']} removed, {counts['unchanged']} unchanged"
+    )
+    return len(chunks)
 
 
 def main():
     """Main function to populate the vector store."""
+    parser = argparse.ArgumentParser(description="Populate the vector store")
+    parser.add_argument(
+        "--research-only",
+        action="store_true",
+        help="Only re-index research chunks incrementally, keeping all other documents",
+    )
+    parser.add_argument(
+        "--chunk-tokens",
+        type=int,
+        default=DEFAULT_MAX_TOKENS,
+        help=f"Research chunk size in estimated tokens (default: {DEFAULT_MAX_TOKENS})",
+    )
+    parser.add_argument(
+        "--overlap-tokens",
+        type=int,
+        default=DEFAULT_OVERLAP_TOKENS,
+        help=f"Overlap between research chunks (default: {DEFAULT_OVERLAP_TOKENS})",
+    )
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("Populating ChromaDB Vector Store")
     print("=" * 60)
@@ -147,6 +151,12 @@ def main():
         print("  ollama pull nomic-embed-text")
         return
     
+    if args.research_only:
+        print("\n📄 Re-indexing research document chunks...")
+        populate_research_chunks(vector_store, args.chunk_tokens, args.overlap_tokens)
+        print(f"\n📈 Total documents: {vector_store.get_collection_stats()['count']}")
+        return
+    
     print("\n🗄️ Connecting to database...")
     db = get_database()
     
@@ -172,7 +182,7 @@ def main():
     
     # Populate research chunks
     print("\n📄 Adding research document chunks...")
-    chunk_count = populate_research_chunks(vector_store)
+    chunk_count = populate_research_chunks(vector_store, args.chunk_tokens, args.overlap_tokens)
     
     # Summary
     print("\n" + "=" * 60)
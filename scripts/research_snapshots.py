@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""CLI script for listing, diffing and restoring research document snapshots."""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.data.snapshot_store import SnapshotStore
+from src.models.merge_models import MergeConfig
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage research document snapshots")
+    parser.add_argument(
+        "--research-dir",
+        default="research",
+        help="Directory containing research files (default: research)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="List stored versions")
+    list_parser.add_argument("--document", help="Only versions of this file name")
+
+    snapshot_parser = subparsers.add_parser("snapshot", help="Snapshot a research file")
+    snapshot_parser.add_argument("file", nargs="?", default="Fusion_Research.md")
+    snapshot_parser.add_argument("--label", default="manual snapshot")
+
+    diff_parser = subparsers.add_parser("diff", help="Compare two versions")
+    diff_parser.add_argument("old", type=int)
+    diff_parser.add_argument("new", type=int)
+    diff_parser.add_argument("--text", action="store_true", help="Show a unified diff")
+
+    restore_parser = subparsers.add_parser("restore", help="Restore a version")
+    restore_parser.add_argument("version", type=int)
+    restore_parser.add_argument(
+        "--output",
+        default=None,
+        help="File name to write (default: the version's original file name)",
+    )
+
+    prune_parser = subparsers.add_parser("prune", help="Keep only the newest versions")
+    prune_parser.add_argument("--keep", type=int, default=20)
+
+    args = parser.parse_args()
+    research_dir = Path(args.research_dir)
+    store = SnapshotStore(str(research_dir / MergeConfig().snapshot_dir))
+
+    if args.command == "list":
+        versions = store.list_versions(args.document)
+        if not versions:
+            print("No snapshots stored.")
+            return 0
+        print(f"{'Version':>8}  {'Created':19}  {'Size':>10}  {'Document':28}  Label")
+        for version in versions:
+            print(
+                f"{'v' + str(version.id):>8}  {version.created_at:19}  {version.size:>10,}  "
+                f"{version.document:28}  {version.label}"
+            )
+        print(f"\nStore size on disk: {store.disk_usage():,} bytes")
+
+    elif args.command == "snapshot":
+        path = research_dir / args.file
+        if not path.exists():
+            print(f"Error: File not found: {path}")
+            return 1
+        version = store.snapshot(path, label=args.label)
+        print(f"Stored {path.name} as v{version.id}")
+
+    elif args.command == "diff":
+        try:
+            if args.text:
+                print(store.diff_text(args.old, args.new) or "No differences.")
+            else:
+                diff = store.diff(args.old, args.new)
+                for label, names in (("+", diff.added), ("-", diff.removed), ("~", diff.changed)):
+                    for name in names:
+                        print(f"  {label} {name or '(preamble)'}")
+                if not diff.has_changes:
+                    print("No differences.")
+        except KeyError as e:
+            print(f"Error: {e}")
+            return 1
+
+    elif args.command == "restore":
+        try:
+            version = store.get_version(args.version)
+        except KeyError as e:
+            print(f"Error: {e}")
+            return 1
+        target = store.restore(version.id, research_dir / (args.output or version.document))
+        print(f"Restored v{version.id} to {target}")
+
+    elif args.command == "prune":
+        removed = store.prune(keep=args.keep)
+        print(f"Removed {removed} versions; store size {store.disk_usage():,} bytes")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
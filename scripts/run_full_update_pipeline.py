@@ -13,6 +13,7 @@ from src.data.database import get_database
 from src.services.markdown_merger_service import MarkdownMergerService, MergeConfig
 from src.services.database_sync_service import DatabaseSyncService, SyncConfig
 from src.llm.chain_factory import get_llm
+from src.llm.scheduler import configure_llm_scheduler
 
 
 def main():
@@ -65,6 +66,12 @@ def main():
         default="qwen3:8b",
         help="Ollama model to use (default: qwen3:8b)",
     )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=4,
+        help="LLM requests (merges, validations) sent at once (default: 4)",
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -95,7 +102,9 @@ def main():
     # Initialize LLM
     print("\nInitializing LLM...")
     try:
-        llm = get_llm(model=args.model)
+        # No interactive traffic in this process: batch work may use every slot
+        configure_llm_scheduler(args.max_concurrent)
+        llm = get_llm(model=args.model, priority="batch")
     except Exception as e:
         print(f"Error initializing LLM: {e}")
         print("Make sure Ollama is running: ollama serve")
@@ -120,7 +129,7 @@ def main():
 
         merger = MarkdownMergerService(
             llm=llm,
-            config=MergeConfig(),
+            config=MergeConfig(max_concurrent_merges=args.max_concurrent),
             research_dir=args.research_dir,
         )
 
@@ -153,6 +162,8 @@ def main():
             print(f"  Sections merged:   {merge_result.sections_merged}")
             print(f"  Companies added:   {merge_result.companies_added}")
             print(f"  Companies updated: {merge_result.companies_updated}")
+            if merge_result.snapshot_version is not None:
+                print(f"  Snapshot:          v{merge_result.snapshot_version}")
             if merge_result.backup_path:
                 print(f"  Backup:            {merge_result.backup_path}")
     else:
@@ -168,6 +179,7 @@ def main():
         sync_config = SyncConfig(
             auto_apply_threshold=args.auto_apply_threshold,
             dry_run=args.dry_run,
+            max_concurrent_validations=args.max_concurrent,
         )
 
         sync_service = DatabaseSyncService(
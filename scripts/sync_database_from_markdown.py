@@ -12,6 +12,7 @@ sys.path.insert(0, str(project_root))
 from src.data.database import get_database
 from src.services.database_sync_service import DatabaseSyncService, SyncConfig
 from src.llm.chain_factory import get_llm
+from src.llm.scheduler import configure_llm_scheduler
 
 
 def main():
@@ -31,7 +32,12 @@ def main():
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Preview changes without applying them",
+        help="Preview change counts per field without the LLM or applying them",
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="With --dry-run, also validate the changes with the LLM",
     )
     parser.add_argument(
         "--auto-apply-threshold",
@@ -56,6 +62,23 @@ def main():
         default=10,
         help="Number of companies to process per batch (default: 10)",
     )
+    parser.add_argument(
+        "--validation-batch-size",
+        type=int,
+        default=8,
+        help="Field changes validated per LLM prompt (default: 8)",
+    )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=4,
+        help="Validation prompts sent concurrently (default: 4)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only sync company blocks changed since the last successful sync",
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -90,29 +113,49 @@ def main():
         print(f"Error connecting to database: {e}")
         return 1
 
-    # Initialize LLM
-    print("Initializing LLM...")
-    try:
-        llm = get_llm(model=args.model)
-    except Exception as e:
-        print(f"Error initializing LLM: {e}")
-        print("Make sure Ollama is running: ollama serve")
-        return 1
-
     # Configure sync service
     config = SyncConfig(
         auto_apply_threshold=args.auto_apply_threshold,
         require_review_threshold=args.review_threshold,
         batch_size=args.batch_size,
         dry_run=args.dry_run,
+        incremental=args.incremental,
+        validation_batch_size=args.validation_batch_size,
+        max_concurrent_validations=args.max_concurrent,
     )
 
     sync_service = DatabaseSyncService(
         db=db,
-        llm=llm,
         config=config,
     )
 
+    # Fast preview: one vectorized diff of all matched companies, no LLM
+    if args.dry_run:
+        preview = sync_service.preview(args.markdown_file)
+        print("\n" + "=" * 60)
+        print("Preview")
+        print("=" * 60)
+        print(f"  Companies matched:      {preview.companies_matched}")
+        print(f"  New companies:          {preview.companies_new}")
+        if args.incremental:
+            print(f"  Companies unchanged:    {preview.companies_unchanged}")
+        print(f"  Field changes:          {preview.total_changes}")
+        for field_name, count in preview.changes_by_field.items():
+            print(f"    {field_name:22} {count}")
+        if not args.validate:
+            return 0
+
+    # Initialize LLM
+    print("Initializing LLM...")
+    try:
+        # No interactive traffic in this process: batch work may use every slot
+        configure_llm_scheduler(args.max_concurrent)
+        sync_service.llm = get_llm(model=args.model, priority="batch")
+    except Exception as e:
+        print(f"Error initializing LLM: {e}")
+        print("Make sure Ollama is running: ollama serve")
+        return 1
+
     # Perform sync
     print("\nSyncing database from markdown...")
     print("-" * 40)
@@ -126,10 +169,13 @@ def main():
     print(f"  Companies processed:    {result.companies_processed}")
     print(f"  Companies added:        {result.companies_added}")
     print(f"  Companies updated:      {result.companies_updated}")
+    if args.incremental:
+        print(f"  Companies unchanged:    {result.companies_unchanged}")
     print(f"  Fields updated:         {result.fields_updated}")
     print(f"  Proposals created:      {result.proposals_created}")
     print(f"  Auto-applied:           {result.proposals_auto_applied}")
     print(f"  Conflicts found:        {result.conflicts_found}")
+    print(f"  LLM requests:           {result.llm_requests}")
 
     if result.errors:
         print("\nErrors:")
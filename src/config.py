@@ -15,6 +15,8 @@ class Settings(BaseSettings):
     llm_model: str = Field(default="qwen3:8b", alias="LLM_MODEL")
     llm_temperature: float = Field(default=0.3, alias="LLM_TEMPERATURE")
     max_response_tokens: int = Field(default=2000, alias="MAX_RESPONSE_TOKENS")
+    llm_max_concurrency: int = Field(default=2, alias="LLM_MAX_CONCURRENCY")
+    llm_batch_concurrency: int = Field(default=1, alias="LLM_BATCH_CONCURRENCY")
 
     # Tavily Web Search
     tavily_api_key: Optional[str] = Field(default=None, alias="TAVILY_API_KEY")
@@ -23,6 +25,15 @@ class Settings(BaseSettings):
     database_path: str = Field(default="research/fusion_research.db", alias="DATABASE_PATH")
     chroma_db_path: str = Field(default="research/chroma_data", alias="CHROMA_DB_PATH")
     
+    # Vector search: "chroma" or the in-process "numpy" index; an Ollama
+    # embedding model or "hashing" for the offline hashing embedder
+    vector_backend: str = Field(default="chroma", alias="VECTOR_BACKEND")
+    embedding_model: str = Field(default="nomic-embed-text", alias="EMBEDDING_MODEL")
+    # NumPy index only: "int8" or "pq" codes with float re-scoring ("" = off),
+    # and the recall@k the re-scoring shortlist is calibrated for
+    vector_quantization: str = Field(default="", alias="VECTOR_QUANTIZATION")
+    vector_recall_target: float = Field(default=0.95, alias="VECTOR_RECALL_TARGET")
+    
     # News Scraping
     news_scrape_frequency: str = Field(default="weekly", alias="NEWS_SCRAPE_FREQUENCY")
     news_sources: str = Field(
@@ -30,6 +41,12 @@ class Settings(BaseSettings):
         alias="NEWS_SOURCES"
     )
     
+    # Background precompute of stored LLM analyses: SWOTs for the top-funded
+    # and recently changed companies (0 = off), comparisons among the top few
+    precompute_top_companies: int = Field(default=10, alias="PRECOMPUTE_TOP_COMPANIES")
+    precompute_changed_days: int = Field(default=7, alias="PRECOMPUTE_CHANGED_DAYS")
+    precompute_compare_top: int = Field(default=5, alias="PRECOMPUTE_COMPARE_TOP")
+    
     # Caching
     query_cache_ttl: int = Field(default=3600, alias="QUERY_CACHE_TTL")
     cache_max_size: int = Field(default=100, alias="CACHE_MAX_SIZE")
@@ -1,14 +1,24 @@
-"""Data layer for Fusion Research Platform."""
-
-from src.data.database import Database, get_database
-from src.data.repositories import (
-    CompanyRepository,
-    FundingRepository,
-    TechnologyRepository,
-    MarketRepository,
-    PartnershipRepository,
-)
-from src.data.vector_store import VectorStore, get_vector_store
+"""Data layer for Fusion Research Platform.
+
+Members are resolved lazily so that importing ``src.data.database`` (e.g. from
+``scripts/init_db.py``) does not load Chroma through the vector store.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+_LAZY_IMPORTS = {
+    "Database": "src.data.database",
+    "get_database": "src.data.database",
+    "CompanyRepository": "src.data.repositories",
+    "FundingRepository": "src.data.repositories",
+    "TechnologyRepository": "src.data.repositories",
+    "MarketRepository": "src.data.repositories",
+    "PartnershipRepository": "src.data.repositories",
+    "LexicalIndex": "src.data.lexical_index",
+    "VectorStore": "src.data.vector_store",
+    "get_vector_store": "src.data.vector_store",
+}
 
 __all__ = [
     "Database",
@@ -18,6 +28,34 @@ __all__ = [
     "TechnologyRepository",
     "MarketRepository",
     "PartnershipRepository",
+    "LexicalIndex",
     "VectorStore",
     "get_vector_store",
 ]
+
+
+def __getattr__(name: str):
+    """Import the providing module on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from src.data.database import Database, get_database
+    from src.data.repositories import (
+        CompanyRepository,
+        FundingRepository,
+        TechnologyRepository,
+        MarketRepository,
+        PartnershipRepository,
+    )
+    from src.data.lexical_index import LexicalIndex
+    from src.data.vector_store import VectorStore, get_vector_store
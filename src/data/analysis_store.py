@@ -0,0 +1,136 @@
+"""Stored LLM analyses keyed by a hash of their input data.
+
+SWOT analyses, company comparisons and AI market reports each take an
+Ollama call. Finished analyses are kept in the ``analyses`` table under
+their kind, a subject (company ids or the report focus) and the SHA-256 of
+the data the prompt is built from. An entry is only served while the hash
+still matches, so editing a company row or a funding round makes the stored
+analyses that depend on it stale without any explicit invalidation.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from src.data.database import Database
+
+if TYPE_CHECKING:
+    from src.models.company import Company
+
+SWOT = "swot"
+COMPARISON = "comparison"
+MARKET_REPORT = "market_report"
+
+# Company fields read by the SWOT and comparison prompts
+SWOT_FIELDS = (
+    "name", "company_type", "country", "founded_year", "technology_approach", "trl",
+    "total_funding_usd", "team_size", "key_investors", "description",
+)
+COMPARISON_FIELDS = (
+    "name", "company_type", "country", "technology_approach", "trl",
+    "total_funding_usd", "team_size",
+)
+
+
+def input_hash(inputs: dict) -> str:
+    """SHA-256 of JSON-serializable analysis inputs (key order does not matter)."""
+    payload = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _company_inputs(company: "Company", fields: tuple[str, ...]) -> dict:
+    """The given company fields as JSON-compatible values."""
+    return company.model_dump(mode="json", include=set(fields))
+
+
+@dataclass(frozen=True)
+class AnalysisKey:
+    """Identifies one stored analysis and the inputs it was generated from."""
+    kind: str
+    subject: str
+    input_hash: str
+
+
+@dataclass
+class StoredAnalysis:
+    """A stored analysis result (the raw LLM markdown)."""
+    kind: str
+    subject: str
+    input_hash: str
+    content: str
+    model: str
+    created_at: datetime
+
+
+def swot_key(company: "Company", market_context: str = "") -> AnalysisKey:
+    """Key of a company's SWOT analysis (one entry per market context)."""
+    subject = str(company.id)
+    if market_context:
+        subject += ":" + input_hash({"context": market_context})[:12]
+    inputs = {"company": _company_inputs(company, SWOT_FIELDS), "context": market_context}
+    return AnalysisKey(SWOT, subject, input_hash(inputs))
+
+
+def comparison_key(company_a: "Company", company_b: "Company") -> AnalysisKey:
+    """Key of a head-to-head comparison; the same for either order of the pair."""
+    pair = sorted((company_a, company_b), key=lambda company: company.id)
+    inputs = {"companies": [_company_inputs(company, COMPARISON_FIELDS) for company in pair]}
+    return AnalysisKey(COMPARISON, f"{pair[0].id}:{pair[1].id}", input_hash(inputs))
+
+
+def market_report_key(market_data: str, focus_area: str = "general") -> AnalysisKey:
+    """Key of an AI market report over the summarized market data."""
+    inputs = {"market_data": market_data, "focus": focus_area}
+    return AnalysisKey(MARKET_REPORT, focus_area, input_hash(inputs))
+
+
+class AnalysisStore:
+    """Reads and writes stored analyses in the ``analyses`` table."""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    def get(self, key: AnalysisKey) -> Optional[StoredAnalysis]:
+        """The stored analysis for a key, or None when missing or stale."""
+        row = self.db.execute(
+            "SELECT * FROM analyses WHERE kind = ? AND subject = ? AND input_hash = ?",
+            (key.kind, key.subject, key.input_hash),
+        ).fetchone()
+        if row is None:
+            return None
+        return StoredAnalysis(
+            kind=row["kind"],
+            subject=row["subject"],
+            input_hash=row["input_hash"],
+            content=row["content"],
+            model=row["model"] or "",
+            created_at=datetime.fromisoformat(row["created_at"]),
+        )
+
+    def is_fresh(self, key: AnalysisKey) -> bool:
+        """Whether an up-to-date analysis is stored for a key."""
+        row = self.db.execute(
+            "SELECT 1 FROM analyses WHERE kind = ? AND subject = ? AND input_hash = ?",
+            (key.kind, key.subject, key.input_hash),
+        ).fetchone()
+        return row is not None
+
+    def save(self, key: AnalysisKey, content: str, model: str = ""):
+        """Store an analysis, replacing any earlier one for the same subject."""
+        self.db.execute(
+            """INSERT OR REPLACE INTO analyses
+               (kind, subject, input_hash, content, model, created_at)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (key.kind, key.subject, key.input_hash, content, model, datetime.now().isoformat()),
+        )
+        self.db.commit()
+
+    def count(self, kind: Optional[str] = None) -> int:
+        """Number of stored analyses (fresh or stale), optionally of one kind."""
+        if kind:
+            row = self.db.execute("SELECT COUNT(*) FROM analyses WHERE kind = ?", (kind,))
+        else:
+            row = self.db.execute("SELECT COUNT(*) FROM analyses")
+        return row.fetchone()[0]
@@ -0,0 +1,187 @@
+"""Company-to-company similarity from stored embeddings.
+
+"Companies like X" is answered by comparing X's stored document vector
+with every other company vector instead of embedding a prose query, so a
+lookup costs no embedding call and finds companies that resemble X rather
+than texts that mention it.
+
+All company vectors are loaded once, normalized, and the ``neighbours``
+most similar companies of every company are computed in row blocks
+(``block_size`` × N cosine products at a time, so memory stays bounded for
+large sets). The resulting neighbour table is cached until the vector
+store reports that company vectors changed.
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Hashable, Optional
+
+import numpy as np
+
+from src.data.name_index import normalize_name
+
+if TYPE_CHECKING:
+    from src.data.vector_store import VectorStore
+
+# Neighbours kept per company; larger requests recompute the table
+NEIGHBOURS_CACHED = 20
+BLOCK_SIZE = 1024
+
+
+@dataclass
+class SimilarCompany:
+    """A neighbouring company and its cosine similarity."""
+    company_id: int
+    name: str
+    similarity: float
+    metadata: dict = field(default_factory=dict)
+    content: str = ""
+
+
+def top_k_neighbours(
+    vectors: np.ndarray,
+    k: int,
+    block_size: int = BLOCK_SIZE,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cosine top-k neighbours of every row, excluding the row itself.
+
+    Args:
+        vectors: ``(n, d)`` matrix, one embedding per row
+        k: Neighbours per row (capped at ``n - 1``)
+        block_size: Rows multiplied against the full matrix at once
+
+    Returns:
+        ``(indices, scores)``, both ``(n, k)`` and ordered best first
+    """
+    n = len(vectors)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.empty((n, 0), dtype=np.int64), np.empty((n, 0), dtype=np.float32)
+
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix = matrix / np.where(norms > 0, norms, 1.0)
+
+    indices = np.empty((n, k), dtype=np.int64)
+    scores = np.empty((n, k), dtype=np.float32)
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        block = matrix[start:stop] @ matrix.T
+        rows = np.arange(stop - start)
+        block[rows, rows + start] = -np.inf
+        top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(block, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        indices[start:stop] = np.take_along_axis(top, order, axis=1)
+        scores[start:stop] = np.take_along_axis(top_scores, order, axis=1)
+    return indices, scores
+
+
+class CompanySimilarity:
+    """Cached nearest-neighbour table over the company vectors of a vector store."""
+
+    def __init__(
+        self,
+        vector_store: "VectorStore",
+        neighbours: int = NEIGHBOURS_CACHED,
+        block_size: int = BLOCK_SIZE,
+    ):
+        """
+        Initialize similarity index.
+
+        Args:
+            vector_store: Store holding the company documents and embeddings
+            neighbours: Neighbours precomputed per company
+            block_size: Rows per matrix product when computing the table
+        """
+        self.vector_store = vector_store
+        self.neighbours = neighbours
+        self.block_size = block_size
+        self._version: Optional[Hashable] = None
+        self._company_ids: list[int] = []
+        self._metadatas: list[dict] = []
+        self._contents: list[str] = []
+        self._positions: dict[int, int] = {}
+        self._names: dict[str, int] = {}
+        self._indices = np.empty((0, 0), dtype=np.int64)
+        self._scores = np.empty((0, 0), dtype=np.float32)
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Reload vectors and recompute the neighbour table if company vectors changed.
+
+        Returns:
+            True if the table was recomputed
+        """
+        version = self.vector_store.company_vectors_version
+        if not force and version == self._version:
+            return False
+
+        stored = self.vector_store.get_company_vectors()
+        self._company_ids = [metadata["company_id"] for metadata in stored["metadatas"]]
+        self._metadatas = list(stored["metadatas"])
+        self._contents = list(stored["documents"])
+        self._positions = {company_id: i for i, company_id in enumerate(self._company_ids)}
+        self._names = {
+            normalize_name(metadata.get("name", "")): metadata["company_id"]
+            for metadata in self._metadatas
+        }
+        vectors = stored["embeddings"]
+        if len(self._company_ids):
+            self._indices, self._scores = top_k_neighbours(
+                np.asarray(vectors), self.neighbours, self.block_size
+            )
+        else:
+            self._indices = np.empty((0, 0), dtype=np.int64)
+            self._scores = np.empty((0, 0), dtype=np.float32)
+        self._version = version
+        return True
+
+    def find_company_id(self, name: str) -> Optional[int]:
+        """Id of the stored company with this name (case and legal form ignored)."""
+        self.refresh()
+        return self._names.get(normalize_name(name))
+
+    def similar(self, company_id: int, k: int = 5) -> list[SimilarCompany]:
+        """
+        Companies most similar to ``company_id``, best first.
+
+        Returns an empty list when the company has no stored vector.
+        """
+        self._ensure_neighbours(k)
+        position = self._positions.get(company_id)
+        if position is None:
+            return []
+        return [
+            self._neighbour(int(index), float(score))
+            for index, score in zip(self._indices[position, :k], self._scores[position, :k])
+        ]
+
+    def all_pairs(self, k: int = 5) -> dict[int, list[SimilarCompany]]:
+        """Top-``k`` similar companies for every stored company."""
+        self._ensure_neighbours(k)
+        return {
+            company_id: [
+                self._neighbour(int(index), float(score))
+                for index, score in zip(self._indices[i, :k], self._scores[i, :k])
+            ]
+            for i, company_id in enumerate(self._company_ids)
+        }
+
+    def _ensure_neighbours(self, k: int):
+        """Refresh the table, widening it when more neighbours are requested."""
+        if k > self.neighbours:
+            self.neighbours = k
+            self.refresh(force=True)
+        else:
+            self.refresh()
+
+    def _neighbour(self, index: int, score: float) -> SimilarCompany:
+        metadata = self._metadatas[index]
+        return SimilarCompany(
+            company_id=self._company_ids[index],
+            name=metadata.get("name", ""),
+            similarity=score,
+            metadata=metadata,
+            content=self._contents[index] or "",
+        )
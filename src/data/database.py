@@ -13,6 +13,7 @@ class Database:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._connection: Optional[sqlite3.Connection] = None
+        self._change_counter = 0
     
     @property
     def connection(self) -> sqlite3.Connection:
@@ -48,6 +49,19 @@ class Database:
         """Commit current transaction."""
         self.connection.commit()
     
+    def mark_changed(self):
+        """Record a data write so cached query results are invalidated."""
+        self._change_counter += 1
+
+    def change_token(self) -> tuple[int, int]:
+        """Get a token that changes whenever the database content changes.
+
+        Combines the in-process write counter with SQLite's ``data_version``,
+        which advances when another connection (e.g. a CLI script) commits.
+        """
+        data_version = self.connection.execute("PRAGMA data_version").fetchone()[0]
+        return (self._change_counter, data_version)
+
     def close(self):
         """Close database connection."""
         if self._connection:
@@ -257,6 +271,35 @@ class Database:
             FOREIGN KEY (proposal_id) REFERENCES update_proposals(id)
         );
 
+        -- Background jobs table (long-running operations)
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            params TEXT,
+            status TEXT DEFAULT 'pending',
+            progress_done INTEGER DEFAULT 0,
+            progress_total INTEGER DEFAULT 0,
+            message TEXT,
+            checkpoint TEXT,
+            result TEXT,
+            error TEXT,
+            cancel_requested INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            started_at TIMESTAMP,
+            finished_at TIMESTAMP
+        );
+
+        -- Stored LLM analyses (SWOTs, comparisons, market reports)
+        CREATE TABLE IF NOT EXISTS analyses (
+            kind TEXT NOT NULL,
+            subject TEXT NOT NULL,
+            input_hash TEXT NOT NULL,
+            content TEXT NOT NULL,
+            model TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (kind, subject)
+        );
+
         -- Create indexes for common queries
         CREATE INDEX IF NOT EXISTS idx_companies_country ON companies(country);
         CREATE INDEX IF NOT EXISTS idx_companies_technology ON companies(technology_approach);
@@ -270,6 +313,7 @@ class Database:
         CREATE INDEX IF NOT EXISTS idx_proposals_status ON update_proposals(status);
         CREATE INDEX IF NOT EXISTS idx_proposals_entity ON update_proposals(entity_type, entity_id);
         CREATE INDEX IF NOT EXISTS idx_audit_entity ON audit_log(entity_type, entity_id);
+        CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
         """
         
         self.connection.executescript(schema_sql)
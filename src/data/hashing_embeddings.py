@@ -0,0 +1,57 @@
+"""Deterministic, dependency-free text embeddings by feature hashing.
+
+Each word and word bigram of a text (tokenized like the keyword index) is
+hashed into one of ``dimensions`` buckets with a hash-derived sign, weighted
+by ``1 + log(tf)``, and the vector is L2-normalized. The same text always
+yields the same vector on every machine, no model server is needed, and
+cosine similarity reflects shared vocabulary. It is a stand-in for a real
+embedding model in tests and air-gapped deployments, not a replacement
+for one: paraphrases without shared words do not match.
+"""
+
+import hashlib
+import math
+from collections import Counter
+
+from src.data.lexical_index import tokenize
+
+DEFAULT_DIMENSIONS = 384
+
+# Model name that selects this embedder in ``VectorStore``
+HASHING_MODEL = "hashing"
+
+
+class HashingEmbeddings:
+    """Embedder with the ``embed_documents``/``embed_query`` interface of LangChain."""
+
+    def __init__(self, dimensions: int = DEFAULT_DIMENSIONS):
+        """
+        Initialize embedder.
+
+        Args:
+            dimensions: Vector size (more buckets mean fewer collisions)
+        """
+        self.dimensions = dimensions
+
+    def _bucket(self, feature: str) -> tuple[int, float]:
+        """Bucket index and sign of a feature."""
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        return value % self.dimensions, 1.0 if value >> 63 else -1.0
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed one text."""
+        tokens = tokenize(text)
+        features = Counter(tokens)
+        features.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+
+        vector = [0.0] * self.dimensions
+        for feature, count in features.items():
+            index, sign = self._bucket(feature)
+            vector[index] += sign * (1.0 + math.log(count))
+        norm = math.sqrt(sum(value * value for value in vector))
+        return [value / norm for value in vector] if norm else vector
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed several texts."""
+        return [self.embed_query(text) for text in texts]
@@ -0,0 +1,220 @@
+"""BM25 keyword index and reciprocal rank fusion for hybrid retrieval.
+
+Embedding similarity is good at paraphrases but weak at exact names,
+acronyms (HTS, FRC, ICF) and numbers. ``LexicalIndex`` scores the same
+documents with Okapi BM25 so those hits rank first, and
+``reciprocal_rank_fusion`` merges the keyword and vector rankings without
+having to calibrate their scores against each other.
+
+Documents are any objects with ``page_content`` and ``metadata`` attributes
+(e.g. LangChain ``Document``); an ``id`` attribute, when set, identifies the
+document across rankings.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Any, Hashable, Iterable, Optional
+
+from src.data.search_filters import metadata_matches
+
+# Constant from the original RRF paper; dampens the weight of top ranks
+RRF_K = 60
+
+# A lexical hit is trusted without vector search when the query has at most
+# this many terms, the top document contains all of them and it outscores the
+# runner-up by the margin
+CONFIDENT_MAX_TERMS = 4
+CONFIDENCE_MARGIN = 1.5
+
+# Words carrying no meaning for keyword matching (English and German)
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "compare", "does", "for", "from", "how",
+    "in", "is", "it", "of", "on", "or", "the", "to", "vs", "was", "what", "which", "who",
+    "with", "der", "die", "das", "und", "ist", "ein", "eine", "mit", "von", "für", "wie",
+    "welche", "wer",
+})
+
+# Words, plus numbers with decimal or thousands separators ("2.5", "385,000,000")
+_TOKEN = re.compile(r"\w+(?:[.,]\d+)*")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_WORD_PIECE = re.compile(r"\w+|[^\w\s]")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word and number tokens of ``text``, without stopwords."""
+    return [
+        token.replace(",", "")
+        for token in _TOKEN.findall(text.lower())
+        if token not in STOPWORDS
+    ]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Fast token count estimate for local models.
+
+    One token per word or punctuation mark plus one per further six
+    characters of a word, roughly how BPE tokenizers split long or
+    compound (German) words.
+    """
+    return sum(1 + len(piece) // 6 for piece in _WORD_PIECE.findall(text))
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences; the last sentence of each line ends with a newline."""
+    sentences = []
+    for line in text.splitlines():
+        parts = [part.strip() for part in _SENTENCE_END.split(line) if part.strip()]
+        if parts:
+            parts[-1] += "\n"
+            sentences.extend(parts)
+    return sentences
+
+
+def join_sentences(sentences: list[str]) -> str:
+    """Inverse of ``split_sentences`` (up to whitespace)."""
+    return "".join(s if s.endswith("\n") else s + " " for s in sentences).strip()
+
+
+def document_key(document: Any) -> Hashable:
+    """Identity of a document across rankings: its id, else its content."""
+    return getattr(document, "id", None) or document.page_content
+
+
+def reciprocal_rank_fusion(
+    rankings: Iterable[list[Any]],
+    k: int = RRF_K,
+) -> list[tuple[Any, float]]:
+    """
+    Merge ranked document lists by reciprocal rank fusion.
+
+    Each document scores ``sum(1 / (k + rank))`` over the lists it appears
+    in (ranks start at 1).
+
+    Returns:
+        ``(document, fused score)`` pairs, best first
+    """
+    scores: dict[Hashable, float] = {}
+    documents: dict[Hashable, Any] = {}
+    for ranking in rankings:
+        for rank, document in enumerate(ranking, 1):
+            key = document_key(document)
+            documents.setdefault(key, document)
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    ordered = sorted(scores, key=scores.get, reverse=True)
+    return [(documents[key], scores[key]) for key in ordered]
+
+
+class LexicalIndex:
+    """In-memory Okapi BM25 index over documents."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize index.
+
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization (0 = none, 1 = full)
+        """
+        self.k1 = k1
+        self.b = b
+        self._documents: list[Any] = []
+        self._term_counts: list[Counter] = []
+        self._lengths: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+        self._total_length = 0
+
+    @classmethod
+    def build(cls, documents: Iterable[Any], **kwargs) -> "LexicalIndex":
+        """Create an index holding ``documents``."""
+        index = cls(**kwargs)
+        for document in documents:
+            index.add(document)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, document: Any):
+        """Index a document."""
+        position = len(self._documents)
+        counts = Counter(tokenize(document.page_content))
+        self._documents.append(document)
+        self._term_counts.append(counts)
+        length = sum(counts.values())
+        self._lengths.append(length)
+        self._total_length += length
+        for term in counts:
+            self._postings.setdefault(term, []).append(position)
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency (never negative)."""
+        frequency = len(self._postings.get(term, ()))
+        total = len(self._documents)
+        return math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+
+    def search(
+        self,
+        query: str,
+        k: int = 5,
+        filter_type: Optional[str] = None,
+        where: Optional[dict] = None,
+    ) -> list[tuple[Any, float]]:
+        """
+        Rank documents containing any query term by BM25.
+
+        Args:
+            query: Search text
+            k: Maximum number of results
+            filter_type: Only return documents with this ``metadata["type"]``
+            where: Only return documents whose metadata matches this
+                Chroma-style clause
+
+        Returns:
+            ``(document, score)`` pairs, best first
+        """
+        terms = set(tokenize(query))
+        if not terms or not self._documents:
+            return []
+        average_length = self._total_length / len(self._documents) or 1.0
+
+        scores: dict[int, float] = {}
+        allowed: dict[int, bool] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term)
+            for position in postings:
+                if filter_type and self._documents[position].metadata.get("type") != filter_type:
+                    continue
+                if where:
+                    if position not in allowed:
+                        metadata = self._documents[position].metadata
+                        allowed[position] = metadata_matches(metadata, where)
+                    if not allowed[position]:
+                        continue
+                tf = self._term_counts[position][term]
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[position] / average_length)
+                weight = idf * tf * (self.k1 + 1) / (tf + norm)
+                scores[position] = scores.get(position, 0.0) + weight
+
+        best = sorted(scores, key=scores.get, reverse=True)[:k]
+        return [(self._documents[position], scores[position]) for position in best]
+
+    def is_confident(self, query: str, hits: list[tuple[Any, float]]) -> bool:
+        """
+        Whether the top hit for a short query is an unambiguous keyword match.
+
+        True when the query has at most ``CONFIDENT_MAX_TERMS`` terms, the top
+        document contains every one of them, and its score is at least
+        ``CONFIDENCE_MARGIN`` times that of the runner-up.
+        """
+        terms = set(tokenize(query))
+        if not hits or not terms or len(terms) > CONFIDENT_MAX_TERMS:
+            return False
+        top_document, top_score = hits[0]
+        if not terms <= set(tokenize(top_document.page_content)):
+            return False
+        return len(hits) == 1 or top_score >= CONFIDENCE_MARGIN * hits[1][1]
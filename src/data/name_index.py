@@ -0,0 +1,219 @@
+"""Name-resolution index for matching company and investor names.
+
+Lookups go from cheapest to most expensive:
+
+1. exact name
+2. normalized key (case, punctuation and legal suffixes such as GmbH/Inc removed)
+3. character-trigram candidates scored by Dice similarity; a name contained
+   in another counts as a full match. Names whose numbers differ ("Fusion
+   Company 12" vs "Fusion Company 13") never match
+4. an optional, cached tie-breaker (e.g. the LLM) that confirms every
+   trigram-only match and decides between several candidates scoring within
+   ``ambiguity_margin`` of the best one; a single containment match is
+   accepted without it
+
+Candidates come from the postings of the query's rarest trigrams only, so
+resolving N names against an index of M entries stays close to O(N + M)
+rather than O(N × M).
+"""
+
+import math
+import re
+from typing import Callable, Generic, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+LEGAL_SUFFIXES = frozenset({
+    "gmbh", "inc", "ltd", "ag", "corp", "llc", "co", "kg", "se", "sa", "plc", "limited",
+})
+
+_TOKEN = re.compile(r"\w+")
+_NUMBER = re.compile(r"\d+")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase a name, drop punctuation and legal-form suffixes."""
+    tokens = _TOKEN.findall(name.lower())
+    kept = [token for token in tokens if token not in LEGAL_SUFFIXES]
+    return " ".join(kept or tokens)
+
+
+def trigrams(key: str) -> set[str]:
+    """Character trigrams of a normalized key."""
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+
+def numbers(key: str) -> frozenset[str]:
+    """Numeric tokens of a normalized key (leading zeros dropped)."""
+    return frozenset(number.lstrip("0") or "0" for number in _NUMBER.findall(key))
+
+
+class NameIndex(Generic[T]):
+    """Index of names to values with exact, normalized and fuzzy lookup."""
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        ambiguity_margin: float = 0.05,
+        tie_breaker: Optional[Callable[[str, str], Optional[bool]]] = None,
+        containment: bool = True,
+    ):
+        """
+        Initialize index.
+
+        Args:
+            threshold: Minimum similarity (0-1) for a fuzzy match
+            ambiguity_margin: Candidates within this score of the best one are
+                ambiguous and go to the tie-breaker
+            tie_breaker: ``(query, candidate) -> bool`` deciding whether two
+                names are the same entity, asked for trigram-only and
+                ambiguous matches; ``None`` results (e.g. the LLM is
+                unavailable) fall back to the best-scored candidate
+            containment: Treat a name contained in another ("TAE" in
+                "TAE Technologies") as a full match
+        """
+        self.threshold = threshold
+        self.ambiguity_margin = ambiguity_margin
+        self.tie_breaker = tie_breaker
+        self.containment = containment
+        self._by_name: dict[str, T] = {}
+        self._by_key: dict[str, T] = {}
+        self._key_names: dict[str, str] = {}
+        self._key_order: dict[str, int] = {}
+        self._key_trigrams: dict[str, set[str]] = {}
+        self._key_numbers: dict[str, frozenset[str]] = {}
+        self._postings: dict[str, list[str]] = {}
+        self._tie_cache: dict[tuple[str, str], Optional[bool]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        items: Iterable[tuple[str, T]],
+        **kwargs,
+    ) -> "NameIndex[T]":
+        """Create an index from ``(name, value)`` pairs."""
+        index = cls(**kwargs)
+        for name, value in items:
+            index.add(name, value)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def __contains__(self, name: str) -> bool:
+        return self.exact(name) is not None
+
+    def add(self, name: str, value: T):
+        """Add a name; the first value added for a normalized key wins."""
+        self._by_name.setdefault(name, value)
+        key = normalize_name(name)
+        if not key or key in self._by_key:
+            return
+        self._by_key[key] = value
+        self._key_names[key] = name
+        self._key_order[key] = len(self._key_order)
+        grams = trigrams(key)
+        self._key_trigrams[key] = grams
+        self._key_numbers[key] = numbers(key)
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(key)
+
+    def exact(self, name: str) -> Optional[T]:
+        """Exact or normalized-key lookup."""
+        if name in self._by_name:
+            return self._by_name[name]
+        return self._by_key.get(normalize_name(name))
+
+    def candidates(self, name: str, limit: int = 5) -> list[tuple[str, T, float]]:
+        """
+        Score indexed names similar to ``name``.
+
+        Only the query's rarest trigrams are probed: a name reaching the
+        threshold must share at least one of them (prefix filtering).
+
+        Returns:
+            ``(indexed name, value, score)`` for scores above the threshold,
+            best first (ties keep insertion order)
+        """
+        return [
+            (self._key_names[candidate], self._by_key[candidate], score)
+            for candidate, score, _ in self._scored(name, limit)
+        ]
+
+    def _scored(self, name: str, limit: int = 5) -> list[tuple[str, float, bool]]:
+        """``(indexed key, score, contained)`` for candidates above the threshold."""
+        key = normalize_name(name)
+        key_numbers = numbers(key)
+        scores: dict[str, float] = {}
+        contained: set[str] = set()
+
+        # Indexed names made of whole words of the query ("TAE" in "TAE Technologies")
+        if self.containment:
+            words = key.split()
+            for start in range(len(words)):
+                for end in range(start + 1, len(words) + 1):
+                    phrase = " ".join(words[start:end])
+                    if (
+                        phrase != key
+                        and phrase in self._by_key
+                        and self._key_numbers[phrase] == key_numbers
+                    ):
+                        scores[phrase] = 1.0
+                        contained.add(phrase)
+
+        grams = trigrams(key)
+        if grams:
+            # Dice >= t needs an overlap of at least t * |grams| / (2 - t)
+            min_overlap = max(1, math.ceil(self.threshold * len(grams) / (2 - self.threshold)))
+            by_rarity = sorted(grams, key=lambda gram: len(self._postings.get(gram, ())))
+            probe = set()
+            for gram in by_rarity[:len(grams) - min_overlap + 1]:
+                probe.update(self._postings.get(gram, ()))
+
+            for candidate in probe:
+                if candidate in scores or self._key_numbers[candidate] != key_numbers:
+                    continue
+                if self.containment and key in candidate:
+                    score = 1.0
+                    contained.add(candidate)
+                else:
+                    overlap = len(grams & self._key_trigrams[candidate])
+                    score = 2 * overlap / (len(grams) + len(self._key_trigrams[candidate]))
+                if score >= self.threshold:
+                    scores[candidate] = score
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self._key_order[item[0]]))
+        return [
+            (candidate, score, candidate in contained) for candidate, score in ranked[:limit]
+        ]
+
+    def resolve(self, name: str) -> Optional[T]:
+        """Find the value for ``name``, or None if nothing matches."""
+        value = self.exact(name)
+        if value is not None:
+            return value
+
+        found = self._scored(name)
+        if not found:
+            return None
+
+        best_key, best_score, best_contained = found[0]
+        ambiguous = [c for c in found if best_score - c[1] <= self.ambiguity_margin]
+        if self.tie_breaker is None or (len(ambiguous) == 1 and best_contained):
+            return self._by_key[best_key]
+
+        # A high trigram score alone does not make near-identical names the same entity
+        undecided = False
+        for candidate, _, _ in ambiguous:
+            decision = self._break_tie(name, self._key_names[candidate])
+            if decision:
+                return self._by_key[candidate]
+            undecided = undecided or decision is None
+        return self._by_key[best_key] if undecided else None
+
+    def _break_tie(self, name: str, candidate_name: str) -> Optional[bool]:
+        """Ask the tie-breaker once per normalized name pair."""
+        pair = (normalize_name(name), normalize_name(candidate_name))
+        if pair not in self._tie_cache:
+            self._tie_cache[pair] = self.tie_breaker(name, candidate_name)
+        return self._tie_cache[pair]
@@ -1,6 +1,8 @@
 """Markdown parser for Fusion_Research.md document."""
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, field
@@ -23,6 +25,72 @@ class ParsedData:
     raw_sections: dict[str, str] = field(default_factory=dict)
 
 
+@dataclass
+class CompanyBlock:
+    """A ``#### Name (Location)`` block found while scanning the document."""
+    name: str
+    location: str
+    content: str
+    line: int  # 0-based line of the heading
+
+
+# Line classifiers used by the single scanning pass
+_COMPANY_HEADING = re.compile(r"^####\s+(.+?)\s*\((.+?)\)\s*$")
+_BLOCK_END = re.compile(r"(?:####|###)(?:\s|$)")
+
+# Field extractors, compiled once (funding patterns carry their USD multiplier)
+_FUNDING_PATTERNS = [
+    (
+        re.compile(r"(?:USD|EUR)\s*([\d.,]+)\s*(?:Mrd\.?|Billion|B)", re.IGNORECASE),
+        1_000_000_000,
+    ),
+    (re.compile(r"(?:USD|EUR)\s*([\d.,]+)\s*(?:M|Million|Mio\.?)", re.IGNORECASE), 1_000_000),
+    (re.compile(r"Gesamt\s*(?:USD|EUR)\s*([\d.,]+)\s*(?:M|Mio\.?)", re.IGNORECASE), 1_000_000),
+    (
+        # Scaled as billions regardless of unit, matching the original pattern-name check
+        re.compile(
+            r"Finanzierung[:\s]+(?:USD|EUR)\s*([\d.,]+)\s*(?:M|Mio\.?|Mrd\.?)", re.IGNORECASE
+        ),
+        1_000_000_000,
+    ),
+]
+_TRL_PATTERNS = [
+    re.compile(r"TRL\s*(\d)", re.IGNORECASE),
+    re.compile(r"TRL\s*(\d)-\d", re.IGNORECASE),
+]
+_TEAM_SIZE_PATTERNS = [
+    re.compile(r"(\d+)\+?\s*(?:Mitarbeiter|employees|Team)", re.IGNORECASE),
+    re.compile(r"Team[:\s]+(\d+)", re.IGNORECASE),
+]
+_FOUNDED_YEAR_PATTERNS = [
+    re.compile(r"gegründet\s*(?:~)?(\d{4})", re.IGNORECASE),
+    re.compile(r"founded\s*(?:~)?(\d{4})", re.IGNORECASE),
+    re.compile(r"\((\d{4})\)", re.IGNORECASE),
+    re.compile(r"Spin-out\s*\((\d{4})\)", re.IGNORECASE),
+]
+_INVESTOR_PATTERNS = [
+    re.compile(r"Investoren[:\s]+(.+?)(?:\n|$)", re.IGNORECASE),
+    re.compile(r"Investors[:\s]+(.+?)(?:\n|$)", re.IGNORECASE),
+]
+_PROFILE_PATTERN = re.compile(r"\*\*Profil:\*\*\s*(.+?)(?:\n\n|\n-|\n\*\*)", re.DOTALL)
+
+# Parallel extraction: below this many blocks process start-up costs more than it saves
+PARALLEL_MIN_BLOCKS = 500
+PARALLEL_CHUNKS_PER_WORKER = 4
+
+
+def _parse_block_chunk(blocks: list[CompanyBlock]) -> list[Optional[Company]]:
+    """Extract a chunk of company blocks (runs in a worker process).
+
+    Ids are reassigned by the caller in document order.
+    """
+    parser = MarkdownParser("")
+    return [
+        parser._parse_company_block(block.name, block.location, block.content)
+        for block in blocks
+    ]
+
+
 class MarkdownParser:
     """Parser for Fusion_Research.md document."""
     
@@ -70,85 +138,144 @@ class MarkdownParser:
         "grant": FundingStage.GRANT,
     }
     
-    def __init__(self, content: str):
+    def __init__(self, content: str, parallel: bool = False, max_workers: Optional[int] = None):
+        """
+        Initialize parser.
+        
+        Args:
+            content: Markdown document text
+            parallel: Extract company blocks across a process pool; documents
+                with fewer than PARALLEL_MIN_BLOCKS blocks are parsed serially
+            max_workers: Worker processes for parallel mode (default: CPU count)
+        """
         self.content = content
         self.lines = content.split("\n")
         self.parsed_data = ParsedData()
+        self.company_blocks: list[CompanyBlock] = []
         self._company_id_counter = 0
+        self.parallel = parallel
+        self.max_workers = max_workers
     
     def parse(self) -> ParsedData:
         """Parse the entire document."""
-        self._extract_sections()
+        self._scan()
         self._parse_companies()
         self._parse_markets()
         return self.parsed_data
     
-    def _extract_sections(self):
-        """Extract major sections from the document."""
-        current_section = ""
-        current_content = []
+    def _scan(self):
+        """Collect ``##`` sections and ``####`` company blocks in one pass over the lines.
+        
+        A section runs until the next ``## `` line; a company block runs until
+        the next ``###`` or ``####`` heading.
+        """
+        lines = self.lines
+        section_name = ""
+        section_start = 0
+        open_block: Optional[tuple[str, str, int]] = None
         
-        for line in self.lines:
+        for index, line in enumerate(lines):
+            if not line.startswith("#"):
+                continue
+            
             if line.startswith("## "):
-                if current_section:
-                    self.parsed_data.raw_sections[current_section] = "\n".join(current_content)
-                current_section = line[3:].strip()
-                current_content = []
-            else:
-                current_content.append(line)
+                if section_name:
+                    self._add_section(section_name, section_start, index)
+                section_name = line[3:].strip()
+                section_start = index + 1
+                continue
+            
+            if _BLOCK_END.match(line):
+                if open_block:
+                    self._add_company_block(*open_block, index)
+                    open_block = None
+                match = _COMPANY_HEADING.match(line)
+                if match:
+                    open_block = (match.group(1).strip(), match.group(2).strip(), index)
         
-        if current_section:
-            self.parsed_data.raw_sections[current_section] = "\n".join(current_content)
+        if section_name:
+            self._add_section(section_name, section_start, len(lines))
+        if open_block:
+            self._add_company_block(*open_block, len(lines))
+    
+    def _add_section(self, name: str, start: int, end: int):
+        """Record the raw text of a section."""
+        self.parsed_data.raw_sections[name] = "\n".join(self.lines[start:end])
+    
+    def _add_company_block(self, name: str, location: str, heading_line: int, end: int):
+        """Record a company block spanning the lines after its heading."""
+        content = "\n" + "\n".join(self.lines[heading_line + 1:end])
+        self.company_blocks.append(CompanyBlock(name, location, content, heading_line))
     
     def _parse_companies(self):
-        """Parse company profiles from the document."""
-        # Find company sections (#### headers)
-        company_pattern = re.compile(r"^####\s+(.+?)\s*\((.+?)\)\s*$", re.MULTILINE)
+        """Parse company profiles from the scanned company blocks."""
+        workers = self._worker_count()
+        if workers > 1:
+            try:
+                self._parse_companies_parallel(workers)
+                return
+            except Exception as e:
+                print(f"Parallel parsing failed, falling back to serial: {e}")
+                self.parsed_data.companies.clear()
+                self._company_id_counter = 0
         
-        for match in company_pattern.finditer(self.content):
-            company_name = match.group(1).strip()
-            location = match.group(2).strip()
-            
-            # Get the content after this header until the next #### or ###
-            start_pos = match.end()
-            next_header = re.search(r"\n(?:####|###)\s+", self.content[start_pos:])
-            if next_header:
-                end_pos = start_pos + next_header.start()
-            else:
-                end_pos = len(self.content)
-            
-            company_content = self.content[start_pos:end_pos]
-            
-            company = self._parse_company_block(company_name, location, company_content)
+        for block in self.company_blocks:
+            company = self._parse_company_block(block.name, block.location, block.content)
             if company:
                 self.parsed_data.companies.append(company)
     
+    def _worker_count(self) -> int:
+        """Number of worker processes to use (1 means serial)."""
+        if not self.parallel or len(self.company_blocks) < PARALLEL_MIN_BLOCKS:
+            return 1
+        return max(1, self.max_workers or os.cpu_count() or 1)
+    
+    def _parse_companies_parallel(self, workers: int):
+        """Extract company blocks in chunks across a process pool, keeping document order."""
+        blocks = self.company_blocks
+        chunk_count = workers * PARALLEL_CHUNKS_PER_WORKER
+        chunk_size = -(-len(blocks) // chunk_count)
+        chunks = [blocks[i:i + chunk_size] for i in range(0, len(blocks), chunk_size)]
+        
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            results = list(executor.map(_parse_block_chunk, chunks))
+        
+        # Same ids as a serial parse: one per block, in document order
+        for chunk_companies in results:
+            for company in chunk_companies:
+                self._company_id_counter += 1
+                if company:
+                    company.id = self._company_id_counter
+                    self.parsed_data.companies.append(company)
+    
     def _parse_company_block(self, name: str, location: str, content: str) -> Optional[Company]:
         """Parse a single company block."""
         self._company_id_counter += 1
+        location_lower = location.lower()
+        content_lower = content.lower()
         
         # Determine country from location
         country = "Unknown"
         city = None
         for key, value in self.COUNTRY_MAPPINGS.items():
-            if key.lower() in location.lower():
+            if key in location_lower:
                 country = value
                 city = location.split("/")[0].strip() if "/" in location else location
                 break
         
         # Determine company type
         company_type = CompanyType.STARTUP
-        if "konzern" in content.lower() or "corporation" in content.lower():
+        if "konzern" in content_lower or "corporation" in content_lower:
             company_type = CompanyType.KONZERN
-        elif "kmu" in content.lower() or "mittelstand" in content.lower():
+        elif "kmu" in content_lower or "mittelstand" in content_lower:
             company_type = CompanyType.KMU
-        elif "forschung" in content.lower() or "research" in content.lower() or "institut" in content.lower():
+        elif any(word in content_lower for word in ("forschung", "research", "institut")):
             company_type = CompanyType.FORSCHUNG
         
         # Extract technology approach
         tech_approach = None
         for key, value in self.TECH_MAPPINGS.items():
-            if key.lower() in content.lower():
+            if key in content_lower:
                 tech_approach = value.value
                 break
         
@@ -189,92 +316,49 @@ class MarkdownParser:
     def _extract_funding(self, content: str) -> Optional[float]:
         """Extract total funding amount from content."""
         # Match patterns like "EUR 130M", "USD 2.86 Mrd.", "USD 1+ Mrd."
-        patterns = [
-            r"(?:USD|EUR)\s*([\d.,]+)\s*(?:Mrd\.?|Billion|B)",  # Billions
-            r"(?:USD|EUR)\s*([\d.,]+)\s*(?:M|Million|Mio\.?)",  # Millions
-            r"Gesamt\s*(?:USD|EUR)\s*([\d.,]+)\s*(?:M|Mio\.?)",  # Total funding
-            r"Finanzierung[:\s]+(?:USD|EUR)\s*([\d.,]+)\s*(?:M|Mio\.?|Mrd\.?)",
-        ]
-        
+        # Convert to USD (assuming EUR ≈ USD for simplicity)
         max_funding = 0.0
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
+        for pattern, multiplier in _FUNDING_PATTERNS:
+            for match in pattern.findall(content):
                 try:
-                    value = float(match.replace(",", ".").replace("+", ""))
-                    # Convert to USD (assuming EUR ≈ USD for simplicity)
-                    if "Mrd" in pattern or "Billion" in pattern or "B" in pattern:
-                        value *= 1_000_000_000
-                    else:
-                        value *= 1_000_000
-                    max_funding = max(max_funding, value)
+                    value = float(match.replace(",", ".").replace("+", "")) * multiplier
                 except ValueError:
                     continue
+                max_funding = max(max_funding, value)
         
         return max_funding if max_funding > 0 else None
     
     def _extract_trl(self, content: str) -> Optional[int]:
         """Extract TRL level from content."""
         # Match patterns like "TRL 6-7", "TRL 5", "erreicht TRL 6"
-        patterns = [
-            r"TRL\s*(\d)",
-            r"TRL\s*(\d)-\d",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in _TRL_PATTERNS:
+            match = pattern.search(content)
             if match:
-                try:
-                    return int(match.group(1))
-                except ValueError:
-                    continue
+                return int(match.group(1))
         return None
     
     def _extract_team_size(self, content: str) -> Optional[int]:
         """Extract team size from content."""
-        patterns = [
-            r"(\d+)\+?\s*(?:Mitarbeiter|employees|Team)",
-            r"Team[:\s]+(\d+)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in _TEAM_SIZE_PATTERNS:
+            match = pattern.search(content)
             if match:
-                try:
-                    return int(match.group(1))
-                except ValueError:
-                    continue
+                return int(match.group(1))
         return None
     
     def _extract_founded_year(self, content: str) -> Optional[int]:
         """Extract founding year from content."""
-        patterns = [
-            r"gegründet\s*(?:~)?(\d{4})",
-            r"founded\s*(?:~)?(\d{4})",
-            r"\((\d{4})\)",
-            r"Spin-out\s*\((\d{4})\)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in _FOUNDED_YEAR_PATTERNS:
+            match = pattern.search(content)
             if match:
-                try:
-                    year = int(match.group(1))
-                    if 1990 <= year <= 2030:
-                        return year
-                except ValueError:
-                    continue
+                year = int(match.group(1))
+                if 1990 <= year <= 2030:
+                    return year
         return None
     
     def _extract_investors(self, content: str) -> Optional[str]:
         """Extract key investors from content."""
-        patterns = [
-            r"Investoren[:\s]+(.+?)(?:\n|$)",
-            r"Investors[:\s]+(.+?)(?:\n|$)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in _INVESTOR_PATTERNS:
+            match = pattern.search(content)
             if match:
                 return match.group(1).strip()[:500]  # Limit length
         return None
@@ -282,7 +366,7 @@ class MarkdownParser:
     def _extract_description(self, content: str) -> Optional[str]:
         """Extract company description."""
         # Look for **Profil:** section
-        match = re.search(r"\*\*Profil:\*\*\s*(.+?)(?:\n\n|\n-|\n\*\*)", content, re.DOTALL)
+        match = _PROFILE_PATTERN.search(content)
         if match:
             return match.group(1).strip()[:1000]
         
@@ -349,12 +433,15 @@ class MarkdownParser:
         self.parsed_data.markets.append(apac_market)
 
 
-def parse_fusion_research(file_path: str = "research/Fusion_Research.md") -> ParsedData:
+def parse_fusion_research(
+    file_path: str = "research/Fusion_Research.md",
+    parallel: bool = False,
+) -> ParsedData:
     """Parse Fusion_Research.md file and return structured data."""
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"Research file not found: {file_path}")
     
     content = path.read_text(encoding="utf-8")
-    parser = MarkdownParser(content)
+    parser = MarkdownParser(content, parallel=parallel)
     return parser.parse()
@@ -0,0 +1,234 @@
+"""Incremental, hash-keyed cache for parsing Fusion_Research.md.
+
+Each ``####`` company block is hashed and its parsed ``Company`` stored on
+disk under that hash, so only blocks whose text changed are re-extracted.
+A per-document manifest records the block and ``##`` section hashes of the
+last committed parse; comparing against it yields a ``ParseDelta`` of new,
+changed, removed and unchanged blocks.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from src.data.parsers.markdown_parser import MarkdownParser, ParsedData
+from src.models.company import Company
+
+DEFAULT_CACHE_DIR = "research/.parse_cache"
+
+# Bump when extraction rules change so cached blocks are re-extracted
+CACHE_VERSION = 1
+
+
+def _hash(*parts: str) -> str:
+    """Stable content hash of the given text parts."""
+    digest = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+    for part in parts:
+        digest.update(b"\0")
+        digest.update(part.encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+@dataclass
+class BlockDelta:
+    """Names of blocks grouped by how they differ from the previous parse."""
+    new: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether anything was added, changed or removed."""
+        return bool(self.new or self.changed or self.removed)
+
+    @classmethod
+    def compare(cls, previous: dict[str, str], current: dict[str, str]) -> "BlockDelta":
+        """Compare two ``name -> hash`` maps."""
+        delta = cls(removed=[name for name in previous if name not in current])
+        for name, block_hash in current.items():
+            if name not in previous:
+                delta.new.append(name)
+            elif previous[name] != block_hash:
+                delta.changed.append(name)
+            else:
+                delta.unchanged.append(name)
+        return delta
+
+
+@dataclass
+class ParseDelta:
+    """Difference between a parse and the last committed parse of a document."""
+    document: str
+    companies: BlockDelta
+    sections: BlockDelta
+    company_hashes: dict[str, str] = field(default_factory=dict)
+    company_names: dict[str, str] = field(default_factory=dict)
+    section_hashes: dict[str, str] = field(default_factory=dict)
+    blocks_parsed: int = 0
+    blocks_cached: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any company block or section differs."""
+        return self.companies.has_changes or self.sections.has_changes
+
+    @property
+    def changed_company_names(self) -> set[str]:
+        """Names of companies whose block is new or changed.
+
+        Block keys of repeated names (``"Name #2"``) map back to the company name.
+        """
+        keys = self.companies.new + self.companies.changed
+        return {self.company_names.get(key, key) for key in keys}
+
+
+class _CachingParser(MarkdownParser):
+    """MarkdownParser that reuses cached company blocks by content hash."""
+
+    def __init__(self, content: str, cache: "ParseCache"):
+        super().__init__(content)
+        self.cache = cache
+        self.blocks_parsed = 0
+        self.blocks_cached = 0
+
+    def _parse_company_block(self, name: str, location: str, content: str) -> Optional[Company]:
+        block_hash = _hash(name, location, content)
+        cached = self.cache.load_block(block_hash)
+        if cached is not None:
+            # Ids follow document order, so they are assigned here rather than cached
+            self._company_id_counter += 1
+            self.blocks_cached += 1
+            return Company.model_validate({**cached, "id": self._company_id_counter})
+
+        company = super()._parse_company_block(name, location, content)
+        self.blocks_parsed += 1
+        if company:
+            self.cache.store_block(block_hash, company)
+        return company
+
+
+class ParseCache:
+    """On-disk cache of parsed company blocks and per-document manifests."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.blocks_dir = self.cache_dir / "blocks"
+        self.manifest_path = self.cache_dir / "manifest.json"
+
+    def _block_path(self, block_hash: str) -> Path:
+        return self.blocks_dir / f"{block_hash}.json"
+
+    def load_block(self, block_hash: str) -> Optional[dict]:
+        """Load a cached company (without id) by block hash."""
+        path = self._block_path(block_hash)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def store_block(self, block_hash: str, company: Company):
+        """Cache a parsed company under its block hash."""
+        self.blocks_dir.mkdir(parents=True, exist_ok=True)
+        data = company.model_dump(mode="json", exclude={"id"})
+        self._write_json(self._block_path(block_hash), data)
+
+    def _load_manifest(self) -> dict:
+        """Load the manifest of all documents."""
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _write_json(self, path: Path, data):
+        """Write JSON atomically."""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _document_key(file_path: str) -> str:
+        return str(Path(file_path).resolve())
+
+    def parse(self, file_path: str) -> tuple[ParsedData, ParseDelta]:
+        """Parse a research document, re-extracting only changed company blocks.
+
+        The delta is relative to the last ``commit()`` for this document; the
+        manifest is not updated until the caller commits.
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Research file not found: {file_path}")
+
+        parser = _CachingParser(path.read_text(encoding="utf-8"), self)
+        parsed_data = parser.parse()
+
+        company_hashes: dict[str, str] = {}
+        company_names: dict[str, str] = {}
+        for block in parser.company_blocks:
+            key = block.name
+            suffix = 2
+            while key in company_hashes:
+                key = f"{block.name} #{suffix}"
+                suffix += 1
+            company_hashes[key] = _hash(block.name, block.location, block.content)
+            company_names[key] = block.name
+        section_hashes = {
+            name: _hash(name, text) for name, text in parsed_data.raw_sections.items()
+        }
+
+        previous = self._load_manifest().get(self._document_key(file_path), {})
+        delta = ParseDelta(
+            document=self._document_key(file_path),
+            companies=BlockDelta.compare(previous.get("companies", {}), company_hashes),
+            sections=BlockDelta.compare(previous.get("sections", {}), section_hashes),
+            company_hashes=company_hashes,
+            company_names=company_names,
+            section_hashes=section_hashes,
+            blocks_parsed=parser.blocks_parsed,
+            blocks_cached=parser.blocks_cached,
+        )
+        return parsed_data, delta
+
+    def commit(self, delta: ParseDelta):
+        """Record a parse as the baseline for the next delta and prune stale blocks."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._load_manifest()
+        manifest[delta.document] = {
+            "companies": delta.company_hashes,
+            "sections": delta.section_hashes,
+        }
+        self._write_json(self.manifest_path, manifest)
+        self._prune(manifest, keep=set(delta.company_hashes.values()))
+
+    def _prune(self, manifest: dict, keep: set[str]):
+        """Delete cached blocks no longer referenced by any manifest."""
+        if not self.blocks_dir.exists():
+            return
+        for document in manifest.values():
+            keep.update(document.get("companies", {}).values())
+        for path in self.blocks_dir.glob("*.json"):
+            if path.stem not in keep:
+                path.unlink(missing_ok=True)
+
+    def clear(self):
+        """Remove all cached blocks and manifests."""
+        if self.blocks_dir.exists():
+            for path in self.blocks_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+        self.manifest_path.unlink(missing_ok=True)
+
+
+def parse_fusion_research_incremental(
+    file_path: str = "research/Fusion_Research.md",
+    cache: Optional[ParseCache] = None,
+) -> tuple[ParsedData, ParseDelta]:
+    """Parse Fusion_Research.md using the block cache; see ``ParseCache.parse``."""
+    return (cache or ParseCache()).parse(file_path)
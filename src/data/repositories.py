@@ -1,9 +1,10 @@
 """Repository pattern implementations for data access."""
 
-from typing import Optional
+from typing import Iterator, Optional
 from datetime import datetime
 
 from src.data.database import Database
+from src.data.name_index import NameIndex
 from src.models.company import Company, CompanyType, CompanyDTO
 from src.models.funding import FundingRound, FundingStage, Investor
 from src.models.technology import Technology, TechnologyApproach
@@ -45,6 +46,31 @@ class CompanyRepository:
         )
         return [self._row_to_company(row) for row in cursor.fetchall()]
     
+    def iter_all(self, batch_size: int = 500) -> Iterator[Company]:
+        """Stream every company in id order, fetching ``batch_size`` rows at a time."""
+        last_id = 0
+        while True:
+            rows = self.db.execute(
+                "SELECT * FROM companies WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, batch_size)
+            ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield self._row_to_company(row)
+            last_id = rows[-1]["id"]
+    
+    def get_recently_updated(self, days: int = 7, limit: int = 100) -> list[Company]:
+        """Get companies updated within the last ``days`` days, newest first."""
+        cursor = self.db.execute(
+            """SELECT * FROM companies
+               WHERE date(last_updated) >= date('now', ?)
+               ORDER BY last_updated DESC
+               LIMIT ?""",
+            (f"-{days} days", limit)
+        )
+        return [self._row_to_company(row) for row in cursor.fetchall()]
+    
     def search(
         self,
         country: Optional[str] = None,
@@ -794,13 +820,43 @@ class InvestorRepository:
         self.db.commit()
         return cursor.lastrowid
 
-    def get_or_create(self, name: str, **kwargs) -> int:
-        """Get investor by name or create if not exists. Returns ID."""
-        existing = self.get_by_name(name)
-        if existing:
-            return existing.id
+    def name_index(self) -> NameIndex[int]:
+        """Index of investor names to IDs for matching spelling variants.
+
+        Containment is off so "Google" does not swallow "Google Ventures".
+        """
+        cursor = self.db.execute("SELECT id, name FROM investors ORDER BY id")
+        return NameIndex.build(
+            ((row["name"], row["id"]) for row in cursor.fetchall()),
+            threshold=0.9,
+            containment=False,
+        )
+
+    def get_or_create(
+        self,
+        name: str,
+        name_index: Optional[NameIndex[int]] = None,
+        **kwargs,
+    ) -> int:
+        """Get investor by name or create if not exists. Returns ID.
+
+        With a ``name_index`` (see ``name_index()``), variants such as
+        "HV Capital GmbH" resolve to the existing investor and created
+        investors are added to the index.
+        """
+        if name_index is not None:
+            existing_id = name_index.resolve(name)
+            if existing_id is not None:
+                return existing_id
+        else:
+            existing = self.get_by_name(name)
+            if existing:
+                return existing.id
         investor = Investor(name=name, **kwargs)
-        return self.create(investor)
+        investor_id = self.create(investor)
+        if name_index is not None:
+            name_index.add(name, investor_id)
+        return investor_id
 
     def update(self, investor: Investor) -> bool:
         """Update an existing investor."""
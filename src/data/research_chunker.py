@@ -0,0 +1,203 @@
+"""Structure-aware chunking of research markdown for the vector store.
+
+Chunks follow the document structure instead of fixed character offsets:
+
+1. a chunk never spans two ``##``/``###``/``####`` sections (``#`` is the
+   document title)
+2. paragraphs - company blocks, bullet lists, tables - stay whole when
+   they fit the token budget; only oversized ones are split at sentence
+   and line boundaries
+3. consecutive chunks of one section share a few trailing sentences
+   (``overlap_tokens``) so facts at a boundary keep their context
+
+Every chunk starts with its heading path ("2. Key Fusion Companies >
+2.1 Marvel Fusion (Germany)"), which also tells the embedder what the
+chunk is about. Chunk ids hash the heading path and text, so re-chunking
+an edited document reproduces the ids of unchanged chunks and
+``VectorStore.sync_research_chunks`` only embeds what actually changed.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+
+from src.data.lexical_index import estimate_tokens, join_sentences, split_sentences
+
+DEFAULT_MAX_TOKENS = 300
+DEFAULT_OVERLAP_TOKENS = 40
+
+HEADING_SEPARATOR = " > "
+
+_HEADING = re.compile(r"^(#{1,4})\s+(.+?)\s*#*\s*$")
+_RULE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+_SLUG = re.compile(r"[^a-z0-9]+")
+
+
+@dataclass
+class ResearchChunk:
+    """A chunk of a research document."""
+    chunk_id: str
+    content: str
+    heading_path: tuple[str, ...]
+    tokens: int
+
+    @property
+    def section(self) -> str:
+        """Heading path as one label."""
+        return HEADING_SEPARATOR.join(self.heading_path)
+
+
+def make_chunk_id(heading_path: tuple[str, ...], text: str) -> str:
+    """Readable, content-derived chunk id: last heading slug plus a hash."""
+    digest = hashlib.sha1("\n".join([*heading_path, text]).encode("utf-8")).hexdigest()[:12]
+    slug = _SLUG.sub("-", heading_path[-1].lower()).strip("-")[:40] if heading_path else ""
+    return f"{slug or 'preamble'}-{digest}"
+
+
+def split_sections(text: str) -> list[tuple[tuple[str, ...], list[str]]]:
+    """
+    Split markdown into sections.
+
+    Returns:
+        ``(heading path, paragraphs)`` per section in document order;
+        sections without body text are omitted
+    """
+    sections: list[tuple[tuple[str, ...], list[str]]] = []
+    headings: list[tuple[int, str]] = []
+    paragraphs: list[str] = []
+    lines: list[str] = []
+    in_fence = False
+
+    def end_paragraph():
+        if lines:
+            paragraphs.append("\n".join(lines))
+            lines.clear()
+
+    def end_section():
+        end_paragraph()
+        if paragraphs:
+            sections.append((tuple(title for _, title in headings), list(paragraphs)))
+            paragraphs.clear()
+
+    for line in text.splitlines():
+        if _FENCE.match(line):
+            in_fence = not in_fence
+        heading = None if in_fence else _HEADING.match(line)
+        if heading:
+            end_section()
+            level = len(heading.group(1))
+            while headings and headings[-1][0] >= level:
+                headings.pop()
+            if level > 1:
+                headings.append((level, heading.group(2).strip("*").strip()))
+        elif in_fence or (line.strip() and not _RULE.match(line)):
+            lines.append(line.rstrip())
+        else:
+            end_paragraph()
+    end_section()
+    return sections
+
+
+class ResearchChunker:
+    """Split research markdown into heading-scoped, token-sized chunks."""
+
+    def __init__(
+        self,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+    ):
+        """
+        Initialize chunker.
+
+        Args:
+            max_tokens: Target chunk size in estimated tokens, heading path
+                included (a single sentence or table row longer than this
+                becomes its own chunk)
+            overlap_tokens: Trailing text of a chunk repeated at the start of
+                the next chunk of the same section
+        """
+        if overlap_tokens >= max_tokens:
+            raise ValueError("overlap_tokens must be smaller than max_tokens")
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+
+    def chunk(self, text: str) -> list[ResearchChunk]:
+        """Chunks of a markdown document, in document order (ids are unique)."""
+        chunks = []
+        seen = set()
+        for heading_path, paragraphs in split_sections(text):
+            for chunk in self._chunk_section(heading_path, paragraphs):
+                if chunk.chunk_id not in seen:
+                    seen.add(chunk.chunk_id)
+                    chunks.append(chunk)
+        return chunks
+
+    def _chunk_section(
+        self,
+        heading_path: tuple[str, ...],
+        paragraphs: list[str],
+    ) -> list[ResearchChunk]:
+        """Pack a section's paragraphs into chunks."""
+        header = HEADING_SEPARATOR.join(heading_path)
+        budget = max(self.max_tokens - estimate_tokens(header), self.overlap_tokens + 1)
+
+        chunks = []
+        current: list[tuple[str, int]] = []
+        has_new = False
+        for unit in self._units(paragraphs, budget):
+            unit_tokens = sum(tokens for _, tokens in unit)
+            if has_new and sum(tokens for _, tokens in current) + unit_tokens > budget:
+                chunks.append(self._make_chunk(heading_path, header, current))
+                current = self._overlap(current)
+                if sum(tokens for _, tokens in current) + unit_tokens > budget:
+                    current = []
+            current.extend(unit)
+            has_new = True
+        if has_new:
+            chunks.append(self._make_chunk(heading_path, header, current))
+        return chunks
+
+    @staticmethod
+    def _units(paragraphs: list[str], budget: int) -> list[list[tuple[str, int]]]:
+        """
+        Packing units as ``(sentence, tokens)`` lists: whole paragraphs that
+        fit the budget, else single sentences or lines.
+        """
+        units = []
+        for paragraph in paragraphs:
+            pieces = split_sentences(paragraph)
+            pieces[-1] += "\n"  # blank line between paragraphs once joined
+            sized = [(piece, estimate_tokens(piece)) for piece in pieces]
+            if sum(tokens for _, tokens in sized) <= budget:
+                units.append(sized)
+            else:
+                units.extend([piece] for piece in sized)
+        return units
+
+    def _overlap(self, pieces: list[tuple[str, int]]) -> list[tuple[str, int]]:
+        """Trailing sentences of a chunk that fit the overlap."""
+        kept: list[tuple[str, int]] = []
+        used = 0
+        for piece, tokens in reversed(pieces):
+            if used + tokens > self.overlap_tokens:
+                break
+            kept.insert(0, (piece, tokens))
+            used += tokens
+        return kept
+
+    @staticmethod
+    def _make_chunk(
+        heading_path: tuple[str, ...],
+        header: str,
+        pieces: list[tuple[str, int]],
+    ) -> ResearchChunk:
+        """Chunk from its heading path and sentences."""
+        body = join_sentences([piece for piece, _ in pieces])
+        content = f"{header}\n\n{body}" if header else body
+        return ResearchChunk(
+            chunk_id=make_chunk_id(heading_path, body),
+            content=content,
+            heading_path=heading_path,
+            tokens=estimate_tokens(content),
+        )
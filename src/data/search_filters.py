@@ -0,0 +1,176 @@
+"""Structured filters for semantic search.
+
+``SearchFilters`` describes constraints on document metadata (entity type,
+country, technology, TRL and funding ranges). ``to_where`` turns them into
+a Chroma-style ``where`` clause that the vector backend applies *before*
+ranking, so a filtered query returns a full top-k of matching documents
+instead of k generic neighbours that are mostly discarded afterwards.
+``metadata_matches`` evaluates the same clause in Python for indexes
+without native filtering (e.g. the keyword index).
+
+The clause follows ``CompanyRepository.search``, so filtering by metadata
+or by a SQLite id list selects the same companies. Company metadata stores
+unknown values as ``""`` (text) and ``0`` (numbers): any TRL or funding
+bound excludes unknown values, like a SQL comparison with NULL, except the
+full TRL range 1-9, which includes companies without a TRL. Country and
+technology match exactly, like SQL ``=``.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+TextFilter = Union[str, list[str], tuple[str, ...], None]
+
+# Numeric metadata value of an unknown TRL or funding amount
+UNKNOWN_NUMBER = 0
+
+# A TRL range this wide also includes unknown TRLs (see CompanyRepository.search)
+FULL_TRL_RANGE = (1, 9)
+
+
+def combine_where(*clauses: Optional[dict]) -> Optional[dict]:
+    """AND-combine ``where`` clauses, skipping empty ones."""
+    parts: list[dict] = []
+    for clause in clauses:
+        if not clause:
+            continue
+        if set(clause) == {"$and"}:
+            parts.extend(clause["$and"])
+        elif len(clause) > 1:
+            parts.extend({key: value} for key, value in clause.items())
+        else:
+            parts.append(clause)
+    if not parts:
+        return None
+    return parts[0] if len(parts) == 1 else {"$and": parts}
+
+
+def _text_condition(field_name: str, value: TextFilter) -> Optional[dict]:
+    """Equality or membership condition for a text filter."""
+    if value is None or value == "" or value == [] or value == ():
+        return None
+    if isinstance(value, str):
+        return {field_name: value}
+    values = list(value)
+    return {field_name: values[0]} if len(values) == 1 else {field_name: {"$in": values}}
+
+
+def _range_condition(field_name: str, low, high) -> list[dict]:
+    """Bound conditions for a numeric range; a bounded range excludes unknown values."""
+    conditions = []
+    if low is not None:
+        conditions.append({field_name: {"$gte": low}})
+    if high is not None:
+        conditions.append({field_name: {"$lte": high}})
+    if conditions and (low is None or low <= UNKNOWN_NUMBER):
+        conditions.append({field_name: {"$ne": UNKNOWN_NUMBER}})
+    return conditions
+
+
+@dataclass
+class SearchFilters:
+    """Metadata constraints for semantic search."""
+    doc_type: Optional[str] = None
+    country: TextFilter = None
+    technology: TextFilter = None
+    trl_min: Optional[int] = None
+    trl_max: Optional[int] = None
+    funding_min: Optional[float] = None
+    funding_max: Optional[float] = None
+
+    @classmethod
+    def from_criteria(cls, criteria: Any) -> "SearchFilters":
+        """Filters from a ``CompanySearchCriteria`` (or any object with its fields)."""
+        return cls(
+            doc_type="company",
+            country=getattr(criteria, "country", None),
+            technology=getattr(criteria, "technology", None),
+            trl_min=getattr(criteria, "trl_min", None),
+            trl_max=getattr(criteria, "trl_max", None),
+            funding_min=getattr(criteria, "funding_min", None),
+            funding_max=getattr(criteria, "funding_max", None),
+        )
+
+    @classmethod
+    def coerce(cls, filters: Any) -> Optional["SearchFilters"]:
+        """Accept ``SearchFilters``, ``CompanySearchCriteria`` or None."""
+        if filters is None or isinstance(filters, cls):
+            return filters
+        return cls.from_criteria(filters)
+
+    @property
+    def company_fields_set(self) -> bool:
+        """Whether any company-only field is constrained."""
+        return any(
+            value not in (None, "", [], ())
+            for value in (
+                self.country, self.technology, self.trl_min, self.trl_max,
+                self.funding_min, self.funding_max,
+            )
+        )
+
+    @property
+    def entity_type(self) -> Optional[str]:
+        """Document type the filters apply to (company fields imply companies)."""
+        if self.doc_type is None and self.company_fields_set:
+            return "company"
+        return self.doc_type
+
+    def to_where(self) -> Optional[dict]:
+        """Chroma-style ``where`` clause, or None when nothing is constrained."""
+        trl_range = (self.trl_min, self.trl_max)
+        if trl_range == FULL_TRL_RANGE:
+            trl_range = (None, None)
+        conditions = [
+            _text_condition("type", self.entity_type),
+            _text_condition("country", self.country),
+            _text_condition("technology", self.technology),
+            *_range_condition("trl", *trl_range),
+            *_range_condition("funding", self.funding_min, self.funding_max),
+        ]
+        return combine_where(*conditions)
+
+
+def metadata_matches(metadata: dict, where: Optional[dict]) -> bool:
+    """Whether document metadata satisfies a Chroma-style ``where`` clause."""
+    if not where:
+        return True
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(metadata_matches(metadata, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(metadata_matches(metadata, clause) for clause in condition):
+                return False
+        elif not _value_matches(metadata.get(key), condition):
+            return False
+    return True
+
+
+def _value_matches(value: Any, condition: Any) -> bool:
+    """Whether a metadata value satisfies one field condition."""
+    if not isinstance(condition, dict):
+        condition = {"$eq": condition}
+    for operator, operand in condition.items():
+        if operator == "$eq":
+            matched = value == operand
+        elif operator == "$ne":
+            matched = value != operand
+        elif operator == "$in":
+            matched = value in operand
+        elif operator == "$nin":
+            matched = value not in operand
+        elif operator in ("$gt", "$gte", "$lt", "$lte"):
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                return False
+            matched = {
+                "$gt": value > operand,
+                "$gte": value >= operand,
+                "$lt": value < operand,
+                "$lte": value <= operand,
+            }[operator]
+        else:
+            raise ValueError(f"Unsupported filter operator: {operator}")
+        if not matched:
+            return False
+    return True
@@ -0,0 +1,308 @@
+"""Content-addressed snapshot store for research markdown documents.
+
+A snapshot splits a document into its preamble and ``##`` sections and
+stores each piece once, compressed, under the SHA-256 of its text. A
+version is just the ordered list of piece hashes, so snapshotting a
+document in which only a few sections changed writes only those sections,
+and diffing two versions compares hashes without decompressing anything.
+
+Layout::
+
+    <root>/manifest.json          versions, oldest first
+    <root>/objects/ab/abcdef….gz  compressed section text (.zst with zstandard)
+"""
+
+import difflib
+import gzip
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_SNAPSHOT_DIR = "research/.snapshots"
+
+
+def _split_sections(content: str) -> list[tuple[str, str]]:
+    """Split a document into (name, text) pieces: the preamble, then each ## section.
+
+    The texts concatenate back to the original document exactly.
+    """
+    pieces: list[tuple[str, str]] = []
+    name = ""
+    start = 0
+    offset = 0
+    for line in content.splitlines(keepends=True):
+        if line.startswith("## "):
+            if offset > start or pieces:
+                pieces.append((name, content[start:offset]))
+            name = line[3:].strip()
+            start = offset
+        offset += len(line)
+    pieces.append((name, content[start:]))
+    return pieces
+
+
+def _zstd():
+    """The zstandard module when installed, else None (gzip is used instead)."""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+@dataclass
+class SnapshotSection:
+    """One stored piece of a version."""
+    name: str
+    hash: str
+    size: int
+
+
+@dataclass
+class SnapshotVersion:
+    """A stored version of a document."""
+    id: int
+    document: str
+    created_at: str
+    label: str = ""
+    sections: list[SnapshotSection] = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        """Uncompressed document size in characters."""
+        return sum(section.size for section in self.sections)
+
+    @property
+    def digest(self) -> str:
+        """Hash of the whole version (identical documents share it)."""
+        joined = "".join(section.hash for section in self.sections)
+        return hashlib.sha256(joined.encode()).hexdigest()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SnapshotVersion":
+        """Build a version from its manifest entry."""
+        sections = [SnapshotSection(**section) for section in data.get("sections", [])]
+        return cls(**{**data, "sections": sections})
+
+
+@dataclass
+class SnapshotDiff:
+    """Section-level difference between two versions."""
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any section was added, removed or changed."""
+        return bool(self.added or self.removed or self.changed)
+
+
+class SnapshotStore:
+    """Versioned, deduplicated and compressed storage of research documents."""
+
+    def __init__(self, root: str = DEFAULT_SNAPSHOT_DIR):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.manifest_path = self.root / "manifest.json"
+        zstd = _zstd()
+        self._zstd = zstd
+        self._suffix = ".zst" if zstd else ".gz"
+
+    def _object_path(self, digest: str, suffix: Optional[str] = None) -> Path:
+        """Path of an object, sharded by the first two hash characters."""
+        return self.objects_dir / digest[:2] / f"{digest}{suffix or self._suffix}"
+
+    def _find_object(self, digest: str) -> Optional[Path]:
+        """Locate an object regardless of the codec it was written with."""
+        for suffix in (self._suffix, ".gz", ".zst"):
+            path = self._object_path(digest, suffix)
+            if path.exists():
+                return path
+        return None
+
+    def _put(self, text: str) -> str:
+        """Store text once under its hash; return the hash."""
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        if self._find_object(digest):
+            return digest
+
+        path = self._object_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self._zstd:
+            compressed = self._zstd.ZstdCompressor(level=10).compress(data)
+        else:
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(compressed)
+        os.replace(tmp_path, path)
+        return digest
+
+    def _get(self, digest: str) -> str:
+        """Load and decompress an object."""
+        path = self._find_object(digest)
+        if path is None:
+            raise FileNotFoundError(f"Snapshot object missing: {digest}")
+        data = path.read_bytes()
+        if path.suffix == ".zst":
+            zstd = self._zstd or _zstd()
+            if zstd is None:
+                raise RuntimeError("zstandard is required to read .zst snapshot objects")
+            return zstd.ZstdDecompressor().decompress(data).decode("utf-8")
+        return gzip.decompress(data).decode("utf-8")
+
+    def _load_manifest(self) -> dict:
+        """Load the version manifest."""
+        if not self.manifest_path.exists():
+            return {"next_id": 1, "versions": []}
+        return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+
+    def _save_manifest(self, manifest: dict):
+        """Write the version manifest atomically."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+
+    def snapshot(self, file_path: Path | str, label: str = "") -> SnapshotVersion:
+        """
+        Store the current content of a document as a new version.
+
+        Only sections not already in the store are written. If the document
+        is identical to its latest version, that version is returned instead.
+        """
+        path = Path(file_path)
+        content = path.read_text(encoding="utf-8")
+
+        sections = [
+            SnapshotSection(name=name, hash=self._put(text), size=len(text))
+            for name, text in _split_sections(content)
+        ]
+
+        manifest = self._load_manifest()
+        latest = self.latest(path.name, manifest)
+        candidate = SnapshotVersion(
+            id=manifest["next_id"],
+            document=path.name,
+            created_at=datetime.now().isoformat(timespec="seconds"),
+            label=label,
+            sections=sections,
+        )
+        if latest and latest.digest == candidate.digest:
+            return latest
+
+        manifest["versions"].append(asdict(candidate))
+        manifest["next_id"] += 1
+        self._save_manifest(manifest)
+        return candidate
+
+    def list_versions(
+        self,
+        document: Optional[str] = None,
+        manifest: Optional[dict] = None,
+    ) -> list[SnapshotVersion]:
+        """List versions, oldest first, optionally for one document name."""
+        manifest = manifest or self._load_manifest()
+        versions = [SnapshotVersion.from_dict(v) for v in manifest["versions"]]
+        if document:
+            versions = [v for v in versions if v.document == document]
+        return versions
+
+    def latest(self, document: str, manifest: Optional[dict] = None) -> Optional[SnapshotVersion]:
+        """Most recent version of a document."""
+        versions = self.list_versions(document, manifest)
+        return versions[-1] if versions else None
+
+    def get_version(self, version_id: int) -> SnapshotVersion:
+        """Look up a version by id."""
+        for version in self.list_versions():
+            if version.id == version_id:
+                return version
+        raise KeyError(f"Snapshot version not found: {version_id}")
+
+    def read(self, version_id: int) -> str:
+        """Reconstruct the document text of a version."""
+        version = self.get_version(version_id)
+        return "".join(self._get(section.hash) for section in version.sections)
+
+    def restore(self, version_id: int, target_path: Path | str) -> Path:
+        """Write a version back to disk (atomically)."""
+        target = Path(target_path)
+        tmp_path = target.with_suffix(target.suffix + ".tmp")
+        tmp_path.write_text(self.read(version_id), encoding="utf-8")
+        os.replace(tmp_path, target)
+        return target
+
+    def diff(self, old_id: int, new_id: int) -> SnapshotDiff:
+        """Section-level diff of two versions (compares hashes only)."""
+        old = {s.name: s.hash for s in self.get_version(old_id).sections}
+        new = {s.name: s.hash for s in self.get_version(new_id).sections}
+        return SnapshotDiff(
+            added=[name for name in new if name not in old],
+            removed=[name for name in old if name not in new],
+            changed=[name for name in new if name in old and old[name] != new[name]],
+        )
+
+    def diff_text(self, old_id: int, new_id: int, context: int = 3) -> str:
+        """Unified diff of two versions, decompressing only the sections that differ."""
+        old_version = self.get_version(old_id)
+        new_version = self.get_version(new_id)
+        old = {s.name: s.hash for s in old_version.sections}
+        new = {s.name: s.hash for s in new_version.sections}
+
+        chunks = []
+        for name in list(old) + [n for n in new if n not in old]:
+            if old.get(name) == new.get(name):
+                continue
+            old_text = self._get(old[name]) if name in old else ""
+            new_text = self._get(new[name]) if name in new else ""
+            chunks.extend(difflib.unified_diff(
+                old_text.splitlines(keepends=True),
+                new_text.splitlines(keepends=True),
+                fromfile=f"v{old_id}/{name or '(preamble)'}",
+                tofile=f"v{new_id}/{name or '(preamble)'}",
+                n=context,
+            ))
+        return "".join(chunks)
+
+    def prune(self, keep: int = 20, document: Optional[str] = None) -> int:
+        """
+        Drop all but the newest ``keep`` versions per document and delete
+        objects no longer referenced.
+
+        Returns:
+            Number of versions removed
+        """
+        manifest = self._load_manifest()
+        versions = manifest["versions"]
+        by_document: dict[str, list[dict]] = {}
+        for version in versions:
+            by_document.setdefault(version["document"], []).append(version)
+
+        dropped = set()
+        for name, document_versions in by_document.items():
+            if document and name != document:
+                continue
+            stale = document_versions[:max(0, len(document_versions) - keep)]
+            dropped.update(v["id"] for v in stale)
+
+        manifest["versions"] = [v for v in versions if v["id"] not in dropped]
+        self._save_manifest(manifest)
+
+        referenced = {s["hash"] for v in manifest["versions"] for s in v["sections"]}
+        if self.objects_dir.exists():
+            for path in self.objects_dir.glob("*/*"):
+                if path.name.split(".")[0] not in referenced:
+                    path.unlink(missing_ok=True)
+        return len(dropped)
+
+    def disk_usage(self) -> int:
+        """Bytes used by stored objects."""
+        if not self.objects_dir.exists():
+            return 0
+        return sum(path.stat().st_size for path in self.objects_dir.glob("*/*"))
@@ -0,0 +1,247 @@
+"""Sandboxed, resource-bounded execution of untrusted SELECT statements.
+
+Generated SQL (e.g. from ``NLQueryProcessor``) runs through:
+
+1. validation: a single ``SELECT``/``WITH`` statement without write keywords
+2. a plan check: ``EXPLAIN QUERY PLAN`` must not nest two full table scans
+   at the same level, which is how SQLite executes a cross product
+3. execution on a pooled read-only (``mode=ro``) connection, with the row
+   count capped by an injected ``LIMIT`` and the wall time bounded by a
+   progress handler that interrupts the statement once its budget is spent
+
+A runaway statement therefore fails within its budget and only ever holds
+one pooled connection; it cannot block other sessions or modify data.
+"""
+
+import queue
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+# The connection is read-only anyway; these give a clear error up front. REPLACE
+# is left out because replace() is a common string function in SELECTs.
+WRITE_KEYWORDS = (
+    "INSERT", "UPDATE", "DELETE", "DROP", "ALTER", "CREATE", "TRUNCATE",
+    "ATTACH", "DETACH", "PRAGMA", "VACUUM", "REINDEX",
+)
+
+_WRITE_PATTERN = re.compile(rf"\b({'|'.join(WRITE_KEYWORDS)})\b", re.IGNORECASE)
+_COMMENT_PATTERN = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_PATTERN = re.compile(r"'(?:[^']|'')*'")
+
+# Virtual machine instructions between progress handler calls
+PROGRESS_INTERVAL = 1000
+
+
+class SandboxError(Exception):
+    """A statement was rejected or aborted by the sandbox."""
+
+
+class QueryTimeout(SandboxError):
+    """A statement exceeded its time budget."""
+
+
+@dataclass
+class SandboxResult:
+    """Rows returned by a sandboxed statement."""
+    sql: str
+    rows: list[dict] = field(default_factory=list)
+    truncated: bool = False
+    elapsed: float = 0.0
+
+
+class SQLSandbox:
+    """Read-only connection pool with row caps, time budgets and plan checks."""
+
+    def __init__(
+        self,
+        db_path: str = "research/fusion_research.db",
+        max_rows: int = 1000,
+        time_budget: float = 2.0,
+        pool_size: int = 4,
+        chunk_size: int = 200,
+        pool_timeout: float = 5.0,
+    ):
+        """
+        Initialize sandbox.
+
+        Args:
+            db_path: SQLite database file (opened read-only)
+            max_rows: Maximum rows returned per statement
+            time_budget: Seconds a statement may run, including fetching
+            pool_size: Maximum concurrent connections
+            chunk_size: Rows fetched per chunk when streaming
+            pool_timeout: Seconds to wait for a free connection
+        """
+        self.db_path = Path(db_path)
+        self.max_rows = max_rows
+        self.time_budget = time_budget
+        self.pool_size = pool_size
+        self.chunk_size = chunk_size
+        self.pool_timeout = pool_timeout
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._slots = queue.Queue()
+        for _ in range(pool_size):
+            self._slots.put(None)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a read-only connection."""
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA query_only = ON")
+        return connection
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection; at most ``pool_size`` are in use at once."""
+        try:
+            self._slots.get(timeout=self.pool_timeout)
+        except queue.Empty:
+            raise SandboxError("All query connections are busy, try again shortly")
+        try:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                connection = self._connect()
+            try:
+                yield connection
+            finally:
+                connection.set_progress_handler(None, 0)
+                self._idle.put(connection)
+        finally:
+            self._slots.put(None)
+
+    def close(self):
+        """Close idle pooled connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def schema_definitions(self) -> list[dict]:
+        """``type``, ``name`` and ``sql`` of every table, view, index and trigger."""
+        with self._connection() as connection:
+            rows = connection.execute(
+                "SELECT type, name, sql FROM sqlite_master "
+                "WHERE name NOT LIKE 'sqlite_%' ORDER BY type, name"
+            )
+            return [dict(row) for row in rows]
+
+    def table_columns(self, table: str) -> tuple[list[dict], list[dict]]:
+        """Column (``PRAGMA table_info``) and foreign key rows of a table."""
+        with self._connection() as connection:
+            columns = connection.execute("SELECT * FROM pragma_table_info(?)", (table,))
+            foreign_keys = connection.execute(
+                "SELECT * FROM pragma_foreign_key_list(?)", (table,)
+            )
+            return [dict(row) for row in columns], [dict(row) for row in foreign_keys]
+
+    def validate(self, sql: str) -> str:
+        """
+        Check that ``sql`` is a single read-only statement.
+
+        Returns:
+            The statement without comments and trailing semicolon
+
+        Raises:
+            SandboxError: If the statement is not allowed
+        """
+        statement = _COMMENT_PATTERN.sub(" ", sql).strip().rstrip(";").strip()
+        if not statement:
+            raise SandboxError("Empty statement")
+        # Keywords and semicolons inside string literals do not count
+        code = _STRING_PATTERN.sub("''", statement)
+        if ";" in code:
+            raise SandboxError("Only a single statement is allowed")
+        if not re.match(r"(SELECT|WITH)\b", code, re.IGNORECASE):
+            raise SandboxError("Only SELECT queries are allowed")
+        match = _WRITE_PATTERN.search(code)
+        if match:
+            raise SandboxError(f"Statement contains forbidden keyword: {match.group(1).upper()}")
+        return statement
+
+    def check_plan(self, connection: sqlite3.Connection, statement: str, params: tuple = ()):
+        """
+        Reject statements whose plan nests full scans of two tables (a cross product).
+
+        Raises:
+            SandboxError: If the plan contains a cross product
+        """
+        scans: dict[int, list[str]] = {}
+        for _, parent, _, detail in connection.execute(f"EXPLAIN QUERY PLAN {statement}", params):
+            if detail.startswith("SCAN ") and not detail.startswith("SCAN CONSTANT"):
+                scans.setdefault(parent, []).append(detail[5:].split(" ")[0])
+        for tables in scans.values():
+            if len(tables) > 1:
+                raise SandboxError(
+                    f"Query joins {', '.join(tables)} without a join condition (cross product)"
+                )
+
+    def stream(self, sql: str, params: tuple = ()) -> Iterator[list[dict]]:
+        """
+        Run a statement and yield its rows in chunks of ``chunk_size``.
+
+        At most ``max_rows`` rows are produced; the time budget covers the
+        whole stream.
+
+        Raises:
+            SandboxError: If the statement is rejected
+            QueryTimeout: If the time budget is exceeded
+        """
+        return self._run(sql, params, self.max_rows)
+
+    def execute(self, sql: str, params: tuple = ()) -> SandboxResult:
+        """Run a statement and collect its rows (see ``stream``)."""
+        started = time.monotonic()
+        rows: list[dict] = []
+        # One extra row tells whether the result was cut off
+        for chunk in self._run(sql, params, self.max_rows + 1):
+            rows.extend(chunk)
+        return SandboxResult(
+            sql=sql,
+            rows=rows[:self.max_rows],
+            truncated=len(rows) > self.max_rows,
+            elapsed=time.monotonic() - started,
+        )
+
+    def _run(self, sql: str, params: tuple, limit: int) -> Iterator[list[dict]]:
+        """Validate, plan-check and run a statement under a row limit and time budget."""
+        statement = self.validate(sql)
+        limited = f"SELECT * FROM ({statement}) LIMIT {int(limit)}"
+
+        with self._connection() as connection:
+            deadline = time.monotonic() + self.time_budget
+            connection.set_progress_handler(
+                lambda: 1 if time.monotonic() > deadline else 0, PROGRESS_INTERVAL
+            )
+            try:
+                self.check_plan(connection, statement, params)
+                cursor = connection.execute(limited, params)
+                while True:
+                    rows = cursor.fetchmany(self.chunk_size)
+                    if not rows:
+                        return
+                    yield [dict(row) for row in rows]
+            except sqlite3.OperationalError as e:
+                if "interrupted" in str(e):
+                    raise QueryTimeout(
+                        f"Query exceeded its time budget of {self.time_budget:g}s"
+                    ) from e
+                raise SandboxError(str(e)) from e
+
+
+_sandboxes: dict[str, SQLSandbox] = {}
+
+
+def get_sql_sandbox(db_path: str = "research/fusion_research.db") -> SQLSandbox:
+    """Get the shared sandbox for a database file."""
+    key = str(Path(db_path).resolve())
+    if key not in _sandboxes:
+        _sandboxes[key] = SQLSandbox(db_path)
+    return _sandboxes[key]
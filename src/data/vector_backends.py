@@ -0,0 +1,766 @@
+"""Storage backends for ``VectorStore``.
+
+A backend stores documents with precomputed embeddings and answers
+nearest-neighbour queries; embedding the text is left to ``VectorStore``.
+Filters use Chroma's ``where`` syntax in both backends::
+
+    {"type": "company"}
+    {"$and": [{"type": "company"}, {"trl": {"$gte": 5}}]}
+
+Backends:
+
+- ``ChromaBackend``: a persistent ChromaDB collection
+- ``NumpyBackend``: an in-process index without extra services. Vectors are
+  appended to a raw float32 file that is memory-mapped on load, so opening a
+  large index costs milliseconds; documents and metadata are appended to a
+  JSON-lines file. Queries compute cosine similarity against all matching
+  rows with one matrix product (shared by a batch of queries), or, with IVF
+  enabled, only against the rows of the ``nprobe`` clusters nearest to the
+  query.
+"""
+
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+from langchain_core.documents import Document
+
+from src.data.vector_quantization import QUANTIZATIONS, create_quantizer, load_quantizer
+
+# Comparison operators of the ``where`` syntax, applied to numeric columns
+_NUMERIC_OPERATORS = {
+    "$gt": np.greater,
+    "$gte": np.greater_equal,
+    "$lt": np.less,
+    "$lte": np.less_equal,
+}
+
+
+class VectorBackend:
+    """Interface of a vector storage backend."""
+
+    name = "base"
+
+    def upsert(self, ids: list[str], embeddings: list[list[float]], documents: list[Document]):
+        """Store documents under ``ids``, replacing existing ones."""
+        raise NotImplementedError
+
+    def query(
+        self,
+        embedding: list[float],
+        k: int = 5,
+        where: Optional[dict] = None,
+    ) -> list[tuple[Document, float]]:
+        """Nearest documents to ``embedding`` as ``(document, distance)``, closest first."""
+        raise NotImplementedError
+
+    def query_many(
+        self,
+        embeddings: list[list[float]],
+        k: int = 5,
+        where: Optional[dict] = None,
+    ) -> list[list[tuple[Document, float]]]:
+        """``query`` for several embeddings at once; one result list per embedding."""
+        return [self.query(embedding, k=k, where=where) for embedding in embeddings]
+
+    def get(self, where: Optional[dict] = None, include_embeddings: bool = False) -> dict:
+        """
+        Stored documents matching ``where``.
+
+        Returns:
+            Dict with ``ids``, ``documents`` and ``metadatas`` lists, plus an
+            ``embeddings`` array when requested
+        """
+        raise NotImplementedError
+
+    def delete(self, ids: list[str]):
+        """Remove the documents with ``ids`` (unknown ids are ignored)."""
+        raise NotImplementedError
+
+    def count(self) -> int:
+        """Number of stored documents."""
+        raise NotImplementedError
+
+    def delete_all(self):
+        """Remove all documents."""
+        raise NotImplementedError
+
+
+class ChromaBackend(VectorBackend):
+    """Backend storing vectors in a persistent ChromaDB collection."""
+
+    name = "chroma"
+
+    def __init__(self, persist_directory: str, collection_name: str = "fusion_research"):
+        self.persist_directory = persist_directory
+        self.collection_name = collection_name
+        self._client = None
+        self._collection = None
+
+    @property
+    def client(self):
+        """Get or create the persistent Chroma client."""
+        if self._client is None:
+            import chromadb
+
+            self._client = chromadb.PersistentClient(path=self.persist_directory)
+        return self._client
+
+    @property
+    def collection(self):
+        """Get or create the Chroma collection."""
+        if self._collection is None:
+            # Embeddings are always passed in, so no embedding function is attached
+            self._collection = self.client.get_or_create_collection(
+                self.collection_name, embedding_function=None
+            )
+        return self._collection
+
+    def upsert(self, ids: list[str], embeddings: list[list[float]], documents: list[Document]):
+        self.collection.upsert(
+            ids=ids,
+            embeddings=embeddings,
+            documents=[doc.page_content for doc in documents],
+            metadatas=[doc.metadata or None for doc in documents],
+        )
+
+    def query(
+        self,
+        embedding: list[float],
+        k: int = 5,
+        where: Optional[dict] = None,
+    ) -> list[tuple[Document, float]]:
+        return self.query_many([embedding], k=k, where=where)[0]
+
+    def query_many(
+        self,
+        embeddings: list[list[float]],
+        k: int = 5,
+        where: Optional[dict] = None,
+    ) -> list[list[tuple[Document, float]]]:
+        if not len(embeddings):
+            return []
+        result = self.collection.query(
+            query_embeddings=list(embeddings),
+            n_results=k,
+            where=where,
+            include=["documents", "metadatas", "distances"],
+        )
+        return [
+            [
+                (Document(page_content=content, metadata=metadata or {}, id=doc_id), distance)
+                for doc_id, content, metadata, distance in zip(ids, documents, metadatas, distances)
+                if content is not None
+            ]
+            for ids, documents, metadatas, distances in zip(
+                result["ids"], result["documents"], result["metadatas"], result["distances"]
+            )
+        ]
+
+    def get(self, where: Optional[dict] = None, include_embeddings: bool = False) -> dict:
+        include = ["documents", "metadatas"] + (["embeddings"] if include_embeddings else [])
+        stored = self.collection.get(where=where, include=include)
+        result = {
+            "ids": stored["ids"],
+            "documents": stored["documents"],
+            "metadatas": [metadata or {} for metadata in stored["metadatas"]],
+        }
+        if include_embeddings:
+            result["embeddings"] = np.asarray(stored["embeddings"], dtype=np.float32)
+        return result
+
+    def delete(self, ids: list[str]):
+        if ids:
+            self.collection.delete(ids=ids)
+
+    def count(self) -> int:
+        return self.collection.count()
+
+    def delete_all(self):
+        self.client.delete_collection(self.collection_name)
+        self._collection = None
+
+
+class NumpyBackend(VectorBackend):
+    """In-process backend: memory-mapped float32 vectors with metadata columns."""
+
+    name = "numpy"
+
+    VECTORS_FILE = "vectors.f32"
+    RECORDS_FILE = "records.jsonl"
+    META_FILE = "meta.json"
+    CODES_FILE = "codes.u8"
+
+    # Shortlist factors tried by ``calibrate``
+    RESCORE_FACTORS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+    def __init__(
+        self,
+        directory: str,
+        ivf_lists: int = 0,
+        nprobe: int = 8,
+        ivf_min_rows: int = 20_000,
+        quantization: Optional[str] = None,
+        rescore: int = 4,
+        recall_target: Optional[float] = None,
+        pq_subspaces: Optional[int] = None,
+        quantize_min_rows: int = 1000,
+    ):
+        """
+        Initialize backend, loading an existing index from ``directory``.
+
+        Args:
+            directory: Index directory (created on first write)
+            ivf_lists: Number of IVF clusters; 0 always searches exhaustively
+            nprobe: Clusters searched per query when IVF is used
+            ivf_min_rows: Documents needed before the IVF partition is built
+            quantization: "int8" or "pq" to rank by compact in-memory codes and
+                re-score a shortlist with the float vectors; None ranks by the
+                float vectors only
+            rescore: Shortlist size as a multiple of k
+            recall_target: When set, ``rescore`` is calibrated to reach this
+                recall@k against exact search (again whenever the index doubled)
+            pq_subspaces: Bytes per product-quantized code (default: dimensions / 8)
+            quantize_min_rows: Documents needed before codes are built; smaller
+                indexes are searched exactly
+        """
+        if quantization and quantization not in QUANTIZATIONS:
+            raise ValueError(
+                f"Unknown vector quantization: {quantization} "
+                f"(expected one of {', '.join(QUANTIZATIONS)})"
+            )
+        self.directory = Path(directory)
+        self.ivf_lists = ivf_lists
+        self.nprobe = nprobe
+        self.ivf_min_rows = ivf_min_rows
+        self.quantization = quantization
+        self.rescore = rescore
+        self.recall_target = recall_target
+        self.pq_subspaces = pq_subspaces
+        self.quantize_min_rows = max(quantize_min_rows, 256 if quantization == "pq" else 1)
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Storage
+
+    def _load(self):
+        """Memory-map the vectors and read the records of an existing index."""
+        self.dimensions: Optional[int] = None
+        self._ids: list[Optional[str]] = []
+        self._documents: list[str] = []
+        self._metadatas: list[dict] = []
+        self._row_of: dict[str, int] = {}
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._columns: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._ivf: Optional[tuple[np.ndarray, np.ndarray]] = None
+        self._quantizer = None
+        self._codes: Optional[np.ndarray] = None
+        self._calibrated_rows = 0
+
+        meta_path = self.directory / self.META_FILE
+        if not meta_path.exists():
+            return
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        self.dimensions = meta["dimensions"]
+        self._map_vectors()
+        rows = len(self._matrix)
+
+        # Rows without a complete record (interrupted write) stay dead
+        self._ids = [None] * rows
+        self._documents = [""] * rows
+        self._metadatas = [{}] * rows
+        records_path = self.directory / self.RECORDS_FILE
+        if records_path.exists():
+            with open(records_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if record.get("deleted"):
+                        self._delete_record(record["id"])
+                    elif record["row"] < rows:
+                        self._set_record(record)
+
+        if self.quantization:
+            self._open_codes(meta)
+
+    def _map_vectors(self):
+        """(Re)open the memory map over the vector file."""
+        path = self.directory / self.VECTORS_FILE
+        rows = path.stat().st_size // (4 * self.dimensions) if path.exists() else 0
+        if rows:
+            self._matrix = np.memmap(
+                path, dtype=np.float32, mode="r", shape=(rows, self.dimensions)
+            )
+        else:
+            self._matrix = np.empty((0, self.dimensions), dtype=np.float32)
+
+    def _update_meta(self, **values):
+        """Merge ``values`` into the index metadata file."""
+        path = self.directory / self.META_FILE
+        meta = json.loads(path.read_text(encoding="utf-8"))
+        meta.update(values)
+        path.write_text(json.dumps(meta), encoding="utf-8")
+
+    def _set_record(self, record: dict):
+        """Make ``record``'s row the live row of its id."""
+        row = record["row"]
+        previous = self._row_of.get(record["id"])
+        if previous is not None:
+            self._ids[previous] = None
+        self._row_of[record["id"]] = row
+        self._ids[row] = record["id"]
+        self._documents[row] = record["document"]
+        self._metadatas[row] = record["metadata"]
+
+    def _delete_record(self, doc_id: str):
+        """Mark the live row of ``doc_id`` as removed."""
+        row = self._row_of.pop(doc_id, None)
+        if row is not None:
+            self._ids[row] = None
+
+    def upsert(self, ids: list[str], embeddings: list[list[float]], documents: list[Document]):
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if vectors.ndim != 2 or not len(vectors):
+            return
+        if self.dimensions is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.dimensions = vectors.shape[1]
+            (self.directory / self.META_FILE).write_text(
+                json.dumps({"dimensions": self.dimensions}), encoding="utf-8"
+            )
+        elif vectors.shape[1] != self.dimensions:
+            raise ValueError(
+                f"Embedding size {vectors.shape[1]} does not match the index ({self.dimensions}); "
+                "clear the vector store after changing the embedding model"
+            )
+
+        # Store unit vectors so cosine similarity is a dot product
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms > 0, norms, 1.0)
+
+        first_row = len(self._ids)
+        records = [
+            {"row": first_row + i, "id": doc_id, "document": doc.page_content,
+             "metadata": doc.metadata or {}}
+            for i, (doc_id, doc) in enumerate(zip(ids, documents))
+        ]
+        # Vectors first: records pointing past the end of the file are ignored on load
+        with open(self.directory / self.VECTORS_FILE, "ab") as f:
+            f.write(vectors.tobytes())
+        with open(self.directory / self.RECORDS_FILE, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+
+        self._ids.extend([None] * len(records))
+        self._documents.extend([""] * len(records))
+        self._metadatas.extend([{}] * len(records))
+        for record in records:
+            self._set_record(record)
+        self._map_vectors()
+        self._columns.clear()
+        self._extend_ivf(first_row)
+        if self._codes is not None:
+            self._append_codes(first_row)
+        elif self.quantization and self.count() >= self.quantize_min_rows:
+            self._build_codes()
+
+        if len(self._ids) > 2 * len(self._row_of) + 1000:
+            self.compact()
+
+    def compact(self):
+        """Rewrite the files without replaced or deleted rows."""
+        rows = self._live_rows()
+        temporary = self.directory.with_name(f"{self.directory.name}.{uuid.uuid4().hex}")
+        temporary.mkdir(parents=True)
+        np.asarray(self._matrix[rows]).tofile(temporary / self.VECTORS_FILE)
+        with open(temporary / self.RECORDS_FILE, "w", encoding="utf-8") as f:
+            for new_row, row in enumerate(rows):
+                f.write(json.dumps({
+                    "row": new_row, "id": self._ids[row], "document": self._documents[row],
+                    "metadata": self._metadatas[row],
+                }, ensure_ascii=False) + "\n")
+        shutil.copy(self.directory / self.META_FILE, temporary / self.META_FILE)
+        names = [self.VECTORS_FILE, self.RECORDS_FILE]
+        if self._codes is not None:
+            self._codes[rows].tofile(temporary / self.CODES_FILE)
+            names.append(self.CODES_FILE)
+
+        self._matrix = np.empty((0, self.dimensions), dtype=np.float32)
+        for name in names:
+            os.replace(temporary / name, self.directory / name)
+        shutil.rmtree(temporary)
+        self._load()
+
+    def delete(self, ids: list[str]):
+        ids = [doc_id for doc_id in ids if doc_id in self._row_of]
+        if not ids:
+            return
+        # Tombstones; the rows are dropped at the next compaction
+        with open(self.directory / self.RECORDS_FILE, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps({"id": doc_id, "deleted": True}) + "\n" for doc_id in ids)
+        for doc_id in ids:
+            self._delete_record(doc_id)
+        self._columns.clear()
+
+        if len(self._ids) > 2 * len(self._row_of) + 1000:
+            self.compact()
+
+    def count(self) -> int:
+        return len(self._row_of)
+
+    def delete_all(self):
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        if self.directory.exists():
+            shutil.rmtree(self.directory)
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Filtering
+
+    def _live_rows(self) -> np.ndarray:
+        """Row numbers of current documents, ascending."""
+        return np.fromiter(sorted(self._row_of.values()), dtype=np.int64, count=len(self._row_of))
+
+    def _column(self, name: str) -> tuple[np.ndarray, np.ndarray]:
+        """Metadata column as (object values, float values with NaN for non-numbers)."""
+        if name not in self._columns:
+            values = [metadata.get(name) for metadata in self._metadatas]
+            numbers = [
+                float(value) if isinstance(value, (int, float)) and not isinstance(value, bool)
+                else np.nan
+                for value in values
+            ]
+            self._columns[name] = (
+                np.array(values, dtype=object), np.array(numbers, dtype=np.float64)
+            )
+        return self._columns[name]
+
+    def _where_mask(self, where: dict) -> np.ndarray:
+        """Rows matching a Chroma-style ``where`` filter."""
+        mask = np.ones(len(self._ids), dtype=bool)
+        for key, condition in where.items():
+            if key == "$and":
+                for clause in condition:
+                    mask &= self._where_mask(clause)
+            elif key == "$or":
+                any_mask = np.zeros(len(self._ids), dtype=bool)
+                for clause in condition:
+                    any_mask |= self._where_mask(clause)
+                mask &= any_mask
+            else:
+                mask &= self._condition_mask(key, condition)
+        return mask
+
+    def _condition_mask(self, name: str, condition: Any) -> np.ndarray:
+        """Rows whose metadata field ``name`` satisfies ``condition``."""
+        values, numbers = self._column(name)
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+        mask = np.ones(len(values), dtype=bool)
+        for operator, operand in condition.items():
+            if operator == "$eq":
+                mask &= values == operand
+            elif operator == "$ne":
+                mask &= values != operand
+            elif operator in ("$in", "$nin"):
+                members = set(operand)
+                found = np.fromiter((value in members for value in values), bool, len(values))
+                mask &= found if operator == "$in" else ~found
+            elif operator in _NUMERIC_OPERATORS:
+                with np.errstate(invalid="ignore"):
+                    mask &= _NUMERIC_OPERATORS[operator](numbers, float(operand))
+            else:
+                raise ValueError(f"Unsupported filter operator: {operator}")
+        return mask
+
+    def _matching_rows(self, where: Optional[dict]) -> np.ndarray:
+        """Live rows matching ``where``, ascending."""
+        rows = self._live_rows()
+        if where:
+            rows = rows[self._where_mask(where)[rows]]
+        return rows
+
+    # ------------------------------------------------------------------
+    # IVF partition
+
+    def _train_ivf(self, iterations: int = 10, sample_per_list: int = 256):
+        """Cluster the live vectors with spherical k-means and assign every row."""
+        rows = self._live_rows()
+        rng = np.random.default_rng(0)
+        sample_size = min(len(rows), self.ivf_lists * sample_per_list)
+        sample = np.asarray(self._matrix[np.sort(rng.choice(rows, sample_size, replace=False))])
+        centroids = sample[rng.choice(len(sample), self.ivf_lists, replace=False)]
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for cluster in range(self.ivf_lists):
+                members = sample[labels == cluster]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    centroids[cluster] = centroid / (np.linalg.norm(centroid) or 1.0)
+        self._ivf = (centroids, self._assign(centroids, 0))
+
+    def _assign(self, centroids: np.ndarray, first_row: int, block_size: int = 8192) -> np.ndarray:
+        """Nearest IVF cluster of every row from ``first_row`` on."""
+        labels = [
+            np.argmax(np.asarray(self._matrix[start:start + block_size]) @ centroids.T, axis=1)
+            for start in range(first_row, len(self._matrix), block_size)
+        ]
+        return np.concatenate(labels).astype(np.int32) if labels else np.empty(0, dtype=np.int32)
+
+    def _extend_ivf(self, first_row: int):
+        """Assign appended rows to clusters; retrain once the index doubled."""
+        if self._ivf is None:
+            return
+        centroids, labels = self._ivf
+        if len(self._matrix) > 2 * len(labels):
+            self._ivf = None
+            return
+        self._ivf = (centroids, np.concatenate([labels, self._assign(centroids, first_row)]))
+
+    def _ivf_candidates(self, query: np.ndarray, rows: np.ndarray, k: int) -> np.ndarray:
+        """Restrict ``rows`` to the clusters nearest to ``query`` when IVF applies."""
+        if not self.ivf_lists or self.count() < self.ivf_min_rows:
+            return rows
+        if self._ivf is None:
+            self._train_ivf()
+        centroids, labels = self._ivf
+        probes = np.argsort(-(centroids @ query))[:self.nprobe]
+        candidates = rows[np.isin(labels[rows], probes)]
+        return candidates if len(candidates) >= k else rows
+
+    # ------------------------------------------------------------------
+    # Quantization
+
+    def _open_codes(self, meta: dict):
+        """Load the stored codes, (re)building them when missing or outdated."""
+        path = self.directory / self.CODES_FILE
+        if meta.get("quantization") == self.quantization and path.exists():
+            quantizer = load_quantizer(self.quantization, self.directory, self.dimensions)
+            if quantizer.trained:
+                codes = np.fromfile(path, dtype=np.uint8)
+                rows = min(len(codes) // quantizer.code_size, len(self._matrix))
+                self._quantizer = quantizer
+                self._codes = codes[:rows * quantizer.code_size].reshape(rows, -1)
+                self.rescore = meta.get("rescore", self.rescore)
+                self._calibrated_rows = meta.get("calibrated_rows", 0)
+                if rows < len(self._matrix):
+                    # Interrupted write: rewrite the file with the missing codes
+                    self._append_codes(rows, rewrite=True)
+                return
+        if self.count() >= self.quantize_min_rows:
+            self._build_codes()
+
+    def _build_codes(self, sample_size: int = 65_536):
+        """Train the quantizer on live vectors and encode every row."""
+        quantizer = create_quantizer(self.quantization, self.dimensions, self.pq_subspaces)
+        if not quantizer.trained:
+            rows = self._live_rows()
+            rng = np.random.default_rng(0)
+            sample = np.sort(rng.choice(rows, min(len(rows), sample_size), replace=False))
+            quantizer.fit(np.asarray(self._matrix[sample]))
+        quantizer.save(self.directory)
+        self._quantizer = quantizer
+        self._codes = np.empty((0, quantizer.code_size), dtype=np.uint8)
+        self._calibrated_rows = 0
+        self._append_codes(0, rewrite=True)
+        self._update_meta(quantization=self.quantization)
+
+    def _append_codes(self, first_row: int, rewrite: bool = False, block_size: int = 65_536):
+        """Encode rows from ``first_row`` on and store their codes."""
+        blocks = [
+            self._quantizer.encode(np.asarray(self._matrix[start:start + block_size]))
+            for start in range(first_row, len(self._matrix), block_size)
+        ]
+        self._codes = np.concatenate([self._codes[:first_row], *blocks])
+        if rewrite:
+            self._codes.tofile(self.directory / self.CODES_FILE)
+        else:
+            with open(self.directory / self.CODES_FILE, "ab") as f:
+                for block in blocks:
+                    f.write(block.tobytes())
+
+    def calibrate(
+        self,
+        target_recall: float,
+        k: int = 10,
+        samples: int = 64,
+        queries: Optional[np.ndarray] = None,
+    ) -> dict:
+        """
+        Set ``rescore`` to the smallest shortlist factor reaching ``target_recall``.
+
+        Recall@k is measured against exact float32 search, for ``queries``
+        (ideally real query embeddings) or else midpoints of ``samples``
+        random pairs of stored vectors. A true top-k document is returned
+        exactly when it makes the shortlist, so the recall of a factor is the
+        shortlist's share of the exact top-k.
+
+        Returns:
+            Dict with the chosen ``rescore`` factor and its measured ``recall``
+        """
+        if self._codes is None:
+            return {"rescore": self.rescore, "recall": 1.0}
+        rows = self._live_rows()
+        k = min(k, len(rows))
+        if queries is None:
+            rng = np.random.default_rng(0)
+            pairs = rng.choice(rows, size=(samples, 2))
+            queries = np.asarray(self._matrix[pairs[:, 0]]) + np.asarray(self._matrix[pairs[:, 1]])
+        queries = np.asarray(queries, dtype=np.float32).reshape(-1, self.dimensions)
+        queries = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+        samples = len(queries)
+
+        exact = self._exact_scores(rows, queries)
+        truth = np.argpartition(-exact, k - 1, axis=0)[:k]
+        estimates = self._quantizer.scores(self._codes[rows], queries)
+        longest = min(len(rows), k * self.RESCORE_FACTORS[-1])
+        shortlist = np.argpartition(-estimates, longest - 1, axis=0)[:longest]
+        ranked = np.take_along_axis(
+            shortlist, np.argsort(-np.take_along_axis(estimates, shortlist, axis=0), axis=0), axis=0
+        )
+
+        recall = 1.0
+        for factor in self.RESCORE_FACTORS:
+            size = min(len(rows), k * factor)
+            recall = float(np.mean([
+                len(np.intersect1d(truth[:, q], ranked[:size, q])) / k for q in range(samples)
+            ]))
+            if recall >= target_recall or size == len(rows):
+                break
+        self.rescore = factor
+        self._calibrated_rows = self.count()
+        self._update_meta(rescore=factor, calibrated_rows=self._calibrated_rows)
+        return {"rescore": factor, "recall": recall}
+
+    def memory_footprint(self) -> dict:
+        """
+        Bytes of the float vectors (memory-mapped from disk) and of the
+        structure scanned by every query (the codes, or the float vectors).
+        """
+        vectors = int(self._matrix.nbytes)
+        if self._codes is None:
+            index = vectors
+        else:
+            codebooks = getattr(self._quantizer, "codebooks", None)
+            index = int(self._codes.nbytes) + (0 if codebooks is None else int(codebooks.nbytes))
+        return {
+            "quantization": self.quantization if self._codes is not None else "none",
+            "vectors_bytes": vectors,
+            "index_bytes": index,
+        }
+
+    # ------------------------------------------------------------------
+    # Queries
+
+    def query(
+        self,
+        embedding: list[float],
+        k: int = 5,
+        where: Optional[dict] = None,
+    ) -> list[tuple[Document, float]]:
+        if self.dimensions is None or not self._row_of:
+            return []
+        query = np.asarray(embedding, dtype=np.float32)
+        query = query / (np.linalg.norm(query) or 1.0)
+
+        rows = self._ivf_candidates(query, self._matching_rows(where), k)
+        if not len(rows):
+            return []
+        return self._rank(rows, query[None, :], k)[0]
+
+    def query_many(
+        self,
+        embeddings: list[list[float]],
+        k: int = 5,
+        where: Optional[dict] = None,
+        block_size: int = 64,
+    ) -> list[list[tuple[Document, float]]]:
+        """
+        Score all queries with one matrix product per block of ``block_size`` queries.
+
+        With IVF active every query probes its own clusters, so queries run one by one.
+        """
+        if self.dimensions is None or not self._row_of:
+            return [[] for _ in embeddings]
+        if self.ivf_lists and self.count() >= self.ivf_min_rows:
+            return super().query_many(embeddings, k=k, where=where)
+        queries = np.asarray(embeddings, dtype=np.float32).reshape(-1, self.dimensions)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(norms > 0, norms, 1.0)
+
+        rows = self._matching_rows(where)
+        if not len(rows):
+            return [[] for _ in queries]
+        results = []
+        for start in range(0, len(queries), block_size):
+            results.extend(self._rank(rows, queries[start:start + block_size], k))
+        return results
+
+    def _exact_scores(self, rows: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        """Cosine similarities of ``rows`` and unit queries, ``rows x queries``."""
+        matrix = self._matrix if len(rows) == len(self._matrix) else self._matrix[rows]
+        return matrix @ queries.T
+
+    def _rank(
+        self,
+        rows: np.ndarray,
+        queries: np.ndarray,
+        k: int,
+    ) -> list[list[tuple[Document, float]]]:
+        """
+        Top-k of ``rows`` for each unit query: exact scores, or with codes,
+        a shortlist by estimated score re-scored with the float vectors.
+        """
+        k = min(k, len(rows))
+        if self._codes is not None and self.recall_target is not None and (
+            not self._calibrated_rows or self.count() >= 2 * self._calibrated_rows
+        ):
+            self.calibrate(self.recall_target)
+        shortlist_size = k * self.rescore
+        if self._codes is None or len(rows) <= shortlist_size:
+            scores = self._exact_scores(rows, queries)
+            candidates = np.argpartition(-scores, k - 1, axis=0)[:k]
+        else:
+            estimates = self._quantizer.scores(self._codes[rows], queries)
+            shortlist = np.sort(
+                np.argpartition(-estimates, shortlist_size - 1, axis=0)[:shortlist_size], axis=0
+            )
+            # Exact scores of the shortlisted rows only (reads them from the mapped file)
+            scores = np.zeros(estimates.shape, dtype=np.float32)
+            for column in range(len(queries)):
+                picked = shortlist[:, column]
+                scores[picked, column] = np.asarray(self._matrix[rows[picked]]) @ queries[column]
+            candidates = shortlist[
+                np.argpartition(-np.take_along_axis(scores, shortlist, axis=0), k - 1, axis=0)[:k],
+                np.arange(len(queries)),
+            ]
+
+        results = []
+        for column in range(len(queries)):
+            top = candidates[:, column]
+            top = top[np.argsort(-scores[top, column], kind="stable")]
+            results.append([
+                (self._document(int(rows[i])), float(1.0 - scores[i, column])) for i in top
+            ])
+        return results
+
+    def _document(self, row: int) -> Document:
+        return Document(
+            page_content=self._documents[row], metadata=self._metadatas[row], id=self._ids[row]
+        )
+
+    def get(self, where: Optional[dict] = None, include_embeddings: bool = False) -> dict:
+        rows = self._matching_rows(where)
+        result = {
+            "ids": [self._ids[row] for row in rows],
+            "documents": [self._documents[row] for row in rows],
+            "metadatas": [self._metadatas[row] for row in rows],
+        }
+        if include_embeddings:
+            result["embeddings"] = np.asarray(self._matrix[rows], dtype=np.float32)
+        return result
@@ -0,0 +1,180 @@
+"""Compact vector codes for the NumPy vector backend.
+
+A quantizer turns unit float32 vectors into short ``uint8`` codes and
+estimates inner products between codes and (float) queries. The backend
+keeps only the codes in memory, ranks all rows by the estimate and
+re-scores a shortlist against the exact float32 vectors, which stay
+memory-mapped on disk.
+
+- ``Int8Quantizer``: one signed byte per dimension plus a float32 scale
+  per row (4x smaller than float32, no training)
+- ``ProductQuantizer``: the vector is cut into ``subspaces`` pieces and each
+  piece is replaced by the index of its nearest of 256 trained centroids
+  (one byte per subspace, e.g. 48 bytes instead of 1536 for 384 dimensions)
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+QUANTIZATIONS = ("int8", "pq")
+
+# Rows scored per step, bounding the temporary float arrays
+_BLOCK_ROWS = 32_768
+
+
+class Int8Quantizer:
+    """Symmetric int8 quantization with a per-row scale."""
+
+    name = "int8"
+    trained = True
+
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+        self.code_size = dimensions + 4  # int8 values, then the float32 scale
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Codes of float vectors, one row each."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        codes = np.empty((len(vectors), self.code_size), dtype=np.uint8)
+        values = np.rint(vectors / scales[:, None]).astype(np.int8)
+        codes[:, :self.dimensions] = values.view(np.uint8)
+        codes[:, self.dimensions:] = scales.astype(np.float32)[:, None].view(np.uint8)
+        return codes
+
+    def scores(self, codes: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        """Estimated inner products, ``len(codes) x len(queries)``."""
+        scores = np.empty((len(codes), len(queries)), dtype=np.float32)
+        for start in range(0, len(codes), _BLOCK_ROWS):
+            block = codes[start:start + _BLOCK_ROWS]
+            values = block[:, :self.dimensions].view(np.int8).astype(np.float32)
+            scales = np.ascontiguousarray(block[:, self.dimensions:]).view(np.float32)
+            scores[start:start + len(block)] = (values @ queries.T) * scales
+        return scores
+
+    def save(self, directory: Path):
+        """Nothing to persist (no training)."""
+
+    @classmethod
+    def load(cls, directory: Path, dimensions: int) -> "Int8Quantizer":
+        return cls(dimensions)
+
+
+class ProductQuantizer:
+    """Product quantization with 256 centroids per subspace."""
+
+    name = "pq"
+    CODEBOOK_FILE = "pq_codebooks.npy"
+    CENTROIDS = 256
+
+    def __init__(self, dimensions: int, subspaces: Optional[int] = None):
+        """
+        Initialize an untrained quantizer.
+
+        Args:
+            dimensions: Vector size
+            subspaces: Bytes per code (default: one per 8 dimensions); vectors
+                are zero-padded when the size is not a multiple
+        """
+        self.dimensions = dimensions
+        self.subspaces = subspaces or max(1, dimensions // 8)
+        self.sub_dimensions = -(-dimensions // self.subspaces)
+        self.code_size = self.subspaces
+        self.codebooks: Optional[np.ndarray] = None  # subspaces x 256 x sub_dimensions
+
+    @property
+    def trained(self) -> bool:
+        return self.codebooks is not None
+
+    def _split(self, vectors: np.ndarray) -> np.ndarray:
+        """Vectors as ``rows x subspaces x sub_dimensions`` (zero-padded)."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        padding = self.subspaces * self.sub_dimensions - self.dimensions
+        if padding:
+            vectors = np.pad(vectors, ((0, 0), (0, padding)))
+        return vectors.reshape(len(vectors), self.subspaces, self.sub_dimensions)
+
+    def fit(self, sample: np.ndarray, iterations: int = 10, seed: int = 0):
+        """Train the codebooks with k-means on a sample of vectors (at least 256)."""
+        parts = self._split(sample)
+        if len(parts) < self.CENTROIDS:
+            raise ValueError(f"Product quantization needs at least {self.CENTROIDS} vectors")
+        rng = np.random.default_rng(seed)
+        codebooks = np.empty(
+            (self.subspaces, self.CENTROIDS, self.sub_dimensions), dtype=np.float32
+        )
+        for j in range(self.subspaces):
+            points = parts[:, j]
+            centroids = points[rng.choice(len(points), self.CENTROIDS, replace=False)].copy()
+            for _ in range(iterations):
+                labels = self._nearest(points, centroids)
+                counts = np.bincount(labels, minlength=self.CENTROIDS)
+                sums = np.stack([
+                    np.bincount(labels, weights=points[:, d], minlength=self.CENTROIDS)
+                    for d in range(self.sub_dimensions)
+                ], axis=1)
+                filled = counts > 0
+                centroids[filled] = sums[filled] / counts[filled, None]
+            codebooks[j] = centroids
+        self.codebooks = codebooks
+
+    @staticmethod
+    def _nearest(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Index of the nearest centroid (Euclidean) of every point."""
+        distances = (centroids ** 2).sum(axis=1) - 2 * points @ centroids.T
+        return np.argmin(distances, axis=1)
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Codes of float vectors, one row each."""
+        codes = np.empty((len(vectors), self.subspaces), dtype=np.uint8)
+        for start in range(0, len(vectors), _BLOCK_ROWS):
+            parts = self._split(vectors[start:start + _BLOCK_ROWS])
+            for j in range(self.subspaces):
+                codes[start:start + len(parts), j] = self._nearest(parts[:, j], self.codebooks[j])
+        return codes
+
+    def scores(self, codes: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        """Estimated inner products via per-query lookup tables."""
+        # tables[q, j, c]: inner product of query q's piece j with centroid c
+        tables = np.einsum("qjd,jcd->qjc", self._split(queries), self.codebooks)
+        scores = np.empty((len(codes), len(queries)), dtype=np.float32)
+        for start in range(0, len(codes), _BLOCK_ROWS):
+            block = codes[start:start + _BLOCK_ROWS]
+            total = np.zeros((len(queries), len(block)), dtype=np.float32)
+            for j in range(self.subspaces):
+                total += tables[:, j, block[:, j]]
+            scores[start:start + len(block)] = total.T
+        return scores
+
+    def save(self, directory: Path):
+        np.save(directory / self.CODEBOOK_FILE, self.codebooks)
+
+    @classmethod
+    def load(cls, directory: Path, dimensions: int) -> "ProductQuantizer":
+        """Quantizer with saved codebooks, or untrained when none are saved."""
+        path = directory / cls.CODEBOOK_FILE
+        if not path.exists():
+            return cls(dimensions)
+        codebooks = np.load(path)
+        quantizer = cls(dimensions, subspaces=len(codebooks))
+        quantizer.codebooks = codebooks
+        return quantizer
+
+
+def create_quantizer(name: str, dimensions: int, subspaces: Optional[int] = None):
+    """Untrained quantizer by name."""
+    if name == "int8":
+        return Int8Quantizer(dimensions)
+    if name == "pq":
+        return ProductQuantizer(dimensions, subspaces)
+    raise ValueError(
+        f"Unknown vector quantization: {name} (expected one of {', '.join(QUANTIZATIONS)})"
+    )
+
+
+def load_quantizer(name: str, directory: Path, dimensions: int):
+    """Quantizer as saved in an index directory."""
+    return {"int8": Int8Quantizer, "pq": ProductQuantizer}[name].load(directory, dimensions)
@@ -1,56 +1,139 @@
-"""ChromaDB vector store for semantic search."""
+"""Vector store for semantic search.
 
-import os
+Documents are embedded here and stored in a pluggable backend (see
+``src.data.vector_backends``): a ChromaDB collection by default, or the
+in-process NumPy index, which together with the hashing embedder
+(``embedding_model="hashing"``) works without any running service.
+"""
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
 
-from langchain_chroma import Chroma
 from langchain_core.documents import Document
-from langchain_community.embeddings import OllamaEmbeddings
 
 from src.config import get_settings
+from src.data.hashing_embeddings import HASHING_MODEL, HashingEmbeddings
+from src.data.lexical_index import LexicalIndex
+from src.data.search_filters import combine_where
+from src.data.vector_backends import ChromaBackend, NumpyBackend, VectorBackend
+
+if TYPE_CHECKING:
+    from src.data.company_similarity import CompanySimilarity
+    from src.data.research_chunker import ResearchChunk
+
+BACKENDS = ("chroma", "numpy")
+
+# Parallel embedding requests when embedding a batch of queries (the Ollama
+# embedder sends one request per text)
+EMBED_CONCURRENCY = 4
+
+
+def document_id(doc_type: str, key) -> str:
+    """Stable id of an entity's document, so re-adding it replaces the old vector."""
+    return f"{doc_type}:{key}"
 
 
 class VectorStore:
-    """ChromaDB-based vector store for semantic search over fusion research data."""
+    """Vector store for semantic search over fusion research data."""
     
     def __init__(
         self,
         persist_directory: Optional[str] = None,
         collection_name: str = "fusion_research",
-        embedding_model: str = "nomic-embed-text",
+        embedding_model: Optional[str] = None,
         ollama_base_url: str = "http://localhost:11434",
+        backend: Union[str, VectorBackend, None] = None,
+        embeddings=None,
     ):
+        """
+        Initialize vector store.
+        
+        Args:
+            persist_directory: Directory holding the index
+            collection_name: Collection (Chroma) or index subdirectory (NumPy)
+            embedding_model: Ollama embedding model, or "hashing" for the
+                local hashing embedder (defaults to the EMBEDDING_MODEL setting)
+            ollama_base_url: Ollama server URL
+            backend: "chroma", "numpy" or a backend instance (defaults to the
+                VECTOR_BACKEND setting)
+            embeddings: Embedder to use instead of ``embedding_model``
+        """
         settings = get_settings()
         self.persist_directory = persist_directory or str(settings.chroma_db_path)
         self.collection_name = collection_name
         
-        # Use Ollama embeddings (local)
-        self.embeddings = OllamaEmbeddings(
-            model=embedding_model,
-            base_url=ollama_base_url,
-        )
+        self.embedding_model = embedding_model or settings.embedding_model
+        self.ollama_base_url = ollama_base_url
+        self._embeddings = embeddings
         
         # Ensure directory exists
         Path(self.persist_directory).mkdir(parents=True, exist_ok=True)
         
-        # Initialize ChromaDB
-        self._vectorstore: Optional[Chroma] = None
+        self.backend = self._create_backend(backend or settings.vector_backend)
+        
+        # Bumped on every write through this store; with the collection size
+        # (which also sees other processes' writes) it keys the cached indexes
+        self._writes = 0
+        
+        # BM25 index over the same documents, rebuilt when the collection changes
+        self._lexical_index: Optional[LexicalIndex] = None
+        self._lexical_version: Optional[tuple[int, int]] = None
+        
+        # Bumped on every company write; keys the cached company similarity table
+        self._company_writes = 0
+        self._company_similarity: Optional["CompanySimilarity"] = None
     
-    @property
-    def vectorstore(self) -> Chroma:
-        """Get or create the Chroma vectorstore."""
-        if self._vectorstore is None:
-            self._vectorstore = Chroma(
-                collection_name=self.collection_name,
-                embedding_function=self.embeddings,
-                persist_directory=self.persist_directory,
+    def _create_backend(self, backend: Union[str, VectorBackend]) -> VectorBackend:
+        """Backend instance for a backend name."""
+        if isinstance(backend, VectorBackend):
+            return backend
+        settings = get_settings()
+        if backend == "chroma":
+            if settings.vector_quantization:
+                raise ValueError("VECTOR_QUANTIZATION requires VECTOR_BACKEND=numpy")
+            return ChromaBackend(self.persist_directory, self.collection_name)
+        if backend == "numpy":
+            return NumpyBackend(
+                str(Path(self.persist_directory) / f"{self.collection_name}_numpy"),
+                quantization=settings.vector_quantization or None,
+                recall_target=settings.vector_recall_target,
             )
-        return self._vectorstore
+        raise ValueError(
+            f"Unknown vector backend: {backend} (expected one of {', '.join(BACKENDS)})"
+        )
     
-    def add_documents(self, documents: list[Document]) -> list[str]:
-        """Add documents to the vector store."""
-        return self.vectorstore.add_documents(documents)
+    @property
+    def embeddings(self):
+        """Get or create the embedder (Ollama, or the local hashing embedder)."""
+        if self._embeddings is None:
+            if self.embedding_model == HASHING_MODEL:
+                self._embeddings = HashingEmbeddings()
+            else:
+                from langchain_community.embeddings import OllamaEmbeddings
+
+                self._embeddings = OllamaEmbeddings(
+                    model=self.embedding_model,
+                    base_url=self.ollama_base_url,
+                )
+        return self._embeddings
+    
+    def add_documents(
+        self,
+        documents: list[Document],
+        ids: Optional[list[str]] = None,
+    ) -> list[str]:
+        """Add documents to the vector store (documents with existing ids are replaced)."""
+        if not documents:
+            return []
+        ids = ids or [doc.id or str(uuid.uuid4()) for doc in documents]
+        embeddings = self.embeddings.embed_documents([doc.page_content for doc in documents])
+        self.backend.upsert(ids, embeddings, documents)
+        self._writes += 1
+        if any(doc.metadata.get("type") == "company" for doc in documents):
+            self._company_writes += 1
+        return ids
     
     def add_company(
         self,
@@ -91,7 +174,7 @@ class VectorStore:
             }
         )
         
-        ids = self.vectorstore.add_documents([doc])
+        ids = self.add_documents([doc], ids=[document_id("company", company_id)])
         return ids[0] if ids else ""
     
     def add_technology(
@@ -127,7 +210,7 @@ class VectorStore:
             }
         )
         
-        ids = self.vectorstore.add_documents([doc])
+        ids = self.add_documents([doc], ids=[document_id("technology", tech_id)])
         return ids[0] if ids else ""
     
     def add_market(
@@ -160,7 +243,7 @@ class VectorStore:
             }
         )
         
-        ids = self.vectorstore.add_documents([doc])
+        ids = self.add_documents([doc], ids=[document_id("market", market_id)])
         return ids[0] if ids else ""
     
     def add_research_chunk(
@@ -171,7 +254,14 @@ class VectorStore:
         source: str = "Fusion_Research.md",
     ) -> str:
         """Add a research document chunk to the vector store."""
-        doc = Document(
+        doc = self._research_document(chunk_id, content, section, source)
+        ids = self.add_documents([doc], ids=[document_id("research", chunk_id)])
+        return ids[0] if ids else ""
+    
+    @staticmethod
+    def _research_document(chunk_id: str, content: str, section: str, source: str) -> Document:
+        """Document of a research chunk."""
+        return Document(
             page_content=content,
             metadata={
                 "type": "research",
@@ -180,29 +270,156 @@ class VectorStore:
                 "source": source,
             }
         )
+    
+    def sync_research_chunks(
+        self,
+        chunks: list["ResearchChunk"],
+        source: str = "Fusion_Research.md",
+    ) -> dict:
+        """
+        Make the stored chunks of ``source`` match ``chunks``.
         
-        ids = self.vectorstore.add_documents([doc])
-        return ids[0] if ids else ""
+        Chunk ids are content-derived, so only new or edited chunks are
+        embedded; stored chunks of ``source`` that are no longer produced
+        (including ones from older chunkings) are deleted.
+        
+        Returns:
+            Counts of ``added``, ``removed`` and ``unchanged`` chunks
+        """
+        stored = set(self.backend.get(
+            where={"$and": [{"type": "research"}, {"source": source}]}
+        )["ids"])
+        wanted = {document_id("research", chunk.chunk_id): chunk for chunk in chunks}
+        new_ids = [doc_id for doc_id in wanted if doc_id not in stored]
+        stale_ids = sorted(stored - wanted.keys())
+        
+        self.add_documents(
+            [
+                self._research_document(
+                    wanted[doc_id].chunk_id, wanted[doc_id].content, wanted[doc_id].section, source
+                )
+                for doc_id in new_ids
+            ],
+            ids=new_ids,
+        )
+        self.delete_documents(stale_ids)
+        return {
+            "added": len(new_ids),
+            "removed": len(stale_ids),
+            "unchanged": len(wanted) - len(new_ids),
+        }
+    
+    def delete_documents(self, ids: list[str]):
+        """Remove documents by id."""
+        if not ids:
+            return
+        self.backend.delete(ids)
+        self._writes += 1
+        self._company_writes += 1
     
     def similarity_search(
         self,
         query: str,
         k: int = 5,
         filter_type: Optional[str] = None,
+        where: Optional[dict] = None,
     ) -> list[Document]:
         """Search for similar documents."""
-        filter_dict = {"type": filter_type} if filter_type else None
-        return self.vectorstore.similarity_search(query, k=k, filter=filter_dict)
+        return [
+            doc for doc, _ in self.similarity_search_with_score(query, k, filter_type, where)
+        ]
     
     def similarity_search_with_score(
         self,
         query: str,
         k: int = 5,
         filter_type: Optional[str] = None,
+        where: Optional[dict] = None,
     ) -> list[tuple[Document, float]]:
-        """Search for similar documents with relevance scores."""
-        filter_dict = {"type": filter_type} if filter_type else None
-        return self.vectorstore.similarity_search_with_score(query, k=k, filter=filter_dict)
+        """Search for similar documents with distances (lower is closer).
+        
+        ``where`` is a Chroma-style metadata clause (see ``SearchFilters``)
+        applied by the backend before ranking.
+        """
+        where = combine_where({"type": filter_type} if filter_type else None, where)
+        embedding = self.embeddings.embed_query(query)
+        return self.backend.query(embedding, k=k, where=where)
+    
+    def search_many(
+        self,
+        queries: list[str],
+        k: int = 5,
+        filter_type: Optional[str] = None,
+        where: Optional[dict] = None,
+    ) -> list[list[tuple[Document, float]]]:
+        """
+        Search for several queries in one backend round trip.
+        
+        Returns:
+            ``(document, distance)`` lists like ``similarity_search_with_score``,
+            one per query in input order
+        """
+        if not queries:
+            return []
+        where = combine_where({"type": filter_type} if filter_type else None, where)
+        return self.backend.query_many(self.embed_queries(queries), k=k, where=where)
+    
+    def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed search queries; repeated queries are embedded once, the rest concurrently."""
+        unique = list(dict.fromkeys(queries))
+        workers = min(EMBED_CONCURRENCY, len(unique))
+        # The hashing embedder is local CPU work that threads would not speed up
+        if workers <= 1 or isinstance(self.embeddings, HashingEmbeddings):
+            vectors = [self.embeddings.embed_query(query) for query in unique]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                vectors = list(executor.map(self.embeddings.embed_query, unique))
+        by_query = dict(zip(unique, vectors))
+        return [by_query[query] for query in queries]
+    
+    @property
+    def lexical_index(self) -> LexicalIndex:
+        """Get the keyword index over the stored documents (no embedding calls)."""
+        version = (self.backend.count(), self._writes)
+        if self._lexical_index is None or version != self._lexical_version:
+            stored = self.backend.get()
+            self._lexical_index = LexicalIndex.build(
+                Document(page_content=content, metadata=metadata, id=doc_id)
+                for doc_id, content, metadata in zip(
+                    stored["ids"], stored["documents"], stored["metadatas"]
+                )
+                if content
+            )
+            self._lexical_version = version
+        return self._lexical_index
+    
+    def lexical_search(
+        self,
+        query: str,
+        k: int = 5,
+        filter_type: Optional[str] = None,
+        where: Optional[dict] = None,
+    ) -> list[tuple[Document, float]]:
+        """Search documents by BM25 keyword relevance (higher scores are better)."""
+        return self.lexical_index.search(query, k=k, filter_type=filter_type, where=where)
+    
+    @property
+    def company_vectors_version(self) -> tuple[int, int]:
+        """Changes whenever company vectors may have changed (collection size, local writes)."""
+        return self.backend.count(), self._company_writes
+    
+    def get_company_vectors(self) -> dict:
+        """Stored company embeddings with their metadata and documents."""
+        return self.backend.get(where={"type": "company"}, include_embeddings=True)
+    
+    @property
+    def company_similarity(self) -> "CompanySimilarity":
+        """Get the cached company nearest-neighbour index."""
+        if self._company_similarity is None:
+            from src.data.company_similarity import CompanySimilarity
+
+            self._company_similarity = CompanySimilarity(self)
+        return self._company_similarity
     
     def search_companies(self, query: str, k: int = 5) -> list[Document]:
         """Search for companies matching the query."""
@@ -222,18 +439,19 @@ class VectorStore:
     
     def get_collection_stats(self) -> dict:
         """Get statistics about the vector store collection."""
-        collection = self.vectorstore._collection
         return {
             "name": self.collection_name,
-            "count": collection.count(),
+            "count": self.backend.count(),
+            "backend": self.backend.name,
             "persist_directory": self.persist_directory,
         }
     
     def clear(self):
         """Clear all documents from the collection."""
         global _vector_store
-        self.vectorstore.delete_collection()
-        self._vectorstore = None
+        self.backend.delete_all()
+        self._lexical_index = None
+        self._company_writes += 1
         _vector_store = None  # Reset singleton so next get_vector_store() creates fresh instance
 
 
@@ -249,8 +467,9 @@ def reset_vector_store():
 
 def get_vector_store(
     persist_directory: Optional[str] = None,
-    embedding_model: str = "nomic-embed-text",
+    embedding_model: Optional[str] = None,
     ollama_base_url: str = "http://localhost:11434",
+    backend: Optional[str] = None,
 ) -> VectorStore:
     """Get or create the singleton vector store instance."""
     global _vector_store
@@ -259,5 +478,6 @@ def get_vector_store(
             persist_directory=persist_directory,
             embedding_model=embedding_model,
             ollama_base_url=ollama_base_url,
+            backend=backend,
         )
     return _vector_store
@@ -1,9 +1,21 @@
-"""LLM integration layer for Fusion Research Platform."""
+"""LLM integration layer for Fusion Research Platform.
 
-from src.llm.chain_factory import ChainFactory, get_llm
-from src.llm.query_processor import NLQueryProcessor
-from src.llm.analyzer import FusionAnalyzer
-from src.llm.cache import QueryCache
+Members are resolved lazily so that importing ``src.llm`` does not load
+LangChain until a chain, analyzer or query processor is actually used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+_LAZY_IMPORTS = {
+    "ChainFactory": "src.llm.chain_factory",
+    "get_llm": "src.llm.chain_factory",
+    "NLQueryProcessor": "src.llm.query_processor",
+    "FusionAnalyzer": "src.llm.analyzer",
+    "QueryCache": "src.llm.cache",
+    "LLMScheduler": "src.llm.scheduler",
+    "get_llm_scheduler": "src.llm.scheduler",
+}
 
 __all__ = [
     "ChainFactory",
@@ -11,4 +23,28 @@ __all__ = [
     "NLQueryProcessor",
     "FusionAnalyzer",
     "QueryCache",
+    "LLMScheduler",
+    "get_llm_scheduler",
 ]
+
+
+def __getattr__(name: str):
+    """Import the providing module on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from src.llm.chain_factory import ChainFactory, get_llm
+    from src.llm.query_processor import NLQueryProcessor
+    from src.llm.analyzer import FusionAnalyzer
+    from src.llm.cache import QueryCache
+    from src.llm.scheduler import LLMScheduler, get_llm_scheduler
@@ -1,14 +1,16 @@
 """LLM-powered analysis functions for fusion industry insights."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 from dataclasses import dataclass
 
-from langchain_ollama import ChatOllama
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
 from src.models.company import Company
 
+if TYPE_CHECKING:
+    from langchain_ollama import ChatOllama
+
 
 @dataclass
 class SWOTAnalysis:
@@ -44,15 +46,50 @@ class MarketInsight:
 class FusionAnalyzer:
     """LLM-powered analyzer for fusion industry insights."""
     
-    def __init__(self, llm: ChatOllama):
+    def __init__(self, llm: "ChatOllama"):
         self.llm = llm
     
+    @property
+    def model_name(self) -> str:
+        """Name of the underlying chat model (recorded with stored analyses)."""
+        return getattr(self.llm, "model", "") or ""
+    
     def generate_swot(
         self,
         company: Company,
         market_context: str = "",
     ) -> SWOTAnalysis:
         """Generate SWOT analysis for a company."""
+        result = self._swot_chain().invoke(self._swot_inputs(company, market_context))
+        return self.parse_swot(company.name, result)
+    
+    def stream_swot(
+        self,
+        company: Company,
+        market_context: str = "",
+    ) -> Iterator[str]:
+        """Stream SWOT analysis tokens; pass the joined text to ``parse_swot``."""
+        yield from self._swot_chain().stream(self._swot_inputs(company, market_context))
+    
+    def parse_swot(self, company_name: str, result: str) -> SWOTAnalysis:
+        """Parse a completed SWOT response into its sections."""
+        # Parse the result into structured format
+        strengths = self._extract_section(result, "Strengths")
+        weaknesses = self._extract_section(result, "Weaknesses")
+        opportunities = self._extract_section(result, "Opportunities")
+        threats = self._extract_section(result, "Threats")
+        
+        return SWOTAnalysis(
+            company_name=company_name,
+            strengths=strengths,
+            weaknesses=weaknesses,
+            opportunities=opportunities,
+            threats=threats,
+            raw_markdown=result,
+        )
+    
+    def _swot_chain(self):
+        """Build the SWOT analysis chain."""
         prompt = ChatPromptTemplate.from_messages([
             ("system", """You are a strategic analyst specializing in the nuclear fusion industry.
 Generate a comprehensive SWOT analysis based on the provided company data.
@@ -77,9 +114,11 @@ Market Context:
 Provide a structured SWOT analysis with 3-4 specific, data-backed points per section."""),
         ])
         
-        chain = prompt | self.llm | StrOutputParser()
-        
-        result = chain.invoke({
+        return prompt | self.llm | StrOutputParser()
+    
+    def _swot_inputs(self, company: Company, market_context: str) -> dict:
+        """Build SWOT prompt inputs from company data."""
+        return {
             "company_name": company.name,
             "company_type": company.company_type.value,
             "country": company.country,
@@ -91,22 +130,7 @@ Provide a structured SWOT analysis with 3-4 specific, data-backed points per sec
             "investors": company.key_investors or "Not disclosed",
             "description": company.description or "No description available",
             "market_context": market_context or "General fusion market context",
-        })
-        
-        # Parse the result into structured format
-        strengths = self._extract_section(result, "Strengths")
-        weaknesses = self._extract_section(result, "Weaknesses")
-        opportunities = self._extract_section(result, "Opportunities")
-        threats = self._extract_section(result, "Threats")
-        
-        return SWOTAnalysis(
-            company_name=company.name,
-            strengths=strengths,
-            weaknesses=weaknesses,
-            opportunities=opportunities,
-            threats=threats,
-            raw_markdown=result,
-        )
+        }
     
     def compare_companies(
         self,
@@ -114,6 +138,31 @@ Provide a structured SWOT analysis with 3-4 specific, data-backed points per sec
         company_b: Company,
     ) -> CompanyComparison:
         """Compare two companies head-to-head."""
+        result = self._comparison_chain().invoke(self._comparison_inputs(company_a, company_b))
+        return self.parse_comparison(company_a.name, company_b.name, result)
+    
+    def stream_comparison(
+        self,
+        company_a: Company,
+        company_b: Company,
+    ) -> Iterator[str]:
+        """Stream comparison tokens; pass the joined text to ``parse_comparison``."""
+        yield from self._comparison_chain().stream(self._comparison_inputs(company_a, company_b))
+    
+    def parse_comparison(self, company_a: str, company_b: str, result: str) -> CompanyComparison:
+        """Parse a completed comparison response."""
+        recommendation = self._extract_section(result, "recommendation")
+        return CompanyComparison(
+            company_a=company_a,
+            company_b=company_b,
+            comparison_table=self._extract_table(result),
+            key_differentiators=self._extract_section(result, "differentiator"),
+            recommendation=recommendation[0] if recommendation else "",
+            raw_markdown=result,
+        )
+    
+    def _comparison_chain(self):
+        """Build the company comparison chain."""
         prompt = ChatPromptTemplate.from_messages([
             ("system", """You are an expert analyst comparing fusion companies.
 Provide objective, data-driven comparisons across key metrics.
@@ -143,9 +192,11 @@ Provide:
 4. Investment recommendation"""),
         ])
         
-        chain = prompt | self.llm | StrOutputParser()
-        
-        result = chain.invoke({
+        return prompt | self.llm | StrOutputParser()
+    
+    def _comparison_inputs(self, company_a: Company, company_b: Company) -> dict:
+        """Build comparison prompt inputs from both companies."""
+        return {
             "company_a_name": company_a.name,
             "company_a_type": company_a.company_type.value,
             "company_a_country": company_a.country,
@@ -160,16 +211,7 @@ Provide:
             "company_b_trl": company_b.trl or "Unknown",
             "company_b_funding": company_b.funding_display,
             "company_b_team": company_b.team_size or "Unknown",
-        })
-        
-        return CompanyComparison(
-            company_a=company_a.name,
-            company_b=company_b.name,
-            comparison_table=self._extract_table(result),
-            key_differentiators=self._extract_section(result, "differentiator"),
-            recommendation=self._extract_section(result, "recommendation")[0] if self._extract_section(result, "recommendation") else "",
-            raw_markdown=result,
-        )
+        }
     
     def answer_question(
         self,
@@ -177,6 +219,34 @@ Provide:
         context: str,
     ) -> MarketInsight:
         """Answer an open-ended question about the fusion industry."""
+        result = self._answer_chain().invoke({
+            "question": question,
+            "context": context,
+        })
+        return self.parse_answer(question, result)
+    
+    def stream_answer(
+        self,
+        question: str,
+        context: str,
+    ) -> Iterator[str]:
+        """Stream answer tokens; pass the joined text to ``parse_answer``."""
+        yield from self._answer_chain().stream({
+            "question": question,
+            "context": context,
+        })
+    
+    def parse_answer(self, question: str, result: str) -> MarketInsight:
+        """Wrap a completed answer with its extracted data points."""
+        return MarketInsight(
+            question=question,
+            answer=result,
+            data_points=self._extract_data_points(result),
+            sources=[],
+        )
+    
+    def _answer_chain(self):
+        """Build the question answering chain."""
         prompt = ChatPromptTemplate.from_messages([
             ("system", """You are an expert analyst specializing in the nuclear fusion industry.
 Answer questions with specific data points and citations.
@@ -190,19 +260,7 @@ Available Context:
 Provide a clear, data-driven answer with specific references."""),
         ])
         
-        chain = prompt | self.llm | StrOutputParser()
-        
-        result = chain.invoke({
-            "question": question,
-            "context": context,
-        })
-        
-        return MarketInsight(
-            question=question,
-            answer=result,
-            data_points=self._extract_data_points(result),
-            sources=[],
-        )
+        return prompt | self.llm | StrOutputParser()
     
     def generate_market_report(
         self,
@@ -210,6 +268,24 @@ Provide a clear, data-driven answer with specific references."""),
         focus_area: str = "general",
     ) -> str:
         """Generate a market report section."""
+        return self._market_report_chain().invoke({
+            "focus_area": focus_area,
+            "market_data": market_data,
+        })
+    
+    def stream_market_report(
+        self,
+        market_data: str,
+        focus_area: str = "general",
+    ) -> Iterator[str]:
+        """Stream a market report section token by token."""
+        yield from self._market_report_chain().stream({
+            "focus_area": focus_area,
+            "market_data": market_data,
+        })
+    
+    def _market_report_chain(self):
+        """Build the market report chain."""
         prompt = ChatPromptTemplate.from_messages([
             ("system", """You are a market analyst specializing in the fusion energy sector.
 Generate professional market reports with clear sections and data-driven insights.
@@ -227,12 +303,7 @@ Include:
 5. Strategic Implications"""),
         ])
         
-        chain = prompt | self.llm | StrOutputParser()
-        
-        return chain.invoke({
-            "focus_area": focus_area,
-            "market_data": market_data,
-        })
+        return prompt | self.llm | StrOutputParser()
     
     def _extract_section(self, text: str, section_name: str) -> list[str]:
         """Extract bullet points from a section."""
@@ -1,10 +1,12 @@
 """LangChain factory for LLM integration with Ollama."""
 
-from typing import Optional, Literal
-from langchain_ollama import ChatOllama
-from langchain_community.utilities import SQLDatabase
+from typing import TYPE_CHECKING, Optional, Literal
 from langchain_core.prompts import ChatPromptTemplate
 
+if TYPE_CHECKING:
+    from langchain_ollama import ChatOllama
+    from langchain_community.utilities import SQLDatabase
+
 # Available Ollama models
 AVAILABLE_MODELS = ["qwen3:8b", "qwen3:14b", "gpt-oss:20b"]
 DEFAULT_MODEL = "qwen3:8b"
@@ -14,12 +16,21 @@ def get_llm(
     model: str = DEFAULT_MODEL,
     temperature: float = 0.3,
     base_url: str = "http://localhost:11434",
-) -> ChatOllama:
-    """Create a ChatOllama instance for local LLM."""
-    return ChatOllama(
+    priority: str = "interactive",
+) -> "ChatOllama":
+    """Create a ChatOllama instance for local LLM.
+
+    Requests are routed through the process-wide LLM scheduler; use
+    ``priority="batch"`` for background work so interactive requests are
+    served first.
+    """
+    from src.llm.scheduled_llm import ScheduledChatOllama
+
+    return ScheduledChatOllama(
         model=model,
         temperature=temperature,
         base_url=base_url,
+        priority=priority,
     )
 
 
@@ -37,11 +48,11 @@ class ChainFactory:
         self.temperature = temperature
         self.db_path = db_path
         self.base_url = base_url
-        self._llm: Optional[ChatOllama] = None
-        self._db: Optional[SQLDatabase] = None
+        self._llm: Optional["ChatOllama"] = None
+        self._db: Optional["SQLDatabase"] = None
     
     @property
-    def llm(self) -> ChatOllama:
+    def llm(self) -> "ChatOllama":
         """Get or create LLM instance."""
         if self._llm is None:
             self._llm = get_llm(
@@ -52,9 +63,11 @@ class ChainFactory:
         return self._llm
     
     @property
-    def db(self) -> SQLDatabase:
+    def db(self) -> "SQLDatabase":
         """Get or create SQLDatabase instance."""
         if self._db is None:
+            from langchain_community.utilities import SQLDatabase
+
             self._db = SQLDatabase.from_uri(f"sqlite:///{self.db_path}")
         return self._db
     
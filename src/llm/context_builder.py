@@ -0,0 +1,193 @@
+"""Token-budgeted context assembly for retrieval-augmented answers.
+
+Retrieved documents often repeat each other (overlapping research chunks,
+a company document and the research paragraph it was built from), and a
+local model answers faster from a shorter prompt. ``ContextBuilder``:
+
+1. drops sentences of research chunks already present in a higher-ranked
+   chunk, and the chunk entirely when little new text is left (company,
+   technology and market documents are structured records whose attribute
+   lines legitimately repeat, e.g. "Country: Germany", so they stay whole)
+2. orders the rest by maximal marginal relevance (MMR), trading the
+   retrieval rank against word overlap with documents already chosen
+3. adds documents until the model's token budget is spent, cutting the
+   last one at a sentence boundary
+
+Citation numbers are the documents' positions in the search results, so
+``[3]`` in an answer always refers to the third result shown to the user,
+whichever documents made it into the prompt.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.data.lexical_index import estimate_tokens, join_sentences, split_sentences, tokenize
+
+# Tokens available for retrieved documents per model (the rest of the
+# context window holds the instructions, the question and the answer)
+CONTEXT_BUDGETS = {
+    "qwen3:8b": 2500,
+    "qwen3:14b": 2500,
+    "gpt-oss:20b": 4000,
+}
+DEFAULT_CONTEXT_BUDGET = 2500
+
+# Result types included whole, without sentence deduplication
+WHOLE_DOCUMENT_TYPES = {"company", "technology", "market"}
+
+
+def _sentence_key(sentence: str) -> str:
+    """Normalized sentence used to detect repeats."""
+    return " ".join(tokenize(sentence))
+
+
+@dataclass
+class ContextItem:
+    """A document included in the prompt."""
+    number: int
+    content: str
+    tokens: int
+    truncated: bool = False
+
+
+@dataclass
+class BuiltContext:
+    """Prompt context assembled from search results."""
+    items: list[ContextItem] = field(default_factory=list)
+    tokens: int = 0
+    dropped: list[int] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        """Numbered context, in citation order."""
+        return "\n\n".join(
+            f"[{item.number}] {item.content}" for item in sorted(self.items, key=lambda i: i.number)
+        )
+
+
+class ContextBuilder:
+    """Deduplicate, diversify and trim search results to a token budget."""
+
+    def __init__(
+        self,
+        token_budget: int = DEFAULT_CONTEXT_BUDGET,
+        mmr_lambda: float = 0.7,
+        min_new_fraction: float = 0.3,
+        min_item_tokens: int = 40,
+    ):
+        """
+        Initialize builder.
+
+        Args:
+            token_budget: Maximum estimated tokens of document text
+            mmr_lambda: Weight of retrieval rank versus novelty (1 = rank only)
+            min_new_fraction: Documents with less new (unseen) text than this
+                fraction are dropped as duplicates
+            min_item_tokens: Smallest remainder worth adding as a truncated document
+        """
+        self.token_budget = token_budget
+        self.mmr_lambda = mmr_lambda
+        self.min_new_fraction = min_new_fraction
+        self.min_item_tokens = min_item_tokens
+
+    @classmethod
+    def for_model(cls, model: Optional[str], **kwargs) -> "ContextBuilder":
+        """Builder with the context budget of ``model``."""
+        return cls(token_budget=CONTEXT_BUDGETS.get(model, DEFAULT_CONTEXT_BUDGET), **kwargs)
+
+    def build(self, results: list[dict]) -> BuiltContext:
+        """
+        Assemble the prompt context for ranked search results.
+
+        Args:
+            results: Search result dicts with ``content``, best first
+
+        Returns:
+            Included documents numbered by their result position
+        """
+        context = BuiltContext()
+        candidates = self._deduplicate(results, context)
+        budget = self.token_budget
+
+        for number, sentences in self._mmr_order(candidates):
+            content = join_sentences(sentences)
+            tokens = estimate_tokens(content)
+            truncated = False
+            if tokens > budget:
+                sentences = self._fit(sentences, budget)
+                if not sentences:
+                    context.dropped.append(number)
+                    continue
+                content = join_sentences(sentences)
+                tokens = estimate_tokens(content)
+                truncated = True
+            context.items.append(ContextItem(number, content, tokens, truncated))
+            context.tokens += tokens
+            budget -= tokens
+
+        context.dropped.sort()
+        return context
+
+    def _deduplicate(self, results: list[dict], context: BuiltContext) -> list[tuple]:
+        """Drop repeated sentences; returns ``(number, relevance, sentences, terms)`` candidates.
+
+        Only research chunks (and untyped results) are deduplicated; documents
+        of ``WHOLE_DOCUMENT_TYPES`` are kept as they are. Relevance is the
+        result's ``relevance`` when present, else derived from its rank.
+        """
+        seen: set[str] = set()
+        candidates = []
+        for rank, result in enumerate(results):
+            number = rank + 1
+            sentences = split_sentences(result.get("content", ""))
+            relevance = result.get("relevance", 1.0 / (1 + rank))
+            if result.get("type") in WHOLE_DOCUMENT_TYPES and sentences:
+                terms = set(tokenize(join_sentences(sentences)))
+                candidates.append((number, relevance, sentences, terms))
+                continue
+            fresh = []
+            for sentence in sentences:
+                key = _sentence_key(sentence) or sentence
+                if key not in seen:
+                    seen.add(key)
+                    fresh.append(sentence)
+            fresh_chars = sum(len(sentence) for sentence in fresh)
+            total_chars = sum(len(sentence) for sentence in sentences)
+            if not fresh or fresh_chars < self.min_new_fraction * total_chars:
+                context.dropped.append(number)
+                continue
+            terms = set(tokenize(join_sentences(fresh)))
+            candidates.append((number, relevance, fresh, terms))
+        return candidates
+
+    def _mmr_order(self, candidates: list[tuple]) -> list[tuple[int, list[str]]]:
+        """Order candidates by maximal marginal relevance."""
+        remaining = list(candidates)
+        chosen_terms: list[set[str]] = []
+        ordered = []
+        while remaining:
+            def score(candidate):
+                _, relevance, _, terms = candidate
+                redundancy = max(
+                    (len(terms & other) / (len(terms | other) or 1) for other in chosen_terms),
+                    default=0.0,
+                )
+                return self.mmr_lambda * relevance - (1 - self.mmr_lambda) * redundancy
+
+            best = max(remaining, key=score)
+            remaining.remove(best)
+            chosen_terms.append(best[3])
+            ordered.append((best[0], best[2]))
+        return ordered
+
+    def _fit(self, sentences: list[str], budget: int) -> list[str]:
+        """Leading sentences that fit ``budget``; empty if too little fits."""
+        kept = []
+        used = 0
+        for sentence in sentences:
+            tokens = estimate_tokens(sentence)
+            if used + tokens > budget:
+                break
+            kept.append(sentence)
+            used += tokens
+        return kept if used >= self.min_item_tokens else []
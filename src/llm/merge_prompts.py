@@ -174,6 +174,20 @@ VALIDATE_CHANGE_PROMPT = ChatPromptTemplate.from_messages([
     ("human", VALIDATE_CHANGE_HUMAN),
 ])
 
+VALIDATE_CHANGES_BATCH_HUMAN = """Validiere jede dieser Datenänderungen einzeln:
+
+{changes}
+
+Quelle: Markdown-Dokument-Update
+
+Antworte mit einem JSON-Array, ein Objekt pro Änderung (gleiche Nummer als "index"):
+[{{"index": 1, "valid": true/false, "confidence": 0.0-1.0, "notes": "kurze Anmerkung"}}]"""
+
+VALIDATE_CHANGES_BATCH_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", VALIDATE_CHANGE_SYSTEM),
+    ("human", VALIDATE_CHANGES_BATCH_HUMAN),
+])
+
 # =============================================================================
 # Fuzzy Company Name Matching
 # =============================================================================
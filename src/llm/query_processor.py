@@ -1,15 +1,32 @@
-"""Natural language query processor."""
+"""Natural language query processor.
 
+Questions are translated to SQL once: the translation is cached under the
+normalized question plus a fingerprint of the database schema, and cached
+SQL is re-executed against the current data without calling the LLM. The
+compact schema sent to the LLM is likewise built once per schema
+fingerprint instead of reflecting the database on every question.
+
+Generated SQL only ever runs inside ``SQLSandbox``: read-only connections,
+capped rows, a time budget and no cross products. The schema is read through
+the sandbox's connections as well.
+"""
+
+import hashlib
+import json
 import re
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from dataclasses import dataclass
 
-from langchain_ollama import ChatOllama
-from langchain_community.utilities import SQLDatabase
-from langchain_experimental.sql import SQLDatabaseChain
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
+from src.data.sql_sandbox import QueryTimeout, SandboxError, SQLSandbox, get_sql_sandbox
+from src.llm.cache import QueryCache
+
+if TYPE_CHECKING:
+    from langchain_community.utilities import SQLDatabase
+    from langchain_ollama import ChatOllama
+
 
 @dataclass
 class QueryResult:
@@ -19,17 +36,78 @@ class QueryResult:
     results: list[dict]
     answer: str
     error: Optional[str] = None
+    cached: bool = False
+    truncated: bool = False
+
+
+SQL_GENERATION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a SQLite expert. Write one SQLite SELECT query that answers the question.
+Use only the tables and columns in the schema below. Unless the question asks for a specific
+number of rows, return at most {top_k} rows. Answer with the SQL query only, without explanation
+or markdown.
+
+Schema:
+{schema}"""),
+    ("human", "{question}"),
+])
+
+# Shared by all processors: the Streamlit page builds one processor per question
+_TRANSLATIONS = QueryCache(max_size=512, ttl_seconds=30 * 24 * 3600)
+_SCHEMAS: dict[str, str] = {}
+
+# Rows included in the answer prompt and in rendered answers
+ANSWER_ROW_LIMIT = 50
+
+
+def normalize_question(question: str) -> str:
+    """Lowercase a question and drop punctuation and extra whitespace."""
+    return " ".join(re.findall(r"\w+", question.lower()))
+
+
+def extract_sql(response: str) -> str:
+    """Pull the SQL statement out of an LLM response."""
+    text = re.sub(r"<think>.*?</think>", "", response, flags=re.DOTALL)
+    fenced = re.search(r"```(?:sql)?\s*(.*?)```", text, re.DOTALL | re.IGNORECASE)
+    if fenced:
+        text = fenced.group(1)
+    text = re.sub(r"^\s*SQL(?:Query)?:\s*", "", text.strip(), flags=re.IGNORECASE)
+    return text.split(";")[0].strip()
+
+
+def format_results(rows: list[dict], limit: int = ANSWER_ROW_LIMIT) -> str:
+    """Render query rows as a markdown table."""
+    if not rows:
+        return "No matching data was found."
+    columns = list(rows[0])
+    lines = [
+        "| " + " | ".join(columns) + " |",
+        "| " + " | ".join("---" for _ in columns) + " |",
+    ]
+    for row in rows[:limit]:
+        cells = ("" if row[column] is None else str(row[column]) for column in columns)
+        lines.append("| " + " | ".join(cells) + " |")
+    if len(rows) > limit:
+        lines.append(f"\n… {len(rows) - limit} more rows")
+    return "\n".join(lines)
 
 
 class NLQueryProcessor:
     """Process natural language queries against the fusion database."""
     
-    # Dangerous SQL patterns to block
-    DANGEROUS_PATTERNS = ["DROP", "DELETE", "UPDATE", "INSERT", "ALTER", "TRUNCATE", ";--"]
-    
-    def __init__(self, llm: ChatOllama, db: SQLDatabase):
+    def __init__(
+        self,
+        llm: "ChatOllama",
+        db: "SQLDatabase",
+        db_path: str = "research/fusion_research.db",
+        translation_cache: Optional[QueryCache] = None,
+        top_k: int = 20,
+        sandbox: Optional[SQLSandbox] = None,
+    ):
         self.llm = llm
         self.db = db
+        self.translations = translation_cache if translation_cache is not None else _TRANSLATIONS
+        self.top_k = top_k
+        self.sandbox = sandbox or get_sql_sandbox(db_path)
         self._sql_chain = None
         self._answer_chain = None
     
@@ -37,9 +115,16 @@ class NLQueryProcessor:
     def sql_chain(self):
         """Get or create SQL generation chain."""
         if self._sql_chain is None:
-            self._sql_chain = SQLDatabaseChain.from_llm(self.llm, self.db, verbose=False, return_intermediate_steps=True)
+            self._sql_chain = SQL_GENERATION_PROMPT | self.llm | StrOutputParser()
         return self._sql_chain
     
+    @property
+    def answer_chain(self):
+        """Get or create the answer chain."""
+        if self._answer_chain is None:
+            self._answer_chain = self._create_answer_chain()
+        return self._answer_chain
+    
     def _create_answer_chain(self):
         """Create chain for generating natural language answers."""
         prompt = ChatPromptTemplate.from_messages([
@@ -59,76 +144,134 @@ Provide a clear, informative answer:"""),
     
     def validate_sql(self, sql: str) -> tuple[bool, Optional[str]]:
         """Validate generated SQL for safety."""
-        sql_upper = sql.upper()
-        
-        for pattern in self.DANGEROUS_PATTERNS:
-            if pattern in sql_upper:
-                return False, f"Dangerous SQL pattern detected: {pattern}"
-        
-        # Ensure it's a SELECT query
-        if not sql_upper.strip().startswith("SELECT"):
-            return False, "Only SELECT queries are allowed"
-        
-        # Check for valid table names
-        valid_tables = self.db.get_usable_table_names()
-        
+        try:
+            self.sandbox.validate(sql)
+        except SandboxError as e:
+            return False, str(e)
         return True, None
     
+    def schema_fingerprint(self) -> str:
+        """Hash of the schema definitions; changes whenever a table, view or index changes."""
+        rows = self.sandbox.schema_definitions()
+        payload = json.dumps([[r["type"], r["name"], r["sql"]] for r in rows])
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+    
+    def compact_schema(self, fingerprint: Optional[str] = None) -> str:
+        """
+        One line per table, e.g. ``companies(id INTEGER, name TEXT, ...)``.
+
+        Built once per schema fingerprint; unlike ``SQLDatabase.get_table_info``
+        it needs no reflection or sample rows.
+        """
+        fingerprint = fingerprint or self.schema_fingerprint()
+        if fingerprint not in _SCHEMAS:
+            lines = []
+            for table in self.db.get_usable_table_names():
+                columns, foreign_keys = self.sandbox.table_columns(table)
+                references = {fk["from"]: f'{fk["table"]}.{fk["to"]}' for fk in foreign_keys}
+                described = []
+                for column in columns:
+                    text = f'{column["name"]} {column["type"]}'.strip()
+                    if column["name"] in references:
+                        text += f' -> {references[column["name"]]}'
+                    described.append(text)
+                lines.append(f"{table}({', '.join(described)})")
+            _SCHEMAS[fingerprint] = "\n".join(lines)
+        return _SCHEMAS[fingerprint]
+    
+    def translate(self, question: str, fingerprint: str) -> str:
+        """Ask the LLM for the SQL answering a question."""
+        response = self.sql_chain.invoke({
+            "question": question,
+            "schema": self.compact_schema(fingerprint),
+            "top_k": self.top_k,
+        })
+        return extract_sql(response)
+    
+    def execute_sql(self, sql: str) -> tuple[list[dict], bool]:
+        """
+        Run a SELECT statement in the sandbox.
+
+        Returns:
+            Rows (at most the sandbox's ``max_rows``) and whether they were truncated
+        """
+        result = self.sandbox.execute(sql)
+        return result.rows, result.truncated
+    
+    @staticmethod
+    def _results_digest(rows: list[dict]) -> str:
+        """Hash of query rows, to tell whether a cached answer still matches the data."""
+        payload = json.dumps(rows, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
     def process_query(self, question: str) -> QueryResult:
-        """Process a natural language query and return results."""
+        """
+        Process a natural language query and return results.
+
+        Repeated questions reuse the cached SQL and run it against the
+        current data; the cached answer is reused only if the rows are
+        unchanged, otherwise the rows are rendered without the LLM.
+        """
+        sql = None
         try:
-            # Use SQLDatabaseChain which handles SQL generation and execution
-            result = self.sql_chain.invoke({"query": question})
-            
-            # Extract SQL from intermediate steps if available
-            sql = None
-            raw_results = []
-            
-            if isinstance(result, dict):
-                answer = result.get("result", str(result))
-                # Get intermediate steps for SQL
-                steps = result.get("intermediate_steps", [])
-                for step in steps:
-                    if isinstance(step, dict) and "sql_cmd" in step:
-                        sql = step["sql_cmd"]
-                    elif isinstance(step, str) and step.strip().upper().startswith("SELECT"):
-                        sql = step
-            else:
-                answer = str(result)
+            fingerprint = self.schema_fingerprint()
+            key = f"{fingerprint}:{normalize_question(question)}"
+            entry = self.translations.get(key)
+
+            if entry is not None:
+                sql = entry["sql"]
+                try:
+                    rows, truncated = self.execute_sql(sql)
+                except QueryTimeout:
+                    raise
+                except Exception:
+                    # Stale translation; fall through to a fresh one
+                    self.translations.invalidate(key)
+                    entry = None
+                else:
+                    if entry["digest"] == self._results_digest(rows):
+                        answer = entry["answer"]
+                    else:
+                        answer = format_results(rows)
+                    return QueryResult(
+                        query=question,
+                        sql=sql,
+                        results=rows,
+                        answer=answer,
+                        cached=True,
+                        truncated=truncated,
+                    )
+
+            sql = self.translate(question, fingerprint)
+            rows, truncated = self.execute_sql(sql)
+            answer = self.answer_chain.invoke({
+                "question": question,
+                "sql": sql,
+                "results": json.dumps(rows[:ANSWER_ROW_LIMIT], default=str),
+            })
+            self.translations.set(key, {
+                "sql": sql,
+                "digest": self._results_digest(rows),
+                "answer": answer,
+            })
             
             return QueryResult(
                 query=question,
                 sql=sql,
-                results=raw_results,
+                results=rows,
                 answer=answer,
+                truncated=truncated,
             )
             
         except Exception as e:
             return QueryResult(
                 query=question,
-                sql=None,
+                sql=sql,
                 results=[],
                 answer=f"An error occurred: {str(e)}",
                 error=str(e),
             )
     
-    def _parse_results(self, raw_results: str) -> list[dict]:
-        """Parse raw SQL results into list of dicts."""
-        if not raw_results or raw_results == "[]":
-            return []
-        
-        # Try to parse as list of tuples
-        try:
-            import ast
-            parsed = ast.literal_eval(raw_results)
-            if isinstance(parsed, list):
-                return [{"row": i, "data": row} for i, row in enumerate(parsed)]
-        except (ValueError, SyntaxError):
-            pass
-        
-        # Return as single result
-        return [{"result": raw_results}]
-    
     def get_schema_info(self) -> str:
         """Get database schema information."""
         return self.db.get_table_info()
@@ -0,0 +1,113 @@
+"""ChatOllama routed through the process-wide LLM scheduler."""
+
+import asyncio
+import hashlib
+import json
+from typing import Any, AsyncIterator, Iterator, Optional
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_ollama import ChatOllama
+
+from src.llm.scheduler import Priority, get_llm_scheduler
+
+
+class ScheduledChatOllama(ChatOllama):
+    """ChatOllama whose requests wait for a scheduler slot.
+
+    Blocking calls of identical prompts are coalesced into a single Ollama
+    request; streaming calls hold a slot until the stream is exhausted.
+    """
+
+    priority: Priority = Priority.INTERACTIVE
+    coalesce: bool = True
+
+    def _request_key(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]],
+        kwargs: dict[str, Any],
+    ) -> Optional[str]:
+        """Fingerprint a request for coalescing."""
+        if not self.coalesce:
+            return None
+        payload = {
+            "model": self.model,
+            "base_url": self.base_url,
+            "temperature": self.temperature,
+            "format": self.format,
+            "messages": [(m.type, m.content) for m in messages],
+            "stop": stop,
+            "kwargs": kwargs,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return get_llm_scheduler().run(
+            self.model,
+            lambda: super(ScheduledChatOllama, self)._generate(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            ),
+            priority=self.priority,
+            key=self._request_key(messages, stop, kwargs),
+        )
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        with get_llm_scheduler().slot(self.model, self.priority):
+            yield from super()._stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        scheduler = get_llm_scheduler()
+        ticket = await asyncio.to_thread(scheduler.acquire, self.model, self.priority)
+        failed = False
+        try:
+            return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            scheduler.release(ticket, failed=failed)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        scheduler = get_llm_scheduler()
+        ticket = await asyncio.to_thread(scheduler.acquire, self.model, self.priority)
+        failed = False
+        try:
+            async for chunk in super()._astream(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            ):
+                yield chunk
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            scheduler.release(ticket, failed=failed)
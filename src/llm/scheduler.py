@@ -0,0 +1,294 @@
+"""Process-wide scheduler for LLM requests.
+
+All chat model calls made through ``get_llm()`` pass through a single
+``LLMScheduler`` so that background work (update cycles, digests, merges)
+and interactive requests share the local Ollama server predictably:
+
+- bounded concurrency per model, with a separate cap for batch work so a
+  slot is always left for interactive requests
+- strict priority between classes (interactive before batch) and FIFO
+  order within a class
+- coalescing of identical in-flight prompts: followers wait for the
+  leader's result instead of sending a duplicate request
+- queue depth, wait time and latency metrics per model
+
+CLI scripts have no interactive traffic to protect and size the scheduler
+from their own ``--max-concurrent`` with ``configure_llm_scheduler()``.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Iterator, Optional
+
+
+class Priority(str, Enum):
+    """Scheduling class of an LLM request."""
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+_PRIORITY_RANK = {Priority.INTERACTIVE: 0, Priority.BATCH: 1}
+
+
+@dataclass
+class SlotTicket:
+    """A granted execution slot."""
+    model: str
+    priority: Priority
+    queued_at: float
+    started_at: float = 0.0
+
+    @property
+    def wait_seconds(self) -> float:
+        """Time spent queued before the slot was granted."""
+        return self.started_at - self.queued_at
+
+
+@dataclass
+class ModelStats:
+    """Snapshot of scheduler metrics for one model."""
+    model: str
+    in_flight: int
+    in_flight_batch: int
+    queued_interactive: int
+    queued_batch: int
+    completed: int
+    failed: int
+    coalesced: int
+    avg_wait_ms: float
+    p95_wait_ms: float
+    avg_latency_ms: float
+    p95_latency_ms: float
+
+
+@dataclass
+class _ModelQueue:
+    """Per-model scheduling state."""
+    active: dict[Priority, int] = field(
+        default_factory=lambda: {Priority.INTERACTIVE: 0, Priority.BATCH: 0}
+    )
+    waiters: list[tuple[int, int, Priority]] = field(default_factory=list)
+    completed: int = 0
+    failed: int = 0
+    coalesced: int = 0
+    wait_times: deque = field(default_factory=lambda: deque(maxlen=256))
+    latencies: deque = field(default_factory=lambda: deque(maxlen=256))
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a sample (0.0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class LLMScheduler:
+    """Priority scheduler with bounded per-model concurrency."""
+
+    def __init__(self, max_concurrency: int = 2, max_batch_concurrency: int = 1):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrency: Maximum simultaneous requests per model
+            max_batch_concurrency: Maximum simultaneous batch requests per model;
+                keep below max_concurrency to reserve capacity for interactive use
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_batch_concurrency = max(1, min(max_batch_concurrency, self.max_concurrency))
+        self._cond = threading.Condition()
+        self._queues: dict[str, _ModelQueue] = {}
+        self._inflight: dict[str, Future] = {}
+        self._sequence = itertools.count()
+
+    def _queue(self, model: str) -> _ModelQueue:
+        """Get or create the queue for a model (caller holds the lock)."""
+        if model not in self._queues:
+            self._queues[model] = _ModelQueue()
+        return self._queues[model]
+
+    def _can_start(self, queue: _ModelQueue, priority: Priority) -> bool:
+        """Whether a request of this class fits in the free capacity."""
+        if sum(queue.active.values()) >= self.max_concurrency:
+            return False
+        if priority == Priority.BATCH:
+            return queue.active[Priority.BATCH] < self.max_batch_concurrency
+        return True
+
+    def acquire(self, model: str, priority: Priority = Priority.INTERACTIVE) -> SlotTicket:
+        """Block until a slot for ``model`` is granted."""
+        priority = Priority(priority)
+        ticket = SlotTicket(model=model, priority=priority, queued_at=time.monotonic())
+
+        with self._cond:
+            queue = self._queue(model)
+            entry = (_PRIORITY_RANK[priority], next(self._sequence), priority)
+            heapq.heappush(queue.waiters, entry)
+            while not (queue.waiters[0] == entry and self._can_start(queue, priority)):
+                self._cond.wait()
+            heapq.heappop(queue.waiters)
+            queue.active[priority] += 1
+            # The next waiter may fit as well (e.g. interactive behind a capped batch)
+            self._cond.notify_all()
+
+        ticket.started_at = time.monotonic()
+        return ticket
+
+    def release(self, ticket: SlotTicket, failed: bool = False):
+        """Return a slot and record its metrics."""
+        finished_at = time.monotonic()
+        with self._cond:
+            queue = self._queue(ticket.model)
+            queue.active[ticket.priority] -= 1
+            if failed:
+                queue.failed += 1
+            else:
+                queue.completed += 1
+            queue.wait_times.append(ticket.wait_seconds)
+            queue.latencies.append(finished_at - ticket.started_at)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, model: str, priority: Priority = Priority.INTERACTIVE) -> Iterator[SlotTicket]:
+        """Hold a slot for the duration of the block."""
+        ticket = self.acquire(model, priority)
+        failed = False
+        try:
+            yield ticket
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.release(ticket, failed=failed)
+
+    def run(
+        self,
+        model: str,
+        func: Callable[[], Any],
+        priority: Priority = Priority.INTERACTIVE,
+        key: Optional[str] = None,
+    ) -> Any:
+        """Run ``func`` in a slot, sharing the result with identical in-flight calls.
+
+        Args:
+            model: Model name the request targets
+            func: Zero-argument callable performing the request
+            priority: Scheduling class
+            key: Request fingerprint; concurrent calls with the same key are
+                coalesced into one request. ``None`` disables coalescing.
+
+        Returns:
+            The value returned by ``func`` (possibly from another caller)
+        """
+        if key is not None:
+            with self._cond:
+                future = self._inflight.get(key)
+                if future is not None:
+                    self._queue(model).coalesced += 1
+                    leader = False
+                else:
+                    future = Future()
+                    self._inflight[key] = future
+                    leader = True
+            if not leader:
+                return future.result()
+
+        try:
+            with self.slot(model, priority):
+                result = func()
+        except BaseException as e:
+            if key is not None:
+                self._settle(key, future, error=e)
+            raise
+        if key is not None:
+            self._settle(key, future, result=result)
+        return result
+
+    def _settle(
+        self,
+        key: str,
+        future: Future,
+        result: Any = None,
+        error: Optional[BaseException] = None,
+    ):
+        """Stop coalescing onto ``key`` and hand the outcome to waiting followers."""
+        with self._cond:
+            self._inflight.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def stats(self) -> list[ModelStats]:
+        """Get a metrics snapshot for every model seen so far."""
+        snapshot = []
+        with self._cond:
+            for model, queue in sorted(self._queues.items()):
+                waiting = [entry[2] for entry in queue.waiters]
+                waits = list(queue.wait_times)
+                latencies = list(queue.latencies)
+                snapshot.append(ModelStats(
+                    model=model,
+                    in_flight=sum(queue.active.values()),
+                    in_flight_batch=queue.active[Priority.BATCH],
+                    queued_interactive=waiting.count(Priority.INTERACTIVE),
+                    queued_batch=waiting.count(Priority.BATCH),
+                    completed=queue.completed,
+                    failed=queue.failed,
+                    coalesced=queue.coalesced,
+                    avg_wait_ms=1000 * sum(waits) / len(waits) if waits else 0.0,
+                    p95_wait_ms=1000 * _percentile(waits, 95),
+                    avg_latency_ms=1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+                    p95_latency_ms=1000 * _percentile(latencies, 95),
+                ))
+        return snapshot
+
+
+# Singleton instance (locked: first use is typically from several threads at once)
+_llm_scheduler: Optional[LLMScheduler] = None
+_llm_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Get LLM scheduler singleton instance."""
+    global _llm_scheduler
+    with _llm_scheduler_lock:
+        if _llm_scheduler is None:
+            from src.config import get_settings
+
+            settings = get_settings()
+            _llm_scheduler = LLMScheduler(
+                max_concurrency=settings.llm_max_concurrency,
+                max_batch_concurrency=settings.llm_batch_concurrency,
+            )
+    return _llm_scheduler
+
+
+def configure_llm_scheduler(
+    max_concurrency: int,
+    max_batch_concurrency: Optional[int] = None,
+) -> LLMScheduler:
+    """Replace the scheduler singleton with one of the given capacity.
+
+    For processes without interactive requests (CLI scripts): the batch cap
+    defaults to ``max_concurrency`` so batch work may use every slot. Call it
+    before the first LLM request.
+    """
+    global _llm_scheduler
+    with _llm_scheduler_lock:
+        _llm_scheduler = LLMScheduler(
+            max_concurrency=max_concurrency,
+            max_batch_concurrency=(
+                max_concurrency if max_batch_concurrency is None else max_batch_concurrency
+            ),
+        )
+    return _llm_scheduler
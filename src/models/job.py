@@ -0,0 +1,92 @@
+"""Models for background jobs."""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional
+
+
+class JobStatus(str, Enum):
+    """Status of a background job."""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    INTERRUPTED = "interrupted"  # Worker died (e.g. app restart); resumable
+
+
+ACTIVE_JOB_STATUSES = (JobStatus.PENDING, JobStatus.RUNNING)
+RESUMABLE_JOB_STATUSES = (JobStatus.FAILED, JobStatus.CANCELLED, JobStatus.INTERRUPTED)
+
+
+@dataclass
+class Job:
+    """A persisted background job."""
+    kind: str
+    params: dict[str, Any] = field(default_factory=dict)
+    status: JobStatus = JobStatus.PENDING
+    progress_done: int = 0
+    progress_total: int = 0
+    message: str = ""
+    checkpoint: Optional[dict[str, Any]] = None
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    id: Optional[int] = None
+
+    @property
+    def progress(self) -> float:
+        """Fraction of work done (0.0 - 1.0)."""
+        if self.progress_total <= 0:
+            return 1.0 if self.status == JobStatus.COMPLETED else 0.0
+        return min(1.0, self.progress_done / self.progress_total)
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the job is queued or running."""
+        return self.status in ACTIVE_JOB_STATUSES
+
+    @property
+    def is_resumable(self) -> bool:
+        """Whether the job can be resubmitted from its checkpoint."""
+        return self.status in RESUMABLE_JOB_STATUSES
+
+    @staticmethod
+    def _load_json(value: Optional[str]) -> Optional[Any]:
+        """Parse a JSON column, tolerating empty values."""
+        if not value:
+            return None
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return None
+
+    @staticmethod
+    def _load_datetime(value: Optional[str]) -> Optional[datetime]:
+        """Parse a timestamp column."""
+        return datetime.fromisoformat(value) if value else None
+
+    @classmethod
+    def from_db_row(cls, row: dict) -> "Job":
+        """Create from database row."""
+        return cls(
+            id=row["id"],
+            kind=row["kind"],
+            params=cls._load_json(row["params"]) or {},
+            status=JobStatus(row["status"]),
+            progress_done=row["progress_done"] or 0,
+            progress_total=row["progress_total"] or 0,
+            message=row["message"] or "",
+            checkpoint=cls._load_json(row["checkpoint"]),
+            result=cls._load_json(row["result"]),
+            error=row["error"],
+            cancel_requested=bool(row["cancel_requested"]),
+            created_at=cls._load_datetime(row["created_at"]) or datetime.now(),
+            started_at=cls._load_datetime(row["started_at"]),
+            finished_at=cls._load_datetime(row["finished_at"]),
+        )
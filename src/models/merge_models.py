@@ -29,10 +29,19 @@ class MergeConfig:
     chunk_size: int = 4000
     overlap_size: int = 500
     backup_suffix: str = ".backup"
+    # Snapshot the base file into the content-addressed store (relative to
+    # research_dir) instead of writing a full .backup copy per merge
+    use_snapshots: bool = True
+    snapshot_dir: str = ".snapshots"
     preserve_structure: bool = True
     llm_timeout: float = 120.0
     max_retries: int = 3
     research_dir: str = "research"
+    # Company/segment merges sent to the LLM at once (the LLM scheduler still
+    # caps how many actually run against the model)
+    max_concurrent_merges: int = 4
+    # Resolve additions and unambiguous edits locally; only conflicts use the LLM
+    structural_merge: bool = True
 
 
 @dataclass
@@ -41,17 +50,27 @@ class MergeResult:
     success: bool = False
     original_path: Optional[Path] = None
     backup_path: Optional[Path] = None
+    snapshot_version: Optional[int] = None
     merged_path: Optional[Path] = None
     sections_merged: int = 0
     companies_added: int = 0
     companies_updated: int = 0
     conflicts_resolved: int = 0
+    sections_merged_locally: int = 0
+    llm_requests: int = 0
     errors: list[str] = field(default_factory=list)
 
     def add_error(self, error: str) -> None:
         """Add an error message."""
         self.errors.append(error)
 
+    @property
+    def local_merge_ratio(self) -> float:
+        """Fraction of merged sections resolved without the LLM."""
+        if not self.sections_merged:
+            return 0.0
+        return self.sections_merged_locally / self.sections_merged
+
 
 @dataclass
 class SectionDiff:
@@ -80,6 +99,24 @@ class CompanyDiff:
     diff_type: DiffType = DiffType.UNCHANGED
 
 
+@dataclass
+class SectionSegment:
+    """A contiguous piece of a section: a #### company block or the text around it."""
+    key: str
+    content: str
+    company_name: Optional[str] = None
+
+
+@dataclass
+class MergeTask:
+    """A changed piece of a section that is merged by the LLM."""
+    key: str
+    section_name: str
+    original_content: str
+    update_content: str
+    company_name: Optional[str] = None
+
+
 @dataclass
 class MergeOperation:
     """A single merge operation record."""
@@ -120,6 +157,13 @@ class SyncConfig:
     require_review_threshold: float = 0.70
     batch_size: int = 10
     dry_run: bool = False
+    # Field changes validated per LLM prompt, and prompts in flight at once
+    validation_batch_size: int = 8
+    max_concurrent_validations: int = 4
+    # Only process company blocks that changed since the last successful sync
+    incremental: bool = False
+    # Ask the LLM to pick between equally similar company names
+    llm_name_matching: bool = True
 
 
 @dataclass
@@ -128,10 +172,12 @@ class SyncResult:
     companies_processed: int = 0
     companies_added: int = 0
     companies_updated: int = 0
+    companies_unchanged: int = 0
     fields_updated: int = 0
     proposals_created: int = 0
     proposals_auto_applied: int = 0
     conflicts_found: int = 0
+    llm_requests: int = 0
     errors: list[str] = field(default_factory=list)
 
     def add_error(self, error: str) -> None:
@@ -139,6 +185,21 @@ class SyncResult:
         self.errors.append(error)
 
 
+@dataclass
+class SyncPreview:
+    """Unvalidated differences between the markdown and the database."""
+    companies_matched: int = 0
+    companies_new: int = 0
+    companies_unchanged: int = 0
+    changes_by_field: dict[str, int] = field(default_factory=dict)
+    changes: list["FieldChange"] = field(default_factory=list)
+
+    @property
+    def total_changes(self) -> int:
+        """Number of significant field changes."""
+        return len(self.changes)
+
+
 @dataclass
 class FieldChange:
     """A proposed change to a field."""
@@ -1,15 +1,26 @@
-"""Services layer module."""
-
-from src.services.company_service import CompanyService
-from src.services.market_service import MarketService
-from src.services.technology_service import TechnologyService
-from src.services.report_service import ReportService
-from src.services.semantic_search_service import SemanticSearchService
-from src.services.news_service import NewsService, get_news_service
-from src.services.updater_service import UpdaterService, get_updater_service
-from src.services.network_service import NetworkService
-from src.services.audit_service import AuditService
-from src.services.crud_service import CrudService
+"""Services layer module.
+
+Services are resolved lazily on first attribute access, so importing
+``src.services`` does not load LangChain, Chroma, Tavily or pyvis up front.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+_LAZY_IMPORTS = {
+    "CompanyService": "src.services.company_service",
+    "MarketService": "src.services.market_service",
+    "TechnologyService": "src.services.technology_service",
+    "ReportService": "src.services.report_service",
+    "SemanticSearchService": "src.services.semantic_search_service",
+    "NewsService": "src.services.news_service",
+    "get_news_service": "src.services.news_service",
+    "UpdaterService": "src.services.updater_service",
+    "get_updater_service": "src.services.updater_service",
+    "NetworkService": "src.services.network_service",
+    "AuditService": "src.services.audit_service",
+    "CrudService": "src.services.crud_service",
+}
 
 __all__ = [
     "CompanyService",
@@ -25,3 +36,30 @@ __all__ = [
     "AuditService",
     "CrudService",
 ]
+
+
+def __getattr__(name: str):
+    """Import the providing module on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from src.services.company_service import CompanyService
+    from src.services.market_service import MarketService
+    from src.services.technology_service import TechnologyService
+    from src.services.report_service import ReportService
+    from src.services.semantic_search_service import SemanticSearchService
+    from src.services.news_service import NewsService, get_news_service
+    from src.services.updater_service import UpdaterService, get_updater_service
+    from src.services.network_service import NetworkService
+    from src.services.audit_service import AuditService
+    from src.services.crud_service import CrudService
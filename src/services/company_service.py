@@ -1,12 +1,15 @@
 """Company business logic service."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from dataclasses import dataclass
 
+from src.data.analysis_store import AnalysisStore, comparison_key, swot_key
 from src.data.database import Database
 from src.data.repositories import CompanyRepository, FundingRepository, PartnershipRepository
 from src.models.company import Company, CompanyDTO
-from src.llm.analyzer import FusionAnalyzer, SWOTAnalysis, CompanyComparison
+
+if TYPE_CHECKING:
+    from src.llm.analyzer import FusionAnalyzer, SWOTAnalysis, CompanyComparison
 
 
 @dataclass
@@ -30,12 +33,13 @@ class CompanyService:
     def __init__(
         self,
         db: Database,
-        analyzer: Optional[FusionAnalyzer] = None,
+        analyzer: Optional["FusionAnalyzer"] = None,
     ):
         self.db = db
         self.company_repo = CompanyRepository(db)
         self.funding_repo = FundingRepository(db)
         self.partnership_repo = PartnershipRepository(db)
+        self.analyses = AnalysisStore(db)
         self.analyzer = analyzer
     
     def get_company(self, company_id: int) -> Optional[Company]:
@@ -85,8 +89,17 @@ class CompanyService:
         """Get partnerships for a company."""
         return self.partnership_repo.get_by_company(company_id)
     
-    def generate_swot(self, company_id: int, market_context: str = "") -> Optional[SWOTAnalysis]:
-        """Generate SWOT analysis for a company."""
+    def generate_swot(
+        self,
+        company_id: int,
+        market_context: str = "",
+        refresh: bool = False,
+    ) -> Optional["SWOTAnalysis"]:
+        """Generate SWOT analysis for a company.
+
+        A stored analysis of the same company data is returned without an LLM
+        call unless ``refresh`` is set; new results are stored.
+        """
         if not self.analyzer:
             return None
         
@@ -94,10 +107,22 @@ class CompanyService:
         if not company:
             return None
         
-        return self.analyzer.generate_swot(company, market_context)
+        key = swot_key(company, market_context)
+        stored = None if refresh else self.analyses.get(key)
+        if stored:
+            return self.analyzer.parse_swot(company.name, stored.content)
+        
+        swot = self.analyzer.generate_swot(company, market_context)
+        self.analyses.save(key, swot.raw_markdown, self.analyzer.model_name)
+        return swot
     
-    def compare_companies(self, company_id_a: int, company_id_b: int) -> Optional[CompanyComparison]:
-        """Compare two companies."""
+    def compare_companies(
+        self,
+        company_id_a: int,
+        company_id_b: int,
+        refresh: bool = False,
+    ) -> Optional["CompanyComparison"]:
+        """Compare two companies, reusing a stored comparison unless ``refresh`` is set."""
         if not self.analyzer:
             return None
         
@@ -107,12 +132,23 @@ class CompanyService:
         if not company_a or not company_b:
             return None
         
-        return self.analyzer.compare_companies(company_a, company_b)
+        key = comparison_key(company_a, company_b)
+        stored = None if refresh else self.analyses.get(key)
+        if stored:
+            return self.analyzer.parse_comparison(company_a.name, company_b.name, stored.content)
+        
+        comparison = self.analyzer.compare_companies(company_a, company_b)
+        self.analyses.save(key, comparison.raw_markdown, self.analyzer.model_name)
+        return comparison
     
     def get_top_funded_companies(self, limit: int = 10) -> list[CompanyDTO]:
         """Get top funded companies."""
         return self.company_repo.search(limit=limit)
     
+    def get_recently_updated_companies(self, days: int = 7, limit: int = 100) -> list[Company]:
+        """Get companies whose row changed within the last ``days`` days."""
+        return self.company_repo.get_recently_updated(days=days, limit=limit)
+    
     def get_companies_by_trl(self, trl: int) -> list[CompanyDTO]:
         """Get companies at a specific TRL."""
         return self.company_repo.search(trl_min=trl, trl_max=trl)
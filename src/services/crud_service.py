@@ -118,6 +118,7 @@ class CrudService:
             change_source=ChangeSource.USER_EDIT,
             changed_by="user",
         )
+        self.db.mark_changed()
         return new_id
 
     def update_entity(self, entity_type: str, entity_id: int, data: dict) -> bool:
@@ -154,6 +155,7 @@ class CrudService:
                     change_source=ChangeSource.USER_EDIT,
                     changed_by="user",
                 )
+        self.db.mark_changed()
         return True
 
     def delete_entity(self, entity_type: str, entity_id: int) -> bool:
@@ -174,6 +176,7 @@ class CrudService:
                 change_source=ChangeSource.USER_EDIT,
                 changed_by="user",
             )
+            self.db.mark_changed()
         return result
 
     def get_company_names(self) -> dict[int, str]:
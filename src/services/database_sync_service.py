@@ -2,22 +2,24 @@
 
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from langchain_ollama import ChatOllama
 from langchain_core.output_parsers import StrOutputParser
 
 from src.data.database import Database, get_database
+from src.data.name_index import NameIndex
 from src.data.repositories import CompanyRepository
 from src.data.parsers.markdown_parser import parse_fusion_research, MarkdownParser
+from src.data.parsers.parse_cache import ParseCache, ParseDelta
 from src.models.company import Company
 from src.models.merge_models import (
     SyncConfig,
     SyncResult,
+    SyncPreview,
     FieldChange,
-    COMPARABLE_FIELDS,
 )
 from src.models.update_proposal import (
     UpdateProposal,
@@ -29,10 +31,43 @@ from src.models.update_proposal import (
     SourceReliability,
 )
 from src.llm.merge_prompts import (
-    VALIDATE_CHANGE_PROMPT,
+    VALIDATE_CHANGES_BATCH_PROMPT,
     FUZZY_MATCH_PROMPT,
 )
 from src.llm.chain_factory import get_llm
+from src.services.sync_diff import changes_per_field, diff_companies
+
+if TYPE_CHECKING:
+    from langchain_ollama import ChatOllama
+
+    from src.services.job_service import JobContext
+
+PROPOSAL_INSERT_SQL = """
+    INSERT INTO update_proposals (
+        entity_type, entity_id, field_name, old_value, new_value,
+        confidence_score, sources, search_query, extracted_at,
+        status, reviewed_by, reviewed_at, notes
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+AUDIT_INSERT_SQL = """
+    INSERT INTO audit_log (
+        entity_type, entity_id, field_name, old_value, new_value,
+        change_source, changed_at, changed_by, proposal_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+COMPANY_INSERT_SQL = """
+    INSERT INTO companies (
+        name, company_type, country, city, founded_year, website,
+        team_size, description, technology_approach, trl, trl_justification,
+        total_funding_usd, key_investors, key_partnerships,
+        competitive_positioning, confidence_score, source_url, last_updated
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Names per SELECT ... IN (...) when looking up ids of inserted companies
+ID_LOOKUP_CHUNK = 500
 
 
 class DatabaseSyncService:
@@ -41,30 +76,35 @@ class DatabaseSyncService:
     def __init__(
         self,
         db: Optional[Database] = None,
-        llm: Optional[ChatOllama] = None,
+        llm: Optional["ChatOllama"] = None,
         config: Optional[SyncConfig] = None,
         db_path: str = "research/fusion_research.db",
+        parse_cache: Optional[ParseCache] = None,
     ):
         self.db = db if db else get_database(db_path)
         self.llm = llm
         self.config = config or SyncConfig()
+        self.parse_cache = parse_cache
         self.company_repo = CompanyRepository(self.db)
 
-    def _get_llm(self) -> ChatOllama:
+    def _get_llm(self) -> "ChatOllama":
         """Get or create LLM instance."""
         if self.llm is None:
-            self.llm = get_llm()
+            self.llm = get_llm(priority="batch")
         return self.llm
 
     def sync_from_markdown(
         self,
         markdown_path: str = "research/Fusion_Research.md",
+        job: Optional["JobContext"] = None,
     ) -> SyncResult:
         """
         Sync database from markdown file.
 
         Args:
             markdown_path: Path to the markdown file
+            job: Background job context; batches are committed and
+                checkpointed so an interrupted sync resumes at the next batch
 
         Returns:
             SyncResult with operation details
@@ -72,111 +112,167 @@ class DatabaseSyncService:
         result = SyncResult()
 
         try:
-            # Parse markdown
-            parsed_data = parse_fusion_research(markdown_path)
+            companies, delta, result.companies_unchanged = self._parse_companies(markdown_path)
+
+            # Index all existing companies by name for exact and fuzzy matching
+            db_companies = self._build_name_index(self.company_repo.iter_all())
 
-            # Get all existing companies from DB
-            db_companies = {c.name: c for c in self.company_repo.get_all(limit=1000)}
+            # Resume after the last committed batch of an interrupted run
+            start = 0
+            if job and job.checkpoint_state:
+                start = job.checkpoint_state.get("next_index", 0)
+                for name, value in job.checkpoint_state.get("counts", {}).items():
+                    setattr(result, name, value)
 
             # Process companies in batches
-            for i in range(0, len(parsed_data.companies), self.config.batch_size):
-                batch = parsed_data.companies[i:i + self.config.batch_size]
+            total = len(companies)
+            for i in range(start, total, self.config.batch_size):
+                if job:
+                    job.raise_if_cancelled()
+                    end = min(i + self.config.batch_size, total)
+                    job.report_progress(i, total, f"Comparing companies {i + 1}-{end}")
+                batch = companies[i:i + self.config.batch_size]
                 batch_changes = self._process_company_batch(batch, db_companies)
+                result.llm_requests += self._validate_changes(batch_changes)
 
+                to_apply: list[FieldChange] = []
+                to_propose: list[FieldChange] = []
                 for change in batch_changes:
+                    if not change.validated:
+                        continue
                     if change.confidence >= self.config.auto_apply_threshold:
-                        if not self.config.dry_run:
-                            self._apply_change(change)
+                        to_apply.append(change)
                         result.proposals_auto_applied += 1
                         result.fields_updated += 1
                     elif change.confidence >= self.config.require_review_threshold:
-                        if not self.config.dry_run:
-                            self._create_proposal(change)
+                        to_propose.append(change)
                         result.proposals_created += 1
                     else:
                         result.conflicts_found += 1
 
+                # One transaction per batch
+                if not self.config.dry_run:
+                    self._write_changes(to_apply, to_propose)
+
                 result.companies_processed += len(batch)
 
+                if job:
+                    job.save_checkpoint({
+                        "next_index": i + self.config.batch_size,
+                        "counts": {
+                            "companies_processed": result.companies_processed,
+                            "fields_updated": result.fields_updated,
+                            "proposals_created": result.proposals_created,
+                            "proposals_auto_applied": result.proposals_auto_applied,
+                            "conflicts_found": result.conflicts_found,
+                            "llm_requests": result.llm_requests,
+                        },
+                    })
+
             # Detect and add new companies
-            new_companies = self._detect_new_companies(parsed_data.companies, db_companies)
-            for company in new_companies:
-                if not self.config.dry_run:
-                    self._add_new_company(company)
-                result.companies_added += 1
+            if job:
+                job.raise_if_cancelled()
+                job.report_progress(total, total, "Adding new companies")
+            new_companies = self._detect_new_companies(companies, db_companies)
+            if new_companies and not self.config.dry_run:
+                self._add_new_companies(new_companies)
+            result.companies_added += len(new_companies)
 
             if not self.config.dry_run:
-                self.db.commit()
+                self.db.mark_changed()
+                # The next incremental sync diffs against this parse
+                if delta is not None:
+                    self.parse_cache.commit(delta)
 
         except Exception as e:
+            if job and job.is_cancelled():
+                raise
             result.add_error(f"Sync failed: {str(e)}")
 
         return result
 
+    def preview(self, markdown_path: str = "research/Fusion_Research.md") -> SyncPreview:
+        """
+        Count the field changes a sync would consider, without the LLM or writes.
+
+        All matched companies are diffed in one vectorized pass; names only
+        resolve through exact, normalized and trigram matching.
+        """
+        companies, _, unchanged = self._parse_companies(markdown_path)
+        db_companies = NameIndex.build((c.name, c) for c in self.company_repo.iter_all())
+
+        pairs = []
+        new_names = set()
+        for parsed_company in companies:
+            db_company = db_companies.resolve(parsed_company.name)
+            if db_company:
+                pairs.append((parsed_company, db_company))
+            else:
+                new_names.add(parsed_company.name)
+
+        changes = diff_companies(pairs)
+        return SyncPreview(
+            companies_matched=len(pairs),
+            companies_new=len(new_names),
+            companies_unchanged=unchanged,
+            changes_by_field=changes_per_field(changes),
+            changes=changes,
+        )
+
+    def _parse_companies(
+        self,
+        markdown_path: str,
+    ) -> tuple[list[Company], Optional[ParseDelta], int]:
+        """
+        Parse markdown; incremental syncs only consider changed company blocks.
+
+        Returns:
+            Companies to process, the parse delta (incremental only) and the
+            number of unchanged companies skipped
+        """
+        if not self.config.incremental:
+            return parse_fusion_research(markdown_path).companies, None, 0
+
+        if self.parse_cache is None:
+            self.parse_cache = ParseCache()
+        parsed_data, delta = self.parse_cache.parse(markdown_path)
+        changed = delta.changed_company_names
+        companies = [c for c in parsed_data.companies if c.name in changed]
+        return companies, delta, len(parsed_data.companies) - len(companies)
+
+    def _build_name_index(self, companies: list[Company]) -> NameIndex[Company]:
+        """Index database companies by name; the LLM confirms fuzzy and ambiguous matches."""
+        tie_breaker = self._llm_fuzzy_match if self.config.llm_name_matching else None
+        return NameIndex.build(((c.name, c) for c in companies), tie_breaker=tie_breaker)
+
     def _process_company_batch(
         self,
         companies: list[Company],
-        db_companies: dict[str, Company],
+        db_companies: NameIndex[Company],
     ) -> list[FieldChange]:
         """Process a batch of companies and detect changes."""
-        changes = []
+        pairs = []
 
         for parsed_company in companies:
             # Find matching company in DB (exact or fuzzy match)
             db_company = self._find_matching_company(parsed_company, db_companies)
 
             if db_company:
-                # Compare fields
-                field_changes = self._compare_company(parsed_company, db_company)
-                changes.extend(field_changes)
+                pairs.append((parsed_company, db_company))
 
-        return changes
+        # Compare all matched pairs at once; changes are validated per batch later
+        return diff_companies(pairs)
 
     def _find_matching_company(
         self,
         parsed_company: Company,
-        db_companies: dict[str, Company],
+        db_companies: NameIndex[Company],
     ) -> Optional[Company]:
         """Find matching company in database, using fuzzy matching if needed."""
-        # Exact match
-        if parsed_company.name in db_companies:
-            return db_companies[parsed_company.name]
-
-        # Try fuzzy matching for similar names
-        for db_name, db_company in db_companies.items():
-            if self._is_fuzzy_match(parsed_company.name, db_name):
-                return db_company
-
-        return None
-
-    def _is_fuzzy_match(self, name1: str, name2: str) -> bool:
-        """Check if two company names refer to the same company."""
-        # Basic normalization
-        n1 = name1.lower().strip()
-        n2 = name2.lower().strip()
-
-        if n1 == n2:
-            return True
-
-        # Remove common suffixes
-        suffixes = [" gmbh", " inc", " ltd", " ag", " corp", " llc"]
-        for suffix in suffixes:
-            n1 = n1.replace(suffix, "")
-            n2 = n2.replace(suffix, "")
-
-        if n1 == n2:
-            return True
-
-        # Check if one is a substring of the other
-        if n1 in n2 or n2 in n1:
-            return True
+        return db_companies.resolve(parsed_company.name)
 
-        # Use LLM for complex cases (optional, expensive)
-        # return self._llm_fuzzy_match(name1, name2)
-        return False
-
-    def _llm_fuzzy_match(self, name1: str, name2: str) -> bool:
-        """Use LLM to determine if names refer to same company."""
+    def _llm_fuzzy_match(self, name1: str, name2: str) -> Optional[bool]:
+        """Use LLM to determine if names refer to same company (None if unavailable)."""
         try:
             llm = self._get_llm()
             chain = FUZZY_MATCH_PROMPT | llm | StrOutputParser()
@@ -191,115 +287,129 @@ class DatabaseSyncService:
             return data.get("same_company", False) and data.get("confidence", 0) > 0.8
 
         except Exception:
-            return False
-
-    def _compare_company(
-        self,
-        parsed: Company,
-        db: Company,
-    ) -> list[FieldChange]:
-        """Compare parsed company with database record."""
-        changes = []
-
-        for field_name, field_config in COMPARABLE_FIELDS.items():
-            parsed_value = getattr(parsed, field_name, None)
-            db_value = getattr(db, field_name, None)
-
-            # Convert to strings for comparison
-            parsed_str = str(parsed_value) if parsed_value is not None else None
-            db_str = str(db_value) if db_value is not None else None
-
-            if parsed_str != db_str and parsed_str is not None:
-                change = FieldChange(
-                    company_id=db.id,
-                    company_name=db.name,
-                    field_name=field_name,
-                    old_value=db_str,
-                    new_value=parsed_str,
-                    change_type="update",
-                    source="markdown_sync",
-                )
+            return None
 
-                # Check if significant based on tolerance
-                tolerance = field_config.get("tolerance", 0.0)
-                if change.is_significant(tolerance or 0.0):
-                    # Validate with LLM
-                    is_valid, confidence = self._validate_change(change)
-                    change.confidence = confidence
-                    change.validated = is_valid
+    def _validate_changes(self, changes: list[FieldChange]) -> int:
+        """
+        Validate changes with the LLM, several per prompt and several prompts at once.
 
-                    if is_valid:
-                        changes.append(change)
+        Sets ``validated`` and ``confidence`` on every change.
 
-        return changes
+        Returns:
+            Number of LLM requests made
+        """
+        size = max(1, self.config.validation_batch_size)
+        chunks = [changes[i:i + size] for i in range(0, len(changes), size)]
+        if not chunks:
+            return 0
+
+        self._get_llm()
+        workers = max(1, min(self.config.max_concurrent_validations, len(chunks)))
+        if workers == 1:
+            for chunk in chunks:
+                self._validate_change_batch(chunk)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self._validate_change_batch, chunks))
+        return len(chunks)
+
+    def _validate_change_batch(self, changes: list[FieldChange]):
+        """Validate a group of changes in one prompt."""
+        listing = "\n\n".join(
+            f"{number}. Unternehmen: {change.company_name}\n"
+            f"   Feld: {change.field_name}\n"
+            f"   Aktueller Wert: {change.old_value or 'None'}\n"
+            f"   Neuer Wert: {change.new_value or 'None'}"
+            for number, change in enumerate(changes, 1)
+        )
 
-    def _validate_change(self, change: FieldChange) -> tuple[bool, float]:
-        """Use LLM to validate a proposed change."""
         try:
             llm = self._get_llm()
-            chain = VALIDATE_CHANGE_PROMPT | llm | StrOutputParser()
-
-            result = chain.invoke({
-                "company_name": change.company_name,
-                "field_name": change.field_name,
-                "old_value": change.old_value or "None",
-                "new_value": change.new_value or "None",
-            })
-
-            # Parse JSON response
-            data = json.loads(result)
-            is_valid = data.get("valid", False)
-            confidence = data.get("confidence", 0.5)
-
-            return is_valid, confidence
-
+            chain = VALIDATE_CHANGES_BATCH_PROMPT | llm | StrOutputParser()
+            verdicts = self._parse_verdicts(chain.invoke({"changes": listing}))
         except Exception as e:
             print(f"LLM validation failed: {e}")
-            # Default to moderate confidence without LLM
-            return True, 0.75
+            verdicts = {}
+
+        for number, change in enumerate(changes, 1):
+            data = verdicts.get(number)
+            if data is None:
+                # Default to moderate confidence without an LLM verdict
+                change.validated, change.confidence = True, 0.75
+            else:
+                change.validated = bool(data.get("valid", False))
+                change.confidence = float(data.get("confidence", 0.5))
+
+    @staticmethod
+    def _parse_verdicts(response: str) -> dict[int, dict]:
+        """Parse the batch validation JSON into verdicts keyed by change number."""
+        match = re.search(r"\[.*\]|\{.*\}", response, re.DOTALL)
+        if not match:
+            return {}
+        data = json.loads(match.group(0))
+        if isinstance(data, dict):
+            data = [{"index": 1, **data}]
+        return {
+            int(item["index"]): item
+            for item in data
+            if isinstance(item, dict) and "index" in item
+        }
 
     def _detect_new_companies(
         self,
         parsed_companies: list[Company],
-        db_companies: dict[str, Company],
+        db_companies: NameIndex[Company],
     ) -> list[Company]:
         """Find companies in markdown but not in database."""
         new_companies = []
+        seen = set()
 
         for parsed in parsed_companies:
+            if parsed.name in seen:
+                continue
             if not self._find_matching_company(parsed, db_companies):
                 new_companies.append(parsed)
+                seen.add(parsed.name)
 
         return new_companies
 
-    def _apply_change(self, change: FieldChange) -> bool:
-        """Apply a change to the database with audit logging."""
-        try:
-            # Update the company field
-            self.db.execute(
-                f"UPDATE companies SET {change.field_name} = ?, last_updated = ? WHERE id = ?",
-                (change.new_value, datetime.now().isoformat(), change.company_id),
-            )
-
-            # Create audit log entry
-            self._save_audit_entry(
-                entity_type=EntityType.COMPANY,
-                entity_id=change.company_id,
-                field_name=change.field_name,
-                old_value=change.old_value,
-                new_value=change.new_value,
-                change_source=ChangeSource.MARKDOWN_SYNC,
-                changed_by="markdown_sync_service",
-            )
+    def _write_changes(self, to_apply: list[FieldChange], to_propose: list[FieldChange]):
+        """Apply accepted changes, their audit rows and review proposals in one transaction."""
+        if not to_apply and not to_propose:
+            return
+        now = datetime.now().isoformat()
+
+        by_field: dict[str, list[FieldChange]] = {}
+        for change in to_apply:
+            by_field.setdefault(change.field_name, []).append(change)
+
+        with self.db.get_cursor() as cursor:
+            for field_name, changes in by_field.items():
+                cursor.executemany(
+                    f"UPDATE companies SET {field_name} = ?, last_updated = ? WHERE id = ?",
+                    [(c.new_value, now, c.company_id) for c in changes],
+                )
+            cursor.executemany(AUDIT_INSERT_SQL, [
+                self._audit_row(
+                    entity_type=EntityType.COMPANY,
+                    entity_id=change.company_id,
+                    field_name=change.field_name,
+                    old_value=change.old_value,
+                    new_value=change.new_value,
+                    change_source=ChangeSource.MARKDOWN_SYNC,
+                    changed_by="markdown_sync_service",
+                    changed_at=now,
+                )
+                for change in to_apply
+            ])
+            cursor.executemany(PROPOSAL_INSERT_SQL, [
+                self._proposal_row(self._build_proposal(change)) for change in to_propose
+            ])
 
+        for change in to_apply:
             change.applied = True
-            return True
-
-        except Exception as e:
-            print(f"Failed to apply change: {e}")
-            return False
 
-    def _create_proposal(self, change: FieldChange) -> int:
+    def _build_proposal(self, change: FieldChange) -> UpdateProposal:
         """Create an update proposal for review."""
         # Create a DataSource for the markdown
         source = DataSource(
@@ -309,7 +419,7 @@ class DatabaseSyncService:
             snippet=f"Field {change.field_name} updated to {change.new_value}",
         )
 
-        proposal = UpdateProposal(
+        return UpdateProposal(
             entity_type=EntityType.COMPANY,
             entity_id=change.company_id,
             field_name=change.field_name,
@@ -320,50 +430,30 @@ class DatabaseSyncService:
             search_query=f"markdown_sync:{change.company_name}:{change.field_name}",
         )
 
-        return self._save_proposal(proposal)
-
-    def _save_proposal(self, proposal: UpdateProposal) -> int:
-        """Save an update proposal to the database."""
+    @staticmethod
+    def _proposal_row(proposal: UpdateProposal) -> tuple:
+        """Parameters for PROPOSAL_INSERT_SQL."""
         data = proposal.to_db_dict()
-
-        cursor = self.db.execute(
-            """
-            INSERT INTO update_proposals (
-                entity_type, entity_id, field_name, old_value, new_value,
-                confidence_score, sources, search_query, extracted_at,
-                status, reviewed_by, reviewed_at, notes
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                data["entity_type"],
-                data["entity_id"],
-                data["field_name"],
-                data["old_value"],
-                data["new_value"],
-                data["confidence_score"],
-                data["sources"],
-                data["search_query"],
-                data["extracted_at"],
-                data["status"],
-                data["reviewed_by"],
-                data["reviewed_at"],
-                data["notes"],
-            ),
+        return (
+            data["entity_type"],
+            data["entity_id"],
+            data["field_name"],
+            data["old_value"],
+            data["new_value"],
+            data["confidence_score"],
+            data["sources"],
+            data["search_query"],
+            data["extracted_at"],
+            data["status"],
+            data["reviewed_by"],
+            data["reviewed_at"],
+            data["notes"],
         )
-        return cursor.lastrowid
 
-    def _add_new_company(self, company: Company) -> int:
-        """Add a new company to the database."""
-        cursor = self.db.execute(
-            """
-            INSERT INTO companies (
-                name, company_type, country, city, founded_year, website,
-                team_size, description, technology_approach, trl, trl_justification,
-                total_funding_usd, key_investors, key_partnerships,
-                competitive_positioning, confidence_score, source_url,
-                created_at, last_updated
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+    def _add_new_companies(self, companies: list[Company]) -> list[int]:
+        """Insert new companies and their audit rows in one transaction."""
+        now = datetime.now().isoformat()
+        rows = [
             (
                 company.name,
                 company.company_type.value if company.company_type else None,
@@ -382,26 +472,66 @@ class DatabaseSyncService:
                 company.competitive_positioning,
                 company.confidence_score or 0.85,
                 "markdown_sync",
-                datetime.now().isoformat(),
-                datetime.now().isoformat(),
-            ),
-        )
+                now,
+            )
+            for company in companies
+        ]
+
+        with self.db.get_cursor() as cursor:
+            cursor.executemany(COMPANY_INSERT_SQL, rows)
+
+            names = [company.name for company in companies]
+            ids: dict[str, int] = {}
+            for i in range(0, len(names), ID_LOOKUP_CHUNK):
+                chunk = names[i:i + ID_LOOKUP_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT id, name FROM companies WHERE name IN ({placeholders})", chunk
+                )
+                ids.update((row["name"], row["id"]) for row in cursor.fetchall())
+
+            # Log the additions
+            cursor.executemany(AUDIT_INSERT_SQL, [
+                self._audit_row(
+                    entity_type=EntityType.COMPANY,
+                    entity_id=ids[name],
+                    field_name="*",
+                    old_value=None,
+                    new_value=f"New company: {name}",
+                    change_source=ChangeSource.MARKDOWN_SYNC,
+                    changed_by="markdown_sync_service",
+                    changed_at=now,
+                )
+                for name in names
+            ])
 
-        company_id = cursor.lastrowid
+        return [ids[name] for name in names]
 
-        # Log the addition
-        self._save_audit_entry(
-            entity_type=EntityType.COMPANY,
-            entity_id=company_id,
-            field_name="*",
-            old_value=None,
-            new_value=f"New company: {company.name}",
-            change_source=ChangeSource.MARKDOWN_SYNC,
-            changed_by="markdown_sync_service",
+    @staticmethod
+    def _audit_row(
+        entity_type: EntityType,
+        entity_id: int,
+        field_name: str,
+        old_value: Optional[str],
+        new_value: Optional[str],
+        change_source: ChangeSource,
+        changed_by: str,
+        proposal_id: Optional[int] = None,
+        changed_at: Optional[str] = None,
+    ) -> tuple:
+        """Parameters for AUDIT_INSERT_SQL."""
+        return (
+            entity_type.value,
+            entity_id,
+            field_name,
+            old_value,
+            new_value,
+            change_source.value,
+            changed_at or datetime.now().isoformat(),
+            changed_by,
+            proposal_id,
         )
 
-        return company_id
-
     def _save_audit_entry(
         self,
         entity_type: EntityType,
@@ -415,22 +545,10 @@ class DatabaseSyncService:
     ) -> int:
         """Save an audit log entry."""
         cursor = self.db.execute(
-            """
-            INSERT INTO audit_log (
+            AUDIT_INSERT_SQL,
+            self._audit_row(
                 entity_type, entity_id, field_name, old_value, new_value,
-                change_source, changed_at, changed_by, proposal_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                entity_type.value,
-                entity_id,
-                field_name,
-                old_value,
-                new_value,
-                change_source.value,
-                datetime.now().isoformat(),
-                changed_by,
-                proposal_id,
+                change_source, changed_by, proposal_id,
             ),
         )
         return cursor.lastrowid
@@ -499,6 +617,7 @@ class DatabaseSyncService:
             )
 
             self.db.commit()
+            self.db.mark_changed()
             return True
 
         except Exception as e:
@@ -537,7 +656,7 @@ class DatabaseSyncService:
 
 def get_database_sync_service(
     db: Optional[Database] = None,
-    llm: Optional[ChatOllama] = None,
+    llm: Optional["ChatOllama"] = None,
     config: Optional[SyncConfig] = None,
     db_path: str = "research/fusion_research.db",
 ) -> DatabaseSyncService:
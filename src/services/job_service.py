@@ -0,0 +1,399 @@
+"""Background job runner for long-running operations.
+
+Jobs are persisted in the ``jobs`` table and executed on a thread pool, so
+they keep running while Streamlit reruns the page or the user navigates
+away. Handlers receive a ``JobContext`` for progress reporting, cancellation
+and checkpoints; pages poll ``JobRunner.get_job`` / ``list_jobs``.
+"""
+
+import json
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from src.config import get_settings
+from src.data.database import Database
+from src.models.job import Job, JobStatus
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job when cancellation was requested."""
+
+
+def _to_json(value: Any) -> Optional[str]:
+    """Serialize a job payload (dicts or dataclass results) to JSON."""
+    if value is None:
+        return None
+    if is_dataclass(value):
+        value = asdict(value)
+    return json.dumps(value, default=str)
+
+
+class JobContext:
+    """Handle passed to a job handler for progress, cancellation and checkpoints."""
+
+    def __init__(
+        self,
+        runner: "JobRunner",
+        job: Job,
+        cancel_event: threading.Event,
+        secrets: Optional[dict] = None,
+    ):
+        self._runner = runner
+        self._cancel_event = cancel_event
+        self.job_id = job.id
+        self.kind = job.kind
+        self.params = job.params
+        self.db_path = runner.db_path
+        self.secrets = secrets or {}
+        # State saved by a previous (interrupted) run of the same job
+        self.checkpoint_state: dict = job.checkpoint or {}
+
+    def report_progress(self, done: int, total: Optional[int] = None, message: str = ""):
+        """Persist progress so pages can poll it."""
+        fields: dict[str, Any] = {"progress_done": done, "message": message}
+        if total is not None:
+            fields["progress_total"] = total
+        self._runner._update_job(self.job_id, **fields)
+
+    def is_cancelled(self) -> bool:
+        """Whether cancellation was requested."""
+        return self._cancel_event.is_set()
+
+    def raise_if_cancelled(self):
+        """Abort the job at a safe point if cancellation was requested."""
+        if self.is_cancelled():
+            raise JobCancelled(f"Job {self.job_id} cancelled")
+
+    def save_checkpoint(self, state: dict):
+        """Persist resumable state (must be JSON-serializable)."""
+        self.checkpoint_state = state
+        self._runner._update_job(self.job_id, checkpoint=_to_json(state))
+
+
+JobHandler = Callable[[JobContext], Any]
+
+JOB_HANDLERS: dict[str, JobHandler] = {}
+
+
+def register_job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """Register a function as the handler for a job kind."""
+    def decorator(func: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = func
+        return func
+    return decorator
+
+
+class JobRunner:
+    """Runs persisted jobs on a thread pool."""
+
+    def __init__(self, db_path: str = "research/fusion_research.db", max_workers: int = 2):
+        self.db_path = db_path
+        # Own connection: job status writes must not interleave with the UI's transactions
+        self.db = Database(db_path)
+        self.db.init_schema()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._cancel_events: dict[int, threading.Event] = {}
+        self._mark_interrupted()
+
+    def _mark_interrupted(self):
+        """Flag jobs left running by a previous process as interrupted."""
+        with self._lock:
+            self.db.execute(
+                "UPDATE jobs SET status = ?, message = ? WHERE status IN (?, ?)",
+                (
+                    JobStatus.INTERRUPTED.value,
+                    "Interrupted by application restart",
+                    JobStatus.PENDING.value,
+                    JobStatus.RUNNING.value,
+                ),
+            )
+            self.db.commit()
+
+    def _update_job(self, job_id: int, **fields):
+        """Update columns of a job row."""
+        if not fields:
+            return
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self.db.execute(
+                f"UPDATE jobs SET {columns} WHERE id = ?",
+                (*fields.values(), job_id),
+            )
+            self.db.commit()
+
+    def submit(
+        self,
+        kind: str,
+        params: Optional[dict] = None,
+        secrets: Optional[dict] = None,
+    ) -> int:
+        """Queue a job and return its ID.
+
+        Args:
+            kind: Registered handler name (see JOB_HANDLERS)
+            params: JSON-serializable parameters, persisted with the job
+            secrets: Values such as API keys that are passed to the handler
+                but never written to the database
+
+        Returns:
+            The new job ID
+        """
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        with self._lock:
+            cursor = self.db.execute(
+                "INSERT INTO jobs (kind, params, status, created_at) VALUES (?, ?, ?, ?)",
+                (
+                    kind,
+                    _to_json(params or {}),
+                    JobStatus.PENDING.value,
+                    datetime.now().isoformat(),
+                ),
+            )
+            self.db.commit()
+            job_id = cursor.lastrowid
+
+        self._start(job_id, secrets)
+        return job_id
+
+    def resume(self, job_id: int, secrets: Optional[dict] = None) -> bool:
+        """Resubmit a failed, cancelled or interrupted job from its checkpoint."""
+        job = self.get_job(job_id)
+        if job is None or not job.is_resumable:
+            return False
+
+        self._update_job(
+            job_id,
+            status=JobStatus.PENDING.value,
+            cancel_requested=0,
+            error=None,
+            finished_at=None,
+            message="Resuming from checkpoint" if job.checkpoint else "Restarting",
+        )
+        self._start(job_id, secrets)
+        return True
+
+    def cancel(self, job_id: int) -> bool:
+        """Request cancellation; running jobs stop at their next safe point."""
+        job = self.get_job(job_id)
+        if job is None or not job.is_active:
+            return False
+
+        self._update_job(job_id, cancel_requested=1, message="Cancellation requested")
+        event = self._cancel_events.get(job_id)
+        if event is not None:
+            event.set()
+        return True
+
+    def get_job(self, job_id: int) -> Optional[Job]:
+        """Get a job by ID."""
+        with self._lock:
+            row = self.db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return Job.from_db_row(dict(row)) if row else None
+
+    def list_jobs(
+        self,
+        limit: int = 20,
+        kind: Optional[str] = None,
+        active_only: bool = False,
+    ) -> list[Job]:
+        """List jobs, newest first."""
+        sql = "SELECT * FROM jobs WHERE 1=1"
+        params: list[Any] = []
+        if kind:
+            sql += " AND kind = ?"
+            params.append(kind)
+        if active_only:
+            sql += " AND status IN (?, ?)"
+            params.extend([JobStatus.PENDING.value, JobStatus.RUNNING.value])
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self.db.execute(sql, tuple(params)).fetchall()
+        return [Job.from_db_row(dict(row)) for row in rows]
+
+    def shutdown(self, wait: bool = False):
+        """Stop accepting jobs and optionally wait for running ones."""
+        for event in self._cancel_events.values():
+            if not wait:
+                event.set()
+        self._executor.shutdown(wait=wait)
+
+    def _start(self, job_id: int, secrets: Optional[dict]):
+        """Hand a queued job to the thread pool."""
+        self._cancel_events[job_id] = threading.Event()
+        self._executor.submit(self._execute, job_id, secrets)
+
+    def _execute(self, job_id: int, secrets: Optional[dict]):
+        """Run a job in a worker thread and record its outcome."""
+        job = self.get_job(job_id)
+        cancel_event = self._cancel_events[job_id]
+        if job is None:
+            return
+        if job.cancel_requested or cancel_event.is_set():
+            self._finish(job_id, JobStatus.CANCELLED, message="Cancelled before start")
+            return
+
+        self._update_job(
+            job_id,
+            status=JobStatus.RUNNING.value,
+            started_at=datetime.now().isoformat(),
+        )
+        context = JobContext(self, job, cancel_event, secrets)
+
+        try:
+            result = JOB_HANDLERS[job.kind](context)
+            self._finish(job_id, JobStatus.COMPLETED, result=_to_json(result), message="Done")
+        except JobCancelled:
+            self._finish(job_id, JobStatus.CANCELLED, message="Cancelled")
+        except Exception as e:
+            print(f"Job {job_id} ({job.kind}) failed: {e}")
+            self._finish(
+                job_id,
+                JobStatus.FAILED,
+                error=f"{e}\n{traceback.format_exc()}",
+                message=f"Failed: {e}",
+            )
+        finally:
+            self._cancel_events.pop(job_id, None)
+
+    def _finish(self, job_id: int, status: JobStatus, **fields):
+        """Record a terminal job state."""
+        self._update_job(
+            job_id,
+            status=status.value,
+            finished_at=datetime.now().isoformat(),
+            **fields,
+        )
+
+
+# --- Job handlers ---------------------------------------------------------
+
+
+def _job_llm(params: dict):
+    """Create the batch-priority LLM for a job from its persisted parameters."""
+    from src.llm.chain_factory import DEFAULT_MODEL, get_llm
+
+    settings = get_settings()
+    return get_llm(
+        model=params.get("model") or DEFAULT_MODEL,
+        base_url=params.get("base_url") or settings.ollama_base_url,
+        priority="batch",
+    )
+
+
+@register_job_handler("update_cycle")
+def run_update_cycle_job(job: JobContext):
+    """Research companies and create update proposals."""
+    from src.services.updater_service import UpdaterConfig, UpdaterService
+
+    db = Database(job.db_path)
+    try:
+        updater = UpdaterService(
+            llm=_job_llm(job.params),
+            tavily_api_key=job.secrets.get("tavily_api_key") or get_settings().tavily_api_key,
+            config=UpdaterConfig(**job.params.get("config", {})),
+            database=db,
+        )
+        return updater.run_update_cycle(
+            company_ids=job.params["company_ids"],
+            fields=job.params.get("fields"),
+            auto_apply=job.params.get("auto_apply", False),
+            job=job,
+        )
+    finally:
+        db.close()
+
+
+@register_job_handler("news_digest")
+def generate_news_digest_job(job: JobContext):
+    """Generate and save a news digest."""
+    from src.services.news_service import get_news_service
+
+    news_service = get_news_service(
+        llm=_job_llm(job.params) if job.params.get("summarize", True) else None,
+        tavily_api_key=job.secrets.get("tavily_api_key") or get_settings().tavily_api_key,
+    )
+    digest = news_service.generate_digest(
+        max_age_days=job.params.get("max_age_days", 7),
+        include_search=job.params.get("include_search", True),
+        summarize=job.params.get("summarize", True),
+        job=job,
+    )
+    filepath = news_service.save_digest(digest)
+    return {"path": str(filepath), "articles": len(digest.articles)}
+
+
+@register_job_handler("merge_files")
+def merge_files_job(job: JobContext):
+    """Merge an update markdown file into the base research file."""
+    from src.services.markdown_merger_service import get_markdown_merger
+
+    merger = get_markdown_merger(
+        llm=_job_llm(job.params),
+        research_dir=job.params.get("research_dir", "research"),
+    )
+    return merger.merge_files(
+        base_file=job.params.get("base_file", "Fusion_Research.md"),
+        update_file=job.params.get("update_file", "Fusion_Research_UPDATE.md"),
+        output_file=job.params.get("output_file"),
+        job=job,
+    )
+
+
+@register_job_handler("sync_markdown")
+def sync_markdown_job(job: JobContext):
+    """Sync the database from the research markdown file."""
+    from src.models.merge_models import SyncConfig
+    from src.services.database_sync_service import DatabaseSyncService
+
+    db = Database(job.db_path)
+    try:
+        sync_service = DatabaseSyncService(
+            db=db,
+            llm=_job_llm(job.params),
+            config=SyncConfig(**job.params.get("config", {})),
+        )
+        return sync_service.sync_from_markdown(
+            markdown_path=job.params.get("markdown_path", "research/Fusion_Research.md"),
+            job=job,
+        )
+    finally:
+        db.close()
+
+
+@register_job_handler("precompute_analyses")
+def precompute_analyses_job(job: JobContext):
+    """Generate stored SWOTs, comparisons and market reports that are missing or stale."""
+    from src.llm.analyzer import FusionAnalyzer
+    from src.services.precompute_service import PrecomputeConfig, PrecomputeService
+
+    db = Database(job.db_path)
+    try:
+        service = PrecomputeService(
+            db,
+            analyzer=FusionAnalyzer(_job_llm(job.params)),
+            config=PrecomputeConfig(**job.params.get("config", {})),
+        )
+        return service.run(job=job)
+    finally:
+        db.close()
+
+
+# Singleton instance
+_job_runner: Optional[JobRunner] = None
+
+
+def get_job_runner(db_path: str = "research/fusion_research.db") -> JobRunner:
+    """Get job runner singleton instance."""
+    global _job_runner
+    if _job_runner is None:
+        _job_runner = JobRunner(db_path)
+    return _job_runner
@@ -3,13 +3,15 @@
 import re
 import shutil
 import hashlib
+import difflib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from langchain_ollama import ChatOllama
 from langchain_core.output_parsers import StrOutputParser
 
+from src.data.snapshot_store import SnapshotStore
 from src.models.merge_models import (
     MergeConfig,
     MergeResult,
@@ -17,7 +19,9 @@ from src.models.merge_models import (
     MergeOperation,
     MergeType,
     SectionDiff,
+    SectionSegment,
     CompanyDiff,
+    MergeTask,
     DiffType,
 )
 from src.llm.merge_prompts import (
@@ -26,6 +30,12 @@ from src.llm.merge_prompts import (
     NEW_COMPANY_PROMPT,
 )
 from src.llm.chain_factory import get_llm
+from src.services.structural_merge import structural_merge
+
+if TYPE_CHECKING:
+    from langchain_ollama import ChatOllama
+
+    from src.services.job_service import JobContext
 
 
 class MarkdownMergerService:
@@ -37,9 +47,12 @@ class MarkdownMergerService:
     # Pattern to extract #### company entries
     COMPANY_PATTERN = re.compile(r"^####\s+(.+?)\s*\((.+?)\)\s*$", re.MULTILINE)
 
+    # A company block ends at the next ### or #### heading
+    BLOCK_END_PATTERN = re.compile(r"^#{3,4}\s", re.MULTILINE)
+
     def __init__(
         self,
-        llm: Optional[ChatOllama] = None,
+        llm: Optional["ChatOllama"] = None,
         config: Optional[MergeConfig] = None,
         research_dir: str = "research",
     ):
@@ -47,11 +60,12 @@ class MarkdownMergerService:
         self.config = config or MergeConfig()
         self.research_dir = Path(research_dir)
         self.report = MergeReport()
+        self.snapshots = SnapshotStore(str(self.research_dir / self.config.snapshot_dir))
 
-    def _get_llm(self) -> ChatOllama:
+    def _get_llm(self) -> "ChatOllama":
         """Get or create LLM instance."""
         if self.llm is None:
-            self.llm = get_llm()
+            self.llm = get_llm(priority="batch")
         return self.llm
 
     def merge_files(
@@ -59,6 +73,7 @@ class MarkdownMergerService:
         base_file: str = "Fusion_Research.md",
         update_file: str = "Fusion_Research_UPDATE.md",
         output_file: Optional[str] = None,
+        job: Optional["JobContext"] = None,
     ) -> MergeResult:
         """
         Merge update file into base file.
@@ -67,6 +82,8 @@ class MarkdownMergerService:
             base_file: Name of the base markdown file
             update_file: Name of the update markdown file
             output_file: Name of the output file (default: overwrite base)
+            job: Background job context for progress, cancellation and
+                checkpointing of already merged blocks
 
         Returns:
             MergeResult with operation details
@@ -88,8 +105,12 @@ class MarkdownMergerService:
             return result
 
         try:
-            # Create backup
-            result.backup_path = self.create_backup(base_path)
+            # Snapshot (or copy) the base file so a failed merge can be rolled back
+            if self.config.use_snapshots:
+                version = self.snapshots.snapshot(base_path, label=f"before merge of {update_file}")
+                result.snapshot_version = version.id
+            else:
+                result.backup_path = self.create_backup(base_path)
 
             # Read files
             base_content = base_path.read_text(encoding="utf-8")
@@ -102,7 +123,9 @@ class MarkdownMergerService:
             # Compare and identify differences
             diffs = self.compare_sections(base_sections, update_sections)
 
-            # Merge sections
+            # Plan merges: only changed company blocks / text segments go to the LLM
+            planned: dict[str, list] = {}
+            tasks: list[MergeTask] = []
             merged_sections = {}
             for diff in diffs:
                 if diff.diff_type == DiffType.UNCHANGED:
@@ -111,14 +134,21 @@ class MarkdownMergerService:
                     # New section from update
                     merged_sections[diff.section_name] = diff.update_content
                     result.sections_merged += 1
+                    result.sections_merged_locally += 1
                 elif diff.diff_type == DiffType.MODIFIED:
-                    # Merge modified section
-                    merged = self.merge_section(
+                    parts = self.plan_section_merge(
                         diff.original_content,
                         diff.update_content,
                         diff.section_name,
                     )
-                    merged_sections[diff.section_name] = merged
+                    section_tasks = [part for part in parts if isinstance(part, MergeTask)]
+                    if section_tasks:
+                        planned[diff.section_name] = parts
+                        tasks.extend(section_tasks)
+                        result.conflicts_resolved += len(section_tasks)
+                    else:
+                        merged_sections[diff.section_name] = "".join(parts)
+                        result.sections_merged_locally += 1
                     result.sections_merged += 1
 
                     # Count company changes
@@ -128,6 +158,11 @@ class MarkdownMergerService:
                     result.companies_added += company_stats["added"]
                     result.companies_updated += company_stats["updated"]
 
+            # Run all merges concurrently (reusing merges checkpointed by an earlier run)
+            merged_tasks = self._run_merge_tasks(tasks, job=job, result=result)
+            for section_name, parts in planned.items():
+                merged_sections[section_name] = self._assemble(parts, merged_tasks)
+
             # Reassemble document
             merged_content = self._reassemble_document(
                 base_content, merged_sections, base_sections
@@ -143,15 +178,21 @@ class MarkdownMergerService:
             output_path.write_text(merged_content, encoding="utf-8")
             result.merged_path = output_path
             result.success = True
+            if job:
+                job.report_progress(len(tasks), len(tasks), "Merge complete")
 
         except Exception as e:
+            if job and job.is_cancelled():
+                raise
             result.add_error(f"Merge failed: {str(e)}")
-            # Restore from backup if available
-            if result.backup_path and result.backup_path.exists():
-                try:
+            # Restore from snapshot or backup if available
+            try:
+                if result.snapshot_version is not None:
+                    self.snapshots.restore(result.snapshot_version, base_path)
+                elif result.backup_path and result.backup_path.exists():
                     shutil.copy2(result.backup_path, base_path)
-                except Exception:
-                    pass
+            except Exception:
+                pass
 
         return result
 
@@ -285,54 +326,250 @@ class MarkdownMergerService:
 
         return diffs
 
-    def merge_section(
+    def split_section(self, section_content: str) -> list[SectionSegment]:
+        """
+        Split a section into #### company blocks and the text between them.
+
+        Concatenating the segments' content reproduces the section exactly.
+        Company blocks are keyed by company name and text by its leading
+        ### heading (or ``intro`` before the first heading).
+        """
+        segments = []
+        position = 0
+        seen: dict[str, int] = {}
+
+        def add(key: str, content: str, company_name: Optional[str] = None):
+            seen[key] = seen.get(key, 0) + 1
+            if seen[key] > 1:
+                key = f"{key} #{seen[key]}"
+            segments.append(SectionSegment(key=key, content=content, company_name=company_name))
+
+        def add_text(content: str):
+            first_line = content.lstrip("\n").split("\n", 1)[0].strip()
+            add(f"text:{first_line}" if first_line.startswith("###") else "text:intro", content)
+
+        for match in self.COMPANY_PATTERN.finditer(section_content):
+            if match.start() < position:
+                continue
+            if match.start() > position:
+                add_text(section_content[position:match.start()])
+
+            company_name = match.group(1).strip()
+            next_header = self.BLOCK_END_PATTERN.search(section_content, match.end())
+            end_pos = next_header.start() if next_header else len(section_content)
+            add(f"company:{company_name}", section_content[match.start():end_pos], company_name)
+            position = end_pos
+
+        if position < len(section_content):
+            add_text(section_content[position:])
+        return segments
+
+    def plan_section_merge(
         self,
         base_section: str,
         update_section: str,
         section_name: str,
-    ) -> str:
+    ) -> list:
         """
-        Use LLM to intelligently merge a single section.
+        Plan the merge of a modified section segment by segment.
 
-        For large sections, processes company-by-company.
+        Unchanged segments are kept, segments only in the update are inserted
+        after their predecessor and changed segments are merged structurally
+        where possible. Conflicting segments become ``MergeTask``s (split into
+        chunks of at most ``chunk_size`` characters).
+
+        Returns:
+            Ordered list of literal strings and MergeTasks
         """
-        # Check if section is small enough to merge directly
-        total_size = len(base_section) + len(update_section)
-
-        if total_size < self.config.chunk_size:
-            return self._llm_merge_section(base_section, update_section, section_name)
-
-        # For large sections, merge company-by-company
-        base_companies = self.extract_company_blocks(base_section)
-        update_companies = self.extract_company_blocks(update_section)
-
-        if not base_companies and not update_companies:
-            # No company structure, use direct merge with chunking
-            return self._llm_merge_section(base_section, update_section, section_name)
-
-        # Merge companies
-        merged_content = base_section  # Start with base
-
-        for company_name, update_company in update_companies.items():
-            if company_name in base_companies:
-                # Update existing company
-                base_company = base_companies[company_name]
-                merged_company = self._llm_merge_company(
-                    base_company.original_content,
-                    update_company.original_content,
-                    company_name,
-                )
-                # Replace in merged content
-                merged_content = merged_content.replace(
-                    base_company.original_content, merged_company
-                )
+        base_segments = self.split_section(base_section)
+        update_segments = self.split_section(update_section)
+        base_by_key = {segment.key: segment for segment in base_segments}
+
+        # Base order, with update-only segments placed after their predecessor
+        order = [segment.key for segment in base_segments]
+        previous_key = None
+        for segment in update_segments:
+            if segment.key not in base_by_key:
+                index = order.index(previous_key) + 1 if previous_key in order else len(order)
+                order.insert(index, segment.key)
+            previous_key = segment.key
+
+        update_by_key = {segment.key: segment for segment in update_segments}
+        parts: list = []
+        for key in order:
+            base = base_by_key.get(key)
+            update = update_by_key.get(key)
+            if base is None:
+                content = update.content
+                if parts and isinstance(parts[-1], str) and not parts[-1].endswith("\n"):
+                    content = "\n" + content
+                parts.append(content if content.endswith("\n") else content + "\n")
+            elif update is None or self._content_hash(base.content) == self._content_hash(
+                update.content
+            ):
+                parts.append(base.content)
             else:
-                # New company - append at end of section
-                merged_content = self._add_new_company(
-                    merged_content, update_company.original_content
-                )
+                resolved = None
+                if self.config.structural_merge:
+                    resolved = structural_merge(base.content, update.content)
+                if resolved is not None:
+                    parts.append(resolved)
+                else:
+                    parts.extend(self._segment_tasks(base, update, section_name))
+        return parts
+
+    def _segment_tasks(
+        self,
+        base: SectionSegment,
+        update: SectionSegment,
+        section_name: str,
+    ) -> list:
+        """Turn a changed segment into merge tasks, chunking oversize segments."""
+        task_key = f"{section_name}\x1f{base.key}"
+        if len(base.content) + len(update.content) <= self.config.chunk_size:
+            return [MergeTask(
+                key=task_key,
+                section_name=section_name,
+                original_content=base.content,
+                update_content=update.content,
+                company_name=base.company_name,
+            )]
+
+        # Align paragraphs and only send the differing runs, grouped up to chunk_size
+        base_paragraphs = base.content.split("\n\n")
+        update_paragraphs = update.content.split("\n\n")
+        matcher = difflib.SequenceMatcher(None, base_paragraphs, update_paragraphs, autojunk=False)
+
+        pieces: list = []
+        pending_base: list[str] = []
+        pending_update: list[str] = []
+
+        def flush():
+            if pending_base or pending_update:
+                pieces.append(MergeTask(
+                    key=f"{task_key}\x1f{len(pieces)}",
+                    section_name=section_name,
+                    original_content="\n\n".join(pending_base),
+                    update_content="\n\n".join(pending_update),
+                    company_name=base.company_name,
+                ))
+                pending_base.clear()
+                pending_update.clear()
+
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                flush()
+                pieces.append("\n\n".join(base_paragraphs[i1:i2]))
+            elif tag == "delete":
+                flush()
+                pieces.append("\n\n".join(base_paragraphs[i1:i2]))
+            elif tag == "insert":
+                flush()
+                pieces.append("\n\n".join(update_paragraphs[j1:j2]))
+            else:
+                size = sum(map(len, pending_base + pending_update))
+                added = sum(map(len, base_paragraphs[i1:i2] + update_paragraphs[j1:j2]))
+                if size and size + added > self.config.chunk_size:
+                    flush()
+                pending_base.extend(base_paragraphs[i1:i2])
+                pending_update.extend(update_paragraphs[j1:j2])
+        flush()
+
+        # Rejoin with the paragraph separators the split removed
+        parts: list = []
+        for index, piece in enumerate(pieces):
+            if index:
+                parts.append("\n\n")
+            parts.append(piece)
+        return parts
+
+    def _run_merge_tasks(
+        self,
+        tasks: list[MergeTask],
+        job: Optional["JobContext"] = None,
+        result: Optional[MergeResult] = None,
+    ) -> dict[str, str]:
+        """
+        Merge tasks concurrently under a bounded thread pool.
 
-        return merged_content
+        Returns:
+            Dictionary mapping task keys to merged content
+        """
+        checkpointed = job.checkpoint_state.get("merged", {}) if job else {}
+        merged: dict[str, str] = {}
+        todo = []
+        for task in tasks:
+            task_hash = self._content_hash(task.original_content + task.update_content)
+            saved = checkpointed.get(task.key)
+            if saved and saved["hash"] == task_hash:
+                merged[task.key] = saved["content"]
+            else:
+                todo.append((task, task_hash))
+
+        if not todo:
+            return merged
+
+        self._get_llm()
+        workers = max(1, min(self.config.max_concurrent_merges, len(todo)))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = {executor.submit(self._merge_task, task): (task, task_hash)
+                       for task, task_hash in todo}
+            for future in as_completed(futures):
+                task, task_hash = futures[future]
+                merged[task.key] = future.result()
+                if result is not None:
+                    result.llm_requests += 1
+                if job:
+                    checkpointed[task.key] = {"hash": task_hash, "content": merged[task.key]}
+                    job.save_checkpoint({"merged": checkpointed})
+                    job.raise_if_cancelled()
+                    job.report_progress(
+                        len(merged), len(tasks),
+                        f"Merged {task.company_name or task.section_name}",
+                    )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return merged
+
+    def _merge_task(self, task: MergeTask) -> str:
+        """Merge one task with the company or section prompt, keeping its padding."""
+        if task.company_name:
+            content = self._llm_merge_company(
+                task.original_content, task.update_content, task.company_name
+            )
+        else:
+            content = self._llm_merge_section(
+                task.original_content, task.update_content, task.section_name
+            )
+        original = task.original_content
+        leading = original[:len(original) - len(original.lstrip())]
+        trailing = original[len(original.rstrip()):]
+        return leading + content.strip() + trailing
+
+    def _assemble(self, parts: list, merged: dict[str, str]) -> str:
+        """Join a planned section merge, substituting merged task content."""
+        return "".join(
+            merged[part.key] if isinstance(part, MergeTask) else part
+            for part in parts
+        )
+
+    def merge_section(
+        self,
+        base_section: str,
+        update_section: str,
+        section_name: str,
+    ) -> str:
+        """
+        Use LLM to merge a single section.
+
+        Only changed company blocks and text segments are sent to the LLM,
+        concurrently; see ``plan_section_merge``.
+        """
+        parts = self.plan_section_merge(base_section, update_section, section_name)
+        tasks = [part for part in parts if isinstance(part, MergeTask)]
+        return self._assemble(parts, self._run_merge_tasks(tasks))
 
     def _llm_merge_section(
         self,
@@ -382,20 +619,6 @@ class MarkdownMergerService:
             # Fallback: return update content (prefer newer)
             return update_company
 
-    def _add_new_company(self, section_content: str, new_company: str) -> str:
-        """Add a new company entry to a section."""
-        # Find a good insertion point (before next ## or at end)
-        next_section = re.search(r"\n##\s+", section_content)
-        if next_section:
-            insert_pos = next_section.start()
-            return (
-                section_content[:insert_pos] +
-                "\n\n" + new_company.strip() + "\n" +
-                section_content[insert_pos:]
-            )
-        else:
-            return section_content.rstrip() + "\n\n" + new_company.strip() + "\n"
-
     def _reassemble_document(
         self,
         original_content: str,
@@ -458,6 +681,11 @@ class MarkdownMergerService:
         shutil.copy2(file_path, backup_path)
         return backup_path
 
+    def restore_snapshot(self, version_id: int, file_name: Optional[str] = None) -> Path:
+        """Restore a snapshot version into the research directory."""
+        version = self.snapshots.get_version(version_id)
+        return self.snapshots.restore(version_id, self.research_dir / (file_name or version.document))
+
     def restore_from_backup(self, backup_path: Path, original_path: Path) -> bool:
         """Restore file from backup."""
         if not backup_path.exists():
@@ -490,7 +718,7 @@ class MarkdownMergerService:
 
 
 def get_markdown_merger(
-    llm: Optional[ChatOllama] = None,
+    llm: Optional["ChatOllama"] = None,
     config: Optional[MergeConfig] = None,
     research_dir: str = "research",
 ) -> MarkdownMergerService:
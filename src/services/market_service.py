@@ -1,12 +1,15 @@
 """Market analysis service."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 from dataclasses import dataclass
 
+from src.data.analysis_store import AnalysisStore, market_report_key
 from src.data.database import Database
 from src.data.repositories import MarketRepository, FundingRepository
 from src.models.market import Market
-from src.llm.analyzer import FusionAnalyzer
+
+if TYPE_CHECKING:
+    from src.llm.analyzer import FusionAnalyzer
 
 
 @dataclass
@@ -27,11 +30,12 @@ class MarketService:
     def __init__(
         self,
         db: Database,
-        analyzer: Optional[FusionAnalyzer] = None,
+        analyzer: Optional["FusionAnalyzer"] = None,
     ):
         self.db = db
         self.market_repo = MarketRepository(db)
         self.funding_repo = FundingRepository(db)
+        self.analyses = AnalysisStore(db)
         self.analyzer = analyzer
     
     def get_all_markets(self) -> list[Market]:
@@ -105,11 +109,34 @@ class MarketService:
             for row in cursor.fetchall()
         ]
     
-    def generate_market_report(self, focus_area: str = "general") -> Optional[str]:
-        """Generate a market report section."""
+    def generate_market_report(
+        self,
+        focus_area: str = "general",
+        refresh: bool = False,
+    ) -> Optional[str]:
+        """Generate a market report section, reusing a stored one unless ``refresh`` is set."""
         if not self.analyzer:
             return None
         
+        market_data = self.market_report_data()
+        key = market_report_key(market_data, focus_area)
+        stored = None if refresh else self.analyses.get(key)
+        if stored:
+            return stored.content
+        
+        report = self.analyzer.generate_market_report(market_data, focus_area)
+        self.analyses.save(key, report, self.analyzer.model_name)
+        return report
+    
+    def stream_market_report(self, focus_area: str = "general") -> Iterator[str]:
+        """Stream a market report section token by token."""
+        if not self.analyzer:
+            return
+        
+        yield from self.analyzer.stream_market_report(self.market_report_data(), focus_area)
+    
+    def market_report_data(self) -> str:
+        """Summarize market metrics as LLM context for a report."""
         metrics = self.get_market_metrics()
         regional = self.get_regional_distribution()
         
@@ -127,7 +154,7 @@ Funding by Year:
 {chr(10).join(f"- {y['year']}: ${y['total']/1e6:.1f}M" for y in metrics.funding_by_year[-5:])}
 """
         
-        return self.analyzer.generate_market_report(market_data, focus_area)
+        return market_data
     
     def get_investment_landscape(self) -> dict:
         """Get investment landscape data."""
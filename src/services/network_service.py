@@ -5,14 +5,15 @@ import re
 import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
-
-import networkx as nx
-import pandas as pd
-from pyvis.network import Network
+from typing import TYPE_CHECKING
 
 from src.data.database import Database, get_database
 from src.data.parsers.relationship_parser import classify_partner, parse_text_list
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from pyvis.network import Network
+
 logger = logging.getLogger(__name__)
 
 
@@ -274,8 +275,10 @@ class NetworkService:
         """Alias for load_network_from_db for backwards compatibility."""
         return self.load_network_from_db()
 
-    def build_nodes_dataframe(self, data: NetworkData | None = None) -> pd.DataFrame:
+    def build_nodes_dataframe(self, data: NetworkData | None = None) -> "pd.DataFrame":
         """Build pandas DataFrame for nodes."""
+        import pandas as pd
+
         if data is None:
             data = self.load_network()
 
@@ -295,8 +298,10 @@ class NetworkService:
 
         return pd.DataFrame(records)
 
-    def build_edges_dataframe(self, data: NetworkData | None = None) -> pd.DataFrame:
+    def build_edges_dataframe(self, data: NetworkData | None = None) -> "pd.DataFrame":
         """Build pandas DataFrame for edges."""
+        import pandas as pd
+
         if data is None:
             data = self.load_network()
 
@@ -317,12 +322,15 @@ class NetworkService:
 
     def create_pyvis_network(
         self,
-        df_edges: pd.DataFrame | None = None,
-        df_nodes: pd.DataFrame | None = None,
+        df_edges: "pd.DataFrame | None" = None,
+        df_nodes: "pd.DataFrame | None" = None,
         height: str = "800px",
         show_buttons: bool = False,
-    ) -> Network:
+    ) -> "Network":
         """Create pyvis Network object for visualization."""
+        import networkx as nx
+        from pyvis.network import Network
+
         data = self.load_network()
 
         if df_nodes is None:
@@ -4,16 +4,18 @@ import hashlib
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from dataclasses import dataclass, field
 
-import httpx
-import feedparser
-from tavily import TavilyClient
-from langchain_ollama import ChatOllama
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
+if TYPE_CHECKING:
+    from langchain_ollama import ChatOllama
+    from tavily import TavilyClient
+
+    from src.services.job_service import JobContext
+
 
 @dataclass
 class NewsArticle:
@@ -133,7 +135,7 @@ class NewsService:
     
     def __init__(
         self,
-        llm: Optional[ChatOllama] = None,
+        llm: Optional["ChatOllama"] = None,
         cache_dir: str = "research/news_cache",
         tavily_api_key: Optional[str] = None,
     ):
@@ -141,12 +143,16 @@ class NewsService:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.tavily_api_key = tavily_api_key
-        self.tavily_client: Optional[TavilyClient] = None
+        self.tavily_client: Optional["TavilyClient"] = None
         if tavily_api_key:
+            from tavily import TavilyClient
+
             self.tavily_client = TavilyClient(api_key=tavily_api_key)
     
     def fetch_rss_articles(self, max_age_days: int = 7) -> list[NewsArticle]:
         """Fetch articles from RSS feeds."""
+        import feedparser
+
         articles = []
         cutoff = datetime.now() - timedelta(days=max_age_days)
         
@@ -314,20 +320,33 @@ Summary:"""),
         max_age_days: int = 7,
         include_search: bool = True,
         summarize: bool = True,
+        job: Optional["JobContext"] = None,
     ) -> NewsDigest:
         """Generate a complete news digest."""
+        search_queries = [
+            "fusion energy startup funding 2024",
+            "tokamak stellarator breakthrough",
+            "fusion power plant progress",
+        ] if include_search else []
+        # Steps: RSS fetch, searches, up to 10 summaries, executive summary
+        total_steps = 1 + len(search_queries) + (10 if summarize else 0) + 1
+        step = 0
+
+        def advance(message: str):
+            nonlocal step
+            if job:
+                job.raise_if_cancelled()
+                job.report_progress(step, total_steps, message)
+            step += 1
+
         # Fetch articles
+        advance("Fetching RSS feeds")
         articles = self.fetch_rss_articles(max_age_days=max_age_days)
         
         # Add search results for key topics
-        if include_search:
-            search_queries = [
-                "fusion energy startup funding 2024",
-                "tokamak stellarator breakthrough",
-                "fusion power plant progress",
-            ]
-            for query in search_queries:
-                articles.extend(self.search_news(query, max_results=5))
+        for query in search_queries:
+            advance(f"Searching: {query}")
+            articles.extend(self.search_news(query, max_results=5))
         
         # Deduplicate by URL
         seen_urls = set()
@@ -348,6 +367,7 @@ Summary:"""),
         # Summarize top articles
         if summarize and self.llm:
             for article in unique_articles[:10]:  # Limit LLM calls
+                advance(f"Summarizing: {article.title[:60]}")
                 if article.relevance in ["high", "medium"]:
                     article.ai_summary = self.summarize_article(article)
         
@@ -362,8 +382,11 @@ Summary:"""),
         
         # Generate executive summary
         if self.llm and unique_articles:
+            advance("Writing executive summary")
             digest.executive_summary = self._generate_executive_summary(unique_articles[:10])
         
+        if job:
+            job.report_progress(total_steps, total_steps, "Digest complete")
         return digest
     
     def _generate_executive_summary(self, articles: list[NewsArticle]) -> str:
@@ -415,7 +438,7 @@ Executive Summary:"""),
 
 
 def get_news_service(
-    llm: Optional[ChatOllama] = None,
+    llm: Optional["ChatOllama"] = None,
     cache_dir: str = "research/news_cache",
     tavily_api_key: Optional[str] = None,
 ) -> NewsService:
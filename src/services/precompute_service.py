@@ -0,0 +1,198 @@
+"""Background precompute of stored LLM analyses.
+
+Generates the SWOT analyses, company comparisons and AI market report that
+pages are most likely to ask for, so they are served from the ``analyses``
+table instead of waiting on Ollama. Targets are the top-funded companies and
+the companies changed recently. Entries whose input hash is still current
+are skipped, so a re-run only regenerates what data changes made stale (and
+an interrupted run resumes where it stopped without a checkpoint). Runs as
+the ``precompute_analyses`` background job on a batch-priority LLM.
+"""
+
+from dataclasses import asdict, dataclass, field
+from itertools import combinations
+from typing import TYPE_CHECKING, Optional
+
+from src.config import get_settings
+from src.data.analysis_store import (
+    COMPARISON,
+    MARKET_REPORT,
+    SWOT,
+    AnalysisKey,
+    AnalysisStore,
+    comparison_key,
+    market_report_key,
+    swot_key,
+)
+from src.data.database import Database
+from src.services.company_service import CompanyService
+from src.services.market_service import MarketService
+
+if TYPE_CHECKING:
+    from src.llm.analyzer import FusionAnalyzer
+    from src.models.company import Company
+    from src.services.job_service import JobContext, JobRunner
+
+PRECOMPUTE_JOB = "precompute_analyses"
+
+
+@dataclass
+class PrecomputeConfig:
+    """Which analyses to precompute."""
+    top_companies: int = 10
+    changed_days: int = 7
+    compare_top: int = 5
+    market_report: bool = True
+
+    @classmethod
+    def from_settings(cls) -> "PrecomputeConfig":
+        """Configuration from the PRECOMPUTE_* settings."""
+        settings = get_settings()
+        return cls(
+            top_companies=settings.precompute_top_companies,
+            changed_days=settings.precompute_changed_days,
+            compare_top=settings.precompute_compare_top,
+        )
+
+
+@dataclass
+class PrecomputeTask:
+    """One analysis to keep stored."""
+    key: AnalysisKey
+    label: str
+    company_ids: tuple[int, ...] = ()
+
+
+@dataclass
+class PrecomputeResult:
+    """Outcome of a precompute run."""
+    generated: int = 0
+    fresh: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+class PrecomputeService:
+    """Plans and generates stored analyses for the most requested subjects."""
+
+    def __init__(
+        self,
+        db: Database,
+        analyzer: Optional["FusionAnalyzer"] = None,
+        config: Optional[PrecomputeConfig] = None,
+    ):
+        self.db = db
+        self.company_service = CompanyService(db, analyzer)
+        self.market_service = MarketService(db, analyzer)
+        self.analyses = AnalysisStore(db)
+        self.analyzer = analyzer
+        self.config = config or PrecomputeConfig()
+
+    def target_companies(self) -> list["Company"]:
+        """Top-funded companies, then recently changed ones (no duplicates)."""
+        if self.config.top_companies <= 0:
+            return []
+        ids = [dto.id for dto in self.company_service.get_top_funded_companies(
+            self.config.top_companies
+        )]
+        changed = self.company_service.get_recently_updated_companies(
+            days=self.config.changed_days, limit=self.config.top_companies
+        )
+        ids += [company.id for company in changed]
+        companies = map(self.company_service.get_company, dict.fromkeys(ids))
+        return [company for company in companies if company]
+
+    def plan(self) -> list[PrecomputeTask]:
+        """All analyses to keep stored, fresh or not."""
+        companies = self.target_companies()
+        if not companies:
+            return []
+
+        tasks = [
+            PrecomputeTask(swot_key(company), f"SWOT: {company.name}", (company.id,))
+            for company in companies
+        ]
+        for company_a, company_b in combinations(companies[:self.config.compare_top], 2):
+            tasks.append(PrecomputeTask(
+                comparison_key(company_a, company_b),
+                f"Comparison: {company_a.name} vs {company_b.name}",
+                (company_a.id, company_b.id),
+            ))
+        if self.config.market_report:
+            tasks.append(PrecomputeTask(
+                market_report_key(self.market_service.market_report_data()),
+                "AI market report",
+            ))
+        return tasks
+
+    def pending(self) -> list[PrecomputeTask]:
+        """Planned analyses that are missing or stale."""
+        return [task for task in self.plan() if not self.analyses.is_fresh(task.key)]
+
+    def run(self, job: Optional["JobContext"] = None) -> PrecomputeResult:
+        """Generate every missing or stale planned analysis.
+
+        A failed analysis is recorded in ``errors`` and the run continues.
+        """
+        if not self.analyzer:
+            raise ValueError("An analyzer is required to precompute analyses")
+
+        result = PrecomputeResult()
+        tasks = self.plan()
+        for done, task in enumerate(tasks):
+            if job:
+                job.raise_if_cancelled()
+                job.report_progress(done, len(tasks), task.label)
+            if self.analyses.is_fresh(task.key):
+                result.fresh += 1
+                continue
+            try:
+                self._generate(task)
+                result.generated += 1
+            except Exception as e:
+                result.errors.append(f"{task.label}: {e}")
+
+        if job:
+            job.report_progress(len(tasks), len(tasks), "Analyses up to date")
+        return result
+
+    def _generate(self, task: PrecomputeTask):
+        """Regenerate and store one analysis."""
+        if task.key.kind == SWOT:
+            self.company_service.generate_swot(task.company_ids[0], refresh=True)
+        elif task.key.kind == COMPARISON:
+            self.company_service.compare_companies(*task.company_ids, refresh=True)
+        elif task.key.kind == MARKET_REPORT:
+            self.market_service.generate_market_report(task.key.subject, refresh=True)
+
+
+def schedule_precompute(
+    runner: "JobRunner",
+    config: Optional[PrecomputeConfig] = None,
+    params: Optional[dict] = None,
+) -> Optional[int]:
+    """Submit a precompute job when analyses are pending and none is queued.
+
+    Args:
+        runner: Job runner to submit to
+        config: Analyses to precompute (default: from settings)
+        params: Extra job parameters such as ``model`` and ``base_url``
+
+    Returns:
+        The new job ID, or None when nothing was submitted
+    """
+    config = config or PrecomputeConfig.from_settings()
+    if config.top_companies <= 0:
+        return None
+    if runner.list_jobs(limit=1, kind=PRECOMPUTE_JOB, active_only=True):
+        return None
+
+    db = Database(runner.db_path)
+    try:
+        if not PrecomputeService(db, config=config).pending():
+            return None
+    finally:
+        db.close()
+
+    job_params = dict(params or {})
+    job_params["config"] = asdict(config)
+    return runner.submit(PRECOMPUTE_JOB, job_params)
@@ -1,6 +1,6 @@
 """Report generation service."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from datetime import datetime
 from pathlib import Path
 
@@ -8,7 +8,9 @@ from src.data.database import Database
 from src.services.company_service import CompanyService
 from src.services.market_service import MarketService
 from src.services.technology_service import TechnologyService
-from src.llm.analyzer import FusionAnalyzer
+
+if TYPE_CHECKING:
+    from src.llm.analyzer import FusionAnalyzer
 
 
 class ReportService:
@@ -17,7 +19,7 @@ class ReportService:
     def __init__(
         self,
         db: Database,
-        analyzer: Optional[FusionAnalyzer] = None,
+        analyzer: Optional["FusionAnalyzer"] = None,
     ):
         self.db = db
         self.company_service = CompanyService(db, analyzer)
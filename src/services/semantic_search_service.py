@@ -1,14 +1,34 @@
 """Semantic search service using ChromaDB vector store."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Union
 from dataclasses import dataclass
 
-from langchain_ollama import ChatOllama
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
+from src.data.lexical_index import RRF_K, reciprocal_rank_fusion
+from src.data.search_filters import SearchFilters, combine_where
 from src.data.vector_store import VectorStore, get_vector_store
 from src.data.database import Database
+from src.llm.context_builder import ContextBuilder
+
+if TYPE_CHECKING:
+    from langchain_ollama import ChatOllama
+
+    from src.services.company_service import CompanySearchCriteria
+
+# Candidates fetched from each retriever per requested result before fusion
+CANDIDATE_FACTOR = 4
+
+# Company filters matching at most this many rows in SQLite are pushed down
+# as an id list; broader filters are applied to the document metadata
+PREFILTER_MAX_IDS = 256
+
+# Criteria fields that only SQLite can evaluate (not stored as metadata)
+SQL_ONLY_CRITERIA = ("company_type", "founded_after", "founded_before")
+
+# Returned by ``_filter_where`` when no document can match the filters
+NO_MATCH = object()
 
 
 @dataclass
@@ -18,6 +38,11 @@ class SemanticSearchResult:
     results: list[dict]
     answer: Optional[str] = None
     sources: list[str] = None
+    # "hybrid", "vector", "lexical" when the embedding call was skipped, or
+    # "filtered" when no company matched the filters
+    retrieval: str = "hybrid"
+    # Estimated tokens of document text sent to the LLM for the answer
+    context_tokens: int = 0
     
     def __post_init__(self):
         if self.sources is None:
@@ -31,32 +56,137 @@ class SemanticSearchService:
         self,
         db: Database,
         vector_store: Optional[VectorStore] = None,
-        llm: Optional[ChatOllama] = None,
+        llm: Optional["ChatOllama"] = None,
+        context_builder: Optional[ContextBuilder] = None,
     ):
         self.db = db
         self.vector_store = vector_store or get_vector_store()
         self.llm = llm
+        # Defaults to the context budget of the LLM's model
+        self.context_builder = context_builder
     
     def search(
         self,
         query: str,
         k: int = 5,
         filter_type: Optional[str] = None,
+        lexical_query: Optional[str] = None,
+        lexical_shortcut: bool = True,
+        filters: Union[SearchFilters, "CompanySearchCriteria", None] = None,
     ) -> SemanticSearchResult:
-        """Perform semantic search and return results."""
-        docs = self.vector_store.similarity_search_with_score(
-            query=query,
+        """Perform hybrid keyword + semantic search and return results.
+        
+        BM25 keyword hits and vector hits are merged by reciprocal rank
+        fusion. When the keyword ranking alone is confident (a short query
+        whose terms all appear in one clearly best document, e.g. a company
+        name or an acronym), the embedding call is skipped.
+        
+        Args:
+            query: Search text for the vector search
+            k: Number of results
+            filter_type: Restrict to one document type
+            lexical_query: Search text for the keyword search (defaults to ``query``)
+            lexical_shortcut: Allow skipping the vector search for confident keyword hits
+            filters: Metadata constraints (``SearchFilters`` or
+                ``CompanySearchCriteria``), applied before ranking
+        """
+        return self.search_many(
+            [query],
             k=k,
             filter_type=filter_type,
-        )
+            filters=filters,
+            lexical_queries=[lexical_query],
+            lexical_shortcut=lexical_shortcut,
+        )[0]
+    
+    def search_many(
+        self,
+        queries: list[str],
+        k: int = 5,
+        filter_type: Optional[str] = None,
+        filters: Union[SearchFilters, "CompanySearchCriteria", None] = None,
+        lexical_queries: Optional[list[Optional[str]]] = None,
+        lexical_shortcut: bool = True,
+    ) -> list[SemanticSearchResult]:
+        """Hybrid search for several queries at once (see ``search``).
+        
+        Filters are resolved once, and all queries that need the vector
+        search are embedded together and sent to the vector store in one
+        ``search_many`` call.
+        
+        Args:
+            queries: Search texts for the vector search
+            k: Number of results per query
+            filter_type: Restrict to one document type
+            filters: Metadata constraints shared by all queries
+            lexical_queries: Keyword search text per query (None entries use the query)
+            lexical_shortcut: Allow skipping the vector search for confident keyword hits
+        
+        Returns:
+            One result per query, in input order
+        """
+        lexical_queries = [
+            lexical_query or query
+            for query, lexical_query in zip(queries, lexical_queries or [None] * len(queries))
+        ]
+        where = self._filter_where(filters)
+        if where is NO_MATCH:
+            return [
+                SemanticSearchResult(query=query, results=[], retrieval="filtered")
+                for query in queries
+            ]
+        
+        candidates = k * CANDIDATE_FACTOR
+        lexical_hits = [
+            self.vector_store.lexical_search(
+                lexical_query, k=candidates, filter_type=filter_type, where=where
+            )
+            for lexical_query in lexical_queries
+        ]
+        pending = [
+            i for i, (lexical_query, hits) in enumerate(zip(lexical_queries, lexical_hits))
+            if not (lexical_shortcut and self.vector_store.lexical_index.is_confident(
+                lexical_query, hits
+            ))
+        ]
+        vector_hits = dict(zip(pending, self.vector_store.search_many(
+            [queries[i] for i in pending],
+            k=candidates,
+            filter_type=filter_type,
+            where=where,
+        ))) if pending else {}
+        
+        return [
+            self._fused_result(query, k, lexical_hits[i], vector_hits.get(i))
+            for i, query in enumerate(queries)
+        ]
+    
+    @staticmethod
+    def _fused_result(
+        query: str,
+        k: int,
+        lexical_hits: list[tuple],
+        vector_hits: Optional[list[tuple]],
+    ) -> SemanticSearchResult:
+        """Merge keyword and vector hits of one query by reciprocal rank fusion."""
+        rankings = [[doc for doc, _ in lexical_hits]]
+        retrieval = "lexical"
+        if vector_hits is not None:
+            rankings.append([doc for doc, _ in vector_hits])
+            retrieval = "hybrid" if lexical_hits else "vector"
+        
+        # Normalize fused scores by the best possible score (rank 1 in every list)
+        best_possible = len(rankings) / (RRF_K + 1)
         
         results = []
         sources = []
         
-        for doc, score in docs:
+        for doc, fused in reciprocal_rank_fusion(rankings)[:k]:
+            relevance = fused / best_possible
             result = {
                 "content": doc.page_content,
-                "score": float(score),
+                "score": 1 - relevance,
+                "relevance": relevance,
                 "type": doc.metadata.get("type", "unknown"),
                 **doc.metadata,
             }
@@ -77,29 +207,124 @@ class SemanticSearchService:
             query=query,
             results=results,
             sources=sources,
+            retrieval=retrieval,
+        )
+    
+    def _filter_where(self, filters: Any) -> Any:
+        """Metadata ``where`` clause for search filters.
+        
+        Company constraints are first counted in SQLite: when few companies
+        match (or the criteria use fields only SQLite has), the matching ids
+        are pushed down instead of the individual conditions. Both paths
+        select the same companies (see ``src.data.search_filters``). Returns
+        ``NO_MATCH`` when SQLite finds no matching company.
+        """
+        search_filters = SearchFilters.coerce(filters)
+        if search_filters is None:
+            return None
+        where = search_filters.to_where()
+        if self.db is None or search_filters.entity_type != "company":
+            return where
+        
+        sql_only = any(getattr(filters, name, None) is not None for name in SQL_ONLY_CRITERIA)
+        if not (search_filters.company_fields_set or sql_only):
+            return where
+        if not all(
+            value is None or isinstance(value, str)
+            for value in (search_filters.country, search_filters.technology)
+        ):
+            # Lists of countries/technologies only exist as metadata filters
+            return where
+        
+        from src.data.repositories import CompanyRepository
+        
+        limit = -1 if sql_only else PREFILTER_MAX_IDS + 1
+        companies = CompanyRepository(self.db).search(
+            country=search_filters.country or None,
+            technology=search_filters.technology or None,
+            trl_min=search_filters.trl_min,
+            trl_max=search_filters.trl_max,
+            funding_min=search_filters.funding_min,
+            funding_max=search_filters.funding_max,
+            **{name: getattr(filters, name, None) for name in SQL_ONLY_CRITERIA},
+            limit=limit,
         )
+        if not companies:
+            return NO_MATCH
+        if sql_only or len(companies) <= PREFILTER_MAX_IDS:
+            ids = [company.id for company in companies]
+            return combine_where({"type": "company"}, {"company_id": {"$in": ids}})
+        return where
     
     def search_with_answer(
         self,
         query: str,
         k: int = 5,
         filter_type: Optional[str] = None,
+        **search_options,
     ) -> SemanticSearchResult:
-        """Perform semantic search and generate an LLM answer."""
+        """Perform search and generate an LLM answer (options are passed to ``search``)."""
         # First get search results
-        search_result = self.search(query, k=k, filter_type=filter_type)
-        
+        search_result = self.search(query, k=k, filter_type=filter_type, **search_options)
+        self._answer(search_result)
+        return search_result
+    
+    def search_many_with_answers(
+        self,
+        queries: list[str],
+        k: int = 5,
+        filter_type: Optional[str] = None,
+        **search_options,
+    ) -> list[SemanticSearchResult]:
+        """Batched ``search_with_answer``: one search round trip, then an answer per query."""
+        search_results = self.search_many(queries, k=k, filter_type=filter_type, **search_options)
+        for search_result in search_results:
+            self._answer(search_result)
+        return search_results
+    
+    def _answer(self, search_result: SemanticSearchResult):
+        """Set the LLM answer on a search result (no-op without an LLM)."""
         if not self.llm:
-            return search_result
+            return
+        
+        try:
+            search_result.answer = self._answer_chain().invoke({
+                "context": self._build_context(search_result),
+                "query": search_result.query,
+            })
+        except Exception as e:
+            search_result.answer = f"Error generating answer: {e}"
+    
+    def stream_answer(self, search_result: SemanticSearchResult) -> Iterator[str]:
+        """Stream an LLM answer for results returned by ``search``.
         
-        # Build context from results
-        context_parts = []
-        for i, result in enumerate(search_result.results, 1):
-            context_parts.append(f"[{i}] {result['content']}")
+        Yields answer tokens as they are generated; the caller joins them
+        (e.g. via ``st.write_stream``) and may store the text on
+        ``search_result.answer``.
+        """
+        if not self.llm:
+            return
         
-        context = "\n\n".join(context_parts)
+        try:
+            yield from self._answer_chain().stream({
+                "context": self._build_context(search_result),
+                "query": search_result.query,
+            })
+        except Exception as e:
+            yield f"Error generating answer: {e}"
+    
+    def _build_context(self, search_result: SemanticSearchResult) -> str:
+        """Build numbered, deduplicated LLM context within the model's token budget.
         
-        # Generate answer using LLM
+        Citation numbers match the positions in ``search_result.results``.
+        """
+        builder = self.context_builder or ContextBuilder.for_model(getattr(self.llm, "model", None))
+        context = builder.build(search_result.results)
+        search_result.context_tokens = context.tokens
+        return context.text
+    
+    def _answer_chain(self):
+        """Build the answer generation chain."""
         prompt = ChatPromptTemplate.from_messages([
             ("system", """You are a fusion energy industry expert. Answer the user's question based on the provided context.
 Be concise and factual. Use bullet points when listing multiple items.
@@ -113,22 +338,20 @@ Question: {query}
 Answer:"""),
         ])
         
-        chain = prompt | self.llm | StrOutputParser()
-        
-        try:
-            answer = chain.invoke({
-                "context": context,
-                "query": query,
-            })
-            search_result.answer = answer
-        except Exception as e:
-            search_result.answer = f"Error generating answer: {e}"
-        
-        return search_result
+        return prompt | self.llm | StrOutputParser()
     
     def find_similar_companies(self, company_name: str, k: int = 5) -> list[dict]:
-        """Find companies similar to the given company."""
-        # First, get the company's description
+        """Find companies similar to the given company.
+        
+        Compares the company's stored embedding with all other company
+        vectors (no embedding call). Companies without a stored vector fall
+        back to a text query.
+        """
+        similarity = self.vector_store.company_similarity
+        company_id = similarity.find_company_id(company_name)
+        if company_id is not None:
+            return self.similar_companies(company_id, k=k)
+        
         query = f"Companies similar to {company_name} in fusion energy"
         docs = self.vector_store.search_companies(query, k=k+1)  # +1 to exclude self
         
@@ -136,33 +359,71 @@ Answer:"""),
         for doc in docs:
             name = doc.metadata.get("name", "")
             if name.lower() != company_name.lower():  # Exclude the query company
-                results.append({
-                    "name": name,
-                    "technology": doc.metadata.get("technology", ""),
-                    "country": doc.metadata.get("country", ""),
-                    "funding": doc.metadata.get("funding", 0),
-                    "trl": doc.metadata.get("trl", 0),
-                    "content": doc.page_content,
-                })
+                results.append(self._company_entry(doc.metadata, doc.page_content))
         
         return results[:k]
     
+    def similar_companies(self, company_id: int, k: int = 5) -> list[dict]:
+        """Companies nearest to a stored company's embedding, best first."""
+        return [
+            self._similar_entry(match)
+            for match in self.vector_store.company_similarity.similar(company_id, k=k)
+        ]
+    
+    def all_similar_companies(self, k: int = 5) -> dict[int, list[dict]]:
+        """Top-``k`` similar companies for every stored company, keyed by company id."""
+        pairs = self.vector_store.company_similarity.all_pairs(k=k)
+        return {
+            company_id: [self._similar_entry(match) for match in matches]
+            for company_id, matches in pairs.items()
+        }
+    
+    @classmethod
+    def _similar_entry(cls, match) -> dict:
+        """Company result dict for a ``SimilarCompany``."""
+        return {**cls._company_entry(match.metadata, match.content), "similarity": match.similarity}
+    
+    @staticmethod
+    def _company_entry(metadata: dict, content: str) -> dict:
+        """Company result dict from document metadata."""
+        return {
+            "name": metadata.get("name", ""),
+            "technology": metadata.get("technology", ""),
+            "country": metadata.get("country", ""),
+            "funding": metadata.get("funding", 0),
+            "trl": metadata.get("trl", 0),
+            "content": content,
+        }
+    
     def find_companies_by_technology(self, technology: str, k: int = 10) -> list[dict]:
         """Find companies working on a specific technology."""
-        query = f"Fusion companies using {technology} technology approach"
-        docs = self.vector_store.search_companies(query, k=k)
-        
-        results = []
-        for doc in docs:
-            results.append({
-                "name": doc.metadata.get("name", ""),
-                "technology": doc.metadata.get("technology", ""),
-                "country": doc.metadata.get("country", ""),
-                "funding": doc.metadata.get("funding", 0),
-                "trl": doc.metadata.get("trl", 0),
-            })
+        return self.find_companies_by_technologies([technology], k=k)[technology]
+    
+    def find_companies_by_technologies(
+        self,
+        technologies: list[str],
+        k: int = 10,
+    ) -> dict[str, list[dict]]:
+        """Companies per technology approach, searched in one round trip."""
+        queries = [
+            f"Fusion companies using {technology} technology approach"
+            for technology in technologies
+        ]
+        hits = self.vector_store.search_many(queries, k=k, filter_type="company")
         
-        return results
+        return {
+            technology: [
+                {
+                    "name": doc.metadata.get("name", ""),
+                    "technology": doc.metadata.get("technology", ""),
+                    "country": doc.metadata.get("country", ""),
+                    "funding": doc.metadata.get("funding", 0),
+                    "trl": doc.metadata.get("trl", 0),
+                }
+                for doc, _ in docs
+            ]
+            for technology, docs in zip(technologies, hits)
+        }
     
     def research_question(self, question: str, k: int = 8) -> SemanticSearchResult:
         """Answer a research question using the full knowledge base."""
@@ -171,10 +432,33 @@ Answer:"""),
     
     def get_market_insights(self, region: str) -> SemanticSearchResult:
         """Get market insights for a specific region."""
-        query = f"Fusion energy market analysis and trends in {region}"
-        return self.search_with_answer(query=query, k=5, filter_type=None)
+        return self.get_market_insights_for_regions([region])[region]
+    
+    def get_market_insights_for_regions(
+        self,
+        regions: list[str],
+    ) -> dict[str, SemanticSearchResult]:
+        """Market insights for several regions (one search round trip)."""
+        queries = [f"Fusion energy market analysis and trends in {region}" for region in regions]
+        return dict(zip(regions, self.search_many_with_answers(queries, k=5, filter_type=None)))
     
     def technology_comparison(self, tech1: str, tech2: str) -> SemanticSearchResult:
         """Compare two fusion technologies."""
-        query = f"Compare {tech1} vs {tech2} fusion technology approaches, advantages, challenges, and companies"
-        return self.search_with_answer(query=query, k=8, filter_type=None)
+        return self.technology_comparisons([(tech1, tech2)])[0]
+    
+    def technology_comparisons(self, pairs: list[tuple[str, str]]) -> list[SemanticSearchResult]:
+        """Compare several technology pairs (one search round trip)."""
+        queries = [
+            f"Compare {tech1} vs {tech2} fusion technology approaches, advantages, challenges, "
+            "and companies"
+            for tech1, tech2 in pairs
+        ]
+        # Keywords match documents naming either technology; the prose query
+        # still goes to the vector search, which a comparison always needs
+        return self.search_many_with_answers(
+            queries,
+            k=8,
+            filter_type=None,
+            lexical_queries=[f"{tech1} {tech2}" for tech1, tech2 in pairs],
+            lexical_shortcut=False,
+        )
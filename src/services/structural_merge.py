@@ -0,0 +1,79 @@
+"""Deterministic line-based merge of research markdown segments.
+
+Update files carry no common ancestor, so the base text acts as the
+ancestor and the update as the only edit: lines the update adds are taken,
+lines it omits are kept (update files are partial and never delete
+information), and lines it rewrites are accepted only when the edit is
+unambiguous. Anything else is a conflict and is left to the LLM.
+
+Segments are already anchored on markdown structure (``####`` company
+blocks and ``###`` headings, see ``MarkdownMergerService.split_section``),
+so the merge here only has to align lines within one block.
+"""
+
+import difflib
+import re
+from typing import Optional
+
+# Numbers including thousands/decimal separators ("2.86", "1,200", "2025")
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+
+
+def _is_blank(lines: list[str]) -> bool:
+    """Whether the lines contain only whitespace."""
+    return not "".join(lines).strip()
+
+
+def _numbers_only(base_line: str, update_line: str) -> bool:
+    """Whether two lines differ only in their numbers (e.g. an updated amount or TRL)."""
+    return _NUMBER.sub("#", base_line) == _NUMBER.sub("#", update_line)
+
+
+def _extends(base_line: str, update_line: str) -> bool:
+    """Whether the update line appends to the base line (e.g. a new investor or source)."""
+    stripped = base_line.rstrip()
+    return bool(stripped) and update_line.startswith(stripped)
+
+
+def _resolve_replace(base_lines: list[str], update_lines: list[str]) -> Optional[list[str]]:
+    """Resolve a block of rewritten lines, or return None on a conflict."""
+    if _is_blank(base_lines):
+        return update_lines
+    if _is_blank(update_lines):
+        return base_lines
+    if len(base_lines) != len(update_lines):
+        return None
+    for base_line, update_line in zip(base_lines, update_lines):
+        if not (_numbers_only(base_line, update_line) or _extends(base_line, update_line)):
+            return None
+    return update_lines
+
+
+def structural_merge(base: str, update: str) -> Optional[str]:
+    """
+    Merge an update into a base segment without the LLM.
+
+    Args:
+        base: Current text of the segment
+        update: Text of the same segment in the update file
+
+    Returns:
+        The merged text, or None when the edits conflict
+    """
+    base_lines = base.split("\n")
+    update_lines = update.split("\n")
+    matcher = difflib.SequenceMatcher(None, base_lines, update_lines, autojunk=False)
+
+    merged: list[str] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag in ("equal", "delete"):
+            merged.extend(base_lines[i1:i2])
+        elif tag == "insert":
+            merged.extend(update_lines[j1:j2])
+        else:
+            resolved = _resolve_replace(base_lines[i1:i2], update_lines[j1:j2])
+            if resolved is None:
+                return None
+            merged.extend(resolved)
+
+    return "\n".join(merged)
@@ -0,0 +1,147 @@
+"""Vectorized field diff between parsed and database companies.
+
+Matched ``(parsed, database)`` company pairs are loaded into two pandas
+frames aligned on the database id, one column per ``COMPARABLE_FIELDS``
+entry. Each field is then compared for all companies at once: numeric
+fields within their relative tolerance count as unchanged, and text fields
+are compared after collapsing whitespace and case. Only the differences
+that remain become ``FieldChange`` records.
+"""
+
+from collections import Counter
+from operator import attrgetter
+from typing import TYPE_CHECKING, Optional
+
+from src.models.company import Company
+from src.models.merge_models import COMPARABLE_FIELDS, FieldChange
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def build_frames(
+    pairs: list[tuple[Company, Company]],
+    fields: Optional[dict] = None,
+) -> tuple["pd.DataFrame", "pd.DataFrame"]:
+    """
+    Load matched companies into aligned frames.
+
+    Returns:
+        ``(parsed, database)`` frames indexed by database id, holding the
+        raw field values (None when missing) plus ``_name`` (the database
+        company name) and ``_order`` (position of the pair)
+    """
+    import pandas as pd
+
+    fields = fields or COMPARABLE_FIELDS
+    ids = [db_company.id for _, db_company in pairs]
+    values = attrgetter(*fields)
+
+    def frame(companies: list[Company]) -> "pd.DataFrame":
+        rows = [values(company) for company in companies]
+        return pd.DataFrame(rows, columns=list(fields), index=ids, dtype=object)
+
+    parsed = frame([parsed_company for parsed_company, _ in pairs])
+    db = frame([db_company for _, db_company in pairs])
+    db["_name"] = [db_company.name for _, db_company in pairs]
+    db["_order"] = range(len(pairs))
+    return parsed, db
+
+
+def _as_text(value) -> Optional[str]:
+    """String form used in comparisons and FieldChange values."""
+    return str(value) if value is not None else None
+
+
+def _normalize_text(values: "pd.Series") -> "pd.Series":
+    """Collapse whitespace and case for text comparison."""
+    return values.str.replace(r"\s+", " ", regex=True).str.strip().str.casefold()
+
+
+def significant_mask(
+    new: "pd.Series",
+    old: "pd.Series",
+    tolerance: Optional[float],
+) -> "pd.Series":
+    """
+    Rows where ``new`` is a significant change from ``old``.
+
+    Mirrors ``FieldChange.is_significant``: a missing new value is never a
+    change, a missing old value always is. Numeric values within the
+    relative ``tolerance`` of a positive old value are unchanged; fields
+    without a tolerance are compared as normalized text.
+    """
+    import pandas as pd
+
+    present = new.notna().to_numpy()
+    missing_old = old.isna().to_numpy()
+    significant = present & missing_old
+    differs = present & ~missing_old & (new != old).to_numpy()
+
+    # Only rows whose raw values differ are converted and checked further
+    new_text, old_text = new[differs].map(str), old[differs].map(str)
+    unchanged = new_text == old_text
+    if tolerance is None:
+        unchanged |= _normalize_text(new_text) == _normalize_text(old_text)
+    else:
+        new_num = pd.to_numeric(new_text, errors="coerce")
+        old_num = pd.to_numeric(old_text, errors="coerce")
+        relative = (new_num - old_num).abs() / old_num.where(old_num > 0)
+        unchanged |= new_num.notna() & old_num.notna() & (
+            ((old_num > 0) & (relative <= tolerance)) | ((old_num <= 0) & (new_num == old_num))
+        )
+
+    significant[differs] = ~unchanged.to_numpy()
+    return pd.Series(significant, index=new.index)
+
+
+def diff_companies(
+    pairs: list[tuple[Company, Company]],
+    fields: Optional[dict] = None,
+    source: str = "markdown_sync",
+) -> list[FieldChange]:
+    """
+    Significant field changes for matched ``(parsed, database)`` company pairs.
+
+    Returns:
+        Changes ordered by pair, then by field order in ``fields``
+    """
+    fields = fields or COMPARABLE_FIELDS
+    if not pairs:
+        return []
+    parsed, db = build_frames(pairs, fields)
+
+    found = []
+    for field_position, (field_name, field_config) in enumerate(fields.items()):
+        mask = significant_mask(parsed[field_name], db[field_name], field_config.get("tolerance"))
+        if not mask.any():
+            continue
+        selected = mask.to_numpy()
+        rows = zip(
+            db.index[selected].tolist(),
+            db["_name"][selected].tolist(),
+            db["_order"][selected].tolist(),
+            db[field_name][selected].tolist(),
+            parsed[field_name][selected].tolist(),
+        )
+        for company_id, company_name, order, old_value, new_value in rows:
+            found.append((order, field_position, FieldChange(
+                company_id=company_id,
+                company_name=company_name,
+                field_name=field_name,
+                old_value=_as_text(old_value),
+                new_value=_as_text(new_value),
+                change_type="update",
+                source=source,
+            )))
+
+    found.sort(key=lambda item: (item[0], item[1]))
+    return [change for _, _, change in found]
+
+
+def changes_per_field(changes: list[FieldChange]) -> dict[str, int]:
+    """Number of changes per field, in ``COMPARABLE_FIELDS`` order."""
+    counts = Counter(change.field_name for change in changes)
+    ordered = {name: counts[name] for name in COMPARABLE_FIELDS if counts[name]}
+    ordered.update((name, n) for name, n in counts.items() if name not in ordered)
+    return ordered
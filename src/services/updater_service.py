@@ -3,14 +3,18 @@
 import re
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from urllib.parse import urlparse
 
-from tavily import TavilyClient
-from langchain_ollama import ChatOllama
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
+if TYPE_CHECKING:
+    from langchain_ollama import ChatOllama
+    from tavily import TavilyClient
+
+    from src.services.job_service import JobContext
+
 from src.data.database import get_database, Database
 from src.services.audit_service import AuditService
 from src.models.update_proposal import (
@@ -53,15 +57,17 @@ class UpdaterService:
 
     def __init__(
         self,
-        llm: Optional[ChatOllama] = None,
+        llm: Optional["ChatOllama"] = None,
         tavily_api_key: Optional[str] = None,
         config: Optional[UpdaterConfig] = None,
         db_path: str = "research/fusion_research.db",
         database: Optional[Database] = None,
     ):
         self.llm = llm
-        self.tavily_client: Optional[TavilyClient] = None
+        self.tavily_client: Optional["TavilyClient"] = None
         if tavily_api_key:
+            from tavily import TavilyClient
+
             self.tavily_client = TavilyClient(api_key=tavily_api_key)
         self.config = config or UpdaterConfig()
         # Use provided database instance or get/create from path
@@ -423,6 +429,7 @@ Extract the {field_name} value. Respond with ONLY the extracted value or "NOT_FO
             self._save_audit_entry(audit_entry)
 
             self.db.commit()
+            self.db.mark_changed()
             return True
 
         except Exception as e:
@@ -547,11 +554,30 @@ Extract the {field_name} value. Respond with ONLY the extracted value or "NOT_FO
         company_ids: list[int],
         fields: Optional[list[str]] = None,
         auto_apply: bool = False,
+        job: Optional["JobContext"] = None,
     ) -> UpdateResult:
-        """Run a full update cycle for specified companies."""
+        """Run a full update cycle for specified companies.
+
+        When run as a background job, progress is reported per company and a
+        checkpoint is saved after each one so an interrupted cycle can resume.
+        """
         result = UpdateResult()
+        done_ids: set[int] = set()
+        if job and job.checkpoint_state:
+            state = job.checkpoint_state
+            done_ids = set(state.get("done_ids", []))
+            result.companies_processed = state.get("companies_processed", 0)
+            result.proposals_created = state.get("proposals_created", 0)
+            result.proposals_auto_applied = state.get("proposals_auto_applied", 0)
+            result.errors = list(state.get("errors", []))
+
+        total = len(company_ids)
+        for index, company_id in enumerate(company_ids):
+            if company_id in done_ids:
+                continue
+            if job:
+                job.raise_if_cancelled()
 
-        for company_id in company_ids:
             # Get company name
             cursor = self.db.execute(
                 "SELECT name FROM companies WHERE id = ?", (company_id,)
@@ -562,6 +588,8 @@ Extract the {field_name} value. Respond with ONLY the extracted value or "NOT_FO
                 continue
 
             company_name = row["name"]
+            if job:
+                job.report_progress(index, total, f"Researching {company_name}")
 
             try:
                 proposals = self.research_company(company_id, company_name, fields)
@@ -583,12 +611,25 @@ Extract the {field_name} value. Respond with ONLY the extracted value or "NOT_FO
             except Exception as e:
                 result.errors.append(f"Error processing {company_name}: {e}")
 
+            if job:
+                self.db.commit()
+                done_ids.add(company_id)
+                job.save_checkpoint({
+                    "done_ids": sorted(done_ids),
+                    "companies_processed": result.companies_processed,
+                    "proposals_created": result.proposals_created,
+                    "proposals_auto_applied": result.proposals_auto_applied,
+                    "errors": result.errors,
+                })
+
         self.db.commit()
+        if job:
+            job.report_progress(total, total, "Update cycle complete")
         return result
 
 
 def get_updater_service(
-    llm: Optional[ChatOllama] = None,
+    llm: Optional["ChatOllama"] = None,
     tavily_api_key: Optional[str] = None,
     config: Optional[UpdaterConfig] = None,
     db_path: str = "research/fusion_research.db",
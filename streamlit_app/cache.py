@@ -0,0 +1,132 @@
+"""Shared Streamlit caching layer.
+
+Services and the database connection are cached with ``st.cache_resource``.
+Query results are cached with ``st.cache_data`` keyed by the database change
+token, so a write through ``CrudService``, ``UpdaterService`` or
+``DatabaseSyncService`` (or any other connection) invalidates them on the next rerun.
+"""
+
+from typing import Any, Callable
+
+import streamlit as st
+
+from src.data.database import Database, get_database
+
+
+@st.cache_resource(show_spinner=False)
+def get_db() -> Database:
+    """Get the shared database connection."""
+    return get_database()
+
+
+def data_version() -> tuple[int, int]:
+    """Get the current database change token."""
+    return get_db().change_token()
+
+
+@st.cache_resource(show_spinner=False)
+def get_company_service():
+    """Get the shared CompanyService."""
+    from src.services.company_service import CompanyService
+
+    return CompanyService(get_db())
+
+
+@st.cache_resource(show_spinner=False)
+def get_market_service():
+    """Get the shared MarketService."""
+    from src.services.market_service import MarketService
+
+    return MarketService(get_db())
+
+
+@st.cache_resource(show_spinner=False)
+def get_technology_service():
+    """Get the shared TechnologyService."""
+    from src.services.technology_service import TechnologyService
+
+    return TechnologyService(get_db())
+
+
+@st.cache_resource(show_spinner=False)
+def get_report_service():
+    """Get the shared ReportService."""
+    from src.services.report_service import ReportService
+
+    return ReportService(get_db())
+
+
+@st.cache_resource(show_spinner=False)
+def get_crud_service():
+    """Get the shared CrudService."""
+    from src.services.crud_service import CrudService
+
+    return CrudService(get_db())
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_network_service(version: tuple[int, int]):
+    """Get a NetworkService for the given data version.
+
+    NetworkService memoizes the loaded graph, so it is rebuilt per version.
+    """
+    from src.services.network_service import NetworkService
+
+    return NetworkService(get_db())
+
+
+_SERVICE_GETTERS: dict[str, Callable[[tuple[int, int]], Any]] = {
+    "company": lambda version: get_company_service(),
+    "market": lambda version: get_market_service(),
+    "technology": lambda version: get_technology_service(),
+    "crud": lambda version: get_crud_service(),
+    "network": get_network_service,
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def _cached_call(
+    version: tuple[int, int],
+    service_name: str,
+    method: str,
+    args: tuple,
+    kwargs: tuple,
+) -> Any:
+    """Run a read-only service method; results are cached per data version."""
+    service = _SERVICE_GETTERS[service_name](version)
+    return getattr(service, method)(*args, **dict(kwargs))
+
+
+class CachedService:
+    """Read-only proxy whose method results are cached per data version.
+
+    Only use it for query methods; writes must go through the real service.
+    """
+
+    def __init__(self, service_name: str):
+        if service_name not in _SERVICE_GETTERS:
+            raise ValueError(f"Unknown service: {service_name}")
+        self._service_name = service_name
+
+    def __getattr__(self, method: str) -> Callable[..., Any]:
+        def call(*args, **kwargs):
+            return _cached_call(
+                data_version(),
+                self._service_name,
+                method,
+                args,
+                tuple(sorted(kwargs.items())),
+            )
+
+        return call
+
+
+def cached_service(service_name: str) -> CachedService:
+    """Get a cached read-only proxy for a service."""
+    return CachedService(service_name)
+
+
+def clear_caches():
+    """Drop all cached query results and service instances."""
+    st.cache_data.clear()
+    st.cache_resource.clear()
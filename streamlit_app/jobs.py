@@ -0,0 +1,80 @@
+"""Shared Streamlit panel for background jobs."""
+
+from typing import Optional
+
+import streamlit as st
+
+from src.models.job import JobStatus
+from src.services.job_service import get_job_runner
+
+STATUS_ICONS = {
+    JobStatus.PENDING: "⏳",
+    JobStatus.RUNNING: "⚙️",
+    JobStatus.COMPLETED: "✅",
+    JobStatus.FAILED: "❌",
+    JobStatus.CANCELLED: "🚫",
+    JobStatus.INTERRUPTED: "⏸️",
+}
+
+
+@st.fragment(run_every=2)
+def render_job_panel(kind: str, key_prefix: str, secrets: Optional[dict] = None, limit: int = 5):
+    """Render recent jobs of one kind with progress, cancel and resume controls.
+
+    Runs as a fragment that re-polls the job table every few seconds, so the
+    rest of the page is not rerun while a job is in progress.
+    """
+    runner = get_job_runner()
+    jobs = runner.list_jobs(limit=limit, kind=kind)
+    if not jobs:
+        st.caption("No background jobs yet.")
+        return
+
+    for job in jobs:
+        icon = STATUS_ICONS.get(job.status, "")
+        created = job.created_at.strftime("%Y-%m-%d %H:%M")
+        st.markdown(f"**{icon} Job #{job.id}** · {job.status.value} · {created}")
+
+        if job.is_active:
+            st.progress(job.progress, text=job.message or "Working...")
+            if st.button("Cancel", key=f"{key_prefix}_cancel_{job.id}"):
+                runner.cancel(job.id)
+                st.rerun(scope="fragment")
+        else:
+            if job.message:
+                st.caption(job.message)
+            if job.result:
+                with st.expander("Result"):
+                    st.json(job.result)
+            if job.error:
+                with st.expander("Error details"):
+                    st.code(job.error)
+            if job.is_resumable:
+                label = "Resume" if job.checkpoint else "Retry"
+                if st.button(label, key=f"{key_prefix}_resume_{job.id}"):
+                    runner.resume(job.id, secrets=secrets)
+                    st.rerun(scope="fragment")
+
+
+def _companies_version() -> tuple:
+    """Token that changes when a company row is added, removed or updated."""
+    from streamlit_app.cache import get_db
+
+    return tuple(get_db().execute("SELECT COUNT(*), MAX(last_updated) FROM companies").fetchone())
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _start_precompute(version: tuple, model: str, base_url: str) -> Optional[int]:
+    """Queue the precompute job once per company data version."""
+    from src.services.precompute_service import schedule_precompute
+
+    return schedule_precompute(get_job_runner(), params={"model": model, "base_url": base_url})
+
+
+def start_precompute(model: str, base_url: str) -> Optional[int]:
+    """Precompute stale SWOTs, comparisons and market reports in the background.
+
+    Keyed on the companies table rather than the database change token, so
+    the job's own writes (job status, stored analyses) do not queue it again.
+    """
+    return _start_precompute(_companies_version(), model, base_url)
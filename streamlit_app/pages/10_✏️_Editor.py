@@ -51,15 +51,15 @@ with st.sidebar:
 st.title("✏️ Database Editor")
 
 try:
-    from src.data.database import get_database
-    from src.services.crud_service import CrudService, ENTITY_CONFIG
+    from src.services.crud_service import ENTITY_CONFIG
+    from streamlit_app.cache import cached_service, get_crud_service
 
-    db = get_database()
-    crud = CrudService(db)
+    crud = get_crud_service()
+    crud_reader = cached_service("crud")
 
     model_cls = crud.get_model_class(selected_type)
     label = crud.get_label(selected_type)
-    company_names = crud.get_company_names()
+    company_names = crud_reader.get_company_names()
 
     # ── Helper: build form fields from Pydantic model ──
 
@@ -250,7 +250,7 @@ try:
                 st.session_state.editor_edit_id = None
                 st.rerun()
 
-        entities = crud.list_entities(selected_type)
+        entities = crud_reader.list_entities(selected_type)
         if not entities:
             st.info(f"No {label.lower()} records found.")
         else:
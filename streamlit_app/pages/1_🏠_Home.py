@@ -23,15 +23,11 @@ if not db_path.exists():
     st.stop()
 
 try:
-    from src.data.database import get_database
-    from src.services.company_service import CompanyService
-    from src.services.market_service import MarketService
-    from src.services.technology_service import TechnologyService
-    
-    db = get_database()
-    company_service = CompanyService(db)
-    market_service = MarketService(db)
-    tech_service = TechnologyService(db)
+    from streamlit_app.cache import cached_service
+    
+    company_service = cached_service("company")
+    market_service = cached_service("market")
+    tech_service = cached_service("technology")
     
     # Key Metrics Row
     st.markdown("### 📊 Key Metrics")
@@ -40,11 +40,10 @@ if not db_path.exists():
     st.stop()
 
 try:
-    from src.data.database import get_database
-    from src.services.company_service import CompanyService, CompanySearchCriteria
+    from src.services.company_service import CompanySearchCriteria
+    from streamlit_app.cache import cached_service
 
-    db = get_database()
-    company_service = CompanyService(db)
+    company_service = cached_service("company")
 
     # Sidebar filters
     with st.sidebar:
@@ -22,11 +22,9 @@ if not db_path.exists():
     st.stop()
 
 try:
-    from src.data.database import get_database
-    from src.services.technology_service import TechnologyService
+    from streamlit_app.cache import cached_service
     
-    db = get_database()
-    tech_service = TechnologyService(db)
+    tech_service = cached_service("technology")
     
     # TRL Definitions
     with st.expander("📖 TRL Definitions", expanded=False):
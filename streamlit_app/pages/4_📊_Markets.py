@@ -22,11 +22,9 @@ if not db_path.exists():
     st.stop()
 
 try:
-    from src.data.database import get_database
-    from src.services.market_service import MarketService
+    from streamlit_app.cache import cached_service
     
-    db = get_database()
-    market_service = MarketService(db)
+    market_service = cached_service("market")
     
     # Key Metrics
     st.markdown("### 📈 Market Overview")
@@ -20,13 +20,35 @@ if not db_path.exists():
     st.stop()
 
 try:
-    from src.data.database import get_database
-    from src.services.company_service import CompanyService
-    from src.services.report_service import ReportService
+    from streamlit_app.cache import cached_service, get_db, get_report_service
+    from src.data.analysis_store import (
+        AnalysisStore,
+        comparison_key,
+        market_report_key,
+        swot_key,
+    )
     
-    db = get_database()
-    company_service = CompanyService(db)
-    report_service = ReportService(db)
+    db = get_db()
+    company_service = cached_service("company")
+    report_service = get_report_service()
+    analysis_store = AnalysisStore(db)
+    
+    # Keep SWOTs, comparisons and the market report of the top companies stored
+    try:
+        from streamlit_app.jobs import start_precompute
+        
+        start_precompute(
+            st.session_state.get("llm_model", "qwen3:8b"),
+            st.session_state.get("ollama_base_url", "http://localhost:11434"),
+        )
+    except Exception as e:
+        st.caption(f"Background precompute unavailable: {e}")
+    
+    def stored_caption(stored):
+        """Caption for an analysis served from the store."""
+        created = stored.created_at.strftime("%Y-%m-%d %H:%M")
+        model = f" with {stored.model}" if stored.model else ""
+        st.caption(f"⚡ Stored analysis, generated {created}{model}. Regenerate for a fresh one.")
     
     # Tabs for different research functions
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
@@ -77,7 +99,7 @@ try:
                             db_path=str(db_path),
                             base_url=ollama_url,
                         )
-                        processor = NLQueryProcessor(factory.llm, factory.db)
+                        processor = NLQueryProcessor(factory.llm, factory.db, str(db_path))
                         
                         result = processor.process_query(query)
                         
@@ -86,6 +108,10 @@ try:
                         else:
                             st.markdown("### Answer")
                             st.markdown(result.answer)
+                            if result.cached:
+                                st.caption("⚡ Reused cached SQL on current data (no LLM call)")
+                            if result.truncated:
+                                st.caption(f"Showing the first {len(result.results)} rows only")
                             
                             if result.sql:
                                 with st.expander("View SQL Query"):
@@ -135,6 +161,31 @@ try:
                     "Research Documents": "research",
                 }
                 
+                # Structured company constraints, applied before ranking
+                company_filters = None
+                if search_type == "Companies":
+                    from src.services.company_service import CompanySearchCriteria
+                    
+                    fcol1, fcol2, fcol3 = st.columns(3)
+                    with fcol1:
+                        filter_country = st.selectbox(
+                            "Country:", ["All"] + company_service.get_countries(),
+                            key="semantic_country",
+                        )
+                    with fcol2:
+                        filter_technology = st.selectbox(
+                            "Technology:", ["All"] + company_service.get_technologies(),
+                            key="semantic_technology",
+                        )
+                    with fcol3:
+                        filter_trl = st.slider("TRL range:", 1, 9, (1, 9), key="semantic_trl")
+                    company_filters = CompanySearchCriteria(
+                        country=None if filter_country == "All" else filter_country,
+                        technology=None if filter_technology == "All" else filter_technology,
+                        trl_min=filter_trl[0] if filter_trl != (1, 9) else None,
+                        trl_max=filter_trl[1] if filter_trl != (1, 9) else None,
+                    )
+                
                 # Sample queries
                 sample_semantic = [
                     "German fusion startups with high TRL",
@@ -166,55 +217,53 @@ try:
                 
                 if st.button("🧠 Search", type="primary", key="semantic_search_btn"):
                     if semantic_query:
-                        with st.spinner("Searching..."):
-                            try:
-                                llm = get_llm(model=ollama_model, base_url=ollama_url) if generate_answer else None
-                                search_service = SemanticSearchService(db, vector_store, llm)
+                        try:
+                            llm = get_llm(model=ollama_model, base_url=ollama_url) if generate_answer else None
+                            search_service = SemanticSearchService(db, vector_store, llm)
+                            
+                            with st.spinner("Searching..."):
+                                result = search_service.search(
+                                    query=semantic_query,
+                                    k=num_results,
+                                    filter_type=filter_map[search_type],
+                                    filters=company_filters,
+                                )
+                            
+                            if generate_answer:
+                                # Stream tokens so the answer appears as it is generated
+                                st.markdown("### 💡 AI Answer")
+                                result.answer = st.write_stream(search_service.stream_answer(result))
+                                st.caption(f"Answered from ~{result.context_tokens:,} context tokens")
+                                st.markdown("---")
+                            
+                            st.markdown(f"### 📚 Found {len(result.results)} relevant documents")
+                            if result.retrieval == "lexical":
+                                st.caption("⚡ Exact keyword match; semantic search skipped")
+                            
+                            for i, res in enumerate(result.results, 1):
+                                relevance = res.get("relevance", 0)
+                                doc_type = res.get("type", "unknown")
                                 
-                                if generate_answer:
-                                    result = search_service.search_with_answer(
-                                        query=semantic_query,
-                                        k=num_results,
-                                        filter_type=filter_map[search_type],
-                                    )
+                                # Format based on type
+                                if doc_type == "company":
+                                    title = f"🏢 {res.get('name', 'Unknown Company')}"
+                                    subtitle = f"{res.get('country', '')} | {res.get('technology', '')} | TRL {res.get('trl', 'N/A')}"
+                                elif doc_type == "technology":
+                                    title = f"🔬 {res.get('name', 'Unknown Technology')}"
+                                    subtitle = f"Approach: {res.get('approach', '')}"
+                                elif doc_type == "market":
+                                    title = f"📊 {res.get('region', 'Unknown Market')}"
+                                    subtitle = f"Size: ${res.get('market_size', 0):,.0f} | CAGR: {res.get('cagr', 0):.1f}%"
                                 else:
-                                    result = search_service.search(
-                                        query=semantic_query,
-                                        k=num_results,
-                                        filter_type=filter_map[search_type],
-                                    )
-                                
-                                if result.answer:
-                                    st.markdown("### 💡 AI Answer")
-                                    st.markdown(result.answer)
-                                    st.markdown("---")
-                                
-                                st.markdown(f"### 📚 Found {len(result.results)} relevant documents")
+                                    title = f"📄 Research: {res.get('section', 'Document')}"
+                                    subtitle = f"Source: {res.get('source', 'Fusion_Research.md')}"
                                 
-                                for i, res in enumerate(result.results, 1):
-                                    score = res.get("score", 0)
-                                    doc_type = res.get("type", "unknown")
-                                    
-                                    # Format based on type
-                                    if doc_type == "company":
-                                        title = f"🏢 {res.get('name', 'Unknown Company')}"
-                                        subtitle = f"{res.get('country', '')} | {res.get('technology', '')} | TRL {res.get('trl', 'N/A')}"
-                                    elif doc_type == "technology":
-                                        title = f"🔬 {res.get('name', 'Unknown Technology')}"
-                                        subtitle = f"Approach: {res.get('approach', '')}"
-                                    elif doc_type == "market":
-                                        title = f"📊 {res.get('region', 'Unknown Market')}"
-                                        subtitle = f"Size: ${res.get('market_size', 0):,.0f} | CAGR: {res.get('cagr', 0):.1f}%"
-                                    else:
-                                        title = f"📄 Research: {res.get('section', 'Document')}"
-                                        subtitle = f"Source: {res.get('source', 'Fusion_Research.md')}"
-                                    
-                                    with st.expander(f"[{i}] {title} (relevance: {1-score:.2f})", expanded=i <= 3):
-                                        st.caption(subtitle)
-                                        st.markdown(res.get("content", "No content available"))
-                                
-                            except Exception as e:
-                                st.error(f"Search failed: {e}")
+                                with st.expander(f"[{i}] {title} (relevance: {relevance:.2f})", expanded=i <= 3):
+                                    st.caption(subtitle)
+                                    st.markdown(res.get("content", "No content available"))
+                            
+                        except Exception as e:
+                            st.error(f"Search failed: {e}")
                     else:
                         st.warning("Please enter a search query.")
         except Exception as e:
@@ -241,52 +290,79 @@ try:
                 key="swot_context",
             )
             
-            if st.button("📊 Generate SWOT", type="primary", key="swot_btn"):
-                company = next((c for c in companies if c.name == selected_company), None)
-                if company:
-                    with st.spinner(f"Generating SWOT analysis with {ollama_model}..."):
-                        try:
-                            from src.llm.chain_factory import get_llm
-                            from src.llm.analyzer import FusionAnalyzer
-                            
-                            llm = get_llm(model=ollama_model, base_url=ollama_url)
-                            analyzer = FusionAnalyzer(llm)
-                            
-                            swot = analyzer.generate_swot(company, market_context)
-                            
-                            st.markdown(f"## SWOT Analysis: {swot.company_name}")
-                            
-                            col1, col2 = st.columns(2)
-                            
-                            with col1:
-                                st.markdown("### ✅ Strengths")
-                                for s in swot.strengths:
-                                    st.markdown(f"- {s}")
-                                
-                                st.markdown("### 🎯 Opportunities")
-                                for o in swot.opportunities:
-                                    st.markdown(f"- {o}")
-                            
-                            with col2:
-                                st.markdown("### ⚠️ Weaknesses")
-                                for w in swot.weaknesses:
-                                    st.markdown(f"- {w}")
-                                
-                                st.markdown("### 🚨 Threats")
-                                for t in swot.threats:
-                                    st.markdown(f"- {t}")
-                            
-                            with st.expander("View Raw Markdown"):
-                                st.markdown(swot.raw_markdown)
-                                st.download_button(
-                                    "📥 Download SWOT",
-                                    swot.raw_markdown,
-                                    file_name=f"swot_{selected_company.replace(' ', '_')}.md",
-                                    mime="text/markdown",
-                                    key="swot_download",
-                                )
-                        except Exception as e:
-                            st.error(f"SWOT generation failed: {e}")
+            company = next((c for c in companies if c.name == selected_company), None)
+            swot_entry = swot_key(company, market_context) if company else None
+            stored = analysis_store.get(swot_entry) if swot_entry else None
+            label = "🔄 Regenerate SWOT" if stored else "📊 Generate SWOT"
+            regenerate = st.button(
+                label, type="secondary" if stored else "primary", key="swot_btn"
+            )
+            
+            if company and (stored or regenerate):
+                try:
+                    from src.llm.chain_factory import get_llm
+                    from src.llm.analyzer import FusionAnalyzer
+                    
+                    llm = get_llm(model=ollama_model, base_url=ollama_url)
+                    analyzer = FusionAnalyzer(llm)
+                    
+                    if stored and not regenerate:
+                        stored_caption(stored)
+                        raw_swot = stored.content
+                    else:
+                        # Show raw tokens while generating, then the parsed layout
+                        live_output = st.empty()
+                        with live_output.container():
+                            st.caption(f"Generating SWOT analysis with {ollama_model}...")
+                            raw_swot = st.write_stream(
+                                analyzer.stream_swot(company, market_context)
+                            )
+                        live_output.empty()
+                        analysis_store.save(swot_entry, raw_swot, ollama_model)
+                    swot = analyzer.parse_swot(company.name, raw_swot)
+                    
+                    st.markdown(f"## SWOT Analysis: {swot.company_name}")
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.markdown("### ✅ Strengths")
+                        for s in swot.strengths:
+                            st.markdown(f"- {s}")
+                        
+                        st.markdown("### 🎯 Opportunities")
+                        for o in swot.opportunities:
+                            st.markdown(f"- {o}")
+                    
+                    with col2:
+                        st.markdown("### ⚠️ Weaknesses")
+                        for w in swot.weaknesses:
+                            st.markdown(f"- {w}")
+                        
+                        st.markdown("### 🚨 Threats")
+                        for t in swot.threats:
+                            st.markdown(f"- {t}")
+                    
+                    with st.expander("View Raw Markdown"):
+                        st.markdown(swot.raw_markdown)
+                        st.download_button(
+                            "📥 Download SWOT",
+                            swot.raw_markdown,
+                            file_name=f"swot_{selected_company.replace(' ', '_')}.md",
+                            mime="text/markdown",
+                            key="swot_download",
+                        )
+                except Exception as e:
+                    st.error(f"SWOT generation failed: {e}")
+            
+            with st.expander("⚙️ Background precompute"):
+                st.caption(
+                    "SWOTs, comparisons and the market report for the top-funded and recently "
+                    "changed companies are generated in the background at low priority."
+                )
+                from streamlit_app.jobs import render_job_panel
+                
+                render_job_panel("precompute_analyses", "precompute")
         else:
             st.info("No companies in database.")
     
@@ -337,22 +413,29 @@ try:
             
             st.markdown("---")
             
-            if st.button("⚖️ Generate AI Comparison", type="primary"):
-                with st.spinner(f"Generating comparison with {ollama_model}..."):
-                    try:
-                        from src.llm.chain_factory import get_llm
-                        from src.llm.analyzer import FusionAnalyzer
-                        
-                        llm = get_llm(model=ollama_model, base_url=ollama_url)
-                        analyzer = FusionAnalyzer(llm)
-                        
-                        if comp_a and comp_b:
-                            comparison = analyzer.compare_companies(comp_a, comp_b)
-                            
-                            st.markdown(f"## AI Analysis: {comparison.company_a} vs {comparison.company_b}")
-                            st.markdown(comparison.raw_markdown)
-                    except Exception as e:
-                        st.error(f"Comparison failed: {e}")
+            comparison_entry = comparison_key(comp_a, comp_b) if comp_a and comp_b else None
+            stored = analysis_store.get(comparison_entry) if comparison_entry else None
+            
+            if stored:
+                st.markdown(f"## AI Analysis: {comp_a.name} vs {comp_b.name}")
+                stored_caption(stored)
+                st.markdown(stored.content)
+            
+            label = "🔄 Regenerate AI Comparison" if stored else "⚖️ Generate AI Comparison"
+            if st.button(label, type="secondary" if stored else "primary"):
+                try:
+                    from src.llm.chain_factory import get_llm
+                    from src.llm.analyzer import FusionAnalyzer
+                    
+                    llm = get_llm(model=ollama_model, base_url=ollama_url)
+                    analyzer = FusionAnalyzer(llm)
+                    
+                    if comp_a and comp_b:
+                        st.markdown(f"## AI Analysis: {comp_a.name} vs {comp_b.name}")
+                        comparison = st.write_stream(analyzer.stream_comparison(comp_a, comp_b))
+                        analysis_store.save(comparison_entry, comparison, ollama_model)
+                except Exception as e:
+                    st.error(f"Comparison failed: {e}")
         else:
             st.info("Need at least 2 companies for comparison.")
     
@@ -362,7 +445,7 @@ try:
         
         report_type = st.selectbox(
             "Report Type:",
-            ["Market Overview", "Company Profile", "Investment Thesis"],
+            ["Market Overview", "Company Profile", "Investment Thesis", "AI Market Report"],
         )
         
         if report_type == "Market Overview":
@@ -418,6 +501,45 @@ try:
                         file_name="investment_thesis.md",
                         mime="text/markdown",
                     )
+        
+        elif report_type == "AI Market Report":
+            ollama_model = st.session_state.get("llm_model", "qwen3:8b")
+            ollama_url = st.session_state.get("ollama_base_url", "http://localhost:11434")
+            focus = st.text_input("Focus Area:", value="general", key="ai_report_focus")
+            
+            from streamlit_app.cache import get_market_service
+            
+            report_entry = market_report_key(get_market_service().market_report_data(), focus)
+            stored = analysis_store.get(report_entry)
+            report = None
+            
+            if stored:
+                stored_caption(stored)
+                report = stored.content
+                st.markdown(report)
+            
+            label = "🔄 Regenerate AI Market Report" if stored else "📄 Generate AI Market Report"
+            if st.button(label, type="secondary" if stored else "primary"):
+                try:
+                    from src.llm.chain_factory import get_llm
+                    from src.llm.analyzer import FusionAnalyzer
+                    from src.services.market_service import MarketService
+                    
+                    llm = get_llm(model=ollama_model, base_url=ollama_url)
+                    market_service = MarketService(db, FusionAnalyzer(llm))
+                    report = st.write_stream(market_service.stream_market_report(focus))
+                    analysis_store.save(report_entry, report, ollama_model)
+                except Exception as e:
+                    st.error(f"Report generation failed: {e}")
+                    report = None
+            
+            if report:
+                st.download_button(
+                    "📥 Download Report",
+                    report,
+                    file_name="ai_market_report.md",
+                    mime="text/markdown",
+                )
 
 except Exception as e:
     st.error(f"Error loading research page: {e}")
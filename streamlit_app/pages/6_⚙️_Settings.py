@@ -111,6 +111,43 @@ with col2:
 
 st.markdown("---")
 
+# LLM Scheduler
+st.markdown("### 🚦 LLM Scheduler")
+
+from src.llm.scheduler import get_llm_scheduler
+
+scheduler = get_llm_scheduler()
+st.caption(
+    f"Up to {scheduler.max_concurrency} concurrent requests per model, "
+    f"{scheduler.max_batch_concurrency} of them for background jobs "
+    "(LLM_MAX_CONCURRENCY / LLM_BATCH_CONCURRENCY)."
+)
+
+scheduler_stats = scheduler.stats()
+if scheduler_stats:
+    st.dataframe(
+        [
+            {
+                "Model": s.model,
+                "In flight": s.in_flight,
+                "Queued (interactive)": s.queued_interactive,
+                "Queued (batch)": s.queued_batch,
+                "Completed": s.completed,
+                "Failed": s.failed,
+                "Coalesced": s.coalesced,
+                "Avg wait (ms)": round(s.avg_wait_ms),
+                "p95 latency (ms)": round(s.p95_latency_ms),
+            }
+            for s in scheduler_stats
+        ],
+        hide_index=True,
+        use_container_width=True,
+    )
+else:
+    st.info("No LLM requests yet.")
+
+st.markdown("---")
+
 # Database Status
 st.markdown("### 🗄️ Database Status")
 
@@ -153,7 +190,9 @@ with col2:
             st.error(f"Error: {e}")
     
     if st.button("🗑️ Clear Cache"):
-        st.cache_data.clear()
+        from streamlit_app.cache import clear_caches
+
+        clear_caches()
         st.success("✅ Cache cleared")
 
 st.markdown("---")
@@ -213,6 +252,7 @@ with col1:
                         except Exception:
                             pass
                     
+                    db.mark_changed()
                     st.success(f"✅ Processed: {new_companies} companies, {new_markets} markets")
                 except Exception as e:
                     st.error(f"Error processing file: {e}")
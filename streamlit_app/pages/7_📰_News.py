@@ -17,6 +17,8 @@ st.markdown("Stay updated with the latest fusion industry news and developments.
 try:
     from src.services.news_service import get_news_service, NewsDigest
     from src.llm.chain_factory import get_llm
+    from src.services.job_service import get_job_runner
+    from streamlit_app.jobs import render_job_panel
     
     # Get Ollama settings
     ollama_model = st.session_state.get("llm_model", "qwen3:8b")
@@ -75,6 +77,28 @@ try:
                 except Exception as e:
                     st.error(f"Failed to generate digest: {e}")
         
+        if st.button("⏱️ Generate in Background", key="generate_digest_job"):
+            job_id = get_job_runner().submit(
+                "news_digest",
+                params={
+                    "max_age_days": max_age,
+                    "include_search": include_search,
+                    "summarize": summarize,
+                    "model": ollama_model,
+                    "base_url": ollama_url,
+                },
+                secrets={"tavily_api_key": tavily_api_key},
+            )
+            st.info(f"Started digest job #{job_id}. The result appears in Saved Digests.")
+        
+        with st.expander("Background jobs"):
+            render_job_panel(
+                "news_digest",
+                key_prefix="news_jobs",
+                secrets={"tavily_api_key": tavily_api_key},
+                limit=3,
+            )
+        
         # Display current digest
         if "current_digest" in st.session_state:
             digest = st.session_state.current_digest
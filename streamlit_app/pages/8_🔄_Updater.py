@@ -3,6 +3,7 @@
 import streamlit as st
 from pathlib import Path
 import sys
+from dataclasses import asdict
 from datetime import datetime
 
 # Add project root to path
@@ -27,6 +28,8 @@ try:
     )
     from src.llm.chain_factory import get_llm
     from src.config import get_settings
+    from src.services.job_service import get_job_runner
+    from streamlit_app.jobs import render_job_panel
 
     # Get settings from session state, fallback to config/.env
     settings = get_settings()
@@ -153,35 +156,32 @@ try:
         with col2:
             st.caption(f"Using model: {ollama_model}")
 
-        # Run updates button
+        # Run updates as a background job (keeps running if you leave the page)
         if st.button("🚀 Run Updates", type="primary", disabled=not companies or not selected_fields):
-            company_ids = [c["id"] for c in companies]
-
-            with st.status("Running updates...", expanded=True) as status:
-                st.write(f"Processing {len(company_ids)} companies...")
-
-                result = updater.run_update_cycle(
-                    company_ids=company_ids,
-                    fields=selected_fields,
-                    auto_apply=auto_apply,
-                )
-
-                st.write(f"✅ Companies processed: {result.companies_processed}")
-                st.write(f"📝 Proposals created: {result.proposals_created}")
-                if auto_apply:
-                    st.write(f"🔄 Auto-applied: {result.proposals_auto_applied}")
-
-                if result.errors:
-                    st.write("⚠️ Errors:")
-                    for error in result.errors:
-                        st.write(f"  - {error}")
-
-                status.update(
-                    label=f"Complete! {result.proposals_created} proposals created",
-                    state="complete",
-                )
+            job_id = get_job_runner().submit(
+                "update_cycle",
+                params={
+                    "company_ids": [c["id"] for c in companies],
+                    "fields": selected_fields,
+                    "auto_apply": auto_apply,
+                    "model": ollama_model,
+                    "base_url": ollama_url,
+                    "config": asdict(config),
+                },
+                secrets={"tavily_api_key": tavily_api_key},
+            )
+            st.success(
+                f"Started update job #{job_id}. It keeps running in the background; "
+                "review the proposals in the Review tab when it completes."
+            )
 
-            st.success(f"Created {result.proposals_created} proposals. Review them in the Review tab.")
+        st.markdown("---")
+        st.markdown("**Background jobs**")
+        render_job_panel(
+            "update_cycle",
+            key_prefix="updater_jobs",
+            secrets={"tavily_api_key": tavily_api_key},
+        )
 
     with tab2:
         st.markdown("### 📋 Review Proposals")
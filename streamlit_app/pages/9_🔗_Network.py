@@ -51,12 +51,11 @@ with st.sidebar:
 
 
 try:
-    from src.data.database import get_database
-    from src.services.network_service import NetworkFilterCriteria, NetworkService
+    from src.services.network_service import NetworkFilterCriteria
+    from streamlit_app.cache import cached_service, data_version, get_network_service
 
-    # Initialize service with database
-    db = get_database()
-    network_service = NetworkService(db)
+    # Shared service per data version (it memoizes the loaded graph)
+    network_service = get_network_service(data_version())
 
     # Load full network for filter options
     full_data = network_service.load_network()
@@ -131,7 +130,7 @@ try:
 
     if filtered_data.nodes:
         # Generate network HTML
-        network_html = network_service.get_network_html(filtered_data, height="700px")
+        network_html = cached_service("network").get_network_html(filtered_data, height="700px")
 
         # Display using streamlit components
         components.html(network_html, height=720, scrolling=False)
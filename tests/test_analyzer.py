@@ -0,0 +1,93 @@
+"""Tests for streaming LLM analysis."""
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from src.llm.analyzer import FusionAnalyzer
+from src.services.semantic_search_service import SemanticSearchResult, SemanticSearchService
+
+SWOT_RESPONSE = """## Strengths
+- Strong funding position
+- Experienced team
+
+## Weaknesses
+- Early TRL
+
+## Opportunities
+- European energy policy
+
+## Threats
+- Competing approaches
+"""
+
+
+def fake_llm(*responses: str) -> GenericFakeChatModel:
+    """Chat model that returns the given responses, streamed token by token."""
+    return GenericFakeChatModel(messages=iter(AIMessage(content=r) for r in responses))
+
+
+class TestFusionAnalyzerStreaming:
+    """Tests for FusionAnalyzer streaming variants."""
+
+    def test_stream_swot_yields_incrementally(self, sample_company):
+        """Test that SWOT output arrives in several chunks and parses once complete."""
+        analyzer = FusionAnalyzer(fake_llm(SWOT_RESPONSE))
+
+        chunks = list(analyzer.stream_swot(sample_company))
+        swot = analyzer.parse_swot(sample_company.name, "".join(chunks))
+
+        assert len(chunks) > 1
+        assert swot.raw_markdown == SWOT_RESPONSE
+        assert swot.strengths == ["Strong funding position", "Experienced team"]
+        assert swot.threats == ["Competing approaches"]
+
+    def test_stream_matches_invoke(self, sample_company):
+        """Test that streamed and non-streamed SWOT results agree."""
+        analyzer = FusionAnalyzer(fake_llm(SWOT_RESPONSE, SWOT_RESPONSE))
+
+        streamed = analyzer.parse_swot(
+            sample_company.name, "".join(analyzer.stream_swot(sample_company))
+        )
+        invoked = analyzer.generate_swot(sample_company)
+
+        assert streamed == invoked
+
+    def test_stream_answer(self):
+        """Test that answers stream and keep their data points."""
+        analyzer = FusionAnalyzer(fake_llm("Funding reached $2.5 billion at TRL 6"))
+
+        text = "".join(analyzer.stream_answer("How much funding?", "context"))
+        insight = analyzer.parse_answer("How much funding?", text)
+
+        assert insight.answer == "Funding reached $2.5 billion at TRL 6"
+        assert "TRL 6" in insight.data_points
+
+
+class TestSemanticSearchStreaming:
+    """Tests for SemanticSearchService.stream_answer."""
+
+    @pytest.fixture
+    def search_result(self):
+        """Search result with one document."""
+        return SemanticSearchResult(
+            query="Who builds stellarators?",
+            results=[{"content": "Proxima Fusion builds stellarators."}],
+        )
+
+    def test_stream_answer(self, temp_db, search_result):
+        """Test that the answer is streamed from the search context."""
+        service = SemanticSearchService(
+            temp_db, vector_store=object(), llm=fake_llm("Proxima Fusion [1]")
+        )
+
+        chunks = list(service.stream_answer(search_result))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == "Proxima Fusion [1]"
+
+    def test_stream_answer_without_llm(self, temp_db, search_result):
+        """Test that nothing is streamed when no LLM is configured."""
+        service = SemanticSearchService(temp_db, vector_store=object())
+
+        assert list(service.stream_answer(search_result)) == []
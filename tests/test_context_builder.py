@@ -0,0 +1,115 @@
+"""Tests for token-budgeted RAG context assembly."""
+
+from langchain_core.runnables import RunnableLambda
+
+from src.llm.context_builder import ContextBuilder, estimate_tokens, split_sentences
+from src.services.semantic_search_service import SemanticSearchResult, SemanticSearchService
+
+STELLARATOR = "Stellarators confine plasma with twisted coils. They need no plasma current."
+MAGNETS = "HTS magnets allow compact tokamaks. Several startups build them."
+
+
+def sentences(count: int, topic: str) -> str:
+    """Text of ``count`` distinct sentences about ``topic``."""
+    return " ".join(f"Sentence {i} about {topic} number {i}." for i in range(count))
+
+
+class TestContextBuilder:
+    """Tests for deduplication, MMR and the token budget."""
+
+    def test_estimate_tokens(self):
+        """Test that the estimate counts words, punctuation and long words."""
+        assert estimate_tokens("Proxima builds stellarators.") == 8
+        assert estimate_tokens("") == 0
+
+    def test_split_sentences_keeps_lines(self):
+        """Test that line ends are kept so structured documents stay readable."""
+        assert split_sentences("Company: Proxima\nCountry: Germany. Founded 2023.") == [
+            "Company: Proxima\n", "Country: Germany.", "Founded 2023.\n",
+        ]
+
+    def test_overlapping_chunks_are_deduplicated(self):
+        """Test that repeated sentences are dropped and numbering follows the results."""
+        results = [
+            {"content": STELLARATOR},
+            {"content": "They need no plasma current. Stellarators confine plasma with twisted "
+                        "coils."},
+            {"content": f"They need no plasma current. {MAGNETS}"},
+        ]
+
+        context = ContextBuilder().build(results)
+
+        assert [item.number for item in context.items] == [1, 3]
+        assert context.dropped == [2]
+        assert context.text == f"[1] {STELLARATOR}\n\n[3] {MAGNETS}"
+
+    def test_company_documents_stay_whole(self):
+        """Test that attribute lines shared by two companies are kept in both documents."""
+        results = [
+            {"type": "company", "content": f"Company: {name}\nCountry: Germany\n"
+                                           f"Technology: Stellarator\n"
+                                           f"Technology Readiness Level (TRL): 4\n"
+                                           f"Description: {name} builds stellarators."}
+            for name in ("Proxima Fusion", "Gauss Fusion")
+        ]
+
+        context = ContextBuilder().build(results)
+
+        assert [item.number for item in context.items] == [1, 2]
+        second = context.items[1].content
+        assert "Company: Gauss Fusion" in second
+        assert "Country: Germany" in second
+        assert "Technology: Stellarator" in second
+        assert "Technology Readiness Level (TRL): 4" in second
+
+    def test_token_budget_truncates_at_sentence_boundary(self):
+        """Test that the context stays within budget and cuts whole sentences."""
+        results = [{"content": sentences(20, topic)} for topic in ("tokamaks", "lasers", "pinches")]
+
+        context = ContextBuilder(token_budget=250, min_item_tokens=20).build(results)
+
+        assert context.tokens <= 250
+        assert [item.number for item in context.items] == [1, 2]
+        assert context.items[1].truncated
+        assert context.items[1].content.endswith(".")
+        assert context.dropped == [3]
+
+    def test_mmr_prefers_diverse_results(self):
+        """Test that a near-duplicate ranks below a novel result."""
+        results = [
+            {"content": "Tokamak magnets use HTS tape. Tokamak magnets are compact.",
+             "relevance": 1.0},
+            {"content": "Compact tokamak magnets use HTS. HTS tape makes tokamak magnets.",
+             "relevance": 0.9},
+            {"content": "Laser fusion compresses fuel pellets.", "relevance": 0.8},
+        ]
+
+        context = ContextBuilder(mmr_lambda=0.5, token_budget=25, min_item_tokens=20).build(results)
+
+        assert [item.number for item in context.items] == [1, 3]
+
+    def test_answer_uses_budgeted_context(self, temp_db):
+        """Test that the answer prompt holds the built context with stable citations."""
+        prompts = []
+
+        def answer(prompt_value):
+            prompts.append(prompt_value.to_messages()[-1].content)
+            return "Stellarators [1], magnets [3]"
+
+        service = SemanticSearchService(
+            temp_db,
+            vector_store=object(),
+            llm=RunnableLambda(answer),
+            context_builder=ContextBuilder(token_budget=100),
+        )
+        result = SemanticSearchResult(
+            query="Which confinement concepts exist?",
+            results=[{"content": STELLARATOR}, {"content": STELLARATOR}, {"content": MAGNETS}],
+        )
+
+        answer_text = "".join(service.stream_answer(result))
+
+        assert answer_text == "Stellarators [1], magnets [3]"
+        assert f"[1] {STELLARATOR}\n\n[3] {MAGNETS}" in prompts[0]
+        assert "[2]" not in prompts[0]
+        assert result.context_tokens == estimate_tokens(STELLARATOR) + estimate_tokens(MAGNETS)
@@ -25,6 +25,29 @@ class TestDatabase:
         assert "name" in column_names
         assert "country" in column_names
 
+    def test_change_token_tracks_local_writes(self, temp_db):
+        """Test that mark_changed advances the change token."""
+        before = temp_db.change_token()
+        assert temp_db.change_token() == before
+        temp_db.mark_changed()
+        assert temp_db.change_token() != before
+
+    def test_change_token_tracks_other_connections(self, temp_db, sample_company):
+        """Test that commits from another connection advance the change token."""
+        before = temp_db.change_token()
+        other = Database(str(temp_db.db_path))
+        CompanyRepository(other).create(sample_company)
+        other.close()
+        assert temp_db.change_token() != before
+
+    def test_crud_service_marks_changes(self, temp_db, sample_company):
+        """Test that CrudService writes invalidate the change token."""
+        from src.services.crud_service import CrudService
+
+        before = temp_db.change_token()
+        CrudService(temp_db).create_entity("companies", sample_company.model_dump(exclude={"id"}))
+        assert temp_db.change_token() != before
+
 
 class TestCompanyRepository:
     """Tests for CompanyRepository."""
@@ -0,0 +1,186 @@
+"""Tests for the database sync service."""
+
+import json
+import re
+import threading
+
+from langchain_core.runnables import RunnableLambda
+
+from src.data.parsers.markdown_parser import MarkdownParser
+from src.data.repositories import CompanyRepository
+from src.models.company import Company
+from src.models.merge_models import SyncConfig
+from src.services.database_sync_service import DatabaseSyncService
+from src.services.sync_diff import changes_per_field, diff_companies
+from tests.test_parse_cache import DOCUMENT
+
+# Verdicts the fake validator returns per field: (valid, confidence)
+VERDICTS = {
+    "team_size": (True, 0.95),
+    "total_funding_usd": (True, 0.95),
+    "founded_year": (True, 0.8),
+    "country": (False, 0.9),
+}
+
+
+class FakeValidationLLM:
+    """Stands in for the chat model: answers batch validation prompts."""
+
+    def __init__(self, response: str = None):
+        self.response = response
+        self.prompts = []
+        self.lock = threading.Lock()
+
+    def invoke(self, prompt_value) -> str:
+        human = prompt_value.to_messages()[-1].content
+        fields = re.findall(r"Feld: (\w+)", human)
+        with self.lock:
+            self.prompts.append(fields)
+        if self.response is not None:
+            return self.response
+        return json.dumps([
+            {"index": i, "valid": VERDICTS[name][0], "confidence": VERDICTS[name][1]}
+            for i, name in enumerate(fields, 1)
+        ])
+
+    def runnable(self) -> RunnableLambda:
+        return RunnableLambda(self.invoke)
+
+
+def seed(temp_db):
+    """Store two of the document's companies with outdated fields."""
+    repo = CompanyRepository(temp_db)
+    proxima, marvel, _ = MarkdownParser(DOCUMENT).parse().companies
+    repo.create(proxima.model_copy(
+        update={"id": None, "team_size": 40, "founded_year": 2020, "country": "Austria"}
+    ))
+    repo.create(marvel.model_copy(update={"id": None, "total_funding_usd": 100_000_000}))
+
+
+def count(temp_db, table: str) -> int:
+    """Number of rows in a table."""
+    return temp_db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def sync(temp_db, tmp_path, fake: FakeValidationLLM, **config):
+    """Run a sync of the sample document with a fake validator."""
+    path = tmp_path / "Fusion_Research.md"
+    path.write_text(DOCUMENT, encoding="utf-8")
+    config = SyncConfig(
+        validation_batch_size=2, max_concurrent_validations=2, llm_name_matching=False, **config
+    )
+    service = DatabaseSyncService(db=temp_db, llm=fake.runnable(), config=config)
+    return service.sync_from_markdown(str(path))
+
+
+class TestDatabaseSync:
+    """Tests for batched validation and bulk writes."""
+
+    def test_batched_validation_and_apply(self, temp_db, tmp_path):
+        """Test that changes are validated several per prompt and written in bulk."""
+        seed(temp_db)
+        fake = FakeValidationLLM()
+        result = sync(temp_db, tmp_path, fake)
+
+        assert result.errors == []
+        assert sorted(len(fields) for fields in fake.prompts) == [2, 2]
+        assert result.llm_requests == 2
+        assert result.fields_updated == 2
+        assert result.proposals_created == 1
+        assert result.companies_added == 1
+
+        repo = CompanyRepository(temp_db)
+        proxima = repo.get_by_name("Proxima Fusion")
+        assert proxima.team_size == 80
+        assert proxima.founded_year == 2020
+        assert proxima.country == "Austria"
+        assert repo.get_by_name("Marvel Fusion").total_funding_usd == 385_000_000
+        assert repo.get_by_name("Helion Energy") is not None
+        assert count(temp_db, "audit_log") == 3
+        assert count(temp_db, "update_proposals") == 1
+
+    def test_unparseable_verdicts_need_review(self, temp_db, tmp_path):
+        """Test that changes without a verdict become proposals instead of being applied."""
+        seed(temp_db)
+        result = sync(temp_db, tmp_path, FakeValidationLLM(response="kein JSON"))
+
+        assert result.fields_updated == 0
+        assert result.proposals_created == 4
+        assert CompanyRepository(temp_db).get_by_name("Proxima Fusion").team_size == 40
+
+    def test_failed_batch_is_rolled_back(self, temp_db, tmp_path, monkeypatch):
+        """Test that a failing write leaves none of the batch's updates behind."""
+        seed(temp_db)
+
+        def fail(proposal):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(DatabaseSyncService, "_proposal_row", staticmethod(fail))
+        result = sync(temp_db, tmp_path, FakeValidationLLM())
+
+        assert result.errors
+        assert CompanyRepository(temp_db).get_by_name("Proxima Fusion").team_size == 40
+        assert count(temp_db, "audit_log") == 0
+
+    def test_iter_all_streams_every_company(self, temp_db):
+        """Test that iter_all pages through all companies in id order."""
+        repo = CompanyRepository(temp_db)
+        for company in MarkdownParser(DOCUMENT).parse().companies:
+            repo.create(company.model_copy(update={"id": None}))
+
+        names = [company.name for company in repo.iter_all(batch_size=2)]
+
+        assert names == ["Proxima Fusion", "Marvel Fusion", "Helion Energy"]
+
+
+class TestSyncDiff:
+    """Tests for the vectorized field diff and the dry-run preview."""
+
+    def make_pair(self, company_id: int, **changes):
+        """A database company and a parsed copy with ``changes`` applied."""
+        db_company = Company(
+            id=company_id, name=f"Company {company_id}", team_size=100,
+            total_funding_usd=1_000_000.0, city="Munich", description="Builds  stellarators",
+        )
+        return db_company.model_copy(update={"id": None, **changes}), db_company
+
+    def test_tolerance_and_text_normalization(self):
+        """Test that small numeric and whitespace/case-only edits are not changes."""
+        pairs = [
+            self.make_pair(1, team_size=110, description="builds stellarators"),
+            self.make_pair(2, team_size=200, city=None),
+            self.make_pair(3, total_funding_usd=2_000_000.0, city="Berlin", trl=5),
+        ]
+
+        changes = diff_companies(pairs)
+
+        assert [(c.company_id, c.field_name) for c in changes] == [
+            (2, "team_size"),
+            (3, "total_funding_usd"),
+            (3, "trl"),
+            (3, "city"),
+        ]
+        assert changes[0].old_value == "100"
+        assert changes[0].new_value == "200"
+        assert changes[2].old_value is None
+        assert changes_per_field(changes) == {
+            "total_funding_usd": 1, "team_size": 1, "trl": 1, "city": 1,
+        }
+
+    def test_preview_counts_without_llm(self, temp_db, tmp_path):
+        """Test that the preview reports per-field counts and writes nothing."""
+        seed(temp_db)
+        path = tmp_path / "Fusion_Research.md"
+        path.write_text(DOCUMENT, encoding="utf-8")
+        fake = FakeValidationLLM()
+        service = DatabaseSyncService(db=temp_db, llm=fake.runnable())
+
+        preview = service.preview(str(path))
+
+        assert preview.companies_matched == 2
+        assert preview.companies_new == 1
+        assert preview.changes_by_field == {
+            "total_funding_usd": 1, "team_size": 1, "founded_year": 1, "country": 1,
+        }
+        assert CompanyRepository(temp_db).get_by_name("Proxima Fusion").team_size == 40
+        assert fake.prompts == []
@@ -0,0 +1,116 @@
+"""Import-time regression tests (``python -X importtime`` budgets)."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+
+HEAVY_MODULES = (
+    "langchain_core",
+    "langchain_community",
+    "langchain_experimental",
+    "langchain_ollama",
+    "langchain_chroma",
+    "chromadb",
+    "tavily",
+    "pyvis",
+    "networkx",
+    "feedparser",
+    "pandas",
+)
+
+# module -> (cumulative import budget in seconds, heavy modules it may load)
+IMPORT_BUDGETS = {
+    "src.data": (0.1, ()),
+    "src.data.database": (0.1, ()),
+    "src.data.snapshot_store": (0.1, ()),
+    "src.data.name_index": (0.1, ()),
+    "src.data.sql_sandbox": (0.1, ()),
+    "src.data.lexical_index": (0.1, ()),
+    "src.data.company_similarity": (1.0, ()),
+    "src.data.vector_quantization": (1.0, ()),
+    "src.data.hashing_embeddings": (0.1, ()),
+    "src.data.search_filters": (0.1, ()),
+    "src.data.research_chunker": (0.1, ()),
+    "src.data.analysis_store": (0.1, ()),
+    "src.llm.context_builder": (0.1, ()),
+    "src.data.vector_backends": (3.0, ("langchain_core",)),
+    "src.llm": (0.1, ()),
+    "src.llm.scheduler": (0.1, ()),
+    "src.services": (0.1, ()),
+    "src.data.repositories": (1.0, ()),
+    "src.services.company_service": (1.0, ()),
+    "src.services.market_service": (1.0, ()),
+    "src.services.technology_service": (1.0, ()),
+    "src.services.report_service": (1.0, ()),
+    "src.services.network_service": (1.0, ()),
+    "src.services.crud_service": (1.0, ()),
+    "src.services.job_service": (1.0, ()),
+    "src.services.sync_diff": (1.0, ()),
+    "src.services.precompute_service": (1.0, ()),
+    "src.llm.query_processor": (3.0, ("langchain_core",)),
+    "src.services.updater_service": (3.0, ("langchain_core",)),
+    "src.services.news_service": (3.0, ("langchain_core",)),
+}
+
+
+def import_profile(module: str) -> tuple[float, set[str]]:
+    """Import a module in a fresh interpreter; return (seconds, imported modules)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = set()
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line.split("|")
+        name = parts[-1].strip()
+        try:
+            cumulative[name] = int(parts[1]) / 1e6
+        except ValueError:
+            continue
+        imported.add(name)
+    return cumulative.get(module, 0.0), imported
+
+
+class TestImportTime:
+    """Tests that heavy dependencies are only loaded on first use."""
+
+    @pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS))
+    def test_no_heavy_imports(self, module):
+        """Test that a module does not eagerly import heavy dependencies."""
+        _, imported = import_profile(module)
+        allowed = IMPORT_BUDGETS[module][1]
+        loaded = {
+            heavy
+            for heavy in HEAVY_MODULES
+            if heavy not in allowed and heavy in imported
+        }
+        assert not loaded, f"{module} eagerly imports {sorted(loaded)}"
+
+    @pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS))
+    def test_import_budget(self, module):
+        """Test that a cold import stays within its time budget."""
+        seconds, _ = import_profile(module)
+        budget = IMPORT_BUDGETS[module][0]
+        assert seconds <= budget, f"{module} took {seconds:.3f}s (budget {budget:.1f}s)"
+
+    def test_lazy_facade_resolves(self):
+        """Test that package facades still resolve their members."""
+        import src.data
+        import src.services
+
+        from src.data.database import Database
+
+        assert src.data.Database is Database
+        assert src.services.CrudService.__name__ == "CrudService"
+        with pytest.raises(AttributeError):
+            src.services.DoesNotExist
@@ -0,0 +1,123 @@
+"""Tests for the background job runner."""
+
+import threading
+import time
+
+import pytest
+
+from src.models.job import JobStatus
+from src.services.job_service import JobRunner, register_job_handler
+
+release_blocking_job = threading.Event()
+
+
+@register_job_handler("test_count")
+def _count_job(job):
+    """Count to params['n'], checkpointing each step."""
+    start = job.checkpoint_state.get("next", 0)
+    total = job.params["n"]
+    for i in range(start, total):
+        job.raise_if_cancelled()
+        failed_once = job.checkpoint_state.get("failed_once", False)
+        if job.params.get("fail_at") == i and not failed_once:
+            job.save_checkpoint({"next": i, "failed_once": True})
+            raise RuntimeError("boom")
+        job.report_progress(i + 1, total, f"step {i + 1}")
+        job.save_checkpoint({"next": i + 1, "failed_once": failed_once})
+    return {"counted": total, "started_at": start}
+
+
+@register_job_handler("test_blocking")
+def _blocking_job(job):
+    """Wait until released or cancelled."""
+    while not release_blocking_job.is_set():
+        job.raise_if_cancelled()
+        time.sleep(0.01)
+    return {"released": True}
+
+
+def wait_for(runner, job_id, timeout=5.0):
+    """Poll until a job reaches a terminal state."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = runner.get_job(job_id)
+        if not job.is_active:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+@pytest.fixture
+def runner(temp_db):
+    """Job runner on the temporary database."""
+    job_runner = JobRunner(str(temp_db.db_path))
+    yield job_runner
+    release_blocking_job.set()
+    job_runner.shutdown(wait=True)
+    job_runner.db.close()
+    release_blocking_job.clear()
+
+
+class TestJobRunner:
+    """Tests for JobRunner."""
+
+    def test_job_completes_with_progress_and_result(self, runner):
+        """Test that a job runs to completion and records progress."""
+        job_id = runner.submit("test_count", {"n": 3})
+        job = wait_for(runner, job_id)
+
+        assert job.status == JobStatus.COMPLETED
+        assert job.progress_done == 3
+        assert job.progress == 1.0
+        assert job.result == {"counted": 3, "started_at": 0}
+        assert job.finished_at is not None
+
+    def test_unknown_kind_rejected(self, runner):
+        """Test that unregistered job kinds are rejected."""
+        with pytest.raises(ValueError):
+            runner.submit("does_not_exist")
+
+    def test_cancel_running_job(self, runner):
+        """Test that a running job stops at its next safe point."""
+        job_id = runner.submit("test_blocking")
+        assert runner.cancel(job_id)
+        job = wait_for(runner, job_id)
+
+        assert job.status == JobStatus.CANCELLED
+        assert job.cancel_requested
+
+    def test_resume_from_checkpoint(self, runner):
+        """Test that a failed job resumes from its last checkpoint."""
+        job_id = runner.submit("test_count", {"n": 5, "fail_at": 2})
+        job = wait_for(runner, job_id)
+        assert job.status == JobStatus.FAILED
+        assert "boom" in job.error
+        assert job.checkpoint["next"] == 2
+
+        assert runner.resume(job_id)
+        job = wait_for(runner, job_id)
+        assert job.status == JobStatus.COMPLETED
+        assert job.result == {"counted": 5, "started_at": 2}
+
+    def test_running_jobs_marked_interrupted_on_restart(self, runner, temp_db):
+        """Test that jobs orphaned by a previous process become resumable."""
+        job_id = runner.submit("test_blocking")
+        deadline = time.time() + 5
+        while runner.get_job(job_id).status != JobStatus.RUNNING and time.time() < deadline:
+            time.sleep(0.01)
+
+        restarted = JobRunner(str(temp_db.db_path))
+        job = restarted.get_job(job_id)
+        restarted.db.close()
+
+        assert job.status == JobStatus.INTERRUPTED
+        assert job.is_resumable
+
+    def test_list_jobs_filters(self, runner):
+        """Test listing jobs by kind and activity."""
+        done_id = runner.submit("test_count", {"n": 1})
+        wait_for(runner, done_id)
+        active_id = runner.submit("test_blocking")
+
+        assert [j.id for j in runner.list_jobs(kind="test_count")] == [done_id]
+        assert [j.id for j in runner.list_jobs(active_only=True)] == [active_id]
@@ -0,0 +1,173 @@
+"""Tests for the research markdown parser."""
+
+from src.data.parsers import markdown_parser
+from src.data.parsers.markdown_parser import MarkdownParser
+
+DOCUMENT = """# Fusion Research
+
+Intro text outside any section.
+
+## 1. German Ecosystem
+
+Funding overview.
+
+### 1.1 Startups
+
+#### Proxima Fusion (München)
+
+**Profil:** Stellarator developer spun out of IPP, gegründet 2023, with 80 Mitarbeiter.
+
+- Finanzierung: EUR 130M
+- Status: TRL 4
+- Investoren: Redalpine, Plural
+
+#### Marvel Fusion (Munich/Germany)
+
+Laser-driven inertial fusion startup building a research facility with partners in Colorado.
+
+- USD 385 Million raised, Team: 120
+
+## 2. International
+
+#### Commonwealth Fusion Systems (USA)
+
+Tokamak company and a corporation spin-out with USD 2.86 Mrd. total funding and TRL 6-7.
+##### Note (2021)
+Still part of the block.
+### 2.2 Programs
+
+ITER overview.
+"""
+
+
+def parse(content: str = DOCUMENT):
+    """Parse a document and return (parser, parsed data)."""
+    parser = MarkdownParser(content)
+    return parser, parser.parse()
+
+
+class TestMarkdownParserScan:
+    """Tests for section and company block scanning."""
+
+    def test_sections(self):
+        """Test that ## sections capture everything up to the next ## heading."""
+        _, data = parse()
+
+        assert list(data.raw_sections) == ["1. German Ecosystem", "2. International"]
+        assert data.raw_sections["1. German Ecosystem"].startswith("\nFunding overview.")
+        assert "#### Marvel Fusion" in data.raw_sections["1. German Ecosystem"]
+        assert data.raw_sections["2. International"].endswith("ITER overview.\n")
+
+    def test_company_blocks(self):
+        """Test that blocks end at the next ### or #### heading but not at ## or #####."""
+        parser, _ = parse()
+        blocks = {block.name: block for block in parser.company_blocks}
+
+        assert list(blocks) == [
+            "Proxima Fusion",
+            "Marvel Fusion",
+            "Commonwealth Fusion Systems",
+        ]
+        assert blocks["Marvel Fusion"].location == "Munich/Germany"
+        # A ## section heading does not close the previous company block
+        assert "## 2. International" in blocks["Marvel Fusion"].content
+        assert "Still part of the block." in blocks["Commonwealth Fusion Systems"].content
+        assert "ITER" not in blocks["Commonwealth Fusion Systems"].content
+
+    def test_headings_without_location_ignored(self):
+        """Test that #### headings without a (location) are not companies."""
+        _, data = parse("## S\n\n#### Overview\n\nText\n")
+
+        assert data.companies == []
+
+
+class TestMarkdownParserExtraction:
+    """Tests for company field extraction."""
+
+    def test_company_fields(self):
+        """Test extraction of the structured fields from a block."""
+        _, data = parse()
+        proxima = data.companies[0]
+
+        assert proxima.id == 1
+        assert proxima.country == "Germany"
+        assert proxima.city == "München"
+        assert proxima.technology_approach == "Stellarator"
+        assert proxima.founded_year == 2023
+        assert proxima.team_size == 80
+        assert proxima.trl == 4
+        assert proxima.key_investors == "Redalpine, Plural"
+        assert proxima.description.startswith("Stellarator developer")
+
+    def test_ids_follow_document_order(self):
+        """Test that company ids are assigned in document order."""
+        _, data = parse()
+
+        assert [c.id for c in data.companies] == [1, 2, 3]
+
+    def test_fallback_description_and_units(self):
+        """Test paragraph descriptions, city splitting and billion-scale funding."""
+        _, data = parse()
+        marvel, cfs = data.companies[1], data.companies[2]
+
+        assert marvel.city == "Munich"
+        assert marvel.description.startswith("Laser-driven inertial fusion")
+        assert marvel.total_funding_usd == 385_000_000
+        assert cfs.country == "USA"
+        assert cfs.company_type.value == "Konzern"
+        assert cfs.total_funding_usd == 2_860_000_000
+        assert cfs.trl == 6
+
+    def test_markets(self):
+        """Test that the market presets are produced."""
+        _, data = parse()
+
+        assert [m.region_name for m in data.markets] == [
+            "Global", "Europe", "Germany", "USA", "Asia-Pacific",
+        ]
+
+
+class TestMarkdownParserParallel:
+    """Tests for process-pool company block extraction."""
+
+    def large_document(self, blocks: int = 40) -> str:
+        """Build a document with many company blocks."""
+        body = "\n".join(
+            f"#### Company {i} (Munich)\n\nTokamak developer, gegründet 2020, TRL {i % 9 + 1}.\n"
+            for i in range(blocks)
+        )
+        return DOCUMENT + body
+
+    def test_matches_serial_parse(self, monkeypatch):
+        """Test that parallel extraction yields the serial result in document order."""
+        monkeypatch.setattr(markdown_parser, "PARALLEL_MIN_BLOCKS", 1)
+        content = self.large_document()
+
+        serial = MarkdownParser(content).parse().companies
+        parallel = MarkdownParser(content, parallel=True, max_workers=2).parse().companies
+
+        assert len(parallel) == 43
+        assert [c.model_dump() for c in parallel] == [c.model_dump() for c in serial]
+
+    def test_small_documents_parse_serially(self, monkeypatch):
+        """Test that inputs below the threshold never start a process pool."""
+        def fail(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(markdown_parser, "ProcessPoolExecutor", fail)
+
+        data = MarkdownParser(DOCUMENT, parallel=True, max_workers=4).parse()
+
+        assert [c.id for c in data.companies] == [1, 2, 3]
+
+    def test_pool_failure_falls_back_to_serial(self, monkeypatch):
+        """Test that a failing pool falls back to a complete serial parse."""
+        def fail(*args, **kwargs):
+            raise OSError("no process support")
+
+        monkeypatch.setattr(markdown_parser, "PARALLEL_MIN_BLOCKS", 1)
+        monkeypatch.setattr(markdown_parser, "ProcessPoolExecutor", fail)
+
+        data = MarkdownParser(self.large_document(), parallel=True, max_workers=2).parse()
+
+        assert [c.id for c in data.companies] == list(range(1, 44))
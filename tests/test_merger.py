@@ -0,0 +1,251 @@
+"""Tests for the markdown merger service."""
+
+import re
+import threading
+
+from langchain_core.runnables import RunnableLambda
+
+from src.models.merge_models import MergeConfig
+from src.services.markdown_merger_service import MarkdownMergerService
+from src.services.structural_merge import structural_merge
+
+BASE_SECTION = """
+Intro paragraph for the section.
+
+#### Alpha Fusion (Munich)
+
+Alpha profile. Team: 10
+
+#### Beta Fusion (USA)
+
+Beta profile. Team: 20
+
+### 1.2 Research
+
+Institutes overview.
+
+#### Gamma Fusion (UK)
+
+Gamma profile.
+"""
+
+UPDATE_SECTION = BASE_SECTION.replace("Beta profile.", "Beta pivots to stellarators.").replace(
+    "### 1.2 Research",
+    "#### Delta Fusion (Japan)\n\nDelta profile.\n\n### 1.2 Research",
+)
+
+
+class FakeMergeLLM:
+    """Stands in for the chat model: records prompts and tags merged output."""
+
+    def __init__(self, barrier: threading.Barrier = None):
+        self.barrier = barrier
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def invoke(self, prompt_value) -> str:
+        human = prompt_value.to_messages()[-1].content
+        name = re.search(r'"(.+?)"', human).group(1)
+        original = human.split("=== ORIGINAL ===")[1].split("=== UPDATE ===")[0].strip()
+        with self.lock:
+            self.calls.append((name, original))
+        if self.barrier:
+            self.barrier.wait()
+        return f"MERGED[{name}]"
+
+    def runnable(self) -> RunnableLambda:
+        return RunnableLambda(self.invoke)
+
+
+def make_merger(fake: FakeMergeLLM, tmp_path=None, **config) -> MarkdownMergerService:
+    """Create a merger wired to the fake LLM."""
+    return MarkdownMergerService(
+        llm=fake.runnable(),
+        config=MergeConfig(**config),
+        research_dir=str(tmp_path) if tmp_path else "research",
+    )
+
+
+class TestSplitSection:
+    """Tests for splitting sections into company blocks and text."""
+
+    def test_segments_roundtrip(self):
+        """Test that segments reproduce the section exactly."""
+        merger = make_merger(FakeMergeLLM())
+        segments = merger.split_section(BASE_SECTION)
+
+        assert "".join(s.content for s in segments) == BASE_SECTION
+        assert [s.key for s in segments] == [
+            "text:intro",
+            "company:Alpha Fusion",
+            "company:Beta Fusion",
+            "text:### 1.2 Research",
+            "company:Gamma Fusion",
+        ]
+        assert segments[3].content.startswith("### 1.2 Research")
+
+    def test_duplicate_company_names(self):
+        """Test that repeated company headings get distinct keys."""
+        merger = make_merger(FakeMergeLLM())
+        section = "#### A (X)\n\none\n\n#### A (X)\n\ntwo\n"
+
+        keys = [s.key for s in merger.split_section(section)]
+
+        assert keys == ["company:A", "company:A #2"]
+
+
+class TestStructuralMerge:
+    """Tests for the deterministic non-LLM merge."""
+
+    def test_appended_bullets_are_taken(self):
+        """Test that lines added by the update are merged in place."""
+        base = "- Funding: EUR 10M\n- Team: 20\n"
+        update = "- Funding: EUR 10M\n- New partner: KIT\n- Team: 20\n"
+
+        assert structural_merge(base, update) == update
+
+    def test_omitted_lines_are_kept(self):
+        """Test that a partial update never deletes base information."""
+        base = "- Funding: EUR 10M\n- Investors: HV Capital\n- Team: 20\n"
+        update = "- Funding: EUR 10M\n- Team: 20\n- TRL 4\n"
+
+        assert structural_merge(base, update) == base + "- TRL 4\n"
+
+    def test_number_and_extension_edits(self):
+        """Test that changed numbers and appended text take the update."""
+        base = "- Funding: EUR 10M\n- Investors: HV Capital\n"
+        update = "- Funding: EUR 25.5M\n- Investors: HV Capital, SPRIND\n"
+
+        assert structural_merge(base, update) == update
+
+    def test_rewritten_text_conflicts(self):
+        """Test that rewritten prose is left to the LLM."""
+        base = "Builds a tokamak.\n"
+        update = "Builds a stellarator.\n"
+
+        assert structural_merge(base, update) is None
+
+
+class TestMergeSection:
+    """Tests for company-granular section merges."""
+
+    def test_only_changed_blocks_are_sent(self):
+        """Test that unchanged and new blocks never reach the LLM."""
+        fake = FakeMergeLLM()
+        merged = make_merger(fake).merge_section(BASE_SECTION, UPDATE_SECTION, "1. Germany")
+
+        assert [name for name, _ in fake.calls] == ["Beta Fusion"]
+        assert "Alpha profile. Team: 10" in merged
+        assert "MERGED[Beta Fusion]\n\n#### Delta Fusion (Japan)" in merged
+        assert merged.index("Delta Fusion") < merged.index("### 1.2 Research")
+        assert merged.count("### 1.2 Research") == 1
+        assert merged.endswith("#### Gamma Fusion (UK)\n\nGamma profile.\n")
+
+    def test_reassembly_is_deterministic(self):
+        """Test that repeated merges produce identical documents."""
+        first = make_merger(FakeMergeLLM()).merge_section(BASE_SECTION, UPDATE_SECTION, "S")
+        second = make_merger(FakeMergeLLM()).merge_section(BASE_SECTION, UPDATE_SECTION, "S")
+
+        assert first == second
+
+    def test_oversize_blocks_are_chunked(self):
+        """Test that only differing paragraphs of an oversize block are sent."""
+        paragraphs = [f"Paragraph {i} " + "x" * 80 for i in range(20)]
+        base = "#### Big Fusion (USA)\n\n" + "\n\n".join(paragraphs) + "\n"
+        update = base.replace("Paragraph 3 ", "Paragraph 3 revised ").replace(
+            "Paragraph 15 ", "Paragraph 15 revised "
+        )
+
+        fake = FakeMergeLLM()
+        merged = make_merger(fake, chunk_size=500).merge_section(base, update, "S")
+
+        assert [original[:12] for _, original in fake.calls] == ["Paragraph 3 ", "Paragraph 15"]
+        assert all(len(original) <= 500 for _, original in fake.calls)
+        assert merged.count("MERGED[Big Fusion]") == 2
+        assert "Paragraph 4 " in merged and merged.endswith("\n")
+
+
+def write_two_block_update(tmp_path):
+    """Write base.md / update.md where two company blocks need an LLM merge."""
+    base = "# Title\n\n## 1. Germany\n" + BASE_SECTION + "\n## 2. USA\n" + BASE_SECTION
+    update = (
+        "# Title\n\n## 1. Germany\n" + UPDATE_SECTION
+        + "\n## 2. USA\n" + BASE_SECTION.replace("Alpha profile.", "Alpha was acquired.")
+    )
+    (tmp_path / "base.md").write_text(base, encoding="utf-8")
+    (tmp_path / "update.md").write_text(update, encoding="utf-8")
+
+
+class TestMergeFiles:
+    """Tests for whole-document merges."""
+
+    def test_changed_blocks_merge_concurrently(self, tmp_path):
+        """Test that block merges across sections run in parallel and reassemble in order."""
+        write_two_block_update(tmp_path)
+
+        # Both merges must be in flight at once to pass the barrier
+        fake = FakeMergeLLM(barrier=threading.Barrier(2, timeout=5))
+        merger = make_merger(fake, tmp_path, max_concurrent_merges=2)
+        result = merger.merge_files("base.md", "update.md", output_file="out.md")
+
+        merged = (tmp_path / "out.md").read_text(encoding="utf-8")
+        assert result.success and result.llm_requests == 2
+        assert sorted(name for name, _ in fake.calls) == ["Alpha Fusion", "Beta Fusion"]
+        assert merged.index("MERGED[Beta Fusion]") < merged.index("## 2. USA")
+        assert merged.index("## 2. USA") < merged.index("MERGED[Alpha Fusion]")
+        assert merged.count("Delta Fusion") == 1
+        assert result.conflicts_resolved == 2
+
+    def test_routine_update_needs_no_llm(self, tmp_path):
+        """Test that additions and number changes merge locally and are reported."""
+        base = "# Title\n\n## 1. Germany\n" + BASE_SECTION + "\n## 2. USA\n\nText.\n"
+        update = (
+            "# Title\n\n## 1. Germany\n"
+            + UPDATE_SECTION.replace("Beta pivots to stellarators.", "Beta profile.")
+            .replace("Team: 10", "Team: 12")
+            + "\n## 3. Asia\n\nNew section.\n"
+        )
+        (tmp_path / "base.md").write_text(base, encoding="utf-8")
+        (tmp_path / "update.md").write_text(update, encoding="utf-8")
+
+        fake = FakeMergeLLM()
+        result = make_merger(fake, tmp_path).merge_files("base.md", "update.md", "out.md")
+
+        merged = (tmp_path / "out.md").read_text(encoding="utf-8")
+        assert fake.calls == []
+        assert result.sections_merged == 2 and result.local_merge_ratio == 1.0
+        assert "Team: 12" in merged and "#### Delta Fusion (Japan)" in merged
+        assert "## 2. USA\n\nText." in merged
+
+    def test_cli_scheduler_runs_merges_concurrently(self, tmp_path, monkeypatch):
+        """Test that a CLI-sized scheduler lets batch merges through the scheduled LLM at once."""
+        from langchain_core.messages import AIMessage
+        from langchain_core.outputs import ChatGeneration, ChatResult
+        from langchain_core.prompt_values import ChatPromptValue
+        from langchain_ollama import ChatOllama
+
+        from src.llm import scheduler
+        from src.llm.chain_factory import get_llm
+
+        fake = FakeMergeLLM(barrier=threading.Barrier(2, timeout=5))
+
+        def generate(self, messages, stop=None, run_manager=None, **kwargs):
+            content = fake.invoke(ChatPromptValue(messages=messages))
+            return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+        monkeypatch.setattr(ChatOllama, "_generate", generate)
+        monkeypatch.setattr(scheduler, "_llm_scheduler", None)
+        scheduler.configure_llm_scheduler(2)
+        write_two_block_update(tmp_path)
+
+        merger = MarkdownMergerService(
+            llm=get_llm(priority="batch"),
+            config=MergeConfig(max_concurrent_merges=2),
+            research_dir=str(tmp_path),
+        )
+        result = merger.merge_files("base.md", "update.md", output_file="out.md")
+
+        assert result.success and result.llm_requests == 2
+        assert result.errors == []
+        assert sorted(name for name, _ in fake.calls) == ["Alpha Fusion", "Beta Fusion"]
+        assert scheduler.get_llm_scheduler().stats()[0].completed == 2
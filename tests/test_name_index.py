@@ -0,0 +1,109 @@
+"""Tests for the name-resolution index."""
+
+from src.data.name_index import NameIndex, normalize_name
+from src.data.repositories import InvestorRepository
+
+COMPANIES = [
+    "Proxima Fusion GmbH",
+    "Marvel Fusion",
+    "TAE Technologies",
+    "Commonwealth Fusion Systems",
+    "Helion Energy",
+]
+
+
+def build(**kwargs) -> NameIndex[str]:
+    """Index the sample company names to themselves."""
+    return NameIndex.build(((name, name) for name in COMPANIES), **kwargs)
+
+
+class TestNameIndex:
+    """Tests for NameIndex lookups."""
+
+    def test_normalize_name(self):
+        """Test that case, punctuation and legal suffixes are removed."""
+        assert normalize_name("Proxima Fusion GmbH") == "proxima fusion"
+        assert normalize_name("Helion Energy, Inc.") == "helion energy"
+        assert normalize_name("AG") == "ag"
+
+    def test_exact_and_normalized(self):
+        """Test exact and normalized-key hits."""
+        index = build()
+
+        assert index.resolve("Marvel Fusion") == "Marvel Fusion"
+        assert index.resolve("proxima fusion") == "Proxima Fusion GmbH"
+        assert index.resolve("Helion Energy Inc.") == "Helion Energy"
+
+    def test_containment_and_typos(self):
+        """Test that contained names and misspellings match."""
+        index = build()
+
+        assert index.resolve("TAE") == "TAE Technologies"
+        assert index.resolve("Commonwealth Fusion System") == "Commonwealth Fusion Systems"
+        assert index.resolve("Helion Energie") == "Helion Energy"
+
+    def test_unrelated_names_do_not_match(self):
+        """Test that dissimilar names resolve to None."""
+        index = build()
+
+        assert index.resolve("Tokamak Energy") is None
+        assert index.resolve("Zap") is None
+
+    def test_tie_breaker_confirms_fuzzy_and_ambiguous_matches(self):
+        """Test that the tie-breaker decides ambiguous and trigram-only names and is cached."""
+        calls = []
+
+        def tie_breaker(name, candidate):
+            calls.append(candidate)
+            return candidate in ("Marvel Fusion", "Helion Energy")
+
+        index = build(tie_breaker=tie_breaker)
+
+        assert index.resolve("Fusion") == "Marvel Fusion"
+        assert index.resolve("FUSION") == "Marvel Fusion"
+        assert calls == ["Proxima Fusion GmbH", "Marvel Fusion"]
+        assert index.resolve("Helion Energie") == "Helion Energy"
+        assert index.resolve("TAE") == "TAE Technologies"
+        assert calls == ["Proxima Fusion GmbH", "Marvel Fusion", "Helion Energy"]
+
+    def test_numbered_names_do_not_match(self):
+        """Test that names differing only by a number stay distinct."""
+        index = NameIndex.build([("Fusion Company 12", 12), ("Stellarator 2", 2)])
+
+        assert index.resolve("Fusion Company 13") is None
+        assert index.resolve("Fusion Company 1") is None
+        assert index.resolve("Stellarator") is None
+        assert index.resolve("Stellarator 3") is None
+        assert index.resolve("fusion company 12 inc") == 12
+
+    def test_single_fuzzy_match_needs_confirmation(self):
+        """Test that a lone near-identical name is only merged if the tie-breaker agrees."""
+        rejecting = build(tie_breaker=lambda name, candidate: False)
+
+        assert rejecting.resolve("Helion Energie") is None
+        assert rejecting.resolve("TAE") == "TAE Technologies"
+
+    def test_tie_breaker_rejection_and_failure(self):
+        """Test that rejected ties are unmatched and failed ties use the best score."""
+        assert build(tie_breaker=lambda name, candidate: False).resolve("Fusion") is None
+        assert build(tie_breaker=lambda name, candidate: None).resolve("Fusion") == (
+            "Proxima Fusion GmbH"
+        )
+
+
+class TestInvestorNameIndex:
+    """Tests for InvestorRepository.get_or_create with a name index."""
+
+    def test_variants_resolve_to_one_investor(self, temp_db):
+        """Test that spelling variants reuse the existing investor."""
+        repo = InvestorRepository(temp_db)
+        hv_id = repo.get_or_create("HV Capital")
+        index = repo.name_index()
+
+        assert repo.get_or_create("HV Capital GmbH", name_index=index) == hv_id
+        google_id = repo.get_or_create("Google", name_index=index)
+        ventures_id = repo.get_or_create("Google Ventures", name_index=index)
+
+        assert len({hv_id, google_id, ventures_id}) == 3
+        assert index.resolve("google") == google_id
+        assert len(repo.get_all()) == 3
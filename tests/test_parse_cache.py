@@ -0,0 +1,185 @@
+"""Tests for the incremental markdown parse cache."""
+
+import pytest
+
+from src.data.parsers.markdown_parser import MarkdownParser
+from src.data.parsers.parse_cache import ParseCache
+
+DOCUMENT = """## 1. Germany
+
+#### Proxima Fusion (Munich)
+
+Stellarator developer, gegründet 2023, with 80 Mitarbeiter.
+
+#### Marvel Fusion (Munich/Germany)
+
+Laser-driven inertial fusion startup. USD 385 Million raised.
+
+## 2. International
+
+#### Helion Energy (USA)
+
+Pulsed FRC company building a fusion power plant for Microsoft.
+"""
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Parse cache in a temporary directory."""
+    return ParseCache(str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def document(tmp_path):
+    """Research document on disk."""
+    path = tmp_path / "Fusion_Research.md"
+    path.write_text(DOCUMENT, encoding="utf-8")
+    return path
+
+
+class TestParseCache:
+    """Tests for ParseCache deltas and block reuse."""
+
+    def test_first_parse_reports_all_new(self, cache, document):
+        """Test that every block is new when there is no committed baseline."""
+        _, delta = cache.parse(str(document))
+
+        assert delta.companies.new == ["Proxima Fusion", "Marvel Fusion", "Helion Energy"]
+        assert delta.sections.new == ["1. Germany", "2. International"]
+        assert delta.blocks_parsed == 3
+        assert delta.has_changes
+
+    def test_matches_full_parse(self, cache, document):
+        """Test that cached parses produce the same companies as a full parse."""
+        _, delta = cache.parse(str(document))
+        cache.commit(delta)
+        data, _ = cache.parse(str(document))
+
+        expected = MarkdownParser(DOCUMENT).parse().companies
+        assert [c.model_dump() for c in data.companies] == [c.model_dump() for c in expected]
+
+    def test_unchanged_document_uses_cache(self, cache, document):
+        """Test that an unchanged document reparses no blocks and has no delta."""
+        _, delta = cache.parse(str(document))
+        cache.commit(delta)
+
+        _, delta = cache.parse(str(document))
+
+        assert delta.blocks_parsed == 0
+        assert delta.blocks_cached == 3
+        assert not delta.has_changes
+        assert delta.changed_company_names == set()
+
+    def test_changed_added_and_removed_blocks(self, cache, document):
+        """Test that edits, additions and removals are reported per block."""
+        _, delta = cache.parse(str(document))
+        cache.commit(delta)
+
+        edited = DOCUMENT.replace("80 Mitarbeiter", "120 Mitarbeiter")
+        edited = edited.replace(
+            "#### Marvel Fusion (Munich/Germany)\n\n"
+            "Laser-driven inertial fusion startup. USD 385 Million raised.\n\n",
+            "",
+        )
+        edited += "\n#### Tokamak Energy (UK)\n\nSpherical tokamak developer.\n"
+        document.write_text(edited, encoding="utf-8")
+
+        data, delta = cache.parse(str(document))
+
+        assert delta.companies.changed == ["Proxima Fusion"]
+        assert delta.companies.removed == ["Marvel Fusion"]
+        assert delta.companies.new == ["Tokamak Energy"]
+        assert delta.companies.unchanged == ["Helion Energy"]
+        assert delta.sections.changed == ["1. Germany", "2. International"]
+        assert delta.blocks_parsed == 2
+        assert data.companies[0].team_size == 120
+
+    def test_ids_follow_document_order(self, cache, document):
+        """Test that cached companies still get ids in document order."""
+        _, delta = cache.parse(str(document))
+        cache.commit(delta)
+        document.write_text(
+            "#### Tokamak Energy (UK)\n\nSpherical tokamak developer.\n\n" + DOCUMENT,
+            encoding="utf-8",
+        )
+
+        data, _ = cache.parse(str(document))
+
+        assert [(c.id, c.name) for c in data.companies] == [
+            (1, "Tokamak Energy"),
+            (2, "Proxima Fusion"),
+            (3, "Marvel Fusion"),
+            (4, "Helion Energy"),
+        ]
+
+    def test_baseline_only_moves_on_commit(self, cache, document):
+        """Test that an uncommitted parse does not change the next delta."""
+        cache.parse(str(document))
+        _, delta = cache.parse(str(document))
+
+        assert len(delta.companies.new) == 3
+
+    def test_commit_prunes_stale_blocks(self, cache, document):
+        """Test that blocks no longer referenced are removed on commit."""
+        _, delta = cache.parse(str(document))
+        cache.commit(delta)
+        document.write_text(DOCUMENT.replace("80 Mitarbeiter", "90 Mitarbeiter"), encoding="utf-8")
+
+        _, delta = cache.parse(str(document))
+        assert len(list(cache.blocks_dir.glob("*.json"))) == 4
+        cache.commit(delta)
+
+        assert len(list(cache.blocks_dir.glob("*.json"))) == 3
+
+
+class TestIncrementalSync:
+    """Tests for DatabaseSyncService consuming the parse delta."""
+
+    def make_service(self, temp_db, cache, dry_run=False):
+        """Create a sync service in incremental mode."""
+        from src.models.merge_models import SyncConfig
+        from src.services.database_sync_service import DatabaseSyncService
+
+        config = SyncConfig(incremental=True, dry_run=dry_run)
+        return DatabaseSyncService(db=temp_db, config=config, parse_cache=cache)
+
+    def seed(self, temp_db):
+        """Store the document's companies so the sync finds no field changes."""
+        from src.data.repositories import CompanyRepository
+
+        repo = CompanyRepository(temp_db)
+        for company in MarkdownParser(DOCUMENT).parse().companies:
+            repo.create(company.model_copy(update={"id": None}))
+
+    def test_only_changed_blocks_are_processed(self, temp_db, cache, document):
+        """Test that later syncs only compare companies whose block changed."""
+        self.seed(temp_db)
+        first = self.make_service(temp_db, cache).sync_from_markdown(str(document))
+        second = self.make_service(temp_db, cache).sync_from_markdown(str(document))
+
+        assert first.errors == []
+        assert first.companies_processed == 3
+        assert second.companies_processed == 0
+        assert second.companies_unchanged == 3
+
+    def test_dry_run_keeps_baseline(self, temp_db, cache, document):
+        """Test that a dry run does not advance the parse baseline."""
+        self.seed(temp_db)
+        self.make_service(temp_db, cache, dry_run=True).sync_from_markdown(str(document))
+        result = self.make_service(temp_db, cache).sync_from_markdown(str(document))
+
+        assert result.companies_processed == 3
+
+    def test_edit_to_repeated_name_block_is_processed(self, temp_db, cache, document):
+        """Test that changing only the second block of a repeated name is still synced."""
+        repeated = DOCUMENT + "\n#### Helion Energy (USA)\n\nSecond entry.\n"
+        document.write_text(repeated, encoding="utf-8")
+        self.make_service(temp_db, cache).sync_from_markdown(str(document))
+
+        document.write_text(repeated.replace("Second entry.", "Second entry, revised."))
+        _, delta = cache.parse(str(document))
+        result = self.make_service(temp_db, cache).sync_from_markdown(str(document))
+
+        assert delta.companies.changed == ["Helion Energy #2"]
+        assert delta.changed_company_names == {"Helion Energy"}
+        assert result.companies_processed == 2
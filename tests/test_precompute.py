@@ -0,0 +1,182 @@
+"""Tests for stored LLM analyses and their background precompute."""
+
+from itertools import cycle
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from src.data.analysis_store import AnalysisStore, comparison_key, swot_key
+from src.data.repositories import CompanyRepository
+from src.llm.analyzer import FusionAnalyzer
+from src.models.company import Company
+from src.services.company_service import CompanyService
+from src.services.precompute_service import (
+    PRECOMPUTE_JOB,
+    PrecomputeConfig,
+    PrecomputeService,
+    schedule_precompute,
+)
+
+SWOT_RESPONSE = "## Strengths\n- Funding\n\n## Weaknesses\n- Early TRL\n"
+
+
+class CountingLLM(GenericFakeChatModel):
+    """Fake chat model that counts its calls."""
+
+    calls: int = 0
+
+    def _generate(self, *args, **kwargs):
+        self.calls += 1
+        return super()._generate(*args, **kwargs)
+
+
+def counting_llm() -> CountingLLM:
+    """Chat model that always returns the SWOT response."""
+    return CountingLLM(messages=cycle([AIMessage(content=SWOT_RESPONSE)]))
+
+
+@pytest.fixture
+def companies(temp_db):
+    """Three companies with decreasing funding."""
+    repo = CompanyRepository(temp_db)
+    ids = [
+        repo.create(Company(name=name, total_funding_usd=funding, technology_approach="Tokamak"))
+        for name, funding in [("Alpha", 3e9), ("Beta", 2e9), ("Gamma", 1e9)]
+    ]
+    temp_db.commit()
+    return [repo.get_by_id(company_id) for company_id in ids]
+
+
+class FakeRunner:
+    """Job runner that records submissions."""
+
+    def __init__(self, db_path, active=()):
+        self.db_path = db_path
+        self.active = list(active)
+        self.submitted = []
+
+    def list_jobs(self, limit=20, kind=None, active_only=False):
+        return self.active
+
+    def submit(self, kind, params=None, secrets=None):
+        self.submitted.append((kind, params))
+        return len(self.submitted)
+
+
+class TestAnalysisStore:
+    """Tests for input-hash keyed analysis storage."""
+
+    def test_key_changes_with_input_data(self, sample_company):
+        """Test that a prompt field changes the hash and an unrelated field does not."""
+        sample_company.id = 1
+        key = swot_key(sample_company)
+
+        assert swot_key(sample_company.model_copy(update={"website": "x.io"})) == key
+        changed = swot_key(sample_company.model_copy(update={"trl": 6}))
+        assert changed.subject == key.subject
+        assert changed.input_hash != key.input_hash
+        assert swot_key(sample_company, "Europe").subject != key.subject
+
+    def test_comparison_key_ignores_order(self, companies):
+        """Test that A vs B and B vs A share one stored comparison."""
+        alpha, beta, _ = companies
+
+        assert comparison_key(alpha, beta) == comparison_key(beta, alpha)
+
+    def test_stale_entries_are_not_served(self, temp_db, companies):
+        """Test that an entry is only returned while its input hash matches."""
+        store = AnalysisStore(temp_db)
+        key = swot_key(companies[0])
+        store.save(key, SWOT_RESPONSE, "qwen3:8b")
+
+        stored = store.get(key)
+        assert (stored.content, stored.model) == (SWOT_RESPONSE, "qwen3:8b")
+        assert store.get(swot_key(companies[0].model_copy(update={"trl": 7}))) is None
+
+        store.save(swot_key(companies[0].model_copy(update={"trl": 7})), "new")
+        assert store.get(key) is None
+        assert store.count() == 1
+
+
+class TestStoredAnalyses:
+    """Tests for services serving stored analyses."""
+
+    def test_swot_served_from_store(self, temp_db, companies):
+        """Test that a repeated SWOT makes no LLM call unless refreshed."""
+        llm = counting_llm()
+        service = CompanyService(temp_db, FusionAnalyzer(llm))
+
+        first = service.generate_swot(companies[0].id)
+        second = service.generate_swot(companies[0].id)
+        assert llm.calls == 1
+        assert second == first
+        assert second.strengths == ["Funding"]
+
+        service.generate_swot(companies[0].id, refresh=True)
+        assert llm.calls == 2
+
+    def test_row_change_invalidates(self, temp_db, companies):
+        """Test that updating the company row regenerates its SWOT."""
+        llm = counting_llm()
+        service = CompanyService(temp_db, FusionAnalyzer(llm))
+        service.generate_swot(companies[0].id)
+
+        service.update_company(companies[0].model_copy(update={"total_funding_usd": 4e9}))
+        service.generate_swot(companies[0].id)
+
+        assert llm.calls == 2
+
+
+class TestPrecompute:
+    """Tests for PrecomputeService and scheduling."""
+
+    def test_plan_covers_top_and_changed_companies(self, temp_db, companies):
+        """Test SWOTs for the targets, pairwise comparisons of the top few and a report."""
+        temp_db.execute(
+            "UPDATE companies SET last_updated = datetime('now', '-30 days') WHERE name != ?",
+            ("Gamma",),
+        )
+        config = PrecomputeConfig(top_companies=2, compare_top=2)
+        service = PrecomputeService(temp_db, config=config)
+
+        labels = [task.label for task in service.plan()]
+
+        # Gamma is outside the top two but changed within the last week
+        assert labels == [
+            "SWOT: Alpha", "SWOT: Beta", "SWOT: Gamma",
+            "Comparison: Alpha vs Beta", "AI market report",
+        ]
+
+    def test_run_generates_only_stale_analyses(self, temp_db, companies):
+        """Test that a second run is free and a row change regenerates its dependents."""
+        llm = counting_llm()
+        config = PrecomputeConfig(top_companies=3, compare_top=3, market_report=False)
+        service = PrecomputeService(temp_db, FusionAnalyzer(llm), config)
+
+        first = service.run()
+        second = service.run()
+        CompanyRepository(temp_db).update(companies[1].model_copy(update={"trl": 4}))
+        third = service.run()
+
+        assert (first.generated, first.fresh, first.errors) == (6, 0, [])
+        assert (second.generated, second.fresh) == (0, 6)
+        # Beta's SWOT and its two comparisons
+        assert (third.generated, third.fresh) == (3, 3)
+        assert llm.calls == 9
+        assert service.pending() == []
+
+    def test_schedule_submits_only_when_pending(self, temp_db, companies):
+        """Test that a job is queued for pending analyses and not while one is active."""
+        config = PrecomputeConfig(top_companies=1, compare_top=0, market_report=False)
+        runner = FakeRunner(str(temp_db.db_path))
+
+        assert schedule_precompute(runner, config, {"model": "qwen3:8b"}) == 1
+        kind, params = runner.submitted[0]
+        assert kind == PRECOMPUTE_JOB
+        assert params["model"] == "qwen3:8b"
+        assert params["config"]["top_companies"] == 1
+
+        assert schedule_precompute(FakeRunner(runner.db_path, active=["job"]), config) is None
+        AnalysisStore(temp_db).save(swot_key(companies[0]), SWOT_RESPONSE)
+        assert schedule_precompute(FakeRunner(runner.db_path), config) is None
@@ -0,0 +1,104 @@
+"""Tests for the natural language query processor."""
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from src.llm.cache import QueryCache
+from src.llm.query_processor import NLQueryProcessor, extract_sql, normalize_question
+
+
+class FakeSQLLLM:
+    """Stands in for the chat model: writes a fixed query and a fixed answer."""
+
+    def __init__(self, sql: str = "SELECT name FROM companies ORDER BY name"):
+        self.sql = sql
+        self.calls = []
+
+    def invoke(self, prompt_value) -> str:
+        system = prompt_value.to_messages()[0].content
+        kind = "sql" if "SQLite expert" in system else "answer"
+        self.calls.append(kind)
+        return f"```sql\n{self.sql};\n```" if kind == "sql" else "Two companies."
+
+
+@pytest.fixture
+def sql_db(temp_db):
+    """Temporary database with two companies."""
+    temp_db.execute("INSERT INTO companies (name) VALUES ('Proxima Fusion'), ('Marvel Fusion')")
+    temp_db.commit()
+    return temp_db
+
+
+def make_processor(fake: FakeSQLLLM, sql_db, cache: QueryCache) -> NLQueryProcessor:
+    """Processor using the fake model and a private translation cache."""
+    from langchain_community.utilities import SQLDatabase
+
+    db_path = str(sql_db.db_path)
+    return NLQueryProcessor(
+        RunnableLambda(fake.invoke),
+        SQLDatabase.from_uri(f"sqlite:///{db_path}"),
+        db_path,
+        translation_cache=cache,
+    )
+
+
+class TestNLQueryProcessor:
+    """Tests for cached NL→SQL translation."""
+
+    def test_helpers(self):
+        """Test question normalization and SQL extraction."""
+        assert normalize_question("  Which companies have TRL 6+? ") == "which companies have trl 6"
+        assert extract_sql("<think>hmm</think>SQLQuery: SELECT 1;") == "SELECT 1"
+
+    def test_repeat_question_skips_llm_and_sees_fresh_data(self, temp_db, sql_db):
+        """Test that cached SQL is re-run on current data without the LLM."""
+        fake = FakeSQLLLM()
+        cache = QueryCache()
+
+        first = make_processor(fake, sql_db, cache).process_query("List all companies?")
+        repeat = make_processor(fake, sql_db, cache).process_query("list all companies")
+
+        assert first.error is None
+        assert not first.cached
+        assert repeat.cached
+        assert repeat.answer == "Two companies."
+        assert fake.calls == ["sql", "answer"]
+
+        temp_db.execute("INSERT INTO companies (name) VALUES ('Helion Energy')")
+        temp_db.commit()
+        fresh = make_processor(fake, sql_db, cache).process_query("List all companies")
+
+        assert fresh.cached
+        assert [row["name"] for row in fresh.results] == [
+            "Helion Energy", "Marvel Fusion", "Proxima Fusion",
+        ]
+        assert "Helion Energy" in fresh.answer
+        assert fake.calls == ["sql", "answer"]
+
+    def test_schema_change_invalidates_translation(self, temp_db, sql_db):
+        """Test that a new schema fingerprint asks the LLM again."""
+        fake = FakeSQLLLM()
+        cache = QueryCache()
+        processor = make_processor(fake, sql_db, cache)
+
+        processor.process_query("List all companies")
+        temp_db.execute("ALTER TABLE companies ADD COLUMN ticker TEXT")
+        temp_db.commit()
+        result = processor.process_query("List all companies")
+
+        assert not result.cached
+        assert fake.calls == ["sql", "answer", "sql", "answer"]
+        assert "ticker TEXT" in processor.compact_schema()
+
+    def test_rejects_writes(self, sql_db):
+        """Test that generated write statements are refused and not cached."""
+        cache = QueryCache()
+        fake = FakeSQLLLM(sql="DELETE FROM companies")
+
+        result = make_processor(fake, sql_db, cache).process_query("Remove everything")
+
+        assert result.error
+        assert cache.size == 0
+        assert make_processor(fake, sql_db, cache).validate_sql(
+            "SELECT name, last_updated FROM companies"
+        ) == (True, None)
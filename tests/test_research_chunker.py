@@ -0,0 +1,126 @@
+"""Tests for structure-aware research chunking and incremental re-indexing."""
+
+import pytest
+
+from src.data.research_chunker import ResearchChunker, split_sections
+from src.data.vector_store import VectorStore
+
+DOCUMENT = """# Fusion Energy Research Update
+
+## 2. Key Fusion Companies
+
+### 2.1 Marvel Fusion (Germany)
+
+| Metric | Value |
+|--------|-------|
+| Total Funding | €385 million |
+
+**Technology Approach:**
+- Solid, non-cryogenic fuels
+- Nanostructured materials
+
+---
+
+### 2.2 Proxima Fusion (Germany)
+
+Stellarator spin-out of the Max Planck IPP. Raised €200 million.
+
+## 3. SMR Companies
+
+### 3.1 Steady Energy (Finland)
+
+District heating reactor LDR-50.
+"""
+
+
+def long_section(sentences: int) -> str:
+    """Markdown section with one long paragraph of distinct sentences."""
+    body = " ".join(f"Fact {i} concerns stellarator coil number {i}." for i in range(sentences))
+    return f"## Coils\n\n{body}\n"
+
+
+class TestResearchChunker:
+    """Tests for heading-scoped chunking."""
+
+    def test_split_sections_by_headings(self):
+        """Test that sections carry their heading path and keep paragraphs whole."""
+        sections = split_sections(DOCUMENT)
+
+        assert [path for path, _ in sections] == [
+            ("2. Key Fusion Companies", "2.1 Marvel Fusion (Germany)"),
+            ("2. Key Fusion Companies", "2.2 Proxima Fusion (Germany)"),
+            ("3. SMR Companies", "3.1 Steady Energy (Finland)"),
+        ]
+        assert sections[0][1][0].splitlines()[2] == "| Total Funding | €385 million |"
+        assert len(sections[0][1]) == 2
+
+    def test_chunks_follow_sections(self):
+        """Test that small sections become one chunk each, prefixed with the heading path."""
+        chunks = ResearchChunker().chunk(DOCUMENT)
+
+        assert [chunk.section for chunk in chunks] == [
+            "2. Key Fusion Companies > 2.1 Marvel Fusion (Germany)",
+            "2. Key Fusion Companies > 2.2 Proxima Fusion (Germany)",
+            "3. SMR Companies > 3.1 Steady Energy (Finland)",
+        ]
+        assert chunks[0].content.startswith(
+            "2. Key Fusion Companies > 2.1 Marvel Fusion (Germany)\n\n| Metric | Value |"
+        )
+        assert "**Technology Approach:**\n- Solid" in chunks[0].content
+        assert chunks[0].chunk_id.startswith("2-1-marvel-fusion-germany-")
+
+    def test_long_sections_split_at_sentences_with_overlap(self):
+        """Test token-sized chunks that end on sentences and overlap their neighbour."""
+        chunker = ResearchChunker(max_tokens=60, overlap_tokens=12)
+
+        chunks = chunker.chunk(long_section(20))
+
+        assert len(chunks) > 2
+        assert all(chunk.tokens <= 60 for chunk in chunks)
+        assert all(chunk.content.endswith(".") for chunk in chunks)
+        for previous, current in zip(chunks, chunks[1:]):
+            first_sentence = current.content.split("\n\n", 1)[1].split(". ")[0]
+            assert first_sentence in previous.content
+
+    def test_ids_stable_under_edits(self):
+        """Test that editing one section changes only that section's chunk id."""
+        chunker = ResearchChunker()
+        before = chunker.chunk(DOCUMENT)
+
+        after = chunker.chunk(DOCUMENT.replace("LDR-50", "LDR-50 in Finland"))
+
+        assert [c.chunk_id for c in before[:2]] == [c.chunk_id for c in after[:2]]
+        assert before[2].chunk_id != after[2].chunk_id
+
+    def test_rejects_overlap_larger_than_chunk(self):
+        """Test that the overlap must leave room for new text."""
+        with pytest.raises(ValueError):
+            ResearchChunker(max_tokens=50, overlap_tokens=50)
+
+
+class TestResearchSync:
+    """Tests for incremental research re-indexing."""
+
+    def test_sync_embeds_only_changed_chunks(self, tmp_path):
+        """Test that re-syncing an edited document adds and removes only changed chunks."""
+        store = VectorStore(persist_directory=str(tmp_path), embedding_model="hashing",
+                            backend="numpy")
+        store.add_research_chunk("section_0_chunk_0", "Old fixed-size chunk", "Old")
+        chunker = ResearchChunker()
+
+        first = store.sync_research_chunks(chunker.chunk(DOCUMENT))
+        edited = DOCUMENT.replace("LDR-50", "LDR-50 in Finland")
+        second = store.sync_research_chunks(chunker.chunk(edited))
+
+        assert first == {"added": 3, "removed": 1, "unchanged": 0}
+        assert second == {"added": 1, "removed": 1, "unchanged": 2}
+        assert store.get_collection_stats()["count"] == 3
+        hit = store.lexical_search("LDR-50 Finland", k=1)[0][0]
+        assert hit.metadata["section"] == "3. SMR Companies > 3.1 Steady Energy (Finland)"
+        assert "in Finland" in hit.page_content
+
+        reopened = VectorStore(persist_directory=str(tmp_path), embedding_model="hashing",
+                               backend="numpy")
+        assert reopened.sync_research_chunks(chunker.chunk(edited)) == {
+            "added": 0, "removed": 0, "unchanged": 3,
+        }
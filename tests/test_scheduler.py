@@ -0,0 +1,182 @@
+"""Tests for the LLM request scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from src.llm.scheduler import LLMScheduler, Priority
+
+
+def wait_until(predicate, timeout=5.0):
+    """Poll until predicate() is true."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return
+        time.sleep(0.005)
+    raise AssertionError("Condition not reached")
+
+
+def queued(scheduler, model="m"):
+    """Total queued requests for a model."""
+    stats = {s.model: s for s in scheduler.stats()}
+    return stats[model].queued_interactive + stats[model].queued_batch if model in stats else 0
+
+
+class TestLLMScheduler:
+    """Tests for LLMScheduler."""
+
+    def test_interactive_served_before_batch(self):
+        """Test that waiting interactive requests jump ahead of queued batch work."""
+        scheduler = LLMScheduler(max_concurrency=1, max_batch_concurrency=1)
+        order = []
+        holder = scheduler.acquire("m", Priority.BATCH)
+
+        def request(name, priority):
+            with scheduler.slot("m", priority):
+                order.append(name)
+
+        threads = [threading.Thread(target=request, args=("batch-1", Priority.BATCH))]
+        threads[0].start()
+        wait_until(lambda: queued(scheduler) == 1)
+        for name, priority in [("batch-2", Priority.BATCH), ("interactive", Priority.INTERACTIVE)]:
+            thread = threading.Thread(target=request, args=(name, priority))
+            thread.start()
+            threads.append(thread)
+            wait_until(lambda n=len(threads): queued(scheduler) == n)
+
+        scheduler.release(holder)
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert order == ["interactive", "batch-1", "batch-2"]
+
+    def test_batch_cap_reserves_interactive_slot(self):
+        """Test that batch work cannot occupy every slot."""
+        scheduler = LLMScheduler(max_concurrency=2, max_batch_concurrency=1)
+        batch = scheduler.acquire("m", Priority.BATCH)
+
+        second_batch = threading.Thread(target=lambda: scheduler.release(
+            scheduler.acquire("m", Priority.BATCH)
+        ))
+        second_batch.start()
+        wait_until(lambda: queued(scheduler) == 1)
+
+        # The interactive request gets the reserved slot immediately
+        interactive = scheduler.acquire("m", Priority.INTERACTIVE)
+        assert interactive.wait_seconds < 1.0
+        scheduler.release(interactive)
+
+        scheduler.release(batch)
+        second_batch.join(timeout=5)
+        assert not second_batch.is_alive()
+
+    def test_models_have_independent_capacity(self):
+        """Test that a busy model does not block another."""
+        scheduler = LLMScheduler(max_concurrency=1)
+        busy = scheduler.acquire("a")
+
+        other = scheduler.acquire("b")
+        assert other.wait_seconds < 1.0
+
+        scheduler.release(other)
+        scheduler.release(busy)
+
+    def test_identical_requests_coalesced(self):
+        """Test that concurrent identical requests share one call."""
+        scheduler = LLMScheduler(max_concurrency=2)
+        calls = []
+        release = threading.Event()
+
+        def slow_call():
+            calls.append(1)
+            release.wait(5)
+            return "answer"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                scheduler.run("m", slow_call, key="same-prompt")
+            ))
+            for _ in range(3)
+        ]
+        threads[0].start()
+        wait_until(lambda: len(calls) == 1)
+        for thread in threads[1:]:
+            thread.start()
+        wait_until(lambda: scheduler.stats()[0].coalesced == 2)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert results == ["answer"] * 3
+        assert len(calls) == 1
+
+    def test_coalesced_followers_receive_errors(self):
+        """Test that a failing leader propagates its error to followers."""
+        scheduler = LLMScheduler()
+
+        with pytest.raises(RuntimeError):
+            scheduler.run("m", lambda: (_ for _ in ()).throw(RuntimeError("down")), key="k")
+
+        # Key is released after failure
+        assert scheduler.run("m", lambda: "ok", key="k") == "ok"
+        stats = scheduler.stats()[0]
+        assert stats.failed == 1
+        assert stats.completed == 1
+
+    def test_metrics(self):
+        """Test that completed requests are reflected in metrics."""
+        scheduler = LLMScheduler()
+        for _ in range(3):
+            scheduler.run("m", lambda: time.sleep(0.01))
+
+        stats = scheduler.stats()[0]
+        assert stats.model == "m"
+        assert stats.completed == 3
+        assert stats.in_flight == 0
+        assert stats.avg_latency_ms >= 10
+        assert stats.p95_latency_ms >= stats.avg_latency_ms * 0.5
+
+    def test_configure_for_cli(self, monkeypatch):
+        """Test that a CLI scheduler lets batch work use every slot."""
+        from src.llm import scheduler as scheduler_module
+
+        monkeypatch.setattr(scheduler_module, "_llm_scheduler", None)
+        scheduler = scheduler_module.configure_llm_scheduler(3)
+
+        assert scheduler_module.get_llm_scheduler() is scheduler
+        tickets = [scheduler.acquire("m", Priority.BATCH) for _ in range(3)]
+        assert scheduler.stats()[0].in_flight_batch == 3
+        for ticket in tickets:
+            scheduler.release(ticket)
+
+
+class TestScheduledLLM:
+    """Tests for get_llm routing through the scheduler."""
+
+    def test_get_llm_priority(self):
+        """Test that get_llm returns a scheduled model with the given priority."""
+        from src.llm.chain_factory import get_llm
+        from src.llm.scheduled_llm import ScheduledChatOllama
+
+        llm = get_llm(priority="batch")
+
+        assert isinstance(llm, ScheduledChatOllama)
+        assert llm.priority == Priority.BATCH
+
+    def test_request_key_depends_on_prompt(self):
+        """Test that coalescing keys distinguish prompts and settings."""
+        from langchain_core.messages import HumanMessage
+
+        from src.llm.chain_factory import get_llm
+
+        llm = get_llm()
+        key_a = llm._request_key([HumanMessage(content="a")], None, {})
+
+        assert key_a == llm._request_key([HumanMessage(content="a")], None, {})
+        assert key_a != llm._request_key([HumanMessage(content="b")], None, {})
+        assert key_a != get_llm(temperature=0.9)._request_key(
+            [HumanMessage(content="a")], None, {}
+        )
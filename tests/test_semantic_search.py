@@ -0,0 +1,234 @@
+"""Tests for hybrid keyword + vector retrieval."""
+
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+
+from src.data.company_similarity import CompanySimilarity, top_k_neighbours
+from src.data.lexical_index import LexicalIndex, reciprocal_rank_fusion, tokenize
+from src.data.search_filters import metadata_matches
+from src.services.semantic_search_service import SemanticSearchService
+
+DOCUMENTS = [
+    Document(
+        id="proxima",
+        page_content="Company: Proxima Fusion\nTechnology: Stellarator\nCountry: Germany",
+        metadata={"type": "company", "name": "Proxima Fusion"},
+    ),
+    Document(
+        id="cfs",
+        page_content="Company: Commonwealth Fusion Systems\nTechnology: Tokamak with HTS magnets",
+        metadata={"type": "company", "name": "Commonwealth Fusion Systems"},
+    ),
+    Document(
+        id="tae",
+        page_content="Company: TAE Technologies\nTechnology: FRC\nTotal Funding: $1,300,000,000",
+        metadata={"type": "company", "name": "TAE Technologies"},
+    ),
+    Document(
+        id="magnets",
+        page_content="High-temperature superconducting magnets allow compact tokamaks.",
+        metadata={"type": "research", "section": "Magnets"},
+    ),
+    Document(
+        id="stellarators",
+        page_content="Stellarators confine plasma with twisted coils and need no plasma current.",
+        metadata={"type": "research", "section": "Stellarators"},
+    ),
+]
+
+
+class FakeVectorStore:
+    """Vector store with a real keyword index and a canned vector ranking."""
+
+    def __init__(self, vector_ranking: list[str]):
+        self.lexical_index = LexicalIndex.build(DOCUMENTS)
+        self.vector_ranking = vector_ranking
+        self.vector_queries = []
+        self.vector_batches = []
+
+    def lexical_search(self, query, k=5, filter_type=None, where=None):
+        return self.lexical_index.search(query, k=k, filter_type=filter_type, where=where)
+
+    def similarity_search_with_score(self, query, k=5, filter_type=None, where=None):
+        self.vector_queries.append(query)
+        by_id = {doc.id: doc for doc in DOCUMENTS}
+        docs = [by_id[doc_id] for doc_id in self.vector_ranking]
+        docs = [doc for doc in docs if not filter_type or doc.metadata["type"] == filter_type]
+        docs = [doc for doc in docs if metadata_matches(doc.metadata, where)]
+        return [(doc, 0.1 * rank) for rank, doc in enumerate(docs[:k])]
+
+    def search_many(self, queries, k=5, filter_type=None, where=None):
+        self.vector_batches.append(list(queries))
+        return [
+            self.similarity_search_with_score(query, k, filter_type, where) for query in queries
+        ]
+
+
+class TestLexicalIndex:
+    """Tests for BM25 scoring and rank fusion."""
+
+    @pytest.fixture
+    def index(self):
+        return LexicalIndex.build(DOCUMENTS)
+
+    def test_tokenize_keeps_acronyms_and_numbers(self):
+        """Test that acronyms and formatted numbers survive tokenization."""
+        assert tokenize("What is the HTS magnet of $1,300,000,000 at 2.5 T?") == [
+            "hts", "magnet", "1300000000", "2.5", "t",
+        ]
+
+    def test_acronym_ranks_first(self, index):
+        """Test that a rare exact term outranks common words."""
+        hits = index.search("HTS fusion")
+
+        assert hits[0][0].id == "cfs"
+        assert index.is_confident("HTS fusion", hits)
+
+    def test_common_term_is_not_confident(self, index):
+        """Test that a term shared by several documents is not trusted alone."""
+        hits = index.search("fusion")
+
+        assert len(hits) == 2
+        assert not index.is_confident("fusion", hits)
+
+    def test_filter_type(self, index):
+        """Test that results are restricted to one document type."""
+        hits = index.search("stellarator stellarators", filter_type="research")
+
+        assert [doc.id for doc, _ in hits] == ["stellarators"]
+
+    def test_reciprocal_rank_fusion(self):
+        """Test that documents ranked well in both lists come first."""
+        a, b, c = DOCUMENTS[:3]
+
+        fused = reciprocal_rank_fusion([[a, b], [c, b]])
+
+        assert [doc.id for doc, _ in fused] == ["cfs", "proxima", "tae"]
+        assert fused[0][1] == pytest.approx(1 / 62 + 1 / 62)
+
+
+class TestHybridSearch:
+    """Tests for SemanticSearchService.search with keyword and vector retrieval."""
+
+    def test_confident_keyword_query_skips_embedding(self, temp_db):
+        """Test that an exact acronym match is answered without the vector search."""
+        store = FakeVectorStore(vector_ranking=["magnets", "proxima"])
+        service = SemanticSearchService(temp_db, vector_store=store)
+
+        result = service.search("FRC", k=2)
+
+        assert result.retrieval == "lexical"
+        assert store.vector_queries == []
+        assert result.results[0]["name"] == "TAE Technologies"
+        assert result.sources == ["Company: TAE Technologies"]
+
+    def test_prose_query_fuses_both_rankings(self, temp_db):
+        """Test that keyword hits missed by the vector search are fused in."""
+        store = FakeVectorStore(vector_ranking=["magnets", "stellarators", "proxima"])
+        service = SemanticSearchService(temp_db, vector_store=store)
+
+        result = service.search("Which companies use HTS magnets in a tokamak?", k=3)
+
+        assert result.retrieval == "hybrid"
+        assert len(store.vector_queries) == 1
+        assert [r.get("name") or r["section"] for r in result.results] == [
+            "Magnets", "Commonwealth Fusion Systems", "Stellarators",
+        ]
+        assert 0 < result.results[-1]["relevance"] < result.results[0]["relevance"] <= 1
+
+    def test_technology_comparison_uses_names_as_keywords(self, temp_db):
+        """Test that comparisons match technology names and still run the vector search."""
+        store = FakeVectorStore(vector_ranking=["magnets"])
+        service = SemanticSearchService(temp_db, vector_store=store)
+
+        result = service.technology_comparison("Stellarator", "FRC")
+
+        assert len(store.vector_queries) == 1
+        assert {"Proxima Fusion", "TAE Technologies"} <= {r.get("name") for r in result.results}
+
+    def test_search_many_batches_vector_queries(self, temp_db):
+        """Test that only non-confident queries go to the vector store, in one batch."""
+        store = FakeVectorStore(vector_ranking=["magnets", "stellarators", "proxima"])
+        service = SemanticSearchService(temp_db, vector_store=store)
+        queries = ["FRC", "Which companies use HTS magnets in a tokamak?", "stellarator coils"]
+
+        results = service.search_many(queries, k=3)
+
+        assert store.vector_batches == [queries[1:]]
+        assert [result.query for result in results] == queries
+        assert [result.retrieval for result in results] == ["lexical", "hybrid", "hybrid"]
+        for query, result in zip(queries, results):
+            assert service.search(query, k=3).results == result.results
+
+
+class FakeCompanyVectors:
+    """Vector store exposing stored company vectors and counting loads."""
+
+    def __init__(self):
+        self.company_vectors_version = 1
+        self.loads = 0
+        self.company_similarity = CompanySimilarity(self, neighbours=2)
+        self.vectors = {
+            1: ("Proxima Fusion", [1.0, 0.1, 0.0]),
+            2: ("Gauss Fusion", [0.9, 0.2, 0.0]),
+            3: ("Marvel Fusion", [0.0, 1.0, 0.2]),
+            4: ("Focused Energy", [0.1, 0.9, 0.3]),
+        }
+
+    def get_company_vectors(self):
+        self.loads += 1
+        return {
+            "embeddings": np.array([vector for _, vector in self.vectors.values()]),
+            "metadatas": [
+                {"type": "company", "company_id": company_id, "name": name}
+                for company_id, (name, _) in self.vectors.items()
+            ],
+            "documents": [f"Company: {name}" for name, _ in self.vectors.values()],
+        }
+
+    def search_companies(self, query, k=5):
+        raise AssertionError("stored vectors should be used")
+
+
+class TestCompanySimilarity:
+    """Tests for nearest-neighbour lookups over stored company vectors."""
+
+    def test_top_k_matches_brute_force(self):
+        """Test that blocked top-k agrees with the full cosine matrix."""
+        vectors = np.random.default_rng(7).normal(size=(50, 8))
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        full = normalized @ normalized.T
+        np.fill_diagonal(full, -np.inf)
+
+        indices, scores = top_k_neighbours(vectors, k=5, block_size=16)
+
+        assert (indices == np.argsort(-full, axis=1)[:, :5]).all()
+        assert np.allclose(scores, np.sort(full, axis=1)[:, ::-1][:, :5], atol=1e-5)
+
+    def test_find_similar_uses_stored_vector(self, temp_db):
+        """Test that similar companies come from the stored embedding, without the query itself."""
+        store = FakeCompanyVectors()
+        service = SemanticSearchService(temp_db, vector_store=store)
+
+        similar = service.find_similar_companies("proxima fusion gmbh", k=2)
+
+        assert [company["name"] for company in similar] == ["Gauss Fusion", "Focused Energy"]
+        assert similar[0]["similarity"] > similar[1]["similarity"]
+        assert similar[0]["content"] == "Company: Gauss Fusion"
+
+    def test_table_refreshed_only_when_vectors_change(self, temp_db):
+        """Test that the neighbour table is cached until the company vectors change."""
+        store = FakeCompanyVectors()
+        service = SemanticSearchService(temp_db, vector_store=store)
+
+        service.similar_companies(3, k=1)
+        pairs = service.all_similar_companies(k=1)
+        assert store.loads == 1
+        assert pairs[3][0]["name"] == "Focused Energy"
+
+        store.vectors[5] = ("Marvel Twin", [0.0, 1.0, 0.2])
+        store.company_vectors_version = 2
+
+        assert service.similar_companies(3, k=1)[0]["name"] == "Marvel Twin"
+        assert store.loads == 2
@@ -0,0 +1,119 @@
+"""Tests for the content-addressed research snapshot store."""
+
+import pytest
+
+from src.data.snapshot_store import SnapshotStore, _split_sections
+
+DOCUMENT = """# Fusion Research
+
+Preamble.
+
+## 1. Germany
+
+Proxima Fusion, Marvel Fusion.
+
+## 2. USA
+
+Commonwealth Fusion Systems.
+"""
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Snapshot store in a temporary directory."""
+    return SnapshotStore(str(tmp_path / ".snapshots"))
+
+
+@pytest.fixture
+def document(tmp_path):
+    """Research document on disk."""
+    path = tmp_path / "Fusion_Research.md"
+    path.write_text(DOCUMENT, encoding="utf-8")
+    return path
+
+
+class TestSnapshotStore:
+    """Tests for SnapshotStore versions, dedup, diff and restore."""
+
+    def test_split_roundtrip(self):
+        """Test that sections concatenate back to the document."""
+        pieces = _split_sections(DOCUMENT)
+
+        assert [name for name, _ in pieces] == ["", "1. Germany", "2. USA"]
+        assert "".join(text for _, text in pieces) == DOCUMENT
+
+    def test_snapshot_and_read(self, store, document):
+        """Test that a version reads back byte for byte."""
+        version = store.snapshot(document, label="initial")
+
+        assert version.id == 1
+        assert store.read(version.id) == DOCUMENT
+        assert [v.label for v in store.list_versions("Fusion_Research.md")] == ["initial"]
+
+    def test_identical_content_reuses_version(self, store, document):
+        """Test that snapshotting an unchanged document adds no version."""
+        first = store.snapshot(document)
+        second = store.snapshot(document)
+
+        assert second.id == first.id
+        assert len(store.list_versions()) == 1
+
+    def test_unchanged_sections_are_deduplicated(self, store, document):
+        """Test that only changed sections are stored again."""
+        store.snapshot(document)
+        objects_before = len(list(store.objects_dir.glob("*/*")))
+
+        document.write_text(DOCUMENT.replace("Commonwealth", "Helion,"), encoding="utf-8")
+        store.snapshot(document)
+
+        assert len(list(store.objects_dir.glob("*/*"))) == objects_before + 1
+
+    def test_diff_and_restore(self, store, document, tmp_path):
+        """Test section diffs and restoring an older version."""
+        v1 = store.snapshot(document)
+        document.write_text(
+            DOCUMENT.replace("Commonwealth", "Helion,") + "\n## 3. Asia\n\nHelical Fusion.\n",
+            encoding="utf-8",
+        )
+        v2 = store.snapshot(document)
+
+        diff = store.diff(v1.id, v2.id)
+        assert diff.changed == ["2. USA"]
+        assert diff.added == ["3. Asia"]
+        assert "+Helion, Fusion Systems." in store.diff_text(v1.id, v2.id)
+
+        store.restore(v1.id, document)
+        assert document.read_text(encoding="utf-8") == DOCUMENT
+
+    def test_prune_removes_unreferenced_objects(self, store, document):
+        """Test that pruning drops old versions and their unique objects."""
+        store.snapshot(document)
+        document.write_text(DOCUMENT.replace("Preamble.", "Intro."), encoding="utf-8")
+        latest = store.snapshot(document)
+
+        assert store.prune(keep=1) == 1
+        assert [v.id for v in store.list_versions()] == [latest.id]
+        assert len(list(store.objects_dir.glob("*/*"))) == 3
+        assert store.read(latest.id) == document.read_text(encoding="utf-8")
+
+
+class TestMergerSnapshots:
+    """Tests for snapshotting the base file during merges."""
+
+    def test_merge_records_snapshot(self, tmp_path):
+        """Test that a merge snapshots the base file instead of copying it."""
+        from src.services.markdown_merger_service import MarkdownMergerService
+
+        (tmp_path / "base.md").write_text(DOCUMENT, encoding="utf-8")
+        (tmp_path / "update.md").write_text(
+            DOCUMENT + "\n## 3. Asia\n\nHelical Fusion.\n", encoding="utf-8"
+        )
+        merger = MarkdownMergerService(llm=object(), research_dir=str(tmp_path))
+
+        result = merger.merge_files("base.md", "update.md")
+
+        assert result.success and result.backup_path is None
+        assert list(tmp_path.glob("*.backup.md")) == []
+        assert merger.snapshots.read(result.snapshot_version) == DOCUMENT
+        merger.restore_snapshot(result.snapshot_version)
+        assert (tmp_path / "base.md").read_text(encoding="utf-8") == DOCUMENT
@@ -0,0 +1,87 @@
+"""Tests for the SQL execution sandbox."""
+
+import sqlite3
+import time
+
+import pytest
+
+from src.data.sql_sandbox import QueryTimeout, SandboxError, SQLSandbox
+
+RUNAWAY = "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n) SELECT count(*) FROM n"
+
+
+@pytest.fixture
+def sandbox(temp_db):
+    """Sandbox over a temporary database with five companies."""
+    temp_db.executemany(
+        "INSERT INTO companies (name, country) VALUES (?, ?)",
+        [(f"Company {i}", "Germany") for i in range(5)],
+    )
+    temp_db.commit()
+    sandbox = SQLSandbox(str(temp_db.db_path), max_rows=3, time_budget=0.2, chunk_size=2)
+    yield sandbox
+    sandbox.close()
+
+
+class TestSQLSandbox:
+    """Tests for validation, limits and isolation."""
+
+    def test_rows_are_capped_and_streamed(self, sandbox):
+        """Test LIMIT injection, truncation and chunked streaming."""
+        result = sandbox.execute("SELECT name FROM companies ORDER BY name DESC;")
+
+        assert [row["name"] for row in result.rows] == ["Company 4", "Company 3", "Company 2"]
+        assert result.truncated
+        assert [len(chunk) for chunk in sandbox.stream("SELECT * FROM companies")] == [2, 1]
+        assert not sandbox.execute("SELECT name FROM companies LIMIT 2").truncated
+
+    @pytest.mark.parametrize("sql", [
+        "DELETE FROM companies",
+        "SELECT 1; DROP TABLE companies",
+        "WITH x AS (SELECT 1) DELETE FROM companies",
+        "SELECT * FROM companies, funding_rounds",
+    ])
+    def test_rejected_statements(self, sandbox, sql):
+        """Test that writes, stacked statements and cross products are refused."""
+        with pytest.raises(SandboxError):
+            sandbox.execute(sql)
+
+    def test_literals_and_joins_are_allowed(self, sandbox):
+        """Test that keywords in strings and keyed joins pass."""
+        sandbox.execute("SELECT name FROM companies WHERE description LIKE '%update; drop%'")
+        sandbox.execute(
+            "SELECT c.name, f.amount_usd FROM companies c "
+            "JOIN funding_rounds f ON f.company_id = c.id"
+        )
+
+    def test_runaway_query_is_interrupted(self, sandbox):
+        """Test that a statement is stopped once its time budget is spent."""
+        started = time.monotonic()
+        with pytest.raises(QueryTimeout):
+            sandbox.execute(RUNAWAY)
+
+        assert time.monotonic() - started < 1.0
+        assert sandbox.execute("SELECT count(*) AS n FROM companies").rows == [{"n": 5}]
+
+    def test_connections_are_read_only(self, sandbox):
+        """Test that pooled connections cannot write even past validation."""
+        with sandbox._connection() as connection:
+            with pytest.raises(sqlite3.OperationalError):
+                connection.execute("DELETE FROM companies")
+
+    def test_pool_is_bounded(self, temp_db):
+        """Test that a busy pool refuses new statements instead of piling up."""
+        sandbox = SQLSandbox(str(temp_db.db_path), pool_size=1, pool_timeout=0.05)
+        with sandbox._connection():
+            with pytest.raises(SandboxError, match="busy"):
+                sandbox.execute("SELECT 1")
+        assert sandbox.execute("SELECT 1 AS one").rows == [{"one": 1}]
+
+    def test_schema_introspection(self, sandbox):
+        """Test reading schema definitions and columns through the read-only pool."""
+        names = {row["name"] for row in sandbox.schema_definitions() if row["type"] == "table"}
+        columns, foreign_keys = sandbox.table_columns("funding_rounds")
+
+        assert {"companies", "funding_rounds"} <= names
+        assert "company_id" in [column["name"] for column in columns]
+        assert ("company_id", "companies") in [(fk["from"], fk["table"]) for fk in foreign_keys]
@@ -0,0 +1,350 @@
+"""Tests for the offline vector store backend and hashing embedder."""
+
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+
+from src.data.hashing_embeddings import HashingEmbeddings
+from src.data.repositories import CompanyRepository
+from src.data.search_filters import SearchFilters, metadata_matches
+from src.data.vector_backends import NumpyBackend
+from src.data.vector_quantization import Int8Quantizer
+from src.data.vector_store import VectorStore
+from src.models.company import Company
+from src.services.company_service import CompanySearchCriteria
+from src.services.semantic_search_service import SemanticSearchService
+
+
+def company(company_id: int, country: str, trl: int) -> Document:
+    """Company document with filterable metadata."""
+    return Document(
+        page_content=f"Company {company_id}",
+        metadata={"type": "company", "company_id": company_id, "country": country, "trl": trl},
+    )
+
+
+@pytest.fixture
+def offline_store(tmp_path):
+    """Vector store on the NumPy backend with the hashing embedder."""
+    store = VectorStore(persist_directory=str(tmp_path), embedding_model="hashing", backend="numpy")
+    store.add_company(1, "Proxima Fusion", "Stellarator power plants", "Stellarator", "Germany",
+                      trl=4)
+    store.add_company(2, "Gauss Fusion", "European stellarator consortium", "Stellarator",
+                      "Germany", trl=3)
+    store.add_company(3, "TAE Technologies", "Beam-driven FRC", "FRC", "USA", trl=5)
+    store.add_research_chunk("magnets", "HTS magnets make compact tokamaks possible.", "Magnets")
+    return store
+
+
+class TestHashingEmbeddings:
+    """Tests for the deterministic local embedder."""
+
+    def test_deterministic_and_normalized(self):
+        """Test that equal texts embed identically to unit vectors."""
+        embedder = HashingEmbeddings(dimensions=64)
+
+        first, second = embedder.embed_documents(["Stellarator startup", "Stellarator startup"])
+
+        assert first == second
+        assert np.linalg.norm(first) == pytest.approx(1.0)
+
+    def test_shared_words_are_closer(self):
+        """Test that texts sharing words are more similar than unrelated ones."""
+        embedder = HashingEmbeddings()
+        query = np.array(embedder.embed_query("stellarator magnets"))
+
+        related = np.array(embedder.embed_query("stellarator coils and magnets"))
+        unrelated = np.array(embedder.embed_query("laser inertial confinement"))
+
+        assert query @ related > query @ unrelated
+
+
+class TestNumpyBackend:
+    """Tests for the memory-mapped NumPy backend."""
+
+    def test_persists_and_reloads(self, tmp_path):
+        """Test that an index reopens from disk with its vectors memory-mapped."""
+        backend = NumpyBackend(str(tmp_path / "index"))
+        docs = [company(1, "DE", 4), company(2, "US", 6)]
+        backend.upsert(["a", "b"], [[1.0, 0.0], [0.0, 2.0]], docs)
+
+        reopened = NumpyBackend(str(tmp_path / "index"))
+        hits = reopened.query([0.1, 1.0], k=1)
+
+        assert isinstance(reopened._matrix, np.memmap)
+        assert reopened.count() == 2
+        assert hits[0][0].id == "b"
+        assert hits[0][0].metadata["country"] == "US"
+
+    def test_upsert_replaces_and_compacts(self, tmp_path):
+        """Test that re-adding an id replaces its row, also after compaction."""
+        backend = NumpyBackend(str(tmp_path / "index"))
+        docs = [company(1, "DE", 4), company(2, "US", 6)]
+        backend.upsert(["a", "b"], [[1.0, 0.0], [0.0, 1.0]], docs)
+        backend.upsert(["a"], [[0.0, 1.0]], [company(1, "FR", 7)])
+
+        assert backend.count() == 2
+        assert backend.get(where={"country": "DE"})["ids"] == []
+        backend.compact()
+
+        reopened = NumpyBackend(str(tmp_path / "index"))
+        assert len(reopened._matrix) == 2
+        assert reopened.get(where={"country": "FR"})["ids"] == ["a"]
+
+    def test_where_filters(self, tmp_path):
+        """Test equality, range, membership and boolean filter clauses."""
+        backend = NumpyBackend(str(tmp_path / "index"))
+        docs = [company(i, country, trl) for i, (country, trl) in
+                enumerate([("DE", 3), ("DE", 6), ("US", 7), ("FR", 5)])]
+        backend.upsert([f"c{i}" for i in range(4)], np.eye(4).tolist(), docs)
+
+        def ids(where):
+            return backend.get(where=where)["ids"]
+
+        assert ids({"country": "DE"}) == ["c0", "c1"]
+        assert ids({"$and": [{"country": "DE"}, {"trl": {"$gte": 5}}]}) == ["c1"]
+        assert ids({"country": {"$in": ["US", "FR"]}}) == ["c2", "c3"]
+        assert ids({"$or": [{"trl": {"$lt": 4}}, {"country": "US"}]}) == ["c0", "c2"]
+        assert [doc.id for doc, _ in backend.query([1, 1, 1, 1], k=5, where={"trl": {"$gt": 5}})] \
+            == ["c1", "c2"]
+
+    def test_query_many_matches_single_queries(self, tmp_path):
+        """Test that batched queries return the same hits as one query at a time."""
+        rng = np.random.default_rng(5)
+        backend = NumpyBackend(str(tmp_path / "index"))
+        docs = [company(i, "DE" if i % 2 else "US", i % 9) for i in range(200)]
+        backend.upsert([str(i) for i in range(200)], rng.normal(size=(200, 16)), docs)
+        queries = rng.normal(size=(5, 16))
+
+        for where in (None, {"country": "DE"}):
+            batched = backend.query_many(queries, k=4, where=where, block_size=2)
+            single = [backend.query(query, k=4, where=where) for query in queries]
+            assert [[(d.id, round(s, 5)) for d, s in hits] for hits in batched] == \
+                [[(d.id, round(s, 5)) for d, s in hits] for hits in single]
+
+    def test_ivf_matches_exhaustive_search(self, tmp_path):
+        """Test that IVF probing finds the same nearest neighbours on clustered data."""
+        rng = np.random.default_rng(3)
+        centers = rng.normal(size=(8, 16))
+        vectors = np.repeat(centers, 150, axis=0) + 0.1 * rng.normal(size=(1200, 16))
+        docs = [Document(page_content=str(i), metadata={"type": "x"}) for i in range(1200)]
+        ids = [str(i) for i in range(1200)]
+        exhaustive = NumpyBackend(str(tmp_path / "flat"))
+        partitioned = NumpyBackend(str(tmp_path / "ivf"), ivf_lists=8, nprobe=2, ivf_min_rows=0)
+        exhaustive.upsert(ids, vectors, docs)
+        partitioned.upsert(ids, vectors, docs)
+
+        queries = centers + 0.1 * rng.normal(size=centers.shape)
+        for query in queries:
+            expected = [doc.id for doc, _ in exhaustive.query(query, k=5)]
+            assert [doc.id for doc, _ in partitioned.query(query, k=5)] == expected
+        assert len(np.unique(partitioned._ivf[1])) > 1
+
+
+def clustered(rows: int, dimensions: int, seed: int = 0) -> tuple[np.ndarray, list[Document]]:
+    """Clustered vectors with one document each."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(20, dimensions))
+    vectors = centers[rng.integers(0, 20, rows)] + 0.5 * rng.normal(size=(rows, dimensions))
+    docs = [Document(page_content=str(i), metadata={"type": "x", "even": i % 2 == 0})
+            for i in range(rows)]
+    return vectors, docs
+
+
+class TestQuantizedIndex:
+    """Tests for int8 and product-quantized codes with float re-scoring."""
+
+    def test_int8_scores_approximate_inner_products(self):
+        """Test that int8 codes estimate dot products closely."""
+        rng = np.random.default_rng(1)
+        vectors = rng.normal(size=(100, 32)).astype(np.float32)
+        queries = rng.normal(size=(3, 32)).astype(np.float32)
+        quantizer = Int8Quantizer(32)
+
+        estimates = quantizer.scores(quantizer.encode(vectors), queries)
+
+        assert quantizer.encode(vectors).shape == (100, 36)
+        np.testing.assert_allclose(estimates, vectors @ queries.T, atol=0.15)
+
+    @pytest.mark.parametrize("quantization", ["int8", "pq"])
+    def test_rescored_results_match_exact_search(self, tmp_path, quantization):
+        """Test that the re-scored shortlist finds the exact top-k, also after reloading."""
+        vectors, docs = clustered(600, 16)
+        ids = [str(i) for i in range(600)]
+        exact = NumpyBackend(str(tmp_path / "exact"))
+        options = {"quantization": quantization, "pq_subspaces": 4, "quantize_min_rows": 300}
+        quantized = NumpyBackend(str(tmp_path / "quantized"), **options)
+        for backend in (exact, quantized):
+            backend.upsert(ids[:300], vectors[:300], docs[:300])
+            backend.upsert(ids[300:], vectors[300:], docs[300:])
+        queries = vectors[:20] + 0.3 * np.random.default_rng(2).normal(size=(20, 16))
+
+        calibration = quantized.calibrate(0.99, k=5, queries=queries)
+        reopened = NumpyBackend(str(tmp_path / "quantized"), **options)
+
+        assert calibration["recall"] >= 0.99
+        assert reopened.rescore == calibration["rescore"]
+        assert len(reopened._codes) == 600
+        for backend in (quantized, reopened):
+            for where in (None, {"even": True}):
+                found = backend.query_many(queries, k=5, where=where)
+                truth = exact.query_many(queries, k=5, where=where)
+                recall = np.mean([
+                    len({doc.id for doc, _ in a} & {doc.id for doc, _ in b}) / 5
+                    for a, b in zip(found, truth)
+                ])
+                assert recall >= 0.95
+                assert [hits[0][0].id for hits in found] == [hits[0][0].id for hits in truth]
+        footprint = quantized.memory_footprint()
+        assert footprint["quantization"] == quantization
+        assert footprint["index_bytes"] < footprint["vectors_bytes"]
+
+    def test_codes_follow_replacements_and_compaction(self, tmp_path):
+        """Test that codes stay aligned with rows through upserts, deletes and compaction."""
+        vectors, docs = clustered(40, 8)
+        backend = NumpyBackend(str(tmp_path / "index"), quantization="int8", rescore=1,
+                               quantize_min_rows=1)
+        backend.upsert([str(i) for i in range(40)], vectors, docs)
+        backend.upsert(["0"], [-vectors[0]], [docs[0]])
+        backend.delete(["1"])
+
+        backend.compact()
+
+        assert len(backend._codes) == len(backend._matrix) == 39
+        assert backend.query(vectors[2], k=1)[0][0].id == "2"
+        assert backend.query(-vectors[0], k=1)[0][0].id == "0"
+
+
+class TestOfflineVectorStore:
+    """Tests for semantic search without Chroma or Ollama."""
+
+    def test_search_and_similarity_offline(self, temp_db, offline_store):
+        """Test that hybrid search and similar companies work on the offline store."""
+        service = SemanticSearchService(temp_db, vector_store=offline_store)
+
+        result = service.search("European stellarator consortium", k=2, filter_type="company")
+        similar = service.find_similar_companies("Proxima Fusion", k=1)
+
+        assert result.results[0]["name"] == "Gauss Fusion"
+        assert similar[0]["name"] == "Gauss Fusion"
+        assert offline_store.get_collection_stats()["backend"] == "numpy"
+
+    def test_search_many(self, offline_store):
+        """Test that a query batch matches single searches and keeps the input order."""
+        queries = ["stellarator", "HTS magnets", "stellarator"]
+
+        batched = offline_store.search_many(queries, k=2, filter_type="company")
+
+        assert len(batched) == 3
+        for query, hits in zip(queries, batched):
+            expected = offline_store.similarity_search_with_score(query, k=2, filter_type="company")
+            assert [doc.id for doc, _ in hits] == [doc.id for doc, _ in expected]
+        assert all(doc.metadata["type"] == "company" for hits in batched for doc, _ in hits)
+
+    def test_reopen_and_clear(self, tmp_path, offline_store):
+        """Test that a second store sees the persisted documents until cleared."""
+        reopened = VectorStore(persist_directory=str(tmp_path), embedding_model="hashing",
+                               backend="numpy")
+
+        assert reopened.get_collection_stats()["count"] == 4
+        assert reopened.search_research("HTS magnets", k=1)[0].metadata["section"] == "Magnets"
+
+        reopened.clear()
+        assert VectorStore(persist_directory=str(tmp_path), embedding_model="hashing",
+                           backend="numpy").get_collection_stats()["count"] == 0
+
+
+class TestSearchFilters:
+    """Tests for metadata filter pushdown."""
+
+    def test_to_where(self):
+        """Test that company constraints become one Chroma where clause."""
+        criteria = CompanySearchCriteria(country="Germany", trl_min=5, funding_max=1e9)
+
+        where = SearchFilters.from_criteria(criteria).to_where()
+
+        assert where == {"$and": [
+            {"type": "company"},
+            {"country": "Germany"},
+            {"trl": {"$gte": 5}},
+            {"funding": {"$lte": 1e9}},
+            {"funding": {"$ne": 0}},
+        ]}
+        # The full TRL range keeps companies without a TRL, like CompanyRepository.search
+        assert SearchFilters(trl_min=1, trl_max=9).to_where() == {"type": "company"}
+        assert SearchFilters(technology=["FRC", "Tokamak"]).to_where() == {"$and": [
+            {"type": "company"}, {"technology": {"$in": ["FRC", "Tokamak"]}},
+        ]}
+        assert SearchFilters(doc_type="research").to_where() == {"type": "research"}
+        assert SearchFilters().to_where() is None
+
+    def test_metadata_matches(self):
+        """Test that Python evaluation agrees with the where semantics."""
+        where = SearchFilters(country="Germany", trl_min=4).to_where()
+
+        assert metadata_matches({"type": "company", "country": "Germany", "trl": 4}, where)
+        assert not metadata_matches({"type": "company", "country": "Germany", "trl": 0}, where)
+        assert not metadata_matches({"type": "research"}, where)
+        upper_only = SearchFilters(trl_max=3).to_where()
+        assert metadata_matches({"type": "company", "trl": 3}, upper_only)
+        assert not metadata_matches({"type": "company", "trl": 0}, upper_only)
+
+    @pytest.fixture
+    def service(self, temp_db, offline_store):
+        """Search service over matching database and vector store companies."""
+        offline_store.add_company(4, "Marvel Fusion", "Laser fusion", "Laser", "Germany", trl=3)
+        offline_store.add_company(5, "Focused Energy", "Laser fusion power", "Laser", "Germany")
+        repo = CompanyRepository(temp_db)
+        for name, country, trl, founded in [
+            ("Proxima Fusion", "Germany", 4, 2023),
+            ("Gauss Fusion", "Germany", 3, 2022),
+            ("TAE Technologies", "USA", 5, 1998),
+            ("Marvel Fusion", "Germany", 3, 2019),
+            ("Focused Energy", "Germany", None, None),
+        ]:
+            repo.create(Company(name=name, country=country, trl=trl, founded_year=founded))
+        return SemanticSearchService(temp_db, vector_store=offline_store)
+
+    @pytest.mark.parametrize("prefilter_max_ids", [256, 1])
+    def test_filtered_search_returns_full_top_k(self, service, monkeypatch, prefilter_max_ids):
+        """Test that filtered queries rank only matching documents (id list or metadata)."""
+        monkeypatch.setattr(
+            "src.services.semantic_search_service.PREFILTER_MAX_IDS", prefilter_max_ids
+        )
+
+        result = service.search(
+            "fusion power plants",
+            k=3,
+            filters=SearchFilters(country="Germany", trl_max=3),
+        )
+
+        assert sorted(r["name"] for r in result.results) == ["Gauss Fusion", "Marvel Fusion"]
+
+    @pytest.mark.parametrize("prefilter_max_ids", [256, 1])
+    def test_unknown_trl_matches_sql_semantics(self, service, monkeypatch, prefilter_max_ids):
+        """Test that id-list and metadata filtering agree on companies without a TRL."""
+        monkeypatch.setattr(
+            "src.services.semantic_search_service.PREFILTER_MAX_IDS", prefilter_max_ids
+        )
+
+        def names(**filters):
+            result = service.search("fusion power", k=5, filters=SearchFilters(**filters))
+            return sorted(r["name"] for r in result.results)
+
+        # Only the full 1-9 range includes the company without a TRL
+        assert "Focused Energy" in names(country="Germany", trl_min=1, trl_max=9)
+        assert "Focused Energy" not in names(country="Germany", trl_min=1, trl_max=8)
+        assert names(country="Germany", trl_max=3) == ["Gauss Fusion", "Marvel Fusion"]
+
+    def test_criteria_prefiltered_in_sqlite(self, service):
+        """Test that SQL-only criteria are pushed down as a company id list."""
+        recent = service.search("fusion company", k=5, filters=CompanySearchCriteria(
+            country="Germany", founded_after=2020,
+        ))
+        none = service.search("fusion company", k=5, filters=CompanySearchCriteria(
+            founded_after=2030,
+        ))
+
+        assert sorted(r["name"] for r in recent.results) == ["Gauss Fusion", "Proxima Fusion"]
+        assert none.results == []
+        assert none.retrieval == "filtered"